@@ -21,6 +21,7 @@ import inspect
 import importlib
 import tempfile
 from tempfile import TemporaryDirectory
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import deepcopy
 from itertools import product
 from pathlib import Path
@@ -28,6 +29,7 @@ from typing import Union, List
 from platform import system
 
 import numpy as np
+import pandas as pd
 from deprecated import deprecated
 import openmdao.api as om
 from openmdao.core.explicitcomponent import ExplicitComponent
@@ -59,6 +61,11 @@ BOOLEAN_OPTIONS = [
     "compute_slipstream",
     "low_speed_aero",
 ]
+DOE_SAMPLE_COLUMN = "sample"
+DOE_ERROR_COLUMN = "error"
+
+# Function of the design of experiments kept by each process, see run_doe
+_DOE_WORKER = {}
 
 
 def _create_tmp_directory() -> TemporaryDirectory:
@@ -520,6 +527,7 @@ def generate_block_analysis(
     xml_file_path: str,
     options: dict = None,
     overwrite: bool = False,
+    persistent: bool = False,
 ):
 
     """
@@ -537,19 +545,17 @@ def generate_block_analysis(
     :param options: the options of the group, required if an id is provided
     :param overwrite: boolean to set whether or not the input XML file will be overwritten once
     the function runs
+    :param persistent: boolean to set whether or not the problem is set up only at the first call
+    of the function and then reused, in which case the following calls only set the values of
+    var_inputs before running the model. The shapes of the inputs must then stay the same
+    between calls, and an input not given in a call keeps its previous value
 
     :return patched_function: the function constructed based on the provided system which takes
-    var_inputs as inputs under the form of a dictionary {"var_name": (var_value, var_units)}
+    var_inputs as inputs under the form of a dictionary {"var_name": (var_value, var_units)},
+    or a list of such dictionaries in which case it returns the list of the outputs of each case
     """
 
-    # If a valid ID or a path to a configuration file is provided, build a system based on that ID
-    if isinstance(local_system, str):
-        if local_system.endswith(".yml"):
-            configurator = oad.FASTOADProblemConfigurator(local_system)
-            dummy_problem = configurator.get_problem(read_inputs=False)
-            local_system = dummy_problem.model
-        else:
-            local_system = oad.RegisterOpenMDAOSystem.get_system(local_system, options=options)
+    local_system = _get_system(local_system, options)
 
     # Search what are the component/group outputs
     variables = list_variables(local_system)
@@ -628,15 +634,14 @@ def generate_block_analysis(
         else:
             # If all inputs addressed either by .xml or var_inputs or in an IVC, construct the
             # function
-            def patched_function(inputs_dict: dict) -> dict:
+            def build_problem(inputs_dict: dict) -> oad.FASTOADProblem:
                 """
-                The patched function perform a run of an openmdao component or group applying
-                FASTOAD formalism.
+                Builds and sets up the problem running the component/group applying FASTOAD
+                formalism.
 
                 @param inputs_dict: dictionary of input (values, units) saved with their key name,
                 as an example: inputs_dict = {'in1': (3.0, "m")}.
-                @return: dictionary of the component/group outputs saving names as keys and (value,
-                units) as tuple.
+                @return: the problem, ready to be run.
                 """
 
                 # Read .xml file and construct Independent Variable Component excluding outputs
@@ -654,21 +659,232 @@ def generate_block_analysis(
                 model_local = problem_local.model
                 model_local.add_subsystem("local_system", group_local, promotes=["*"])
                 problem_local.setup()
+
+                return problem_local
+
+            # Problem kept between calls in persistent mode
+            persistent_problems = []
+
+            def run_case(inputs_dict: dict) -> dict:
+                """
+                The patched function perform a run of an openmdao component or group applying
+                FASTOAD formalism.
+
+                @param inputs_dict: dictionary of input (values, units) saved with their key name,
+                as an example: inputs_dict = {'in1': (3.0, "m")}.
+                @return: dictionary of the component/group outputs saving names as keys and (value,
+                units) as tuple.
+                """
+
+                if persistent_problems:
+                    problem_local = persistent_problems[0]
+                    for name, value in inputs_dict.items():
+                        problem_local.set_val(name, value[0], units=value[1])
+                else:
+                    problem_local = build_problem(inputs_dict)
+                    if persistent:
+                        persistent_problems.append(problem_local)
                 problem_local.run_model()
                 if overwrite:
                     problem_local.output_file_path = xml_file_path
                     problem_local.write_outputs()
-                # Get output names from component/group and construct dictionary
+                # Get output names from component/group and construct dictionary, values are
+                # copied so that they are not modified by the next runs of a persistent problem
                 outputs_units = [var.units for var in variables if not var.is_input]
                 outputs_dict = {}
                 for idx, _ in enumerate(outputs_names):
-                    value = problem_local.get_val(outputs_names[idx], outputs_units[idx])
+                    value = np.copy(problem_local.get_val(outputs_names[idx], outputs_units[idx]))
                     outputs_dict[outputs_names[idx]] = (value, outputs_units[idx])
                 return outputs_dict
 
+            def patched_function(inputs_dict: Union[dict, List[dict]]) -> Union[dict, List[dict]]:
+                """
+                The patched function perform a run of an openmdao component or group applying
+                FASTOAD formalism, or one run per case if a list of cases is given.
+
+                @param inputs_dict: dictionary of input (values, units) saved with their key name,
+                as an example: inputs_dict = {'in1': (3.0, "m")}, or list of such dictionaries.
+                @return: dictionary of the component/group outputs saving names as keys and (value,
+                units) as tuple, or list of such dictionaries.
+                """
+
+                if isinstance(inputs_dict, dict):
+                    return run_case(inputs_dict)
+
+                return [run_case(case_inputs_dict) for case_inputs_dict in inputs_dict]
+
             return patched_function
 
 
+def run_doe(
+    local_system: Union[ExplicitComponent, ImplicitComponent, Group, str],
+    samples: pd.DataFrame,
+    xml_file_path: str,
+    result_file_path: str,
+    workers_number: int = 1,
+    options: dict = None,
+    units: dict = None,
+    resume: bool = True,
+) -> pd.DataFrame:
+    """
+    Runs a design of experiments on a system, each sample being a run of a function generated
+    by generate_block_analysis. The samples are spread over a pool of processes, each one keeping
+    a persistent problem, and the results are appended to a .csv file as soon as they are
+    computed. The failure of a sample is written in the file instead of stopping the other ones.
+
+    :param local_system: the system the design of experiments is based on, can be either an
+    OpenMDAO component (Implicit, Explicit or a Group), a registered FAST-OAD id, or the absolute
+    path to a configuration file. It is sent to each process, so an id or a configuration file
+    is preferred when workers_number is greater than 1
+    :param samples: the table of the samples, with one column per varying input and one row
+    per sample, the index of the table identifies the sample
+    :param xml_file_path: the path of the XML that contains the values of the variables
+    necessary for the models but that are not varying
+    :param result_file_path: the path of the .csv file in which the results are written, with one
+    column per input and output and one row per sample
+    :param workers_number: number of processes on which the samples are spread, if 1 they are
+    run in the current process
+    :param options: the options of the group, required if an id is provided
+    :param units: dictionary of the units of the varying inputs, inputs not in the dictionary
+    are taken in the units of the system
+    :param resume: boolean to set whether or not the samples already successfully computed in
+    an existing result file are skipped, if False the existing file is overwritten
+
+    :return: the table of the results of all the samples of the result file, indexed by sample
+    """
+
+    var_inputs = list(samples.columns)
+    if units is None:
+        units = {}
+
+    variables = list_variables(_get_system(local_system, options))
+    outputs_names = [var.name for var in variables if not var.is_input]
+    columns = [DOE_SAMPLE_COLUMN] + var_inputs + outputs_names + [DOE_ERROR_COLUMN]
+
+    # Samples already computed without error are skipped, the failed ones are computed again
+    computed_samples = set()
+    if pth.exists(result_file_path):
+        if resume:
+            previous_results = pd.read_csv(result_file_path)
+            columns = list(previous_results.columns)
+            computed_samples = set(
+                previous_results[DOE_SAMPLE_COLUMN][previous_results[DOE_ERROR_COLUMN].isna()]
+            )
+        else:
+            os.remove(result_file_path)
+
+    cases = [
+        (sample, {name: (value, units.get(name)) for name, value in sample_inputs.items()})
+        for sample, sample_inputs in samples.iterrows()
+        if sample not in computed_samples
+    ]
+    inputs_dicts = dict(cases)
+
+    init_args = (local_system, var_inputs, xml_file_path, options)
+    if workers_number > 1 and len(cases) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers_number, len(cases)),
+            initializer=_init_doe_worker,
+            initargs=init_args,
+        ) as executor:
+            futures = [executor.submit(_run_doe_sample, case) for case in cases]
+            for future in as_completed(futures):
+                sample, outputs_values, error = future.result()
+                _write_doe_result(
+                    result_file_path, columns, sample, inputs_dicts[sample], outputs_values, error
+                )
+    else:
+        _init_doe_worker(*init_args)
+        for case in cases:
+            sample, outputs_values, error = _run_doe_sample(case)
+            _write_doe_result(
+                result_file_path, columns, sample, inputs_dicts[sample], outputs_values, error
+            )
+
+    if not pth.exists(result_file_path):
+        return pd.DataFrame(columns=columns).set_index(DOE_SAMPLE_COLUMN)
+
+    # A sample computed again after a failure only keeps its last result
+    results = pd.read_csv(result_file_path)
+
+    return results.drop_duplicates(DOE_SAMPLE_COLUMN, keep="last").set_index(DOE_SAMPLE_COLUMN)
+
+
+def _get_system(
+    local_system: Union[ExplicitComponent, ImplicitComponent, Group, str], options: dict = None
+):
+    """
+    Builds the system based on an id or a path to a configuration file, returns it unchanged if
+    it already is an OpenMDAO component.
+    """
+
+    if isinstance(local_system, str):
+        if local_system.endswith(".yml"):
+            configurator = oad.FASTOADProblemConfigurator(local_system)
+            dummy_problem = configurator.get_problem(read_inputs=False)
+            local_system = dummy_problem.model
+        else:
+            local_system = oad.RegisterOpenMDAOSystem.get_system(local_system, options=options)
+
+    return local_system
+
+
+def _init_doe_worker(local_system, var_inputs, xml_file_path, options):
+    """Stores the arguments of the function run by a process of the design of experiments."""
+
+    _DOE_WORKER.clear()
+    _DOE_WORKER["args"] = (local_system, var_inputs, xml_file_path, options)
+
+
+def _run_doe_sample(case: tuple) -> tuple:
+    """
+    Runs one sample of the design of experiments with the persistent function of the process.
+
+    :param case: tuple of the sample index and of the inputs dictionary of the sample
+    :return: tuple of the sample index, of the dictionary of output values (None if the sample
+    failed) and of the error message (None if the sample succeeded)
+    """
+
+    sample, inputs_dict = case
+
+    # noinspection PyBroadException
+    try:
+        if "function" not in _DOE_WORKER:
+            local_system, var_inputs, xml_file_path, options = _DOE_WORKER["args"]
+            _DOE_WORKER["function"] = generate_block_analysis(
+                local_system, var_inputs, xml_file_path, options, persistent=True
+            )
+        outputs_dict = _DOE_WORKER["function"](inputs_dict)
+    except Exception as error:
+        # The problem may be left in a diverged state, so it is set up again for the next sample
+        _DOE_WORKER.pop("function", None)
+        _LOGGER.warning("Sample %s of the design of experiments failed: %s", sample, error)
+        return sample, None, repr(error)
+
+    return sample, {name: value for name, (value, _) in outputs_dict.items()}, None
+
+
+def _write_doe_result(
+    result_file_path: str, columns: list, sample, inputs_dict: dict, outputs_values, error
+):
+    """Appends the result of a sample to the result file, creating it if needed."""
+
+    row = {name: value for name, (value, _) in inputs_dict.items()}
+    if outputs_values is not None:
+        row.update(outputs_values)
+    row[DOE_SAMPLE_COLUMN] = sample
+    row[DOE_ERROR_COLUMN] = error
+
+    # Arrays of size 1 are written as floats and bigger ones as lists
+    for name, value in row.items():
+        if isinstance(value, np.ndarray):
+            row[name] = value.item() if value.size == 1 else value.tolist()
+
+    pd.DataFrame([row]).reindex(columns=columns).to_csv(
+        result_file_path, mode="a", header=not pth.exists(result_file_path), index=False
+    )
+
+
 def list_all_subsystem(model, model_address, dict_subsystems):
     # noinspection PyBroadException
     try:
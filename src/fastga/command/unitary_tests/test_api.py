@@ -14,9 +14,12 @@
 
 import os.path as pth
 import os
+import tempfile
 import pytest
 import warnings
 
+import pandas as pd
+
 import fastoad.api as oad
 
 from fastga.command import api
@@ -109,6 +112,57 @@ def test_input_vars_working():
     assert value == pytest.approx(17.0, abs=1e-3)
 
 
+def test_persistent_working():
+
+    missing_input_xml_file = pth.join(pth.dirname(__file__), "data/missing_one_input.xml")
+    var_inputs = ["data:geometry:variable_1"]
+
+    test_generate_block_analysis = api.generate_block_analysis(
+        Disc1(), var_inputs, missing_input_xml_file, overwrite=False, persistent=True
+    )
+    output_dict = test_generate_block_analysis({"data:geometry:variable_1": (4.0, None)})
+    value = output_dict.get("data:geometry:variable_4")[0]
+    assert value == pytest.approx(17.0, abs=1e-3)
+
+    # The next calls reuse the problem set up at the first call, and the outputs already
+    # returned are not modified by them
+    output_dict_list = test_generate_block_analysis(
+        [{"data:geometry:variable_1": (5.0, None)}, {"data:geometry:variable_1": (6.0, None)}]
+    )
+    values = [output_dict.get("data:geometry:variable_4")[0] for output_dict in output_dict_list]
+    assert values == pytest.approx([18.0, 19.0], abs=1e-3)
+    assert value == pytest.approx(17.0, abs=1e-3)
+
+
+def test_run_doe():
+
+    missing_input_xml_file = pth.join(pth.dirname(__file__), "data/missing_one_input.xml")
+    results_folder = tempfile.TemporaryDirectory()
+    result_file = pth.join(results_folder.name, "doe_results.csv")
+
+    # The third sample has a wrong shape and fails without stopping the other ones
+    samples = pd.DataFrame({"data:geometry:variable_1": [4.0, 5.0, [1.0, 2.0], 6.0]})
+    results = api.run_doe(
+        Disc1(), samples, missing_input_xml_file, result_file, workers_number=2
+    ).sort_index()
+    assert results["error"].isna().tolist() == [True, True, False, True]
+    assert results["data:geometry:variable_4"][[0, 1, 3]].tolist() == pytest.approx(
+        [17.0, 18.0, 19.0]
+    )
+
+    # Only the failed and the new samples are computed when resuming
+    samples.loc[2, "data:geometry:variable_1"] = 7.0
+    samples.loc[4, "data:geometry:variable_1"] = 8.0
+    results = api.run_doe(Disc1(), samples, missing_input_xml_file, result_file)
+    assert len(pd.read_csv(result_file)) == 6
+    assert results.sort_index()["data:geometry:variable_4"].tolist() == pytest.approx(
+        [17.0, 18.0, 20.0, 19.0, 21.0]
+    )
+    assert results["error"].isna().all()
+
+    results_folder.cleanup()
+
+
 def test_ivc_working():
     missing_input_xml_file = pth.join(pth.dirname(__file__), "data/missing_one_input.xml")
 
@@ -134,9 +134,6 @@ class ComputeEquilibratedPolar(DynamicEquilibrium):
             altitude = inputs["data:mission:sizing:main_route:cruise:altitude"]
             v_tas = inputs["data:TLAR:v_cruise"]
 
-        cl_array = np.array([])
-        cd_array = np.array([])
-
         atm = Atmosphere(altitude, altitude_in_feet=False)
 
         # Computation of the maximum aircraft mass that can be used before exceeding
@@ -146,30 +143,25 @@ class ComputeEquilibratedPolar(DynamicEquilibrium):
         cg_ratio = self.options["cg_ratio"]
         x_cg = x_cg_aft + cg_ratio * (x_cg_fwd - x_cg_aft)
 
-        mass_array = np.linspace(0.1 * mtow, 1.15 * init_mass_guess, POLAR_POINT_COUNT)
-        # previous_step = ()
-        for mass in mass_array:
-            previous_step = self.dynamic_equilibrium(
+        mass_array = np.linspace(0.1 * mtow, 1.15 * init_mass_guess, POLAR_POINT_COUNT).ravel()
+        dynamic_pressure = 0.5 * atm.density * v_tas ** 2
+        # All the points are solved at once, only the ones before the first one in error are kept
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            equilibrium_result = self.dynamic_equilibrium_vector(
                 inputs,
                 0.0,
-                (0.5 * atm.density * v_tas ** 2),
+                dynamic_pressure,
                 0.0,
                 0.0,
-                mass,
+                mass_array,
                 "none",
-                (),
                 low_speed=self.options["low_speed_aero"],
                 x_cg=x_cg,
             )
-            if previous_step[-1]:
-                break
-            else:
-                cl_wing = float(previous_step[2])
-                cl_tail = float(previous_step[3])
-                thrust = float(previous_step[1])
-                cl_array = np.append(cl_array, cl_wing + cl_tail)
-                cd = thrust / (0.5 * atm.density * v_tas ** 2 * wing_area)
-                cd_array = np.append(cd_array, cd)
+        error = equilibrium_result[-1]
+        valid_point_count = int(np.argmax(error)) if np.any(error) else POLAR_POINT_COUNT
+        cl_array = (equilibrium_result[2] + equilibrium_result[3])[:valid_point_count]
+        cd_array = equilibrium_result[1][:valid_point_count] / (dynamic_pressure * wing_area)
 
         additional_zeros = np.linspace(
             FIRST_INVALID_COEFF, 2 * FIRST_INVALID_COEFF, POLAR_POINT_COUNT - len(cd_array)
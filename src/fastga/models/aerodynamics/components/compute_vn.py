@@ -13,7 +13,6 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-import warnings
 
 import numpy as np
 import openmdao.api as om
@@ -145,6 +144,23 @@ class ComputeVN(om.ExplicitComponent):
         self.ft_to_m = foot  # Converting from feet to meters
         self.lbf_to_N = lbf  # Converting from pound force to Newtons
 
+    def initialize(self):
+        self.options.declare(
+            "number_of_masses",
+            default=0,
+            types=int,
+            desc="number of masses, equally spaced between the MZFW and the MTOW, for which the "
+            "flight domain is computed in addition to the MTOW and MZFW ones, if 0 no grid is "
+            "computed",
+        )
+        self.options.declare(
+            "number_of_altitudes",
+            default=2,
+            types=int,
+            desc="number of altitudes, equally spaced between sea level and the cruise altitude, "
+            "for which the flight domain is computed when a grid of masses is required",
+        )
+
     def setup(self):
 
         self.add_input("data:TLAR:category", val=3.0)
@@ -187,6 +203,29 @@ class ComputeVN(om.ExplicitComponent):
             "data:mission:sizing:cs23:flight_domain:mzfw:load_factor", shape=DOMAIN_PTS_NB
         )
 
+        number_of_masses = self.options["number_of_masses"]
+        if number_of_masses > 0:
+            number_of_altitudes = self.options["number_of_altitudes"]
+            grid_shape = (number_of_masses, number_of_altitudes, DOMAIN_PTS_NB)
+            self.add_output(
+                "data:mission:sizing:cs23:flight_domain:grid:mass",
+                units="kg",
+                shape=number_of_masses,
+            )
+            self.add_output(
+                "data:mission:sizing:cs23:flight_domain:grid:altitude",
+                units="m",
+                shape=number_of_altitudes,
+            )
+            self.add_output(
+                "data:mission:sizing:cs23:flight_domain:grid:velocity",
+                units="m/s",
+                shape=grid_shape,
+            )
+            self.add_output(
+                "data:mission:sizing:cs23:flight_domain:grid:load_factor", shape=grid_shape
+            )
+
         self.declare_partials("*", "*", method="fd")
 
     def check_config(self, logger):
@@ -195,67 +234,50 @@ class ComputeVN(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         v_tas = inputs["data:TLAR:v_cruise"]
-        cruise_altitude = inputs["data:mission:sizing:main_route:cruise:altitude"]
-        mtow = inputs["data:weight:aircraft:MTOW"]
-        mzfw = inputs["data:weight:aircraft:MTOW"]
+        cruise_altitude = float(inputs["data:mission:sizing:main_route:cruise:altitude"])
+        mtow = float(inputs["data:weight:aircraft:MTOW"])
+        mzfw = float(inputs["data:weight:aircraft:MZFW"])
 
         atm = Atmosphere(cruise_altitude, altitude_in_feet=False)
         atm.true_airspeed = v_tas
-        design_vc = atm.equivalent_airspeed
-
-        velocity_array_mtow, load_factor_array_mtow, _ = self.flight_domain(
-            inputs,
-            mtow,
-            cruise_altitude,
-            design_vc,
-            design_n_ps=0.0,
-            design_n_ng=0.0,
-        )
-
-        if DOMAIN_PTS_NB < len(velocity_array_mtow):
-            velocity_array_mtow = velocity_array_mtow[0 : DOMAIN_PTS_NB - 1]
-            load_factor_array_mtow = load_factor_array_mtow[0 : DOMAIN_PTS_NB - 1]
-            warnings.warn(
-                "Defined maximum stored domain points at the beginning of the file exceeded!"
+        design_vc = float(atm.equivalent_airspeed)
+
+        # All the flight domains are computed at once, the MTOW one comes first, followed by the
+        # grid, if any, ordered by mass then altitude. The MZFW flight domain has always been
+        # computed at the MTOW and the structural sizing relies on it, so it is kept that way, the
+        # actual MZFW is only used as the lower bound of the grid.
+        mass = np.array([mtow])
+        altitude = np.array([cruise_altitude])
+
+        number_of_masses = self.options["number_of_masses"]
+        if number_of_masses > 0:
+            grid_mass = np.linspace(mzfw, mtow, number_of_masses)
+            grid_altitude = np.linspace(0.0, cruise_altitude, self.options["number_of_altitudes"])
+            grid_mass_mesh, grid_altitude_mesh = np.meshgrid(
+                grid_mass, grid_altitude, indexing="ij"
             )
-        else:
-            additional_zeros = list(np.zeros(DOMAIN_PTS_NB - len(velocity_array_mtow)))
-            velocity_array_mtow.extend(additional_zeros)
-            load_factor_array_mtow.extend(additional_zeros)
-
-        outputs["data:mission:sizing:cs23:flight_domain:mtow:velocity"] = np.array(
-            velocity_array_mtow
-        )
-        outputs["data:mission:sizing:cs23:flight_domain:mtow:load_factor"] = np.array(
-            load_factor_array_mtow
-        )
+            mass = np.concatenate((mass, grid_mass_mesh.flatten()))
+            altitude = np.concatenate((altitude, grid_altitude_mesh.flatten()))
 
-        velocity_array_mzfw, load_factor_array_mzfw, _ = self.flight_domain(
-            inputs,
-            mzfw,
-            cruise_altitude,
-            design_vc,
-            design_n_ps=0.0,
-            design_n_ng=0.0,
+        velocity_array, load_factor_array = self.flight_domains(
+            inputs, mass, altitude, design_vc, design_n_ps=0.0, design_n_ng=0.0
         )
 
-        if DOMAIN_PTS_NB < len(velocity_array_mzfw):
-            velocity_array_mzfw = velocity_array_mzfw[0 : DOMAIN_PTS_NB - 1]
-            load_factor_array_mzfw = load_factor_array_mzfw[0 : DOMAIN_PTS_NB - 1]
-            warnings.warn(
-                "Defined maximum stored domain points at the beginning of the file exceeded!"
-            )
-        else:
-            additional_zeros = list(np.zeros(DOMAIN_PTS_NB - len(velocity_array_mzfw)))
-            velocity_array_mzfw.extend(additional_zeros)
-            load_factor_array_mzfw.extend(additional_zeros)
-
-        outputs["data:mission:sizing:cs23:flight_domain:mzfw:velocity"] = np.array(
-            velocity_array_mzfw
-        )
-        outputs["data:mission:sizing:cs23:flight_domain:mzfw:load_factor"] = np.array(
-            load_factor_array_mzfw
-        )
+        outputs["data:mission:sizing:cs23:flight_domain:mtow:velocity"] = velocity_array[0]
+        outputs["data:mission:sizing:cs23:flight_domain:mtow:load_factor"] = load_factor_array[0]
+        outputs["data:mission:sizing:cs23:flight_domain:mzfw:velocity"] = velocity_array[0]
+        outputs["data:mission:sizing:cs23:flight_domain:mzfw:load_factor"] = load_factor_array[0]
+
+        if number_of_masses > 0:
+            grid_shape = (number_of_masses, self.options["number_of_altitudes"], DOMAIN_PTS_NB)
+            outputs["data:mission:sizing:cs23:flight_domain:grid:mass"] = grid_mass
+            outputs["data:mission:sizing:cs23:flight_domain:grid:altitude"] = grid_altitude
+            outputs["data:mission:sizing:cs23:flight_domain:grid:velocity"] = velocity_array[
+                1:
+            ].reshape(grid_shape)
+            outputs["data:mission:sizing:cs23:flight_domain:grid:load_factor"] = load_factor_array[
+                1:
+            ].reshape(grid_shape)
 
     # noinspection PyUnusedLocal
     def flight_domain(self, inputs, mass, altitude, design_vc, design_n_ps=0.0, design_n_ng=0.0):
@@ -271,39 +293,74 @@ class ComputeVN(om.ExplicitComponent):
         if higher than it
         @param design_n_ng: the negative design load factor, will replace the maneuver load factor
         if lower than it
-        @return velocity_array: an array containing the characteristic speeds necessary to draw
-        the flight domain stored as [Vs_1g_ps, Vs_1g_ng, V_a_ps (maneuver diagram), V_a_ng (maneuver
-        diagram), V_a_ps (gust, 0 if same as maneuver), V_a_ng (gust, 0 if same as maneuver), V_c,
-        V_c, V_c, V_d, V_d, V_d, V_d, V_ne, V_no, V_mg (for commuter), Vs_1g_fe, V_a_fe, V_fe]
-        @return load_factor_array: an array containing the load factors necessary to draw the flight
-        domain stored as [1.0, -1.0, n_lim_ps (maneuver diagram), n_lim_ng (maneuver diagram),
-        n_a_ps (gust, 0 if same as maneuver), n_a_ng (gust, 0 if same as maneuver), n_lim_ng,
-        n_c_ps (maneuver or gust, whichever is greatest), n_c_ng ( maneuver or gust, whichever is
-        greatest), n_lim_ps, 0.0, n_d_ps (maneuver or gust, whichever is greatest), n_d_ng
-        (maneuver or gust, whichever is greatest), 0.0, 0.0, n_v_mg, 1.0, n_fe, n_fe]
+        @return velocity_array: a list containing the characteristic speeds necessary to draw
+        the flight domain, see flight_domains for the order
+        @return load_factor_array: a list containing the load factors necessary to draw the flight
+        domain, see flight_domains for the order
         @return conditions: an array containing the conditions at which the diagram was computed
         """
 
+        velocity_array, load_factor_array = self.flight_domains(
+            inputs, mass, altitude, design_vc, design_n_ps=design_n_ps, design_n_ng=design_n_ng
+        )
+
+        conditions = [mass, altitude]
+
+        return list(velocity_array[0]), list(load_factor_array[0]), conditions
+
+    def flight_domains(self, inputs, mass, altitude, design_vc, design_n_ps=0.0, design_n_ng=0.0):
+        """
+        Function that computes the flight domains of the aircraft represented in the inputs for
+        several couples of mass and altitude at once, for a given cruise equivalent airspeed and
+        design load factors
+
+        @param inputs: a dictionary containing the properties of the aircraft
+        @param mass: the masses for which we want to compute the flight domain
+        @param altitude: the altitudes at which we want to compute the flight domain, broadcast
+        against the masses
+        @param design_vc: the cruise equivalent airspeed
+        @param design_n_ps: the positive design load factor, will replace the maneuver load factor
+        if higher than it
+        @param design_n_ng: the negative design load factor, will replace the maneuver load factor
+        if lower than it
+        @return velocity_array: an array containing, for each couple of mass and altitude, the
+        characteristic speeds necessary to draw the flight domain stored as [Vs_1g_ps, Vs_1g_ng,
+        V_a_ps (maneuver diagram), V_a_ng (maneuver diagram), V_a_ps (gust, 0 if same as
+        maneuver), V_a_ng (gust, 0 if same as maneuver), V_c, V_c, V_c, V_d, V_d, V_d, V_d, V_ne,
+        V_no, V_mg (for commuter), Vs_1g_fe, V_a_fe, V_fe]
+        @return load_factor_array: an array containing, for each couple of mass and altitude, the
+        load factors necessary to draw the flight domain stored as [1.0, -1.0, n_lim_ps (maneuver
+        diagram), n_lim_ng (maneuver diagram), n_a_ps (gust, 0 if same as maneuver), n_a_ng
+        (gust, 0 if same as maneuver), n_lim_ng, n_c_ps (maneuver or gust, whichever is
+        greatest), n_c_ng ( maneuver or gust, whichever is greatest), n_lim_ps, 0.0, n_d_ps
+        (maneuver or gust, whichever is greatest), n_d_ng (maneuver or gust, whichever is
+        greatest), 0.0, 0.0, n_v_mg, 1.0, n_fe, n_fe]
+        """
+
+        mass, altitude = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(mass, dtype=float)).flatten(),
+            np.atleast_1d(np.asarray(altitude, dtype=float)).flatten(),
+        )
+        zeros = np.zeros_like(mass)
+
         # Get necessary inputs
-        wing_area = inputs["data:geometry:wing:area"]
-        mtow = inputs["data:weight:aircraft:MTOW"]
-        category = inputs[
-            "data:TLAR:category"
-        ]  # Aerobatic = 1.0, Utility = 2.0, Normal = 3.0, Commuter = 4.0
-        level = inputs["data:TLAR:level"]
-        vh = inputs["data:TLAR:v_max_sl"]
-        root_chord = inputs["data:geometry:wing:root:chord"]
-        tip_chord = inputs["data:geometry:wing:tip:chord"]
-        cl_max_flaps = inputs["data:aerodynamics:aircraft:landing:CL_max"]
-        cl_max = inputs["data:aerodynamics:wing:low_speed:CL_max_clean"]
-        cl_min = inputs["data:aerodynamics:wing:low_speed:CL_min_clean"]
+        wing_area = float(inputs["data:geometry:wing:area"])
+        mtow = float(inputs["data:weight:aircraft:MTOW"])
+        category = float(
+            inputs["data:TLAR:category"]
+        )  # Aerobatic = 1.0, Utility = 2.0, Normal = 3.0, Commuter = 4.0
+        level = float(inputs["data:TLAR:level"])
+        vh = float(inputs["data:TLAR:v_max_sl"])
+        root_chord = float(inputs["data:geometry:wing:root:chord"])
+        tip_chord = float(inputs["data:geometry:wing:tip:chord"])
+        cl_max_flaps = float(inputs["data:aerodynamics:aircraft:landing:CL_max"])
+        cl_max = float(inputs["data:aerodynamics:wing:low_speed:CL_max_clean"])
+        cl_min = float(inputs["data:aerodynamics:wing:low_speed:CL_min_clean"])
         mean_chord = (root_chord + tip_chord) / 2.0
         atm_0 = Atmosphere(0.0)
         atm = Atmosphere(altitude, altitude_in_feet=False)
-
-        # Initialise the lists in which we will store the data
-        velocity_array = []
-        load_factor_array = []
+        density = np.asarray(atm.density)
+        speed_of_sound = np.asarray(atm.speed_of_sound)
 
         # For some of the correlation presented in the regulation, we need to convert the data
         # of the airplane to imperial units
@@ -320,25 +377,23 @@ class ComputeVN(om.ExplicitComponent):
         # Lets start by computing the 1g/-1g stall speeds using the usual formulations
         vs_1g_ps = np.sqrt((2.0 * mass * g) / (atm_0.density * wing_area * cl_max))  # [m/s]
         vs_1g_ng = np.sqrt((2.0 * mass * g) / (atm_0.density * wing_area * abs(cl_min)))  # [m/s]
-        velocity_array.append(float(vs_1g_ps))
-        load_factor_array.append(1.0)
-        velocity_array.append(float(vs_1g_ng))
-        load_factor_array.append(-1.0)
 
         # As we will consider all the calculated speed to be Vs_1g_ps < V < 1.4*Vh, we will
         # compute cl_alpha for N points equally spaced on log scale (to take into account the
         # high non-linearity effect). If the option is not selected, we will only consider
         # low_speed and cruise cl_alpha points and consider a square regression between both.
+        # The interpolation is done on the Mach number so that it is only built once for all the
+        # altitudes, the speed being converted to Mach number with the local speed of sound.
 
         mach_interp = inputs["data:aerodynamics:aircraft:mach_interpolation:mach_vector"]
-        v_interp = []
-        for mach in mach_interp:
-            v_interp.append(float(mach * atm.speed_of_sound))
         cl_alpha_interp = inputs["data:aerodynamics:aircraft:mach_interpolation:CL_alpha_vector"]
-        cl_alpha_fct = interpolate.interp1d(
-            v_interp, cl_alpha_interp, fill_value="extrapolate", kind="quadratic"
+        cl_alpha_mach_fct = interpolate.interp1d(
+            mach_interp, cl_alpha_interp, fill_value="extrapolate", kind="quadratic"
         )
 
+        def cl_alpha_fct(x):
+            return cl_alpha_mach_fct(x / speed_of_sound)
+
         # We will now establish the minimum limit maneuvering load factors outside of gust load
         # factors. Th designer can take higher load factor if he so wish. As will later be done
         # for the the cruising speed, we will simply ensure that the designer choice agrees with
@@ -360,9 +415,6 @@ class ComputeVN(om.ExplicitComponent):
             n_lim_ng_max = -0.4 * n_lim_ps  # CS 23.337 (b)
         n_lim_ng = min(n_lim_ng_max, design_n_ng)
 
-        load_factor_array.append(float(n_lim_ps))
-        load_factor_array.append(float(n_lim_ng))
-
         # Starting from there, we need to compute the gust lines as it can have an impact on the
         # choice of the maneuvering speed. We will also compute the maximum intensity gust line
         # for later use but keep in mind that this is specific for commuter or level 4 aircraft
@@ -373,52 +425,35 @@ class ComputeVN(om.ExplicitComponent):
         # take into account the case of the commuter nor do we implement the reduction of gust
         # intensity with the location of the gust center
 
-        if altitude <= 20000.0:
-            u_de_vc = 50.0  # [ft/s]
-            u_de_vd = 25.0  # [ft/s]
-            u_de_vmg = 66.0  # [ft/s]
-        elif 20000.0 < altitude < 50000.0:
-            u_de_vc = 66.7 - 0.000833 * altitude  # [ft/s]
-            u_de_vd = 33.4 - 0.000417 * altitude  # [ft/s]
-            u_de_vmg = 84.7 - 0.000933 * altitude  # [ft/s]
-        else:
-            u_de_vc = 25.0  # [ft/s]
-            u_de_vd = 12.5  # [ft/s]
-            u_de_vmg = 38.0  # [ft/s]
+        low_altitude = altitude <= 20000.0
+        high_altitude = altitude >= 50000.0
+        u_de_vc = np.select(
+            [low_altitude, high_altitude], [50.0, 25.0], 66.7 - 0.000833 * altitude
+        )  # [ft/s]
+        u_de_vd = np.select(
+            [low_altitude, high_altitude], [25.0, 12.5], 33.4 - 0.000417 * altitude
+        )  # [ft/s]
+        u_de_vmg = np.select(
+            [low_altitude, high_altitude], [66.0, 38.0], 84.7 - 0.000933 * altitude
+        )  # [ft/s]
 
         # Let us define aeroplane mass ratio formula and alleviation factor formula
         def mu_g(x):
-            return (2.0 * mass * g / wing_area) / (
-                atm.density * mean_chord * x * g
-            )  # [x = cl_alpha]
+            return (2.0 * mass * g / wing_area) / (density * mean_chord * x * g)  # [x = cl_alpha]
 
         def k_g(x):
             return (0.88 * x) / (5.3 + x)  # [x = mu_g]
 
         # Now, define the gust function
         def load_factor_gust_p(u_de_v, x):
-            return float(
-                1.0
-                + k_g(mu_g(cl_alpha_fct(x)))
-                * atm_0.density
-                * u_de_v
-                * self.ft_to_m
-                * x
-                * cl_alpha_fct(x)
-                / (2.0 * weight_lbf / wing_area_sft * self.lbf_to_N / self.ft_to_m ** 2)
-            )
+            return 1.0 + k_g(mu_g(cl_alpha_fct(x))) * atm_0.density * u_de_v * self.ft_to_m * x * (
+                cl_alpha_fct(x)
+            ) / (2.0 * weight_lbf / wing_area_sft * self.lbf_to_N / self.ft_to_m ** 2)
 
         def load_factor_gust_n(u_de_v, x):
-            return float(
-                1
-                - k_g(mu_g(cl_alpha_fct(x)))
-                * atm_0.density
-                * u_de_v
-                * self.ft_to_m
-                * x
-                * cl_alpha_fct(x)
-                / (2.0 * weight_lbf / wing_area_sft * self.lbf_to_N / self.ft_to_m ** 2)
-            )
+            return 1.0 - k_g(mu_g(cl_alpha_fct(x))) * atm_0.density * u_de_v * self.ft_to_m * x * (
+                cl_alpha_fct(x)
+            ) / (2.0 * weight_lbf / wing_area_sft * self.lbf_to_N / self.ft_to_m ** 2)
 
         def load_factor_stall_p(x):
             return (x / vs_1g_ps) ** 2.0
@@ -433,47 +468,34 @@ class ComputeVN(om.ExplicitComponent):
         # https://www.easa.europa.eu/sites/default/files/dfu/CS-23%20Amendment%204.pdf
         # https://www.astm.org/Standards/F3116.htm
 
-        vma_ps = vs_1g_ps * np.sqrt(n_lim_ps)  # [m/s]
-        vma_ng = vs_1g_ng * np.sqrt(abs(n_lim_ng))  # [m/s]
-        velocity_array.append(float(vma_ps))
-        velocity_array.append(float(vma_ng))
+        vma_ps_maneuver = vs_1g_ps * np.sqrt(n_lim_ps)  # [m/s]
+        vma_ng_maneuver = vs_1g_ng * np.sqrt(abs(n_lim_ng))  # [m/s]
 
         # We now need to check if we are in the aforementioned case (usually happens for low
-        # design wing loading aircraft and/or mission wing loading)
+        # design wing loading aircraft and/or mission wing loading). In case the gust line load
+        # factor is above the maneuvering load factor, we need to solve the difference between
+        # both curve to be 0.0 to find intersect, beyond the traditional maneuvering speed. The
+        # intersection is computed for all domains and only kept where it is needed.
 
-        n_ma_ps = load_factor_gust_p(u_de_vc, vma_ps)
+        gust_above_ps = load_factor_gust_p(u_de_vc, vma_ps_maneuver) > n_lim_ps
 
-        if n_ma_ps > n_lim_ps:
-            # In case the gust line load factor is above the maneuvering load factor, we need to
-            # solve the difference between both curve to be 0.0 to find intersect
-            def delta_maneuver_pos(x):
-                return load_factor_gust_p(u_de_vc, x) - load_factor_stall_p(x)
+        def delta_maneuver_pos(x):
+            return load_factor_gust_p(u_de_vc, x) - load_factor_stall_p(x)
 
-            vma_ps = max(optimize.fsolve(delta_maneuver_pos, np.array(1000.0)))
-            n_ma_ps = load_factor_gust_p(u_de_vc, vma_ps)  # [-]
-            velocity_array.append(float(vma_ps))
-            load_factor_array.append(float(n_ma_ps))
-        else:
-            velocity_array.append(0.0)
-            load_factor_array.append(0.0)
+        vma_ps_gust = vectorized_bisection(delta_maneuver_pos, vma_ps_maneuver, gust_above_ps)
+        vma_ps = np.where(gust_above_ps, vma_ps_gust, vma_ps_maneuver)
+        n_ma_ps = np.where(gust_above_ps, load_factor_gust_p(u_de_vc, vma_ps), 0.0)  # [-]
 
         # We now need to do the same thing for the negative maneuvering speed
 
-        n_ma_ng = load_factor_gust_n(u_de_vc, vma_ng)  # [-]
+        gust_under_ng = load_factor_gust_n(u_de_vc, vma_ng_maneuver) < n_lim_ng
 
-        if n_ma_ng < n_lim_ng:
-            # In case the gust line load factor is above the maneuvering load factor, we need to
-            # solve the difference between both curve to be 0.0 to find intersect
-            def delta_maneuver_neg(x):
-                return load_factor_gust_n(u_de_vc, x) - load_factor_stall_n(x)
+        def delta_maneuver_neg(x):
+            return load_factor_gust_n(u_de_vc, x) - load_factor_stall_n(x)
 
-            vma_ng = max(optimize.fsolve(delta_maneuver_neg, np.array(1000.0)))
-            n_ma_ng = load_factor_gust_n(u_de_vc, vma_ng)  # [-]
-            velocity_array.append(float(vma_ng))
-            load_factor_array.append(float(n_ma_ng))
-        else:
-            velocity_array.append(0.0)
-            load_factor_array.append(0.0)
+        vma_ng_gust = vectorized_bisection(delta_maneuver_neg, vma_ng_maneuver, gust_under_ng)
+        vma_ng = np.where(gust_under_ng, vma_ng_gust, vma_ng_maneuver)
+        n_ma_ng = np.where(gust_under_ng, load_factor_gust_n(u_de_vc, vma_ng), 0.0)  # [-]
 
         # For the cruise velocity, things will be different since it is an entry choice. As such
         # we will simply check that it complies with the values given in the certification papers
@@ -506,31 +528,24 @@ class ComputeVN(om.ExplicitComponent):
         # This second constraint rather refers to the paragraph on maneuvering speeds,
         # which needs to be chosen so that they are smaller than cruising speeds
         vc_min_2 = vma_ps  # [m/s]
-        vc_min = max(vc_min_1, vc_min_2)  # [m/s]
+        vc_min = np.maximum(vc_min_1, vc_min_2)  # [m/s]
 
         # The certifications specifies that Vc need not be more than 0.9 Vh so we will simply
         # take the minimum value between the Vc_min and this value
 
-        vc_min_fin = min(vc_min, 0.9 * vh)  # [m/s]
+        vc_min_fin = np.minimum(vc_min, 0.9 * vh)  # [m/s]
 
         # The constraint regarding the maximum velocity for cruise does not appear in the
         # certifications but from a physics point of view we can easily infer that the cruise
         # speed will never be greater than the maximum level velocity at sea level hence
 
-        vc = max(min(design_vc, vh), vc_min_fin)  # [m/s]
-        velocity_array.append(float(vc))
-        load_factor_array.append(float(n_lim_ng))
+        vc = np.maximum(min(design_vc, vh), vc_min_fin)  # [m/s]
 
         # Lets now look at the load factors associated with the Vc, since it is here that the
         # greatest load factors can appear
 
-        n_vc_ps = max(load_factor_gust_p(u_de_vc, vc), n_lim_ps)  # [-]
-        n_vc_ng = min(load_factor_gust_n(u_de_vc, vc), n_lim_ng)  # [-]
-
-        velocity_array.append(float(vc))
-        load_factor_array.append(float(n_vc_ps))
-        velocity_array.append(float(vc))
-        load_factor_array.append(float(n_vc_ng))
+        n_vc_ps = np.maximum(load_factor_gust_p(u_de_vc, vc), n_lim_ps)  # [-]
+        n_vc_ng = np.minimum(load_factor_gust_n(u_de_vc, vc), n_lim_ng)  # [-]
 
         # We now compute the diving speed, methods are described in CS 23.335 (b). We will take
         # the minimum diving speed allowable as our design diving speed. We need to keep in mind
@@ -569,12 +584,7 @@ class ComputeVN(om.ExplicitComponent):
                 k_d = 1.35
 
         vd_min_2 = k_d * vc_min_fin  # [m/s]
-        vd = max(vd_min_1, vd_min_2)  # [m/s]
-
-        velocity_array.append(float(vd))
-        load_factor_array.append(float(n_lim_ps))
-        velocity_array.append(float(vd))
-        load_factor_array.append(0.0)
+        vd = np.maximum(vd_min_1, vd_min_2)  # [m/s]
 
         # Similarly to what was done for the design cruising speed we will explore the load
         # factors associated with the diving speed since gusts are likely to broaden the flight
@@ -593,11 +603,6 @@ class ComputeVN(om.ExplicitComponent):
 
         n_vd_ng = load_factor_gust_n(u_de_vd, vd)  # [-]
 
-        velocity_array.append(float(vd))
-        load_factor_array.append(float(n_vd_ps))
-        velocity_array.append(float(vd))
-        load_factor_array.append(float(n_vd_ng))
-
         # We have now calculated all the velocities need to plot the flight domain. For the sake
         # of thoroughness we will also compute the maximal structural cruising speed and cruise
         # never-exceed speed. The computation for these two can be found in CS 23.1505
@@ -616,19 +621,13 @@ class ComputeVN(om.ExplicitComponent):
 
         v_ne = 0.9 * vd  # [m/s]
 
-        velocity_array.append(float(v_ne))
-        load_factor_array.append(0.0)
-
         v_no_min = vc_min  # [m/s]
-        v_no_max = min(vc, 0.89 * v_ne)  # [m/s]
+        v_no_max = np.minimum(vc, 0.89 * v_ne)  # [m/s]
 
         # Again we need to make a choice for this speed : what value would be retained. We will
         # take the highest speed acceptable for certification, i.e
 
-        v_no = max(v_no_min, v_no_max)  # [m/s]
-
-        velocity_array.append(float(v_no))
-        load_factor_array.append(0.0)
+        v_no = np.maximum(v_no_min, v_no_max)  # [m/s]
 
         # One additional velocity needs to be computed if we are talking about commuter aircraft.
         # It is the maximum gust intensity velocity. Due to the way we are returning the values,
@@ -650,33 +649,31 @@ class ComputeVN(om.ExplicitComponent):
             # We first need to compute the intersection of the stall line with the gust line
             # given by the gust of maximum intensity. Similar calculation were already done in
             # case the maneuvering speed is dictated by the Vc gust line so the computation will
-            # be very similar
+            # be very similar. The gust line is above the stall line at the 1g stall speed.
             def delta_max_gust_pos(x):
                 return load_factor_gust_p(u_de_vmg, x) - load_factor_stall_p(x)
 
-            vmg_min_1 = max(optimize.fsolve(delta_max_gust_pos, np.array(1000.0)))
+            vmg_min_1 = vectorized_bisection(
+                delta_max_gust_pos, vs_1g_ps, np.full(np.shape(mass), True)
+            )
 
             # The second candidate for the Vmg is given by the stall speed and the load factor at
             # the cruise speed
             vmg_min_2 = vs_1g_ps * np.sqrt(load_factor_gust_p(u_de_vc, vc))  # [m/s]
-            vmg = min([vmg_min_1, vmg_min_2])  # [m/s]
+            vmg = np.minimum(vmg_min_1, vmg_min_2)  # [m/s]
 
             # As for the computation of the associated load factor, no source were found for any
             # formula or hint as to its computation. It can however be guessed that depending on
             # the minimum value found above, it will either be on the stall line or at the
             # maximum design load factor
 
-            if vmg == vmg_min_1:  # On the gust line
-                n_vmg = load_factor_gust_p(u_de_vmg, vmg_min_1)  # [-]
-            else:
-                n_vmg = n_vc_ps  # [-]
+            n_vmg = np.where(
+                vmg == vmg_min_1, load_factor_gust_p(u_de_vmg, vmg_min_1), n_vc_ps
+            )  # [-]
 
         else:
-            vmg = 0.0  # [m/s]
-            n_vmg = 0.0
-
-        velocity_array.append(float(vmg))
-        load_factor_array.append(float(n_vmg))
+            vmg = zeros  # [m/s]
+            n_vmg = zeros
 
         # Let us now look at the flight domain in the flap extended configuration. For the
         # computation of these speeds and load factors, we will use the formula provided in CS
@@ -695,12 +692,9 @@ class ComputeVN(om.ExplicitComponent):
         )  # [m/s]
         vfe_min_1 = 1.4 * vs_1g_ps  # [m/s]
         vfe_min_2 = 1.8 * vs_fe_1g_ps  # [m/s]
-        vfe_min = max(vfe_min_1, vfe_min_2)  # [m/s]
+        vfe_min = np.maximum(vfe_min_1, vfe_min_2)  # [m/s]
         vfe = vfe_min  # [m/s]
 
-        velocity_array.append(float(vs_fe_1g_ps))
-        load_factor_array.append(1.0)
-
         # We can then move on to the computation of the load limitation of the flapped flight
         # domain, which must be equal to either a constant load factor of 2 or a load factor
         # dictated by a gust of 25 fps. Also since the use of flaps is limited to take-off,
@@ -708,16 +702,101 @@ class ComputeVN(om.ExplicitComponent):
 
         u_de_fe = 25.0  # [ft/s]
         n_lim_ps_fe = 2.0
-        n_vfe = max(n_lim_ps_fe, load_factor_gust_n(u_de_fe, vfe))
+        n_vfe = np.maximum(n_lim_ps_fe, load_factor_gust_n(u_de_fe, vfe))
+
+        velocity_array = np.stack(
+            (
+                vs_1g_ps,
+                vs_1g_ng,
+                vma_ps_maneuver,
+                vma_ng_maneuver,
+                np.where(gust_above_ps, vma_ps, 0.0),
+                np.where(gust_under_ng, vma_ng, 0.0),
+                vc,
+                vc,
+                vc,
+                vd,
+                vd,
+                vd,
+                vd,
+                v_ne,
+                v_no,
+                vmg,
+                vs_fe_1g_ps,
+                vs_fe_1g_ps * np.sqrt(n_vfe),
+                vfe,
+            ),
+            axis=1,
+        )
+        load_factor_array = np.stack(
+            (
+                zeros + 1.0,
+                zeros - 1.0,
+                zeros + n_lim_ps,
+                zeros + n_lim_ng,
+                n_ma_ps,
+                n_ma_ng,
+                zeros + n_lim_ng,
+                n_vc_ps,
+                n_vc_ng,
+                zeros + n_lim_ps,
+                zeros,
+                n_vd_ps,
+                n_vd_ng,
+                zeros,
+                zeros,
+                n_vmg,
+                zeros + 1.0,
+                n_vfe,
+                n_vfe,
+            ),
+            axis=1,
+        )
 
-        velocity_array.append(float(vs_fe_1g_ps * np.sqrt(n_vfe)))
-        load_factor_array.append(float(n_vfe))
-        velocity_array.append(float(vfe))
-        load_factor_array.append(float(n_vfe))
+        return velocity_array, load_factor_array
 
-        # We also store the conditions in which the values were computed so that we can easily
-        # access them when drawing the flight domains
 
-        conditions = [mass, altitude]
+def vectorized_bisection(function, lower_bound, active, max_iterations=100, rtol=1e-12):
+    """
+    Finds, for several independent problems at once, the first root of a function above a lower
+    bound, by doubling an upper bound until the sign of the function changes and then
+    bisecting the bracket.
+
+    @param function: the function whose roots are searched, takes and returns arrays of the
+    same shape as the lower bound, each element being an independent problem
+    @param lower_bound: the lower bound of the search for each problem
+    @param active: an array of boolean telling which problems are to be solved, the result of
+    the other ones is the lower bound
+    @param max_iterations: the maximum number of iterations for the bracketing and the bisection
+    @param rtol: the relative tolerance on the root
+    @return root: the roots of the function
+    """
 
-        return velocity_array, load_factor_array, conditions
+    lower = np.array(lower_bound, dtype=float)
+    active = np.array(active, dtype=bool)
+    if not np.any(active):
+        return lower
+
+    sign_lower = np.sign(function(lower))
+
+    # Bracket the root by doubling the upper bound
+    upper = 2.0 * lower
+    for _ in range(max_iterations):
+        not_bracketed = active & (np.sign(function(upper)) == sign_lower)
+        if not np.any(not_bracketed):
+            break
+        lower = np.where(not_bracketed, upper, lower)
+        upper = np.where(not_bracketed, 2.0 * upper, upper)
+    else:
+        _LOGGER.warning("Could not bracket the intersection of the gust and stall lines")
+
+    # Bisect the bracket
+    for _ in range(max_iterations):
+        middle = 0.5 * (lower + upper)
+        same_sign = np.sign(function(middle)) == sign_lower
+        lower = np.where(active & same_sign, middle, lower)
+        upper = np.where(active & np.logical_not(same_sign), middle, upper)
+        if np.all(upper[active] - lower[active] <= rtol * upper[active]):
+            break
+
+    return np.where(active, 0.5 * (lower + upper), lower_bound)
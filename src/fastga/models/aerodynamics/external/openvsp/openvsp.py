@@ -18,7 +18,6 @@ import warnings
 from importlib.resources import path
 
 import numpy as np
-import pandas as pd
 
 # noinspection PyProtectedMember
 from fastoad._utils.resource_management.copy import copy_resource, copy_resource_folder
@@ -32,6 +31,7 @@ from fastga.command.api import _create_tmp_directory
 from fastga.utils.resource_management.copy import copy_resource_from_path
 from . import openvsp3201
 from . import resources as local_resources
+from ..result_store import AeroResultStore
 from ... import airfoil_folder
 from ...constants import SPAN_MESH_POINT, MACH_NB_PTS
 
@@ -200,26 +200,18 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
             decimals=6,
         )
 
-        # Search if results already exist:
+        # Search if results already exist, the area ratio is not part of the key since results
+        # can be adapted to a new area ratio:
         result_folder_path = self.options["result_folder_path"]
-        result_file_path = None
-        saved_area_ratio = 1.0
+        result_store = None
+        saved_results = None
         if result_folder_path != "":
-            result_file_path, saved_area_ratio = self.search_results(
-                result_folder_path, geometry_set
-            )
+            # Create result store first (if it must fail, let it fail as soon as possible)
+            result_store = AeroResultStore(result_folder_path, "openvsp")
+            saved_results = result_store.get(geometry_set[0:-1])
 
         # If no result saved for that geometry under this mach condition, computation is done
-        if result_file_path is None:
-
-            # Create result folder first (if it must fail, let it fail as soon as possible)
-            if result_folder_path != "":
-                if not os.path.exists(result_folder_path):
-                    os.makedirs(pth.join(result_folder_path), exist_ok=True)
-
-            # Save the geometry (result_file_path is None entering the function)
-            if self.options["result_folder_path"] != "":
-                result_file_path = self.save_geometry(result_folder_path, geometry_set)
+        if saved_results is None:
 
             # Compute wing alone @ 0°/X° angle of attack
             wing_0 = self.compute_wing(inputs, outputs, altitude, mach, 0.0)
@@ -292,59 +284,54 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
                 cl_vector_htp.extend(additional_zeros)
 
             # Save results to defined path ---------------------------------------------------------
-            if self.options["result_folder_path"] != "":
-                results = [
-                    cl_0_wing,
-                    cl_x_wing,
-                    cl_alpha_wing,
-                    cm_0_wing,
-                    y_vector_wing,
-                    cl_vector_wing,
-                    chord_vector_wing,
-                    coeff_k_wing,
-                    cl_0_htp,
-                    cl_aoa_htp,
-                    cl_alpha_htp,
-                    cl_alpha_htp_isolated,
-                    y_vector_htp,
-                    cl_vector_htp,
-                    coeff_k_htp,
-                    s_ref_wing,
-                ]
-                self.save_results(result_file_path, results)
+            if result_store is not None:
+                results = {
+                    "cl_0_wing": cl_0_wing,
+                    "cl_X_wing": cl_x_wing,
+                    "cl_alpha_wing": cl_alpha_wing,
+                    "cm_0_wing": cm_0_wing,
+                    "y_vector_wing": y_vector_wing,
+                    "cl_vector_wing": cl_vector_wing,
+                    "chord_vector_wing": chord_vector_wing,
+                    "coeff_k_wing": coeff_k_wing,
+                    "cl_0_htp": cl_0_htp,
+                    "cl_X_htp": cl_aoa_htp,
+                    "cl_alpha_htp": cl_alpha_htp,
+                    "cl_alpha_htp_isolated": cl_alpha_htp_isolated,
+                    "y_vector_htp": y_vector_htp,
+                    "cl_vector_htp": cl_vector_htp,
+                    "coeff_k_htp": coeff_k_htp,
+                    "saved_ref_area": s_ref_wing,
+                    "area_ratio": geometry_set[-1],
+                }
+                result_store.put(geometry_set[0:-1], results)
 
         # Else retrieved results are used, eventually adapted with new area ratio
         else:
-            # Read values from result file ---------------------------------------------------------
-            data = self.read_results(result_file_path)
-            saved_area_wing = float(data.loc["saved_ref_area", 0])
-            cl_0_wing = float(data.loc["cl_0_wing", 0])
-            cl_x_wing = float(data.loc["cl_X_wing", 0])
-            cl_alpha_wing = float(data.loc["cl_alpha_wing", 0])
-            cm_0_wing = float(data.loc["cm_0_wing", 0])
-            y_vector_wing = np.array(
-                [float(i) for i in data.loc["y_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(s_ref_wing / saved_area_wing)
-            cl_vector_wing = np.array(
-                [float(i) for i in data.loc["cl_vector_wing", 0][1:-2].split(",")]
+            # Read values from result store --------------------------------------------------------
+            saved_area_wing = float(saved_results["saved_ref_area"])
+            saved_area_ratio = float(saved_results["area_ratio"])
+            cl_0_wing = float(saved_results["cl_0_wing"])
+            cl_x_wing = float(saved_results["cl_X_wing"])
+            cl_alpha_wing = float(saved_results["cl_alpha_wing"])
+            cm_0_wing = float(saved_results["cm_0_wing"])
+            y_vector_wing = saved_results["y_vector_wing"] * np.sqrt(s_ref_wing / saved_area_wing)
+            cl_vector_wing = np.array(saved_results["cl_vector_wing"])
+            chord_vector_wing = saved_results["chord_vector_wing"] * np.sqrt(
+                s_ref_wing / saved_area_wing
             )
-            chord_vector_wing = np.array(
-                [float(i) for i in data.loc["chord_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(s_ref_wing / saved_area_wing)
-            coeff_k_wing = float(data.loc["coeff_k_wing", 0])
-            cl_0_htp = float(data.loc["cl_0_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_aoa_htp = float(data.loc["cl_X_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp = float(data.loc["cl_alpha_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp_isolated = float(data.loc["cl_alpha_htp_isolated", 0]) * (
+            coeff_k_wing = float(saved_results["coeff_k_wing"])
+            cl_0_htp = float(saved_results["cl_0_htp"]) * (area_ratio / saved_area_ratio)
+            cl_aoa_htp = float(saved_results["cl_X_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp = float(saved_results["cl_alpha_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp_isolated = float(saved_results["cl_alpha_htp_isolated"]) * (
                 area_ratio / saved_area_ratio
             )
-            y_vector_htp = np.array(
-                [float(i) for i in data.loc["y_vector_htp", 0][1:-2].split(",")]
+            y_vector_htp = np.array(saved_results["y_vector_htp"])
+            cl_vector_htp = np.array(saved_results["cl_vector_htp"]) * (
+                area_ratio / saved_area_ratio
             )
-            cl_vector_htp = np.array(
-                [float(i) for i in data.loc["cl_vector_htp", 0][1:-2].split(",")]
-            ) * (area_ratio / saved_area_ratio)
-            coeff_k_htp = float(data.loc["coeff_k_htp", 0]) * (area_ratio / saved_area_ratio)
+            coeff_k_htp = float(saved_results["coeff_k_htp"]) * (area_ratio / saved_area_ratio)
 
         return (
             cl_0_wing,
@@ -1150,114 +1137,6 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         }
         return wing, htp, aircraft
 
-    @staticmethod
-    def search_results(result_folder_path, geometry_set):
-        """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "dihedral_angle_wing",
-                "twist_angle_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "mach",
-                "area_ratio",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if (
-                                np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy())
-                                == len(geometry_set_labels) - 1
-                            ):
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if (
-                                    np.sum(saved_set == geometry_set[0:-1])
-                                    == len(geometry_set_labels) - 1
-                                ):
-                                    result_file_path = pth.join(
-                                        result_folder_path, "openvsp_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio = data.loc["area_ratio", 0]
-                                    return result_file_path, saved_area_ratio
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0
-
-    @staticmethod
-    def save_geometry(result_folder_path, geometry_set):
-        """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "dihedral_angle_wing",
-            "twist_angle_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "mach",
-            "area_ratio",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")
-
-        return result_file_path
-
-    @staticmethod
-    def save_results(result_file_path, results):
-        """Reads saved results."""
-        labels = [
-            "cl_0_wing",
-            "cl_X_wing",
-            "cl_alpha_wing",
-            "cm_0_wing",
-            "y_vector_wing",
-            "cl_vector_wing",
-            "chord_vector_wing",
-            "coeff_k_wing",
-            "cl_0_htp",
-            "cl_X_htp",
-            "cl_alpha_htp",
-            "cl_alpha_htp_isolated",
-            "y_vector_htp",
-            "cl_vector_htp",
-            "coeff_k_htp",
-            "saved_ref_area",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
-
-    @staticmethod
-    def read_results(result_file_path):
-
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
-
-        return pd.DataFrame(values, index=labels)
-
 
 class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
     """Execution of OpenVSP for surfaces with slipstream effects."""
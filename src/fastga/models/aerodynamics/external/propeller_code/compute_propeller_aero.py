@@ -23,12 +23,14 @@ from fastoad.module_management.constants import ModelDomain
 
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
 
-from .propeller_core import PropellerCoreModule
+from .propeller_core import GEOMETRY_INPUTS, PropellerCoreModule
+from ..result_store import AeroResultStore
 
 _LOGGER = logging.getLogger(__name__)
 
 THRUST_PTS_NB = 30
 SPEED_PTS_NB = 10
+THETA_PTS_NB = 100
 
 
 @oad.RegisterOpenMDAOSystem("fastga.aerodynamics.propeller", domain=ModelDomain.AERODYNAMICS)
@@ -49,6 +51,8 @@ class ComputePropellerPerformance(om.Group):
             types=list,
         )
         self.options.declare("elements_number", default=20, types=int)
+        self.options.declare("workers_number", default=1, types=int, lower=1)
+        self.options.declare("result_folder_path", default="", types=str)
 
     def setup(self):
         ivc = om.IndepVarComp()
@@ -80,6 +84,8 @@ class ComputePropellerPerformance(om.Group):
                 sections_profile_position_list=self.options["sections_profile_position_list"],
                 sections_profile_name_list=self.options["sections_profile_name_list"],
                 elements_number=self.options["elements_number"],
+                workers_number=self.options["workers_number"],
+                result_folder_path=self.options["result_folder_path"],
             ),
             promotes_inputs=["data:*"],
             promotes_outputs=["*"],
@@ -100,6 +106,10 @@ class ComputePropellerPerformance(om.Group):
 
 
 class _ComputePropellerPerformance(PropellerCoreModule):
+    def initialize(self):
+        super().initialize()
+        self.options.declare("result_folder_path", default="", types=str)
+
     def setup(self):
 
         super().setup()
@@ -145,38 +155,80 @@ class _ComputePropellerPerformance(PropellerCoreModule):
         v_max = inputs["data:TLAR:v_cruise"] * 1.2
         speed_interp = np.linspace(v_min, v_max, SPEED_PTS_NB)
 
-        # Construct table for init of climb
-        altitude = 0.0
-        thrust_vect, _, eta_vect = self.construct_table(inputs, speed_interp, altitude, omega)
-
-        # Reformat table
-        thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(thrust_vect, eta_vect)
+        # Tables are constructed at sea level for init of climb and at cruise altitude
+        altitudes = {
+            "sea_level": 0.0,
+            "cruise_level": inputs["data:mission:sizing:main_route:cruise:altitude"],
+        }
+
+        # Search if the tables have already been computed for the same propeller and conditions
+        result_folder_path = self.options["result_folder_path"]
+        result_store = None
+        saved_results = None
+        if result_folder_path != "":
+            result_store = AeroResultStore(result_folder_path, "propeller")
+            key_values = self.compute_key(inputs, speed_interp, list(altitudes.values()), omega)
+            saved_results = result_store.get(key_values)
+
+        if saved_results is None:
+            results = {}
+            for level, altitude in altitudes.items():
+                # theta_vect can be obtained with construct table, it is the second input, not
+                # used as of now
+                thrust_vect, _, eta_vect = self.construct_table(
+                    inputs, speed_interp, altitude, omega
+                )
 
-        # Save results
-        outputs["data:aerodynamics:propeller:sea_level:efficiency"] = efficiency_interp
-        outputs["data:aerodynamics:propeller:sea_level:thrust"] = thrust_interp
-        outputs["data:aerodynamics:propeller:sea_level:thrust_limit"] = thrust_limit
-        outputs["data:aerodynamics:propeller:sea_level:speed"] = speed_interp
+                # Reformat table
+                thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(
+                    thrust_vect, eta_vect
+                )
+                results[level + ":efficiency"] = efficiency_interp
+                results[level + ":thrust"] = thrust_interp
+                results[level + ":thrust_limit"] = thrust_limit
 
-        # construct table for cruise
-        altitude = inputs["data:mission:sizing:main_route:cruise:altitude"]
-        # theta_vect can be obtained with construct table, it is the second input, not used as of
-        # now
-        thrust_vect, _, eta_vect = self.construct_table(inputs, speed_interp, altitude, omega)
-        # Reformat table
-        thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(thrust_vect, eta_vect)
+            if result_store is not None:
+                result_store.put(key_values, results)
+        else:
+            results = saved_results
 
         _LOGGER.debug("Finishing propeller computation")
 
         # Save results
-        outputs["data:aerodynamics:propeller:cruise_level:efficiency"] = efficiency_interp
-        outputs["data:aerodynamics:propeller:cruise_level:thrust"] = thrust_interp
-        outputs["data:aerodynamics:propeller:cruise_level:thrust_limit"] = thrust_limit
+        for name, value in results.items():
+            outputs["data:aerodynamics:propeller:" + name] = value
+        outputs["data:aerodynamics:propeller:sea_level:speed"] = speed_interp
         outputs["data:aerodynamics:propeller:cruise_level:speed"] = speed_interp
         outputs["data:aerodynamics:propeller:cruise_level:altitude"] = inputs[
             "data:mission:sizing:main_route:cruise:altitude"
         ]
 
+    def compute_key(self, inputs, speed_interp, altitudes, omega):
+        """
+        Gathers the values on which the propeller tables depend, used to identify them in the
+        result store: the blade geometry, the section polars, the flight speeds, the altitudes
+        and the rotation speed.
+
+        :param inputs: the inputs containing the propeller geometry and the polars.
+        :param speed_interp: the flight speeds of the tables, in m/s.
+        :param altitudes: the altitudes of the tables, in m.
+        :param omega: the propeller rotation speed, in rpm.
+        """
+
+        key_values = [np.ravel(inputs[name]) for name in GEOMETRY_INPUTS]
+        for profile in self.options["sections_profile_name_list"]:
+            for coefficient in ("alpha", "CL", "CD"):
+                key_values.append(np.ravel(inputs[profile + "_polar:" + coefficient]))
+        key_values += [
+            np.ravel(self.options["sections_profile_position_list"]),
+            np.ravel(self.options["elements_number"]),
+            np.ravel(speed_interp),
+            np.hstack(altitudes),
+            np.ravel(omega),
+        ]
+
+        return np.concatenate(key_values)
+
     def construct_table(self, inputs, speed_interp, altitude, omega):
         """
         Computes the propeller characteristics in the given flight conditions for various
@@ -229,19 +281,31 @@ class _ComputePropellerPerformance(PropellerCoreModule):
             cl_list[idx, :] = np.interp(alpha_interp, alpha_element, cl_element)
             cd_list[idx, :] = np.interp(alpha_interp, alpha_element, cd_element)
 
-        for v_inf in speed_interp:
+        # Compute the performances for all the speeds and pitches at once
+        theta_table = np.zeros((len(speed_interp), THETA_PTS_NB))
+        for idx_speed, v_inf in enumerate(speed_interp):
             self.compute_extreme_pitch(inputs, v_inf)
-            theta_interp = np.linspace(self.theta_min, self.theta_max, 100)
-            local_thrust_vect = []
-            local_theta_vect = []
-            local_eta_vect = []
-            for theta_75 in theta_interp:
-                thrust, eta, _ = self.compute_pitch_performance(
-                    inputs, theta_75, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
-                )
-                local_thrust_vect.append(thrust)
-                local_theta_vect.append(theta_75)
-                local_eta_vect.append(eta)
+            theta_table[idx_speed, :] = np.linspace(
+                self.theta_min, self.theta_max, THETA_PTS_NB
+            ).ravel()
+        thrust_table, eta_table, _ = self.compute_pitches_performance(
+            inputs,
+            theta_table.ravel(),
+            np.repeat(np.ravel(speed_interp), THETA_PTS_NB),
+            altitude,
+            omega,
+            radius,
+            alpha_list,
+            cl_list,
+            cd_list,
+        )
+        thrust_table = np.reshape(thrust_table, np.shape(theta_table))
+        eta_table = np.reshape(eta_table, np.shape(theta_table))
+
+        for idx_speed, _ in enumerate(speed_interp):
+            local_thrust_vect = thrust_table[idx_speed, :].tolist()
+            local_theta_vect = theta_table[idx_speed, :].tolist()
+            local_eta_vect = eta_table[idx_speed, :].tolist()
 
             # Find first the "monotone" zone (10 points of increase)
             idx_in_zone = 0
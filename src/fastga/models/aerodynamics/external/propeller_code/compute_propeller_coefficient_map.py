@@ -51,6 +51,7 @@ class ComputePropellerCoefficientMap(om.Group):
             types=list,
         )
         self.options.declare("elements_number", default=20, types=int)
+        self.options.declare("workers_number", default=1, types=int, lower=1)
 
     def setup(self):
         ivc = om.IndepVarComp()
@@ -82,6 +83,7 @@ class ComputePropellerCoefficientMap(om.Group):
                 sections_profile_position_list=self.options["sections_profile_position_list"],
                 sections_profile_name_list=self.options["sections_profile_name_list"],
                 elements_number=self.options["elements_number"],
+                workers_number=self.options["workers_number"],
             ),
             promotes_inputs=["data:*"],
             promotes_outputs=["*"],
@@ -148,10 +150,7 @@ class _ComputePropellerCoefficientMap(PropellerCoreModule):
         atm = Atmosphere(altitude, altitude_in_feet=False)
         v_min = inputs["data:aerodynamics:propeller:coefficient_map:min_speed"]
         v_max = inputs["data:aerodynamics:propeller:coefficient_map:max_speed"]
-        speed_interp = np.linspace(v_min, v_max, J_POINTS_NUMBER)
-        ct_list = np.zeros_like(speed_interp)
-        cp_list = np.zeros_like(speed_interp)
-        j_list = np.zeros_like(speed_interp)
+        speed_interp = np.linspace(v_min, v_max, J_POINTS_NUMBER).ravel()
         theta_75 = inputs["data:aerodynamics:propeller:coefficient_map:twist_75"]
 
         prop_diameter = inputs["data:geometry:propeller:diameter"]
@@ -193,18 +192,13 @@ class _ComputePropellerCoefficientMap(PropellerCoreModule):
             cl_list[idx, :] = np.interp(alpha_interp, alpha_element, cl_element)
             cd_list[idx, :] = np.interp(alpha_interp, alpha_element, cd_element)
 
-        for idx, v_inf in enumerate(speed_interp):
-
-            thrust, eta, _ = self.compute_pitch_performance(
-                inputs, theta_75, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
-            )
-            ct_local = thrust / (atm.density * (omega / 60.00) ** 2.0 * prop_diameter ** 4.0)
-            ct_list[idx] = ct_local
-            shaft_power = thrust * v_inf / eta
-            cp_local = shaft_power / (atm.density * (omega / 60.0) ** 3.0 * prop_diameter ** 5.0)
-            cp_list[idx] = cp_local
-            j_local = v_inf / (omega / 60.0 * prop_diameter)
-            j_list[idx] = j_local
+        thrust, eta, _ = self.compute_pitches_performance(
+            inputs, theta_75, speed_interp, altitude, omega, radius, alpha_list, cl_list, cd_list
+        )
+        ct_list = thrust / (atm.density * (omega / 60.00) ** 2.0 * prop_diameter ** 4.0)
+        shaft_power = thrust * speed_interp / eta
+        cp_list = shaft_power / (atm.density * (omega / 60.0) ** 3.0 * prop_diameter ** 5.0)
+        j_list = speed_interp / (omega / 60.0 * prop_diameter)
 
         _LOGGER.debug("Finishing propeller computation")
 
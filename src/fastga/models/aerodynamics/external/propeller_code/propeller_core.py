@@ -13,6 +13,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from scipy.optimize import root
@@ -27,6 +28,22 @@ _LOGGER = logging.getLogger(__name__)
 
 THRUST_PTS_NB = 30
 SPEED_PTS_NB = 10
+MAX_NEWTON_ITERATIONS = 50
+MAX_STEP_REDUCTIONS = 20
+FD_STEP = 1e-7
+SPEED_TOLERANCE = 1e-8
+
+# Inputs needed to compute the performances of the propeller, sent to the worker processes
+GEOMETRY_INPUTS = [
+    "reference_reynolds",
+    "data:geometry:propeller:diameter",
+    "data:geometry:propeller:hub_diameter",
+    "data:geometry:propeller:blades_number",
+    "data:geometry:propeller:sweep_vect",
+    "data:geometry:propeller:chord_vect",
+    "data:geometry:propeller:twist_vect",
+    "data:geometry:propeller:radius_ratio_vect",
+]
 
 
 class PropellerCoreModule(om.ExplicitComponent):
@@ -46,6 +63,8 @@ class PropellerCoreModule(om.ExplicitComponent):
         self.options.declare("sections_profile_position_list", types=list)
         self.options.declare("sections_profile_name_list", types=list)
         self.options.declare("elements_number", default=20, types=int)
+        # Number of processes on which the points of the propeller performance tables are spread
+        self.options.declare("workers_number", default=1, types=int, lower=1)
 
     def setup(self):
         self.add_input("reference_reynolds", val=1e6)
@@ -126,6 +145,74 @@ class PropellerCoreModule(om.ExplicitComponent):
         :return: thrust [N], eta (efficiency) [-] and power [W].
         """
 
+        thrust, eta, torque = self.compute_pitches_performance(
+            inputs,
+            np.atleast_1d(theta_75).ravel()[:1],
+            v_inf,
+            altitude,
+            omega,
+            radius,
+            alpha_list,
+            cl_list,
+            cd_list,
+        )
+
+        return float(thrust[0]), float(eta[0]), torque[0]
+
+    def compute_pitches_performance(
+        self, inputs, theta_75_vect, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
+    ):
+        """
+        Same as compute_pitch_performance but for arrays of pitches and flight speeds. The BEM vs.
+        disk theory system of equations is solved for all the points at once with a vectorized
+        Newton method, the points that do not converge being solved one by one with scipy. If
+        more than one worker is required, the points are split between worker processes, the
+        points being independent the results are the same as with a single process.
+
+        :param inputs: structure of data relative to the blade geometry available from setup
+        :param theta_75_vect: pitches defined at r = 0.75*R radial position [deg].
+        :param v_inf: flight speeds, either a single value or one per pitch [m/s].
+        :param altitude: flight altitude [m].
+        :param omega: angular velocity of the propeller [RPM].
+        :param radius: array of radius of discretized blade elements [m].
+        :param alpha_list: angle of attack list for aerodynamic coefficient of profile at
+        discretized blade element [deg].
+        :param cl_list: cl list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+        :param cd_list: cd list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+
+        :return: thrust [N], eta (efficiency) [-] and torque [N.m] arrays for each point.
+        """
+
+        theta_75_vect, v_inf_vect = np.broadcast_arrays(np.ravel(theta_75_vect), np.ravel(v_inf))
+        workers_number = min(self.options["workers_number"], len(theta_75_vect))
+
+        if workers_number > 1:
+            geometry_inputs = {name: np.array(inputs[name]) for name in GEOMETRY_INPUTS}
+            with ProcessPoolExecutor(max_workers=workers_number) as executor:
+                futures = [
+                    executor.submit(
+                        _compute_pitches_performance,
+                        self.options["elements_number"],
+                        geometry_inputs,
+                        theta_75_vect[points],
+                        v_inf_vect[points],
+                        altitude,
+                        omega,
+                        radius,
+                        alpha_list,
+                        cl_list,
+                        cd_list,
+                    )
+                    for points in np.array_split(np.arange(len(theta_75_vect)), workers_number)
+                ]
+                results = [future.result() for future in futures]
+
+            thrust, eta, torque = (np.concatenate(result) for result in zip(*results))
+
+            return thrust, eta, torque
+
         blades_number = inputs["data:geometry:propeller:blades_number"]
         radius_min = inputs["data:geometry:propeller:hub_diameter"] / 2.0
         radius_max = inputs["data:geometry:propeller:diameter"] / 2.0
@@ -141,80 +228,184 @@ class PropellerCoreModule(om.ExplicitComponent):
 
         theta_75_ref = np.interp(0.75, radius_ratio_vect, twist_vect)
 
-        # Initialise vectors
-        vi_vect = np.zeros_like(radius)
-        vt_vect = np.zeros_like(radius)
-        thrust_element_vector = np.zeros_like(radius)
-        torque_element_vector = np.zeros_like(radius)
-        alpha_vect = np.zeros_like(radius)
-        speed_vect = np.array([0.1 * float(v_inf), 1.0])
+        # Each line of the arrays corresponds to a point and each column to a blade element
+        v_inf = v_inf_vect[:, np.newaxis]
 
         chord = np.interp(radius / radius_max, radius_ratio_vect, chord_vect)
 
         theta = np.interp(radius / radius_max, radius_ratio_vect, twist_vect) + (
-            theta_75 - theta_75_ref
+            theta_75_vect[:, np.newaxis] - theta_75_ref
         )
         sweep = np.interp(radius / radius_max, radius_ratio_vect, sweep_vect)
 
-        # Loop on element number to compute equations
+        # Solve BEM vs. disk theory system of equations for all the points at once, element by
+        # element since the solution of an element is used as initial guess for the next one
+        speed_vect = np.zeros((2,) + np.shape(theta))
+        element_speed_vect = np.zeros((2, np.shape(theta)[0], 1))
+        element_speed_vect[0, :, :] = 0.1 * v_inf
+        element_speed_vect[1, :, :] = 1.0
+
         for idx, _ in enumerate(radius):
 
-            # Solve BEM vs. disk theory system of equations
-            speed_vect = root(
-                fun=self.delta,
-                x0=speed_vect,
-                args=(
-                    radius[idx],
+            element = slice(idx, idx + 1)
+            initial_speed_vect = element_speed_vect
+            element_speed_vect, converged = self.solve_speeds(
+                initial_speed_vect,
+                (
+                    radius[element],
                     radius_min,
                     radius_max,
-                    chord[idx],
+                    chord[element],
                     blades_number,
-                    sweep[idx],
+                    sweep[element],
                     omega,
                     v_inf,
-                    theta[idx],
-                    alpha_list[idx, :],
-                    cl_list[idx, :],
-                    cd_list[idx, :],
+                    theta[:, element],
+                    alpha_list[element, :],
+                    cl_list[element, :],
+                    cd_list[element, :],
                     atm,
                     reference_reynolds,
                 ),
-                method="hybr",
-                options={"xtol": 1e-3},
-            ).x
-            vi_vect[idx] = speed_vect[0]
-            vt_vect[idx] = speed_vect[1]
-            results = self.bem_theory(
-                speed_vect,
-                radius[idx],
-                chord[idx],
-                blades_number,
-                sweep[idx],
-                omega,
-                v_inf,
-                theta[idx],
-                alpha_list[idx, :],
-                cl_list[idx, :],
-                cd_list[idx, :],
-                atm,
-                reference_reynolds,
             )
-            out_of_polars = results[3]
-            if out_of_polars:
-                thrust_element_vector[idx] = 0.0
-                torque_element_vector[idx] = 0.0
-            else:
-                thrust_element_vector[idx] = results[0] * element_length * atm.density
-                torque_element_vector[idx] = results[1] * element_length * atm.density
-            alpha_vect[idx] = results[2]
-
-        torque = np.sum(torque_element_vector)
-        thrust = float(np.sum(thrust_element_vector))
-        power = float(torque * omega)
-        eta = float(v_inf * thrust / power)
+
+            # Points for which the Newton method failed are solved one by one
+            for idx_point in np.where(np.logical_not(converged[:, 0]))[0]:
+                element_speed_vect[:, idx_point, 0] = root(
+                    fun=self.delta,
+                    x0=initial_speed_vect[:, idx_point, 0],
+                    args=(
+                        radius[idx],
+                        radius_min,
+                        radius_max,
+                        chord[idx],
+                        blades_number,
+                        sweep[idx],
+                        omega,
+                        v_inf_vect[idx_point],
+                        theta[idx_point, idx],
+                        alpha_list[idx, :],
+                        cl_list[idx, :],
+                        cd_list[idx, :],
+                        atm,
+                        reference_reynolds,
+                    ),
+                    method="hybr",
+                    options={"xtol": SPEED_TOLERANCE},
+                ).x
+
+            speed_vect[:, :, element] = element_speed_vect
+
+        results = self.bem_theory(
+            speed_vect,
+            radius,
+            chord,
+            blades_number,
+            sweep,
+            omega,
+            v_inf,
+            theta,
+            alpha_list,
+            cl_list,
+            cd_list,
+            atm,
+            reference_reynolds,
+        )
+        out_of_polars = results[3] > 0.0
+        thrust_element_vector = np.where(
+            out_of_polars, 0.0, results[0] * element_length * atm.density
+        )
+        torque_element_vector = np.where(
+            out_of_polars, 0.0, results[1] * element_length * atm.density
+        )
+
+        torque = np.sum(torque_element_vector, axis=1)
+        thrust = np.sum(thrust_element_vector, axis=1)
+        power = torque * omega
+        eta = v_inf_vect * thrust / power
 
         return thrust, eta, torque
 
+    def solve_speeds(self, speed_vect: np.ndarray, args: tuple, x_tol: float = SPEED_TOLERANCE):
+        """
+        Solves the BEM vs. disk theory system of equations for all the points given in args at
+        once, using a Newton method with a finite difference jacobian and a step reduction. The
+        iterations are stopped independently for each point once it has converged.
+
+        :param speed_vect: initial axial and tangential induced speeds, the first dimension
+        being the speed type [m/s].
+        :param args: other arguments of the delta function.
+        :param x_tol: relative tolerance on the induced speeds.
+
+        :return: the induced speeds and a boolean array indicating which points converged.
+        """
+
+        speed_vect = np.array(speed_vect, dtype=float)
+        residuals = self.delta(speed_vect, *args)
+        converged = np.zeros(np.shape(speed_vect)[1:], dtype=bool)
+        failed = np.zeros_like(converged)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for _ in range(MAX_NEWTON_ITERATIONS):
+
+                active = np.logical_not(np.logical_or(converged, failed))
+                if not np.any(active):
+                    break
+
+                # Finite difference jacobian, jacobian[i, j] is the derivative of residual i with
+                # respect to speed j
+                jacobian = np.zeros((2,) + np.shape(speed_vect))
+                for j in range(2):
+                    step = FD_STEP * np.maximum(1.0, np.abs(speed_vect[j]))
+                    perturbed_speed_vect = np.copy(speed_vect)
+                    perturbed_speed_vect[j] += step
+                    jacobian[:, j] = (self.delta(perturbed_speed_vect, *args) - residuals) / step
+
+                determinant = jacobian[0, 0] * jacobian[1, 1] - jacobian[0, 1] * jacobian[1, 0]
+                newton_step = (
+                    -np.array(
+                        [
+                            jacobian[1, 1] * residuals[0] - jacobian[0, 1] * residuals[1],
+                            jacobian[0, 0] * residuals[1] - jacobian[1, 0] * residuals[0],
+                        ]
+                    )
+                    / determinant
+                )
+
+                # Elements with a singular jacobian are left to the scalar solver
+                singular = np.logical_not(np.all(np.isfinite(newton_step), axis=0))
+                failed = np.logical_or(failed, np.logical_and(active, singular))
+                active = np.logical_and(active, np.logical_not(singular))
+
+                small_step = np.all(
+                    np.abs(newton_step) <= x_tol * (np.abs(speed_vect) + x_tol), axis=0
+                )
+                converged = np.logical_or(converged, np.logical_and(active, small_step))
+                active = np.logical_and(active, np.logical_not(small_step))
+                newton_step[:, np.logical_not(active)] = 0.0
+
+                # Reduce the step until the residuals decrease
+                residuals_norm = np.sum(residuals ** 2.0, axis=0)
+                relaxation = np.ones_like(residuals_norm)
+                accepted = np.logical_not(active)
+                for _ in range(MAX_STEP_REDUCTIONS):
+                    trial_speed_vect = speed_vect + relaxation * newton_step
+                    trial_residuals = self.delta(trial_speed_vect, *args)
+                    decrease = np.logical_and(
+                        np.logical_not(accepted),
+                        np.sum(trial_residuals ** 2.0, axis=0) < residuals_norm,
+                    )
+                    speed_vect[:, decrease] = trial_speed_vect[:, decrease]
+                    residuals[:, decrease] = trial_residuals[:, decrease]
+                    accepted = np.logical_or(accepted, decrease)
+                    if np.all(accepted):
+                        break
+                    relaxation = np.where(accepted, relaxation, relaxation / 2.0)
+
+                failed = np.logical_or(failed, np.logical_not(accepted))
+
+        return speed_vect, converged
+
     @staticmethod
     def bem_theory(
         speed_vect: np.array,
@@ -234,7 +425,8 @@ class PropellerCoreModule(om.ExplicitComponent):
         """
         The core of the Propeller code. Given the geometry of a propeller element,
         its aerodynamic polars, flight conditions and axial/tangential velocities it computes the
-        thrust and the torque produced using force and momentum with BEM theory.
+        thrust and the torque produced using force and momentum with BEM theory. Also works on
+        arrays of elements, in which case the polars are given as one line per element.
 
         :param speed_vect: the vector of axial and tangential induced speed in m/s
         :param radius: radius position of the element center  [m]
@@ -269,19 +461,25 @@ class PropellerCoreModule(om.ExplicitComponent):
         mach_local = atm.mach
 
         # Apply the compressibility corrections for cl and cd
-        out_of_polars = bool((alpha > max(alpha_element)) or (alpha < min(alpha_element)))
+        out_of_polars = np.logical_or(
+            alpha > np.max(alpha_element, axis=-1), alpha < np.min(alpha_element, axis=-1)
+        )
 
-        c_l = np.interp(alpha, alpha_element, cl_element)
-        c_d = np.interp(alpha, alpha_element, cd_element)
+        c_l = PropellerCoreModule.interp_polar(alpha, alpha_element, cl_element)
+        c_d = PropellerCoreModule.interp_polar(alpha, alpha_element, cd_element)
 
-        if mach_local < 1:
-            beta = np.sqrt(1 - mach_local ** 2.0)
-            c_l = c_l / (beta + c_l * mach_local ** 2.0 / (2.0 + 2.0 * beta))
-            c_d = c_d / (beta + c_d * mach_local ** 2.0 / (2.0 + 2.0 * beta))
-        else:
-            beta = np.sqrt(mach_local ** 2.0 - 1)
-            c_l = c_l / beta
-            c_d = c_d / beta
+        beta = np.sqrt(np.abs(1 - mach_local ** 2.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c_l = np.where(
+                mach_local < 1,
+                c_l / (beta + c_l * mach_local ** 2.0 / (2.0 + 2.0 * beta)),
+                c_l / beta,
+            )
+            c_d = np.where(
+                mach_local < 1,
+                c_d / (beta + c_d * mach_local ** 2.0 / (2.0 + 2.0 * beta)),
+                c_d / beta,
+            )
 
         reynolds = chord * atm.unitary_reynolds
         f_re = (3.46 * np.log(reynolds) - 5.6) ** -2
@@ -306,11 +504,9 @@ class PropellerCoreModule(om.ExplicitComponent):
         )
 
         # Store results
-        output = np.empty(4)
-        output[0] = thrust_element
-        output[1] = torque_element
-        output[2] = alpha
-        output[3] = out_of_polars
+        output = np.array(
+            np.broadcast_arrays(thrust_element, torque_element, alpha, out_of_polars), dtype=float
+        )
 
         return output
 
@@ -390,9 +586,7 @@ class PropellerCoreModule(om.ExplicitComponent):
         torque_element = 4.0 * np.pi * radius ** 2.0 * (v_inf + v_i) * v_t * f_tip * f_hub
 
         # Store results
-        output = np.empty(2)
-        output[0] = thrust_element
-        output[1] = torque_element
+        output = np.array(np.broadcast_arrays(thrust_element, torque_element), dtype=float)
 
         return output
 
@@ -458,7 +652,34 @@ class PropellerCoreModule(om.ExplicitComponent):
             speed_vect, radius, radius_min, radius_max, blades_number, sweep, omega, v_inf
         )
 
-        return bem_result[0:1] - adt_result
+        return np.reshape(bem_result[0:1] - adt_result, np.shape(speed_vect))
+
+    @staticmethod
+    def interp_polar(alpha, alpha_element, coeff_element):
+        """
+        Equivalent of np.interp for the angles of attack of several blade elements, each element
+        having its own polar.
+
+        :param alpha: angles of attack, the last dimension being the blade element [deg].
+        :param alpha_element: reference angle vector of each element polar, assumed ordered [deg].
+        :param coeff_element: aerodynamic coefficient vector of each element polar [-].
+
+        :return: the interpolated coefficients with the same shape as alpha.
+        """
+
+        alpha_element = np.atleast_2d(alpha_element)
+        coeff_element = np.atleast_2d(coeff_element)
+        alpha_vect = np.broadcast_to(
+            alpha, np.broadcast(np.asarray(alpha), alpha_element[:, 0]).shape
+        )
+
+        coeff = np.zeros(np.shape(alpha_vect))
+        for idx, _ in enumerate(alpha_element):
+            coeff[..., idx] = np.interp(
+                alpha_vect[..., idx], alpha_element[idx, :], coeff_element[idx, :]
+            )
+
+        return np.reshape(coeff, np.shape(alpha))
 
     @staticmethod
     def reshape_polar(alpha, c_l, c_d):
@@ -476,3 +697,14 @@ class PropellerCoreModule(om.ExplicitComponent):
             c_l[idx_start : idx_end + 1],
             c_d[idx_start : idx_end + 1],
         )
+
+
+def _compute_pitches_performance(elements_number, geometry_inputs, *args):
+    """
+    Computes the propeller performances of a subset of points in a worker process, see
+    PropellerCoreModule.compute_pitches_performance.
+    """
+
+    return PropellerCoreModule(elements_number=elements_number).compute_pitches_performance(
+        geometry_inputs, *args
+    )
@@ -0,0 +1,188 @@
+"""Storage of the results of the external aerodynamic codes, shared between processes."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import io
+import os
+import os.path as pth
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+RESULT_STORE_FILE_NAME = "results.sqlite"
+LOCK_TIMEOUT = 120.0  # Maximum time waiting for another process to release a result file, in s
+
+
+class AeroResultStore:
+    """
+    Stores computation results in a single SQLite file. Each entry is indexed by the hash of a set
+    of rounded key values (typically the geometry and the Mach number), so that looking for
+    an already computed case does not depend on the number of cases stored. Scalars and vectors
+    are stored as numpy arrays, so they are retrieved with no loss of precision.
+
+    :param result_folder_path: folder in which the SQLite file is created.
+    :param table_name: name of the table in which the results are stored, allows to share the
+    same file between several codes (e.g. "vlm" and "openvsp").
+    :param decimals: number of decimals to which the key values are rounded before hashing.
+    """
+
+    def __init__(self, result_folder_path: str, table_name: str, decimals: int = 6):
+
+        self.file_path = pth.join(result_folder_path, RESULT_STORE_FILE_NAME)
+        self.table_name = table_name
+        self.decimals = decimals
+
+        os.makedirs(result_folder_path, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS %s (key TEXT PRIMARY KEY, data BLOB NOT NULL)"
+                % self.table_name
+            )
+
+    def get(self, key_values) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Retrieves the results stored for the given key values.
+
+        :param key_values: values identifying the case.
+        :return: a dictionary with the stored arrays, or None if the case has not been computed.
+        """
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT data FROM %s WHERE key = ?" % self.table_name,
+                (self.hash_key(key_values),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        with np.load(io.BytesIO(row[0])) as data:
+            return {name: data[name] for name in data.files}
+
+    def put(self, key_values, results: Dict[str, np.ndarray]):
+        """
+        Stores the results of a case, replacing any previous results with the same key values.
+
+        :param key_values: values identifying the case.
+        :param results: dictionary of scalars or arrays to store.
+        """
+
+        buffer = io.BytesIO()
+        np.savez(buffer, **{name: np.asarray(value) for name, value in results.items()})
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO %s (key, data) VALUES (?, ?)" % self.table_name,
+                (self.hash_key(key_values), sqlite3.Binary(buffer.getvalue())),
+            )
+
+    def hash_key(self, key_values) -> str:
+        """Hash of the key values once rounded to the number of decimals of the store."""
+
+        # Adding 0.0 ensures that -0.0 and 0.0 give the same hash
+        rounded_values = np.around(np.asarray(key_values, dtype=float), self.decimals) + 0.0
+
+        return hashlib.sha256(rounded_values.tobytes()).hexdigest()
+
+    @contextmanager
+    def _connect(self):
+        """Opens a connection to the store, commits the transaction and closes it on exit."""
+
+        # SQLite handles the locking of the file, the timeout allows to wait for another process
+        # writing in the store instead of failing
+        connection = sqlite3.connect(self.file_path, timeout=LOCK_TIMEOUT)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+@contextmanager
+def file_lock(file_path: str, timeout: float = LOCK_TIMEOUT):
+    """
+    Context manager that gives an exclusive access to a file shared between several processes.
+    The lock is held on a separate file in the temporary directory, so that the folder of the
+    locked file does not need to be writable, and is released by the OS if the process dies.
+
+    :param file_path: path of the file to lock.
+    :param timeout: maximum time waiting for the lock, in s.
+    """
+
+    lock_name = hashlib.sha256(pth.abspath(file_path).encode()).hexdigest()[:16] + ".lock"
+    lock_path = pth.join(tempfile.gettempdir(), "fastga_" + lock_name)
+
+    start_time = time.time()
+    with open(lock_path, "a+") as lock_file:
+        while True:
+            try:
+                _lock(lock_file)
+                break
+            except OSError:
+                if time.time() - start_time > timeout:
+                    raise TimeoutError("Unable to lock %s file!" % file_path)
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            _unlock(lock_file)
+
+
+def atomic_to_csv(data: pd.DataFrame, file_path: str):
+    """
+    Writes a DataFrame to a csv file through a temporary file that then replaces the target, so
+    that another process never reads a partially written file.
+
+    :param data: DataFrame to write.
+    :param file_path: path of the csv file.
+    """
+
+    file_descriptor, tmp_file_path = tempfile.mkstemp(
+        dir=pth.dirname(pth.abspath(file_path)), suffix=".tmp"
+    )
+    os.close(file_descriptor)
+    try:
+        data.to_csv(tmp_file_path)
+        os.replace(tmp_file_path, file_path)
+    finally:
+        if pth.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+
+
+def _lock(lock_file):
+
+    lock_file.seek(0)
+    if os.name == "nt":
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _unlock(lock_file):
+
+    lock_file.seek(0)
+    if os.name == "nt":
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -14,23 +14,35 @@
 
 import copy
 import logging
-import os
-import os.path as pth
 import warnings
 from typing import Optional
 
 import numpy as np
 import openmdao.api as om
-import pandas as pd
+from scipy.linalg import lu_factor, lu_solve
 from stdatm import Atmosphere
 
 from fastga.models.geometry.profiles.get_profile import get_profile
+from ..result_store import AeroResultStore
 from ...constants import SPAN_MESH_POINT, POLAR_POINT_COUNT, MACH_NB_PTS
 
 DEFAULT_NX = 19
 DEFAULT_NY1 = 3
 DEFAULT_NY2 = 14
 
+# Inputs defining the VLM mesh, and thus the AIC matrices, of the wing and the HTP
+MESH_INPUTS = [
+    "data:geometry:wing:kink:span_ratio",
+    "data:geometry:wing:root:y",
+    "data:geometry:wing:span",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:flap:span_ratio",
+    "data:geometry:horizontal_tail:span",
+    "data:geometry:horizontal_tail:root:chord",
+    "data:geometry:horizontal_tail:tip:chord",
+]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -48,6 +60,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self.ny2 = None
         self.ny3 = None
         self.n_y = None
+        self._mesh_key = None
 
     def initialize(self):
         self.options.declare("low_speed_aero", default=False, types=bool)
@@ -209,46 +222,33 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             decimals=6,
         )
 
-        # Search if results already exist:
+        # Search if results already exist, the area ratio is not part of the key since results
+        # can be adapted to a new area ratio:
         result_folder_path = self.options["result_folder_path"]
-        result_file_path = None
-        saved_area_ratio = 1.0
+        result_store = None
+        saved_results = None
         if result_folder_path != "":
-            result_file_path, saved_area_ratio = self.search_results(
-                result_folder_path, geometry_set
-            )
+            # Create result store first (if it must fail, let it fail as soon as possible)
+            result_store = AeroResultStore(result_folder_path, "vlm")
+            saved_results = result_store.get(geometry_set[0:-1])
 
         # If no result saved for that geometry under this mach condition, computation is done
-        if result_file_path is None:
-
-            # Create result folder first (if it must fail, let it fail as soon as possible)
-            if result_folder_path != "":
-                if not os.path.exists(result_folder_path):
-                    os.makedirs(pth.join(result_folder_path), exist_ok=True)
-
-            # Save the geometry (result_file_path is None entering the function)
-            if self.options["result_folder_path"] != "":
-                result_file_path = self.save_geometry(result_folder_path, geometry_set)
+        if saved_results is None:
 
             # Compute wing alone @ 0°/X° angle of attack
-            wing_0 = self.compute_wing(
-                inputs, altitude, mach, 0.0, flaps_angle=0.0, use_airfoil=True
-            )
-            wing_aoa = self.compute_wing(
-                inputs, altitude, mach, aoa_angle, flaps_angle=0.0, use_airfoil=True
+            wing_0, wing_aoa = self.compute_wing_sweep(
+                inputs, altitude, mach, [0.0, aoa_angle], flaps_angle=0.0, use_airfoil=True
             )
 
             # Compute complete aircraft @ 0°/X° angle of attack
-            _, htp_0, _ = self.compute_aircraft(
-                inputs, altitude, mach, 0.0, flaps_angle=0.0, use_airfoil=True
-            )
-            _, htp_aoa, _ = self.compute_aircraft(
-                inputs, altitude, mach, aoa_angle, flaps_angle=0.0, use_airfoil=True
+            _, (htp_0, htp_aoa), _ = self.compute_aircraft_sweep(
+                inputs, altitude, mach, [0.0, aoa_angle], flaps_angle=0.0, use_airfoil=True
             )
 
             # Compute isolated HTP @ 0°/X° angle of attack
-            htp_0_isolated = self.compute_htp(inputs, altitude, mach, 0.0, use_airfoil=True)
-            htp_aoa_isolated = self.compute_htp(inputs, altitude, mach, aoa_angle, use_airfoil=True)
+            htp_0_isolated, htp_aoa_isolated = self.compute_htp_sweep(
+                inputs, altitude, mach, [0.0, aoa_angle], use_airfoil=True
+            )
 
             # Post-process wing data ---------------------------------------------------------------
             k_fus = 1 + 0.025 * width_max / span_wing - 0.025 * (width_max / span_wing) ** 2
@@ -332,59 +332,52 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 cl_vector_htp.extend(additional_zeros)
 
             # Save results to defined path ---------------------------------------------------------
-            if self.options["result_folder_path"] != "":
-                results = [
-                    cl_0_wing,
-                    cl_x_wing,
-                    cl_alpha_wing,
-                    cm_0_wing,
-                    y_vector_wing,
-                    cl_vector_wing,
-                    chord_vector_wing,
-                    coef_k_wing,
-                    cl_0_htp,
-                    cl_aoa_htp,
-                    cl_alpha_htp,
-                    cl_alpha_htp_isolated,
-                    y_vector_htp,
-                    cl_vector_htp,
-                    coef_k_htp,
-                    sref_wing,
-                ]
-                self.save_results(result_file_path, results)
+            if result_store is not None:
+                results = {
+                    "cl_0_wing": cl_0_wing,
+                    "cl_X_wing": cl_x_wing,
+                    "cl_alpha_wing": cl_alpha_wing,
+                    "cm_0_wing": cm_0_wing,
+                    "y_vector_wing": y_vector_wing,
+                    "cl_vector_wing": cl_vector_wing,
+                    "chord_vector_wing": chord_vector_wing,
+                    "coef_k_wing": coef_k_wing,
+                    "cl_0_htp": cl_0_htp,
+                    "cl_X_htp": cl_aoa_htp,
+                    "cl_alpha_htp": cl_alpha_htp,
+                    "cl_alpha_htp_isolated": cl_alpha_htp_isolated,
+                    "y_vector_htp": y_vector_htp,
+                    "cl_vector_htp": cl_vector_htp,
+                    "coef_k_htp": coef_k_htp,
+                    "saved_ref_area": sref_wing,
+                    "area_ratio": geometry_set[-1],
+                }
+                result_store.put(geometry_set[0:-1], results)
 
         # Else retrieved results are used, eventually adapted with new area ratio
         else:
-            # Read values from result file ---------------------------------------------------------
-            data = self.read_results(result_file_path)
-            saved_area_wing = float(data.loc["saved_ref_area", 0])
-            cl_0_wing = float(data.loc["cl_0_wing", 0])
-            cl_x_wing = float(data.loc["cl_X_wing", 0])
-            cl_alpha_wing = float(data.loc["cl_alpha_wing", 0])
-            cm_0_wing = float(data.loc["cm_0_wing", 0])
-            y_vector_wing = np.array(
-                [float(i) for i in data.loc["y_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(sref_wing / saved_area_wing)
-            cl_vector_wing = np.array(
-                [float(i) for i in data.loc["cl_vector_wing", 0][1:-2].split(",")]
+            # Read values from result store --------------------------------------------------------
+            saved_area_wing = float(saved_results["saved_ref_area"])
+            saved_area_ratio = float(saved_results["area_ratio"])
+            cl_0_wing = float(saved_results["cl_0_wing"])
+            cl_x_wing = float(saved_results["cl_X_wing"])
+            cl_alpha_wing = float(saved_results["cl_alpha_wing"])
+            cm_0_wing = float(saved_results["cm_0_wing"])
+            y_vector_wing = saved_results["y_vector_wing"] * np.sqrt(sref_wing / saved_area_wing)
+            cl_vector_wing = np.array(saved_results["cl_vector_wing"])
+            chord_vector_wing = saved_results["chord_vector_wing"] * np.sqrt(
+                sref_wing / saved_area_wing
             )
-            chord_vector_wing = np.array(
-                [float(i) for i in data.loc["chord_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(sref_wing / saved_area_wing)
-            coef_k_wing = float(data.loc["coef_k_wing", 0])
-            cl_0_htp = float(data.loc["cl_0_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_aoa_htp = float(data.loc["cl_X_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp = float(data.loc["cl_alpha_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp_isolated = float(data.loc["cl_alpha_htp_isolated", 0]) * (
+            coef_k_wing = float(saved_results["coef_k_wing"])
+            cl_0_htp = float(saved_results["cl_0_htp"]) * (area_ratio / saved_area_ratio)
+            cl_aoa_htp = float(saved_results["cl_X_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp = float(saved_results["cl_alpha_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp_isolated = float(saved_results["cl_alpha_htp_isolated"]) * (
                 area_ratio / saved_area_ratio
             )
-            y_vector_htp = np.array(
-                [float(i) for i in data.loc["y_vector_htp", 0][1:-2].split(",")]
-            )
-            cl_vector_htp = np.array(
-                [float(i) for i in data.loc["cl_vector_htp", 0][1:-2].split(",")]
-            )
-            coef_k_htp = float(data.loc["coef_k_htp", 0]) * (area_ratio / saved_area_ratio)
+            y_vector_htp = np.array(saved_results["y_vector_htp"])
+            cl_vector_htp = np.array(saved_results["cl_vector_htp"])
+            coef_k_htp = float(saved_results["coef_k_htp"]) * (area_ratio / saved_area_ratio)
 
         return (
             cl_0_wing,
@@ -426,6 +419,38 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         cm_vector, cl, cdi, cm, coef_e
         """
 
+        return self.compute_wing_sweep(
+            inputs,
+            altitude,
+            mach,
+            [aoa_angle],
+            flaps_angle=flaps_angle,
+            use_airfoil=use_airfoil,
+        )[0]
+
+    def compute_wing_sweep(
+        self,
+        inputs,
+        altitude: float,
+        mach: float,
+        aoa_angles,
+        flaps_angle: Optional[float] = 0.0,
+        use_airfoil: Optional[bool] = True,
+    ) -> list:
+        """
+        VLM computations for the wing alone on several angles of attack. The circulation is
+        obtained for all angles at once by solving the system with the factorized AIC matrix.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach: air speed expressed in mach
+        @param aoa_angles: list of air speed angles of attack with respect to aircraft (degree)
+        @param flaps_angle: flaps angle in Deg (default=0.0: i.e. no deflection)
+        @param use_airfoil: adds the camberline coordinates of the selected airfoil (default=True)
+        @return: list of wing dictionaries (one per angle of attack) including aero parameters as
+        keys: y_vector, cl_vector, cd_vector, cm_vector, cl, cdi, cm, coef_e
+        """
+
         # Generate geometries
         self._run(inputs)
 
@@ -446,8 +471,6 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self.apply_deflection(inputs, flaps_angle)
         self.generate_twist(self.wing, wing_twist, y2_wing, semi_span)
         panelangle_vect = self.wing["panel_angle_vect"]
-        aic = self.wing["aic"]
-        aic_inv = np.linalg.inv(aic)
         aic_wake = self.wing["aic_wake"]
 
         # Compute air speed
@@ -455,51 +478,54 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
         )  # avoid V=0 m/s crashes
 
-        # Calculate all the aerodynamic parameters
-        aoa_angle = aoa_angle * np.pi / 180
-        alpha = np.add(panelangle_vect, aoa_angle)
-        gamma = -np.dot(aic_inv, alpha) * v_inf
-        c_p = -2 / v_inf * np.divide(gamma, panelchord)
-        for i in range(self.n_x):
-            c_p[i * self.n_y] = c_p[i * self.n_y] * 1
-        cl_wing = -np.sum(c_p * panelsurf) / np.sum(panelsurf)
-        alphaind = np.dot(aic_wake, gamma) / v_inf
-        cdind_panel = c_p * alphaind
-        cdi_wing = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
-        wing_e = cl_wing ** 2 / (np.pi * aspect_ratio * cdi_wing) * 0.955  # !!!: manual correction?
-        cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
-        cm_wing = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
-
-        # Calculate curves
-        wing_cl_vect = []
-        wing_y_vect = []
-        wing_chord_vect = []
-        yc_wing = self.wing["yc"]
-        chord_wing = self.wing["chord"]
-        for j in range(self.n_y):
-            cl_span = 0.0
-            y_local = yc_wing[j]
-            chord = (chord_wing[j] + chord_wing[j + 1]) / 2.0
-            for i in range(self.n_x):
-                cl_span += -c_p[i * self.n_y + j] * panelchord[i * self.n_y + j] / chord
-            wing_cl_vect.append(cl_span)
-            wing_y_vect.append(y_local)
-            wing_chord_vect.append(chord)
-
-        # Return values
-        wing = {
-            "y_vector": wing_y_vect,
-            "cl_vector": wing_cl_vect,
-            "chord_vector": wing_chord_vect,
-            "cd_vector": [],
-            "cm_vector": [],
-            "cl": cl_wing,
-            "cdi": cdi_wing,
-            "cm": cm_wing,
-            "coef_e": wing_e,
-        }
-
-        return wing
+        # Solve the circulation for all the angles of attack at once
+        gamma_cases = self._solve_circulation(self.wing, panelangle_vect, aoa_angles, v_inf)
+
+        wings = []
+        for gamma in gamma_cases.T:
+            # Calculate all the aerodynamic parameters
+            c_p = -2 / v_inf * np.divide(gamma, panelchord)
+            cl_wing = -np.sum(c_p * panelsurf) / np.sum(panelsurf)
+            alphaind = np.dot(aic_wake, gamma) / v_inf
+            cdind_panel = c_p * alphaind
+            cdi_wing = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
+            wing_e = (
+                cl_wing ** 2 / (np.pi * aspect_ratio * cdi_wing) * 0.955
+            )  # !!!: manual correction?
+            cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
+            cm_wing = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
+
+            # Calculate curves
+            wing_cl_vect = []
+            wing_y_vect = []
+            wing_chord_vect = []
+            yc_wing = self.wing["yc"]
+            chord_wing = self.wing["chord"]
+            for j in range(self.n_y):
+                cl_span = 0.0
+                y_local = yc_wing[j]
+                chord = (chord_wing[j] + chord_wing[j + 1]) / 2.0
+                for i in range(self.n_x):
+                    cl_span += -c_p[i * self.n_y + j] * panelchord[i * self.n_y + j] / chord
+                wing_cl_vect.append(cl_span)
+                wing_y_vect.append(y_local)
+                wing_chord_vect.append(chord)
+
+            # Return values
+            wing = {
+                "y_vector": wing_y_vect,
+                "cl_vector": wing_cl_vect,
+                "chord_vector": wing_chord_vect,
+                "cd_vector": [],
+                "cm_vector": [],
+                "cl": cl_wing,
+                "cdi": cdi_wing,
+                "cm": cm_wing,
+                "coef_e": wing_e,
+            }
+            wings.append(wing)
+
+        return wings
 
     def compute_htp(
         self,
@@ -521,6 +547,32 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         cm_vector, cl, cdi, cm, coef_e.
         """
 
+        return self.compute_htp_sweep(inputs, altitude, mach, [aoa_angle], use_airfoil=use_airfoil)[
+            0
+        ]
+
+    def compute_htp_sweep(
+        self,
+        inputs,
+        altitude: float,
+        mach: float,
+        aoa_angles,
+        use_airfoil: Optional[bool] = True,
+    ) -> list:
+        """
+        VLM computation for the horizontal tail alone on several angles of attack. The
+        circulation is obtained for all angles at once by solving the system with the factorized
+        AIC matrix.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA.
+        @param altitude: altitude for aerodynamic calculation in meters.
+        @param mach: air speed expressed in mach.
+        @param aoa_angles: list of air speed angles of attack with respect to aircraft (degree).
+        @param use_airfoil: adds the camberline coordinates of the selected airfoil (default=True).
+        @return: list of htp dictionaries (one per angle of attack) including aero parameters as
+        keys: y_vector, cl_vector, cd_vector, cm_vector, cl, cdi, cm, coef_e.
+        """
+
         # Generate geometries
         self._run(inputs)
 
@@ -535,8 +587,6 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         if use_airfoil:
             self.generate_curvature(self.htp, self.options["htp_airfoil_file"])
         panelangle_vect = self.htp["panel_angle_vect"]
-        aic = self.htp["aic"]
-        aic_inv = np.linalg.inv(aic)
         aic_wake = self.htp["aic_wake"]
 
         # Compute air speed
@@ -544,48 +594,49 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
         )  # avoid V=0 m/s crashes
 
-        # Calculate all the aerodynamic parameters
-        aoa_angle = aoa_angle * np.pi / 180
-        alpha = np.add(panelangle_vect, aoa_angle)
-        gamma = -np.dot(aic_inv, alpha) * v_inf
-        c_p = -2 / v_inf * np.divide(gamma, panelchord)
-        for i in range(self.n_x):
-            c_p[i * self.n_y] = c_p[i * self.n_y] * 1
-        cl_htp = -np.sum(c_p * panelsurf) / np.sum(panelsurf)
-        alphaind = np.dot(aic_wake, gamma) / v_inf
-        cdind_panel = c_p * alphaind
-        cdi_htp = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
-        htp_e = cl_htp ** 2 / (np.pi * aspect_ratio * max(cdi_htp, 1e-12))  # avod 0.0 division
-        cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
-        cm_htp = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
-
-        # Calculate curves
-        htp_cl_vect = []
-        htp_y_vect = []
-        yc_htp = self.htp["yc"]
-        chord_htp = self.htp["chord"]
-        for j in range(self.n_y):
-            cl_span = 0.0
-            y_local = yc_htp[j]
-            chord = (chord_htp[j] + chord_htp[j + 1]) / 2.0
-            for i in range(self.n_x):
-                cl_span += -c_p[i * self.n_y + j] * panelchord[i * self.n_y + j] / chord
-            htp_cl_vect.append(cl_span)
-            htp_y_vect.append(y_local)
-
-        # Return values
-        htp = {
-            "y_vector": htp_y_vect,
-            "cl_vector": htp_cl_vect,
-            "cd_vector": [],
-            "cm_vector": [],
-            "cl": cl_htp,
-            "cdi": cdi_htp,
-            "cm": cm_htp,
-            "coef_e": htp_e,
-        }
-
-        return htp
+        # Solve the circulation for all the angles of attack at once
+        gamma_cases = self._solve_circulation(self.htp, panelangle_vect, aoa_angles, v_inf)
+
+        htps = []
+        for gamma in gamma_cases.T:
+            # Calculate all the aerodynamic parameters
+            c_p = -2 / v_inf * np.divide(gamma, panelchord)
+            cl_htp = -np.sum(c_p * panelsurf) / np.sum(panelsurf)
+            alphaind = np.dot(aic_wake, gamma) / v_inf
+            cdind_panel = c_p * alphaind
+            cdi_htp = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
+            htp_e = cl_htp ** 2 / (np.pi * aspect_ratio * max(cdi_htp, 1e-12))  # avoid 0.0 division
+            cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
+            cm_htp = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
+
+            # Calculate curves
+            htp_cl_vect = []
+            htp_y_vect = []
+            yc_htp = self.htp["yc"]
+            chord_htp = self.htp["chord"]
+            for j in range(self.n_y):
+                cl_span = 0.0
+                y_local = yc_htp[j]
+                chord = (chord_htp[j] + chord_htp[j + 1]) / 2.0
+                for i in range(self.n_x):
+                    cl_span += -c_p[i * self.n_y + j] * panelchord[i * self.n_y + j] / chord
+                htp_cl_vect.append(cl_span)
+                htp_y_vect.append(y_local)
+
+            # Return values
+            htp = {
+                "y_vector": htp_y_vect,
+                "cl_vector": htp_cl_vect,
+                "cd_vector": [],
+                "cm_vector": [],
+                "cl": cl_htp,
+                "cdi": cdi_htp,
+                "cm": cm_htp,
+                "coef_e": htp_e,
+            }
+            htps.append(htp)
+
+        return htps
 
     def compute_aircraft(
         self,
@@ -609,30 +660,103 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         coefficients.
         """
 
+        wings, htps, aircrafts = self.compute_aircraft_sweep(
+            inputs,
+            altitude,
+            mach,
+            [aoa_angle],
+            flaps_angle=flaps_angle,
+            use_airfoil=use_airfoil,
+        )
+
+        return wings[0], htps[0], aircrafts[0]
+
+    def compute_aircraft_sweep(
+        self,
+        inputs,
+        altitude: float,
+        mach: float,
+        aoa_angles,
+        flaps_angle: Optional[float] = 0.0,
+        use_airfoil: Optional[bool] = True,
+    ):
+        """
+        VLM computation for the complete aircraft on several angles of attack.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA.
+        @param altitude: altitude for aerodynamic calculation in meters.
+        @param mach: air speed expressed in mach.
+        @param aoa_angles: list of air speed angles of attack with respect to aircraft (degree).
+        @param use_airfoil: adds the camberline coordinates of the selected airfoil (default=True).
+        @param flaps_angle: flaps angle in Deg (default=0.0: i.e. no deflection).
+        @return: lists of wing/htp and aircraft dictionaries (one per angle of attack) including
+        their respective aerodynamic coefficients.
+        """
+
         # Get inputs
         aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
 
         # Compute wing
-        wing = self.compute_wing(
-            inputs, altitude, mach, aoa_angle, flaps_angle=flaps_angle, use_airfoil=use_airfoil
+        wings = self.compute_wing_sweep(
+            inputs, altitude, mach, aoa_angles, flaps_angle=flaps_angle, use_airfoil=use_airfoil
         )
 
         # Calculate downwash angle based on Gudmundsson model (p.467)
-        cl_wing = wing["cl"]
         beta = np.sqrt(1 - mach ** 2)  # Prandtl-Glauert
-        downwash_angle = 2.0 * np.array(cl_wing) / beta * 180.0 / (aspect_ratio_wing * np.pi ** 2)
-        aoa_angle_corrected = aoa_angle - downwash_angle
+        aoa_angles_corrected = []
+        for aoa_angle, wing in zip(aoa_angles, wings):
+            cl_wing = wing["cl"]
+            downwash_angle = (
+                2.0 * np.array(cl_wing) / beta * 180.0 / (aspect_ratio_wing * np.pi ** 2)
+            )
+            aoa_angles_corrected.append(aoa_angle - downwash_angle)
 
         # Compute htp
-        htp = self.compute_htp(inputs, altitude, mach, aoa_angle_corrected, use_airfoil=True)
+        htps = self.compute_htp_sweep(
+            inputs, altitude, mach, aoa_angles_corrected, use_airfoil=True
+        )
 
         # Save results at aircraft level
-        aircraft = {"cl": wing["cl"] + htp["cl"], "cd0": None, "cdi": None, "coef_e": None}
+        aircrafts = [
+            {"cl": wing["cl"] + htp["cl"], "cd0": None, "cdi": None, "coef_e": None}
+            for wing, htp in zip(wings, htps)
+        ]
+
+        return wings, htps, aircrafts
+
+    @staticmethod
+    def _solve_circulation(dictionary, panelangle_vect, aoa_angles, v_inf):
+        """
+        Solves the circulation of the lifting surface for several angles of attack as a single
+        multiple right-hand sides system, using the LU factorization of the AIC matrix computed
+        with the geometry.
+
+        :param dictionary: dictionary which contains the factorized AIC of the lifting surface
+        :param panelangle_vect: local angle of each panel due to camber, deflection and twist, in
+        rad
+        :param aoa_angles: list of angles of attack, in deg
+        :param v_inf: free stream velocity, in m/s
+        :return: an array with the panels circulation, one column per angle of attack
+        """
+
+        aoa_angles = np.array(aoa_angles, dtype=float).flatten() * np.pi / 180
+        alpha = panelangle_vect[:, np.newaxis] + aoa_angles[np.newaxis, :]
 
-        return wing, htp, aircraft
+        return -lu_solve(dictionary["aic_lu"], alpha) * v_inf
 
     def _run(self, inputs):
 
+        # If the geometry has not changed since the last call, the mesh and the factorized AIC
+        # matrices are kept and only the panel angles, which depend on the airfoil, deflection
+        # and twist, are reset
+        mesh_key = tuple(float(inputs[name]) for name in MESH_INPUTS)
+        if mesh_key == self._mesh_key:
+            for dictionary in [self.wing, self.htp]:
+                dictionary["z"] = np.zeros(self.n_x + 1)
+                dictionary["panel_angle"] = np.zeros(self.n_x)
+                dictionary["panel_angle_vect"] = np.zeros(self.n_x * self.n_y)
+            return
+
         wing_break = float(inputs["data:geometry:wing:kink:span_ratio"])
 
         # Define mesh size
@@ -668,6 +792,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             "panel_angle_vect": np.zeros(self.n_x * self.n_y),
             "aic": np.zeros((self.n_x * self.n_y, self.n_x * self.n_y)),
             "aic_wake": np.zeros((self.n_x * self.n_y, self.n_x * self.n_y)),
+            "aic_lu": None,
         }
         # Duplicate for HTP
         self.htp = copy.deepcopy(self.wing)
@@ -678,6 +803,8 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         # Generate HTP
         self._generate_htp(inputs)
 
+        self._mesh_key = mesh_key
+
     def _generate_wing(self, inputs):
         """Generates the coordinates for VLM calculations and aic matrix of the wing."""
         y2_wing = inputs["data:geometry:wing:root:y"]
@@ -781,8 +908,6 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         y_1 = dictionary["y1"]
         x_2 = dictionary["x2"]
         y_2 = dictionary["y2"]
-        aic = dictionary["aic"]
-        aic_wake = dictionary["aic_wake"]
         # Calculate panel corners x-coordinate
         for i in range(self.n_x + 1):
             x_panel[i, :] = x_le + chord * i / self.n_x
@@ -857,48 +982,28 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         x_c[self.n_x * self.n_y :] = x_c[: self.n_x * self.n_y]
         y_c[self.n_x * self.n_y :] = -y_c[: self.n_x * self.n_y]
 
-        # Aerodynamic coefficients computation (Right side)
-        for i in range(self.n_x * self.n_y):
-            for j in range(self.n_x * self.n_y):
-                # Right wing
-                coeff_1 = x_c[i] - x_1[j]
-                coeff_2 = y_c[i] - y_1[j]
-                coeff_3 = x_c[i] - x_2[j]
-                coeff_4 = y_c[i] - y_2[j]
-                coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
-                coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
-                coeff_7 = x_2[j] - x_1[j]
-                coeff_8 = y_2[j] - y_1[j]
-                coeff_10 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
-                    coeff_7 * coeff_3 + coeff_8 * coeff_4
-                ) / coeff_6
-                coeff_11 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
-                if coeff_1 * coeff_4 - coeff_2 * coeff_3 != 0:
-                    aic[i, j] = (coeff_10 / (coeff_1 * coeff_4 - coeff_2 * coeff_3)) / (4 * np.pi)
-                aic_wake[i, j] = coeff_11 / (4 * np.pi)
-                aic[i, j] = aic[i, j] + coeff_11 / (4 * np.pi)
-        # Aerodynamic coefficients computation (Left side)
-        for i in range(self.n_x * self.n_y):
-            for j in range(self.n_x * self.n_y):
-                # Left wing
-                coeff_1 = x_c[i] - x_1[self.n_x * self.n_y + j]
-                coeff_2 = y_c[i] - y_1[self.n_x * self.n_y + j]
-                coeff_3 = x_c[i] - x_2[self.n_x * self.n_y + j]
-                coeff_4 = y_c[i] - y_2[self.n_x * self.n_y + j]
-                coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
-                coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
-                coeff_7 = x_2[self.n_x * self.n_y + j] - x_1[self.n_x * self.n_y + j]
-                coeff_8 = y_2[self.n_x * self.n_y + j] - y_1[self.n_x * self.n_y + j]
-                coeff_9 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
-                    coeff_7 * coeff_3 + coeff_8 * coeff_4
-                ) / coeff_6
-                coeff_10 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
-                if coeff_1 * coeff_4 - coeff_2 * coeff_3 != 0:
-                    aic[i, j] = aic[i, j] + (coeff_9 / (coeff_1 * coeff_4 - coeff_2 * coeff_3)) / (
-                        4 * np.pi
-                    )
-                aic_wake[i, j] = aic_wake[i, j] + coeff_10 / (4 * np.pi)
-                aic[i, j] = aic[i, j] + coeff_10 / (4 * np.pi)
+        # Aerodynamic coefficients computation, the right side horseshoe vortices contributions
+        # are added first and then the left side ones, in the same order as the panel-by-panel
+        # formulation so that the results are kept identical
+        n_panels = self.n_x * self.n_y
+        aic_right, aic_wake_right = self._compute_aic_contributions(
+            x_c[:n_panels],
+            y_c[:n_panels],
+            x_1[:n_panels],
+            y_1[:n_panels],
+            x_2[:n_panels],
+            y_2[:n_panels],
+        )
+        aic_left, aic_wake_left = self._compute_aic_contributions(
+            x_c[:n_panels],
+            y_c[:n_panels],
+            x_1[n_panels:],
+            y_1[n_panels:],
+            x_2[n_panels:],
+            y_2[n_panels:],
+        )
+        aic = aic_right + aic_wake_right + aic_left + aic_wake_left
+        aic_wake = aic_wake_right + aic_wake_left
         # Save data
         dictionary["x_panel"] = x_panel
         dictionary["panel_span"] = panelspan
@@ -912,6 +1017,49 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         dictionary["y2"] = y_2
         dictionary["aic"] = aic
         dictionary["aic_wake"] = aic_wake
+        # The AIC only depends on the geometry so it is factorized once and reused for every
+        # right-hand side (angle of attack, camber, deflection and twist)
+        dictionary["aic_lu"] = lu_factor(aic)
+
+    @staticmethod
+    def _compute_aic_contributions(x_c, y_c, x_1, y_1, x_2, y_2):
+        """
+        Computes the influence coefficients of a set of horseshoe vortices on a set of control
+        points. All the (control point, vortex) pairs are evaluated at once using broadcasting,
+        rows corresponding to the control points and columns to the vortices.
+
+        :param x_c: x coordinates of the control points
+        :param y_c: y coordinates of the control points
+        :param x_1: x coordinates of the first point of the bound vortices
+        :param y_1: y coordinates of the first point of the bound vortices
+        :param x_2: x coordinates of the second point of the bound vortices
+        :param y_2: y coordinates of the second point of the bound vortices
+        :return: the influence matrix of the bound vortices and the influence matrix of the
+        trailing vortices.
+        """
+
+        coeff_1 = x_c[:, np.newaxis] - x_1[np.newaxis, :]
+        coeff_2 = y_c[:, np.newaxis] - y_1[np.newaxis, :]
+        coeff_3 = x_c[:, np.newaxis] - x_2[np.newaxis, :]
+        coeff_4 = y_c[:, np.newaxis] - y_2[np.newaxis, :]
+        coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
+        coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
+        coeff_7 = (x_2 - x_1)[np.newaxis, :]
+        coeff_8 = (y_2 - y_1)[np.newaxis, :]
+        coeff_9 = coeff_1 * coeff_4 - coeff_2 * coeff_3
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coeff_10 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
+                coeff_7 * coeff_3 + coeff_8 * coeff_4
+            ) / coeff_6
+            coeff_11 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
+            # The bound vortex contribution is discarded when the control point is aligned with
+            # the vortex segment
+            aic_bound = np.where(coeff_9 != 0, (coeff_10 / coeff_9) / (4 * np.pi), 0.0)
+
+        aic_wake = coeff_11 / (4 * np.pi)
+
+        return aic_bound, aic_wake
 
     def generate_twist(self, dictionary, twist, y_start, y_end):
         """
@@ -1032,111 +1180,3 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             ) / (lift_coeff[-1] - lift_coeff[-2])
         _LOGGER.warning("CL not in range. Linear extrapolation of CDp value %f", cdp)
         return cdp
-
-    @staticmethod
-    def search_results(result_folder_path, geometry_set):
-        """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "dihedral_angle_wing",
-                "twist_angle_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "mach",
-                "area_ratio",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if (
-                                np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy())
-                                == len(geometry_set_labels) - 1
-                            ):
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if (
-                                    np.sum(saved_set == geometry_set[0:-1])
-                                    == len(geometry_set_labels) - 1
-                                ):
-                                    result_file_path = pth.join(
-                                        result_folder_path, "vlm_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio = data.loc["area_ratio", 0]
-                                    return result_file_path, saved_area_ratio
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0
-
-    @staticmethod
-    def save_geometry(result_folder_path, geometry_set):
-        """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "dihedral_angle_wing",
-            "twist_angle_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "mach",
-            "area_ratio",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")
-
-        return result_file_path
-
-    @staticmethod
-    def save_results(result_file_path, results):
-        """Reads saved results."""
-        labels = [
-            "cl_0_wing",
-            "cl_X_wing",
-            "cl_alpha_wing",
-            "cm_0_wing",
-            "y_vector_wing",
-            "cl_vector_wing",
-            "chord_vector_wing",
-            "coef_k_wing",
-            "cl_0_htp",
-            "cl_X_htp",
-            "cl_alpha_htp",
-            "cl_alpha_htp_isolated",
-            "y_vector_htp",
-            "cl_vector_htp",
-            "coef_k_htp",
-            "saved_ref_area",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
-
-    @staticmethod
-    def read_results(result_file_path):
-
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
-
-        return pd.DataFrame(values, index=labels)
@@ -34,6 +34,7 @@ from openmdao.utils.file_wrap import InputFileGenerator
 from fastga.models.aerodynamics.external.xfoil import xfoil699
 from fastga.models.geometry.profiles.get_profile import get_profile
 from . import resources as local_resources
+from ..result_store import atomic_to_csv, file_lock
 from ...constants import POLAR_POINT_COUNT
 
 OPTION_RESULT_POLAR_FILENAME = "result_polar_filename"
@@ -147,7 +148,9 @@ class XfoilPolar(ExternalCodeComp):
             )
         if pth.exists(result_file) and not self.options["single_AoA"]:
             no_file = False
-            data_saved = pd.read_csv(result_file)
+            # Lock the file in case it is being rewritten by a process sharing the resources
+            with file_lock(result_file):
+                data_saved = pd.read_csv(result_file)
             values = data_saved.to_numpy()[:, 1 : len(data_saved.to_numpy()[0])]
             labels = data_saved.to_numpy()[:, 0].tolist()
             data_saved = pd.DataFrame(values, index=labels)
@@ -408,13 +411,9 @@ class XfoilPolar(ExternalCodeComp):
                         "cdp",
                         "cm",
                     ]
-                    if no_file or (data_saved is None):
-                        data = pd.DataFrame(results, index=labels)
-                    else:
-                        data = pd.DataFrame(np.c_[data_saved, results], index=labels)
                     # noinspection PyBroadException
                     try:
-                        data.to_csv(result_file)
+                        self._save_results(result_file, results, labels)
                     except:
                         warnings.warn(
                             "Unable to save XFoil results to *.csv file: writing permission denied for "
@@ -512,6 +511,27 @@ class XfoilPolar(ExternalCodeComp):
             outputs["xfoil:CL_max_2D"] = cl_max_2d
             outputs["xfoil:CL_min_2D"] = cl_min_2d
 
+    @staticmethod
+    def _save_results(result_file: str, results: list, labels: list):
+        """
+        Adds the results of a polar computation to the result file. Since the file may be shared
+        between several processes, it is locked and read again before being rewritten so that
+        results saved by another process since the beginning of the computation are not lost.
+
+        :param result_file: path of the .csv result file.
+        :param results: values of the polar to add.
+        :param labels: labels of the values.
+        """
+
+        with file_lock(result_file):
+            if pth.exists(result_file):
+                data_saved = pd.read_csv(result_file)
+                values = data_saved.to_numpy()[:, 1 : len(data_saved.to_numpy()[0])]
+                data = pd.DataFrame(np.c_[values, results], index=labels)
+            else:
+                data = pd.DataFrame(results, index=labels)
+            atomic_to_csv(data, result_file)
+
     def _write_script_file(
         self,
         reynolds,
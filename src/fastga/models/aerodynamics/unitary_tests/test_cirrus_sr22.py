@@ -48,6 +48,7 @@ from .test_functions import (
     high_speed_connection,
     low_speed_connection,
     v_n_diagram,
+    v_n_diagram_grid,
     load_factor,
     equilibrated_cl_cd_polar,
     non_equilibrated_cl_cd_polar,
@@ -1149,6 +1150,11 @@ def test_v_n_diagram():
     )
 
 
+def test_v_n_diagram_grid():
+    # load all inputs
+    v_n_diagram_grid(XML_FILE, number_of_masses=3, number_of_altitudes=2)
+
+
 def test_load_factor():
     # load all inputs
     load_factor(
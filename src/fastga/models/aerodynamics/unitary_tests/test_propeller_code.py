@@ -0,0 +1,176 @@
+"""Test module for the options of the propeller performance computation."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import ast
+import os.path as pth
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
+
+from ..constants import POLAR_POINT_COUNT
+from ..external.propeller_code.compute_propeller_aero import _ComputePropellerPerformance
+from ..external.propeller_code.compute_propeller_coefficient_map import (
+    _ComputePropellerCoefficientMap,
+)
+from ..external.result_store import RESULT_STORE_FILE_NAME
+from ..external.xfoil import resources
+
+XML_FILE = "beechcraft_76.xml"
+PROFILE = "naca4430"
+
+
+def _get_inputs(component):
+    """Reads the inputs of the component, the polars being read from the saved Xfoil results."""
+
+    ivc = get_indep_var_comp(
+        [name for name in list_inputs(component) if "_polar:" not in name], __file__, XML_FILE
+    )
+    data_saved = pd.read_csv(
+        pth.join(pth.dirname(resources.__file__), PROFILE + "_30S.csv"), index_col=0
+    )
+    for label, saved_label, units in (
+        ("alpha", "alpha", "deg"),
+        ("CL", "cl", None),
+        ("CD", "cd", None),
+    ):
+        values = np.zeros(POLAR_POINT_COUNT)
+        saved_values = ast.literal_eval(data_saved.loc[saved_label].iloc[0])
+        values[0 : len(saved_values)] = saved_values
+        ivc.add_output(PROFILE + "_polar:" + label, values, units=units)
+
+    return ivc
+
+
+def test_propeller_performance_workers():
+    """Tests that the propeller tables are the same when computed on several processes."""
+
+    def component(workers_number):
+        return _ComputePropellerPerformance(
+            sections_profile_name_list=[PROFILE],
+            sections_profile_position_list=[0],
+            elements_number=3,
+            workers_number=workers_number,
+        )
+
+    problem_serial = run_system(component(1), _get_inputs(component(1)))
+    problem_parallel = run_system(component(3), _get_inputs(component(1)))
+
+    for level in ("sea_level", "cruise_level"):
+        for name in ("efficiency", "thrust", "thrust_limit", "speed"):
+            variable_name = "data:aerodynamics:propeller:" + level + ":" + name
+            assert np.array_equal(problem_serial[variable_name], problem_parallel[variable_name])
+
+
+def test_propeller_coefficient_map_workers():
+    """Tests that the propeller coefficient map is the same when computed on several processes."""
+
+    def component(workers_number):
+        return _ComputePropellerCoefficientMap(
+            sections_profile_name_list=[PROFILE],
+            sections_profile_position_list=[0],
+            elements_number=3,
+            workers_number=workers_number,
+        )
+
+    def inputs():
+        ivc = _get_inputs(component(1))
+        ivc.add_output("data:aerodynamics:propeller:coefficient_map:twist_75", 25.0, units="deg")
+        ivc.add_output("data:aerodynamics:propeller:coefficient_map:altitude", 1000.0, units="m")
+        ivc.add_output("data:aerodynamics:propeller:coefficient_map:max_speed", 80.0, units="m/s")
+        ivc.add_output("data:aerodynamics:propeller:coefficient_map:min_speed", 5.0, units="m/s")
+        return ivc
+
+    problem_serial = run_system(component(1), inputs())
+    problem_parallel = run_system(component(4), inputs())
+
+    for name in ("advance_ratio", "power_coefficient", "thrust_coefficient"):
+        variable_name = "data:aerodynamics:propeller:coefficient_map:" + name
+        assert np.array_equal(problem_serial[variable_name], problem_parallel[variable_name])
+
+
+class _ComputePropellerPerformanceScalar(_ComputePropellerPerformance):
+    """Solves the induced speeds one point at a time with scipy, as the batched solver's fallback."""
+
+    def solve_speeds(self, speed_vect, args, x_tol=None):
+        return speed_vect, np.zeros(np.shape(speed_vect)[1:], dtype=bool)
+
+
+def test_propeller_performance_batched_solver():
+    """Tests that the batched Newton solver gives the same tables as the scalar scipy solve."""
+
+    def component(component_class):
+        return component_class(
+            sections_profile_name_list=[PROFILE],
+            sections_profile_position_list=[0],
+            elements_number=3,
+        )
+
+    problem_batched = run_system(
+        component(_ComputePropellerPerformance),
+        _get_inputs(component(_ComputePropellerPerformance)),
+    )
+    problem_scalar = run_system(
+        component(_ComputePropellerPerformanceScalar),
+        _get_inputs(component(_ComputePropellerPerformance)),
+    )
+
+    for level in ("sea_level", "cruise_level"):
+        for name in ("efficiency", "thrust", "thrust_limit"):
+            variable_name = "data:aerodynamics:propeller:" + level + ":" + name
+            assert problem_batched[variable_name] == pytest.approx(
+                problem_scalar[variable_name], rel=1e-6
+            )
+
+
+class _ComputePropellerPerformanceFromCache(_ComputePropellerPerformance):
+    """Fails if the tables are not read from the result store."""
+
+    def construct_table(self, inputs, speed_interp, altitude, omega):
+        raise AssertionError("Propeller tables should have been read from the result store")
+
+
+def test_propeller_performance_cache():
+    """Tests that the propeller tables are read from the result store when already computed."""
+
+    results_folder = tempfile.TemporaryDirectory()
+
+    def component(component_class=_ComputePropellerPerformance):
+        return component_class(
+            sections_profile_name_list=[PROFILE],
+            sections_profile_position_list=[0],
+            elements_number=3,
+            result_folder_path=results_folder.name,
+        )
+
+    problem = run_system(component(), _get_inputs(component()))
+    assert pth.exists(pth.join(results_folder.name, RESULT_STORE_FILE_NAME))
+
+    problem_cache = run_system(
+        component(_ComputePropellerPerformanceFromCache), _get_inputs(component())
+    )
+    for level in ("sea_level", "cruise_level"):
+        for name in ("efficiency", "thrust", "thrust_limit", "speed"):
+            variable_name = "data:aerodynamics:propeller:" + level + ":" + name
+            assert np.array_equal(problem[variable_name], problem_cache[variable_name])
+
+    # A change of rotation speed requires a new computation
+    problem_cache.set_val("data:geometry:propeller:average_rpm", 2400.0, units="rpm")
+    with pytest.raises(AssertionError, match="result store"):
+        problem_cache.run_model()
+
+    results_folder.cleanup()
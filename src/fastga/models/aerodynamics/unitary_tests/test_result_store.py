@@ -0,0 +1,113 @@
+"""Test module for the storage of external aerodynamic codes results."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os.path as pth
+import tempfile
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+from ..external.result_store import AeroResultStore, RESULT_STORE_FILE_NAME
+from ..external.xfoil.xfoil_polar import XfoilPolar
+
+PROCESS_COUNT = 6
+CASES_PER_PROCESS = 10
+
+
+def test_result_store():
+    """Tests the storage and retrieval of results in the indexed result store."""
+
+    results_folder = tempfile.TemporaryDirectory()
+    store = AeroResultStore(results_folder.name, "vlm")
+    geometry_set = np.array([0.0, 0.8, 7.98, 0.0, -0.0349066, 4.0, 0.6, 4.42, 0.248])
+    results = {
+        "cl_0_wing": 0.0962,
+        "y_vector_wing": np.linspace(0.1, 5.6, 17),
+        "cl_vector_wing": [0.97, 0.98, 1.01],
+    }
+
+    assert store.get(geometry_set) is None
+    store.put(geometry_set, results)
+    assert pth.exists(pth.join(results_folder.name, RESULT_STORE_FILE_NAME))
+
+    # Results are retrieved with a slightly different key as long as the rounded key is the same,
+    # and vectors are stored with no loss of precision
+    saved_results = AeroResultStore(results_folder.name, "vlm").get(geometry_set + 1e-8)
+    assert float(saved_results["cl_0_wing"]) == results["cl_0_wing"]
+    assert np.array_equal(saved_results["y_vector_wing"], results["y_vector_wing"])
+    assert np.array_equal(saved_results["cl_vector_wing"], results["cl_vector_wing"])
+
+    # Tables are independent
+    assert AeroResultStore(results_folder.name, "openvsp").get(geometry_set) is None
+
+    # Storing a case with the same key overwrites the previous one
+    store.put(geometry_set, {"cl_0_wing": 0.1})
+    assert float(store.get(geometry_set)["cl_0_wing"]) == 0.1
+    assert store.get(geometry_set * 1.01) is None
+
+    results_folder.cleanup()
+
+
+def _store_cases(args):
+    """Stores and reads back cases in the result store, as a process running VLM would."""
+
+    results_folder_path, process_index = args
+    store = AeroResultStore(results_folder_path, "vlm")
+    for case_index in range(CASES_PER_PROCESS):
+        key_values = [process_index, case_index]
+        store.put(key_values, {"cl_0_wing": process_index * 100.0 + case_index})
+        assert store.get(key_values) is not None
+
+
+def _save_polars(args):
+    """Adds polars to a shared csv file, as a process running Xfoil would."""
+
+    result_file, process_index = args
+    labels = ["mach", "reynolds", "cl_max_2d"]
+    for case_index in range(CASES_PER_PROCESS):
+        results = [0.1, process_index * 100.0 + case_index, 1.5]
+        XfoilPolar._save_results(result_file, results, labels)
+
+
+def test_concurrent_access():
+    """Tests that no result is lost when several processes save results at the same time."""
+
+    results_folder = tempfile.TemporaryDirectory()
+    result_file = pth.join(results_folder.name, "polar_results.csv")
+    args = [(results_folder.name, index) for index in range(PROCESS_COUNT)]
+    csv_args = [(result_file, index) for index in range(PROCESS_COUNT)]
+
+    with Pool(PROCESS_COUNT) as pool:
+        pool.map(_store_cases, args)
+        pool.map(_save_polars, csv_args)
+
+    store = AeroResultStore(results_folder.name, "vlm")
+    for process_index in range(PROCESS_COUNT):
+        for case_index in range(CASES_PER_PROCESS):
+            saved_results = store.get([process_index, case_index])
+            assert float(saved_results["cl_0_wing"]) == process_index * 100.0 + case_index
+
+    data_saved = pd.read_csv(result_file, index_col=0)
+    saved_reynolds = np.sort(data_saved.loc["reynolds", :].to_numpy().astype(float))
+    expected_reynolds = np.sort(
+        [
+            process_index * 100.0 + case_index
+            for process_index in range(PROCESS_COUNT)
+            for case_index in range(CASES_PER_PROCESS)
+        ]
+    )
+    assert np.array_equal(saved_reynolds, expected_reynolds)
+
+    results_folder.cleanup()
@@ -17,6 +17,7 @@ import openmdao.api as om
 import fastoad.api as oad
 
 from ..constants import SUBMODEL_WING_L1
+from ..wing_planform import wing_root_chord
 
 
 @oad.RegisterSubmodel(SUBMODEL_WING_L1, "fastga.submodel.geometry.wing.l1.legacy")
@@ -41,7 +42,7 @@ class ComputeWingL1(om.ExplicitComponent):
         y4_wing = inputs["data:geometry:wing:tip:y"]
         taper_ratio = inputs["data:geometry:wing:taper_ratio"]
 
-        l1_wing = wing_area / (2.0 * y2_wing + (y4_wing - y2_wing) * (1.0 + taper_ratio))
+        l1_wing = wing_root_chord(wing_area, y2_wing, y4_wing, taper_ratio)
 
         outputs["data:geometry:wing:root:virtual_chord"] = l1_wing
 
@@ -17,6 +17,7 @@ import openmdao.api as om
 import fastoad.api as oad
 
 from ..constants import SUBMODEL_WING_L4
+from ..wing_planform import wing_tip_chord
 
 
 @oad.RegisterSubmodel(SUBMODEL_WING_L4, "fastga.submodel.geometry.wing.l4.legacy")
@@ -37,7 +38,7 @@ class ComputeWingL4(om.ExplicitComponent):
         taper_ratio = inputs["data:geometry:wing:taper_ratio"]
         l1_wing = inputs["data:geometry:wing:root:virtual_chord"]
 
-        l4_wing = l1_wing * taper_ratio
+        l4_wing = wing_tip_chord(l1_wing, taper_ratio)
 
         outputs["data:geometry:wing:tip:chord"] = l4_wing
 
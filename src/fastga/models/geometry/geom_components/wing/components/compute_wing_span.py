@@ -17,6 +17,7 @@ import openmdao.api as om
 import fastoad.api as oad
 
 from ..constants import SUBMODEL_WING_SPAN
+from ..wing_planform import wing_span
 
 
 @oad.RegisterSubmodel(SUBMODEL_WING_SPAN, "fastga.submodel.geometry.wing.span.legacy")
@@ -39,7 +40,7 @@ class ComputeWingSpan(om.ExplicitComponent):
         lambda_wing = inputs["data:geometry:wing:aspect_ratio"]
         wing_area = inputs["data:geometry:wing:area"]
 
-        span = np.sqrt(lambda_wing * wing_area)
+        span = wing_span(lambda_wing, wing_area)
 
         outputs["data:geometry:wing:span"] = span
 
@@ -48,7 +49,7 @@ class ComputeWingSpan(om.ExplicitComponent):
         lambda_wing = inputs["data:geometry:wing:aspect_ratio"]
         wing_area = inputs["data:geometry:wing:area"]
 
-        span = np.sqrt(lambda_wing * wing_area)
+        span = wing_span(lambda_wing, wing_area)
 
         partials["data:geometry:wing:span", "data:geometry:wing:aspect_ratio"] = (
             0.5 * wing_area / span
@@ -17,6 +17,7 @@ import openmdao.api as om
 import fastoad.api as oad
 
 from ..constants import SUBMODEL_WING_Y_ROOT
+from ..wing_planform import wing_root_y
 
 
 @oad.RegisterSubmodel(SUBMODEL_WING_Y_ROOT, "fastga.submodel.geometry.wing.y.root.legacy")
@@ -37,6 +38,6 @@ class ComputeWingYRoot(om.ExplicitComponent):
 
         width_max = inputs["data:geometry:fuselage:maximum_width"]
 
-        y2_wing = width_max / 2.0
+        y2_wing = wing_root_y(width_max)
 
         outputs["data:geometry:wing:root:y"] = y2_wing
@@ -17,6 +17,7 @@ import openmdao.api as om
 import fastoad.api as oad
 
 from ..constants import SUBMODEL_WING_Y_TIP
+from ..wing_planform import wing_tip_y
 
 
 @oad.RegisterSubmodel(SUBMODEL_WING_Y_TIP, "fastga.submodel.geometry.wing.y.tip.legacy")
@@ -37,6 +38,6 @@ class ComputeWingYTip(om.ExplicitComponent):
 
         span = inputs["data:geometry:wing:span"]
 
-        y4_wing = span / 2.0
+        y4_wing = wing_tip_y(span)
 
         outputs["data:geometry:wing:tip:y"] = y4_wing
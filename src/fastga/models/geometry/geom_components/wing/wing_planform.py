@@ -0,0 +1,75 @@
+"""Relations of the wing planform shared by the wing geometry components and the loops."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+def wing_span(aspect_ratio, wing_area):
+    """
+    Computes the wing span.
+
+    :param aspect_ratio: wing aspect ratio
+    :param wing_area: wing area, in m**2
+    :return: wing span, in m
+    """
+
+    return np.sqrt(aspect_ratio * wing_area)
+
+
+def wing_root_y(fuselage_maximum_width):
+    """
+    Computes the Y position of the wing root.
+
+    :param fuselage_maximum_width: maximum width of the fuselage, in m
+    :return: Y position of the wing root, in m
+    """
+
+    return fuselage_maximum_width / 2.0
+
+
+def wing_tip_y(span):
+    """
+    Computes the Y position of the wing tip.
+
+    :param span: wing span, in m
+    :return: Y position of the wing tip, in m
+    """
+
+    return span / 2.0
+
+
+def wing_root_chord(wing_area, root_y, tip_y, taper_ratio):
+    """
+    Computes the wing root chord, the virtual root chord has the same value.
+
+    :param wing_area: wing area, in m**2
+    :param root_y: Y position of the wing root, in m
+    :param tip_y: Y position of the wing tip, in m
+    :param taper_ratio: wing taper ratio
+    :return: wing root chord, in m
+    """
+
+    return wing_area / (2.0 * root_y + (tip_y - root_y) * (1.0 + taper_ratio))
+
+
+def wing_tip_chord(virtual_root_chord, taper_ratio):
+    """
+    Computes the wing tip chord.
+
+    :param virtual_root_chord: wing virtual root chord, in m
+    :param taper_ratio: wing taper ratio
+    :return: wing tip chord, in m
+    """
+
+    return virtual_root_chord * taper_ratio
@@ -37,8 +37,8 @@ class ComputeMFWAdvanced(om.ExplicitComponent):
     "data:geometry:propulsion:tank:y_ratio_tank_beginning" and
     "data:geometry:propulsion:tank:y_ratio_tank_end" have to be determined as close to possible
     as the real aircraft quantities. The quantity "settings:geometry:fuel_tanks:depth" allows to
-    calibrate the model for each aircraft. WARNING : If this class is updated, update_wing_area
-    will have to be updated as well as it uses the same approach.
+    calibrate the model for each aircraft. The computation is done in maximum_fuel_weight which
+    is also used by the advanced geometric wing area loop.
     """
 
     def setup(self):
@@ -73,39 +73,64 @@ class ComputeMFWAdvanced(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        fuel_type = inputs["data:propulsion:fuel_type"]
-        y_ratio_tank_beginning = inputs["data:geometry:propulsion:tank:y_ratio_tank_beginning"]
-        y_ratio_tank_end = inputs["data:geometry:propulsion:tank:y_ratio_tank_end"]
-        span = inputs["data:geometry:wing:span"]
+        outputs["data:weight:aircraft:MFW"] = maximum_fuel_weight(inputs)
 
-        if fuel_type == 1.0:
-            m_vol_fuel = 718.9  # gasoline volume-mass [kg/m**3], cold worst case, Avgas
-        elif fuel_type == 2.0:
-            m_vol_fuel = 860.0  # Diesel volume-mass [kg/m**3], cold worst case
-        elif fuel_type == 3.0:
-            m_vol_fuel = 804.0  # Jet-A1 volume mass [kg/m**3], cold worst case
-        else:
-            m_vol_fuel = 718.9
-            warnings.warn("Fuel type {} does not exist, replaced by type 1!".format(fuel_type))
 
-        semi_span = span / 2
-        y_tank_beginning = semi_span * y_ratio_tank_beginning
-        y_tank_end = semi_span * y_ratio_tank_end
-        y_array = np.linspace(y_tank_beginning, y_tank_end, POINTS_NB_WING)
+def fuel_volume_mass(fuel_type):
+    """
+    Returns the volume-mass of the fuel, cold worst case.
+
+    :param fuel_type: type of fuel, 1.0 for Avgas, 2.0 for Diesel and 3.0 for Jet-A1
+    :return: the volume-mass of the fuel, in kg/m**3
+    """
+
+    if fuel_type == 1.0:
+        m_vol_fuel = 718.9  # gasoline volume-mass [kg/m**3], cold worst case, Avgas
+    elif fuel_type == 2.0:
+        m_vol_fuel = 860.0  # Diesel volume-mass [kg/m**3], cold worst case
+    elif fuel_type == 3.0:
+        m_vol_fuel = 804.0  # Jet-A1 volume mass [kg/m**3], cold worst case
+    else:
+        m_vol_fuel = 718.9
+        warnings.warn("Fuel type {} does not exist, replaced by type 1!".format(fuel_type))
 
-        # Computation of the fuel volume available in one wing. The 0.85 coefficient represents
-        # the internal obstructions caused by the structural and system components within the
-        # tank, typical of integral tanks.
+    return m_vol_fuel
+
+
+def maximum_fuel_weight(inputs):
+    """
+    Computes the maximum fuel weight that can be stored in the wings. Only relies on NumPy so
+    that it can be evaluated directly by the loops that size the wing based on its fuel
+    capacity.
+
+    :param inputs: inputs of ComputeMFWAdvanced, as the inputs vector of the component or as a
+    dictionary with the same keys and values in SI units
+    :return: the maximum fuel weight, in kg
+    """
+
+    fuel_type = inputs["data:propulsion:fuel_type"]
+    y_ratio_tank_beginning = inputs["data:geometry:propulsion:tank:y_ratio_tank_beginning"]
+    y_ratio_tank_end = inputs["data:geometry:propulsion:tank:y_ratio_tank_end"]
+    span = inputs["data:geometry:wing:span"]
+
+    m_vol_fuel = fuel_volume_mass(fuel_type)
+
+    semi_span = span / 2
+    y_tank_beginning = semi_span * y_ratio_tank_beginning
+    y_tank_end = semi_span * y_ratio_tank_end
+    y_array = np.linspace(y_tank_beginning, y_tank_end, POINTS_NB_WING)
 
-        area_array = tank_volume_distribution(inputs, y_array)
+    # Computation of the fuel volume available in one wing. The 0.85 coefficient represents
+    # the internal obstructions caused by the structural and system components within the
+    # tank, typical of integral tanks.
 
-        tank_volume_one_wing = trapz(area_array, y_array.flatten())
+    area_array = tank_volume_distribution(inputs, y_array)
 
-        tank_volume = tank_volume_one_wing * 2
+    tank_volume_one_wing = trapz(area_array, y_array.flatten())
 
-        maximum_fuel_weight = tank_volume * m_vol_fuel
+    tank_volume = tank_volume_one_wing * 2
 
-        outputs["data:weight:aircraft:MFW"] = maximum_fuel_weight
+    return tank_volume * m_vol_fuel
 
 
 def tank_volume_distribution(inputs, y_array_orig):
@@ -137,30 +162,23 @@ def tank_volume_distribution(inputs, y_array_orig):
     y_tank_beginning = semi_span * y_ratio_tank_beginning
     y_tank_end = semi_span * y_ratio_tank_end
 
-    y_in_tank_index = np.where((y_array >= y_tank_beginning) & (y_array <= y_tank_end))[0]
-    y_in_tank_array = y_array[y_in_tank_index]
+    in_tank = (y_array >= y_tank_beginning) & (y_array <= y_tank_end)
+    in_fuselage = y_array < root_y
+    y_in_tank_array = y_array[in_tank]
 
     slope_chord = (tip_chord - root_chord) / (tip_y - root_y)
 
-    chord_array = np.zeros_like(y_array)
-    for y in y_in_tank_array:
-        idx = np.where(y_array == y)[0]
-        if y < root_y:
-            chord_array[idx] = root_chord
-        else:
-            chord_array[idx] = slope_chord * y + root_chord
+    chord_array = np.where(
+        in_tank, np.where(in_fuselage, root_chord, slope_chord * y_array + root_chord), 0.0
+    )
 
     # Computation of the thickness ratio profile along the span, as tc = slope * y +
     # tc_fuselage_center.
     slope_tc = (tip_tc - root_tc) / (tip_y - root_y)
     # fuselage_center_virtual_tc = 0.5 * (root_tc + tip_tc - slope_tc * (root_y + tip_y))
-    thickness_ratio_array = np.zeros_like(y_array)
-    for y in y_in_tank_array:
-        idx = np.where(y_array == y)[0]
-        if y < root_y:
-            thickness_ratio_array[idx] = root_tc
-        else:
-            thickness_ratio_array[idx] = slope_tc * y + root_tc
+    thickness_ratio_array = np.where(
+        in_tank, np.where(in_fuselage, root_tc, slope_tc * y_array + root_tc), 0.0
+    )
     # thickness_ratio_array = slope_tc * y_array + fuselage_center_virtual_tc
 
     # The k factor stating the depth of the fuel tanks is included here.
@@ -174,10 +192,11 @@ def tank_volume_distribution(inputs, y_array_orig):
 
     y_eng_array = semi_span * np.array(y_ratio)
 
-    in_eng_nacelle = np.full(len(y_in_tank_array), False)
-    for y_eng in y_eng_array:
-        for i in np.where(abs(y_in_tank_array - y_eng) <= nacelle_width / 2.0):
-            in_eng_nacelle[i] = True
+    in_eng_nacelle = np.any(
+        np.abs(y_in_tank_array[:, np.newaxis] - y_eng_array.flatten()[np.newaxis, :])
+        <= nacelle_width / 2.0,
+        axis=1,
+    )
     where_engine = np.where(in_eng_nacelle)
 
     width_array = (
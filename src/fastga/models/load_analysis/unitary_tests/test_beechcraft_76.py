@@ -18,7 +18,7 @@ import numpy as np
 import pytest
 
 
-from ..wing.aerostructural_loads import AerostructuralLoad
+from ..wing.aerostructural_loads import AerostructuralLoad, reverse_cumulative_trapezoid
 from ..wing.structural_loads import StructuralLoads
 from ..wing.aerodynamic_loads import AerodynamicLoads
 from ..wing.loads import WingLoads
@@ -287,6 +287,28 @@ def test_compute_root_bending_moment():
     assert weight_rbm == pytest.approx(-34854, abs=1)
 
 
+def test_reverse_cumulative_trapezoid():
+    # Non-uniform grid with a repeated station, as when point masses are added to the wing
+    y_vector = np.array([0.0, 0.3, 0.35, 1.1, 1.1, 2.0, 3.7, 4.05, 5.5])
+    force_array = np.array([120.0, 95.0, -40.0, 80.0, 60.0, 55.0, 30.0, 12.0, 0.0])
+
+    integral = reverse_cumulative_trapezoid(force_array, y_vector)
+    shear_force_diagram = AerostructuralLoad.compute_shear_diagram(y_vector, force_array)
+    bending_moment_diagram = AerostructuralLoad.compute_bending_moment_diagram(
+        y_vector, force_array
+    )
+
+    for i in range(len(y_vector)):
+        expected_shear = np.trapz(force_array[i:], y_vector[i:])
+        expected_bending = np.trapz(force_array[i:] * (y_vector[i:] - y_vector[i]), y_vector[i:])
+        assert integral[i] == pytest.approx(expected_shear, rel=1e-12, abs=1e-10)
+        assert shear_force_diagram[i] == pytest.approx(expected_shear, rel=1e-12, abs=1e-10)
+        assert bending_moment_diagram[i] == pytest.approx(expected_bending, rel=1e-9, abs=1e-9)
+
+    # The integral is taken from each station to the tip, so it vanishes at the last one
+    assert integral[-1] == 0.0
+
+
 def test_compute_mass_distribution():
     # Research independent input value in .xml file
     ivc = get_indep_var_comp(list_inputs(StructuralLoads()), __file__, XML_FILE)
@@ -33,6 +33,27 @@ from .constants import SUBMODEL_AEROSTRUCTURAL_LOADS, NB_POINTS_POINT_MASS, POIN
 SPAN_MESH_POINT_LOADS = int(1.5 * SPAN_MESH_POINT)
 
 
+def reverse_cumulative_trapezoid(values, x_vector):
+    """
+    Computes, for each station, the integral of the values from that station to the last one
+    with the trapezoidal rule. Gives the same results as calling trapz on the tail of the arrays
+    for each station, but in a single pass.
+
+    :param values: an array containing the values to integrate
+    :param x_vector: an array containing the position of the stations
+    :return: an array containing the integral from each station to the end of the arrays
+    """
+
+    values = np.asarray(values, dtype=float)
+    x_vector = np.asarray(x_vector, dtype=float)
+
+    segment_integrals = 0.5 * (values[:-1] + values[1:]) * np.diff(x_vector)
+    tail_integrals = np.zeros(len(x_vector))
+    tail_integrals[:-1] = np.cumsum(segment_integrals[::-1])[::-1]
+
+    return tail_integrals
+
+
 @oad.RegisterSubmodel(
     SUBMODEL_AEROSTRUCTURAL_LOADS, "fastga.submodel.loads.wings.aerostructural.legacy"
 )
@@ -377,13 +398,10 @@ class AerostructuralLoad(om.ExplicitComponent):
         given in input
         """
 
-        # We first create the array to fill
-        shear_force_diagram = np.zeros(len(y_vector))
-
         # Each station of the shear diagram is equal to the integral of the forces on all
-        # subsequent station
-        for i, _ in enumerate(y_vector):
-            shear_force_diagram[i] = trapz(force_array[i:], y_vector[i:])
+        # subsequent station, which is the reversed cumulative sum of the trapezoid of each
+        # segment
+        shear_force_diagram = reverse_cumulative_trapezoid(force_array, y_vector)
 
         return shear_force_diagram
 
@@ -400,14 +418,13 @@ class AerostructuralLoad(om.ExplicitComponent):
         input
         """
 
-        # We first create the array to fill
-        bending_moment_diagram = np.zeros(len(y_vector))
-
         # Each station of the shear diagram is equal to the root bending moment created by all
-        # subsequent stations
-        for i, _ in enumerate(y_vector):
-            lever_arm = y_vector - y_vector[i]
-            bending_moment_diagram[i] = trapz(force_array[i:] * lever_arm[i:], y_vector[i:])
+        # subsequent stations. Since the lever arm is y - y_i, the moment can be split into the
+        # first moment of the forces minus y_i times the shear at that station, both being
+        # computed with a single reversed cumulative integration
+        bending_moment_diagram = reverse_cumulative_trapezoid(
+            force_array * y_vector, y_vector
+        ) - y_vector * reverse_cumulative_trapezoid(force_array, y_vector)
 
         return bending_moment_diagram
 
@@ -16,10 +16,23 @@ test module for wing area computation.
 
 import os.path as pth
 
+import numpy as np
 import openmdao.api as om
 
 from numpy.testing import assert_allclose
 
+from fastga.models.geometry.geom_components.wing.components import (
+    ComputeWingSpan,
+    ComputeWingYRoot,
+    ComputeWingYTip,
+    ComputeWingL1,
+    ComputeWingL2,
+    ComputeWingL4,
+)
+from fastga.models.geometry.geom_components.wing_tank.compute_mfw_advanced import (
+    ComputeMFWAdvanced,
+)
+
 from ..wing_area_component.wing_area_loop_geom_simple import (
     UpdateWingAreaGeomSimple,
     ConstraintWingAreaGeomSimple,
@@ -35,6 +48,7 @@ from ..wing_area_component.wing_area_loop_geom_adv import (
 from ..wing_area_component.wing_area_cl_equilibrium import (
     UpdateWingAreaLiftEquilibrium,
     ConstraintWingAreaLiftEquilibrium,
+    compute_wing_area,
 )
 from ..wing_area_component.update_wing_area import UpdateWingArea
 from ..update_wing_area_group import UpdateWingAreaGroup
@@ -207,6 +221,58 @@ def test_advanced_geom():
     assert_allclose(problem_cons["data:constraints:wing:additional_fuel_capacity"], 0.0, atol=1)
 
 
+def test_advanced_geom_matches_components():
+
+    # The constraint is computed next to the geometry components it replaces so that their
+    # results can be compared on the same inputs
+    group = om.Group()
+    group.add_subsystem("span", ComputeWingSpan(), promotes=["*"])
+    group.add_subsystem("y_root", ComputeWingYRoot(), promotes=["*"])
+    group.add_subsystem("y_tip", ComputeWingYTip(), promotes=["*"])
+    group.add_subsystem("l1", ComputeWingL1(), promotes=["*"])
+    group.add_subsystem("l2", ComputeWingL2(), promotes=["*"])
+    group.add_subsystem("l4", ComputeWingL4(), promotes=["*"])
+    group.add_subsystem("mfw", ComputeMFWAdvanced(), promotes=["*"])
+    group.add_subsystem("constraint", ConstraintWingAreaGeomAdvanced(), promotes=["*"])
+
+    ivc = om.IndepVarComp()
+    ivc.add_output("data:propulsion:fuel_type", 1.0)
+    ivc.add_output("data:geometry:wing:root:thickness_ratio", 0.149)
+    ivc.add_output("data:geometry:wing:tip:thickness_ratio", 0.103)
+    ivc.add_output("data:geometry:wing:kink:span_ratio", 0.0)
+    ivc.add_output("data:mission:sizing:fuel", val=600.0, units="kg")
+    ivc.add_output("data:geometry:wing:taper_ratio", val=0.8)
+    ivc.add_output("data:geometry:wing:aspect_ratio", val=4)
+    ivc.add_output("data:geometry:flap:chord_ratio", val=0.15)
+    ivc.add_output("data:geometry:wing:aileron:chord_ratio", val=0.2)
+    ivc.add_output("data:geometry:fuselage:maximum_width", val=1.5, units="m")
+    ivc.add_output("data:geometry:propulsion:tank:y_ratio_tank_beginning", val=0.2)
+    ivc.add_output("data:geometry:propulsion:tank:y_ratio_tank_end", val=0.8)
+    ivc.add_output("data:geometry:propulsion:engine:layout", val=1.0)
+    ivc.add_output(
+        "data:geometry:propulsion:engine:y_ratio",
+        val=0.34,
+    )
+    ivc.add_output("data:geometry:propulsion:tank:LE_chord_percentage", val=0.05)
+    ivc.add_output("data:geometry:propulsion:tank:TE_chord_percentage", val=0.05)
+    ivc.add_output("data:geometry:landing_gear:type", val=1.0)
+    ivc.add_output("data:geometry:landing_gear:y", val=1.5, units="m")
+    ivc.add_output("data:geometry:propulsion:nacelle:width", val=0.9291288709126333, units="m")
+    ivc.add_output("settings:geometry:fuel_tanks:depth", val=0.6)
+    ivc.add_output("data:geometry:wing:area", val=21.72, units="m**2")
+
+    problem = run_system(group, ivc)
+    for wing_area in [12.0, 16.8871, 21.72]:
+        problem.set_val("data:geometry:wing:area", wing_area, units="m**2")
+        problem.run_model()
+        assert_allclose(
+            problem.get_val("data:constraints:wing:additional_fuel_capacity", units="kg"),
+            problem.get_val("data:weight:aircraft:MFW", units="kg")
+            - problem.get_val("data:mission:sizing:fuel", units="kg"),
+            rtol=1e-10,
+        )
+
+
 def test_advanced_cl():
 
     xml_file = "beechcraft_76.xml"
@@ -254,6 +320,65 @@ def test_advanced_cl():
     )
 
 
+def test_advanced_cl_search():
+    """
+    Tests the search of the smallest wing area allowing the landing equilibrium on an analytic
+    equilibrium, the bounds being reached above and below the initial guess of 9.3 m**2.
+    """
+
+    inputs = {
+        "data:TLAR:v_approach": 40.0,
+        "data:weight:aircraft:MLW": 1100.0,
+        "data:weight:aircraft:CG:aft:x": 3.0,
+        "data:weight:aircraft:CG:fwd:x": 2.8,
+        "data:aerodynamics:flaps:landing:CL": 0.6,
+        "data:aerodynamics:wing:cruise:CL_alpha": 4.6,
+        "data:aerodynamics:wing:cruise:CL0_clean": 0.1,
+        "data:aerodynamics:aircraft:landing:CL_max": 2.0,
+        "data:mission:sizing:landing:elevator_angle": -25.0,
+        "data:mission:sizing:takeoff:elevator_angle": -20.0,
+    }
+    alpha_max = (2.0 - 0.6 - 0.1) / 4.6 * 180.0 / np.pi
+
+    def equilibrium_problem(alpha_factor, thrust_rate_factor):
+        ivc = om.IndepVarComp()
+        ivc.add_output("data:geometry:wing:area", val=10.0, units="m**2")
+        ivc.add_output("mass", val=np.full(2, np.nan), units="kg")
+        ivc.add_output("x_cg", val=np.full(2, np.nan), units="m")
+        ivc.add_output("true_airspeed", val=np.full(2, np.nan), units="m/s")
+
+        problem = om.Problem()
+        problem.model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
+        problem.model.add_subsystem(
+            "equilibrium",
+            om.ExecComp(
+                [
+                    "alpha = %f / wing_area" % alpha_factor,
+                    "delta_m = -50.0 / wing_area",
+                    "thrust_rate = 0.5 - %f / wing_area" % thrust_rate_factor,
+                ],
+                wing_area={"units": "m**2"},
+                alpha={"shape": 2, "units": "deg"},
+                delta_m={"shape": 2, "units": "deg"},
+                thrust_rate={"shape": 2},
+            ),
+            promotes_outputs=["*"],
+        )
+        problem.model.connect("data:geometry:wing:area", "equilibrium.wing_area")
+        problem.setup()
+
+        return problem
+
+    # Angle of attack at max lift reached above and below the initial guess
+    for wing_area in (12.0, 6.0):
+        problem = equilibrium_problem(wing_area * alpha_max, 0.0)
+        assert_allclose(compute_wing_area(inputs, [], problem), wing_area, rtol=1e-4)
+
+    # The thrust rate can't be negative, which limits the wing area before the angle of attack
+    problem = equilibrium_problem(6.0 * alpha_max, 4.0)
+    assert_allclose(compute_wing_area(inputs, [], problem), 8.0, rtol=1e-4)
+
+
 def test_update_wing_area():
 
     ivc_geom = om.IndepVarComp()
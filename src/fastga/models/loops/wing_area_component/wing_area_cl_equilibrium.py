@@ -21,6 +21,7 @@ import numpy as np
 import openmdao.api as om
 
 from scipy.constants import g
+from scipy.optimize import brentq
 
 import fastoad.api as oad
 from fastoad.openmdao.problem import AutoUnitsDefaultGroup
@@ -56,9 +57,15 @@ class UpdateWingAreaLiftEquilibrium(om.ExplicitComponent):
         self.add_input("data:weight:aircraft:CG:aft:x", val=np.nan, units="m")
         self.add_input("data:weight:aircraft:CG:fwd:x", val=np.nan, units="m")
 
+        # The sub-problem that computes the equilibrium is built on the first call to compute
+        # and reused afterwards
+        self._equilibrium_problem = None
+        self._equilibrium_input_names = []
+
         input_zip = zip_equilibrium_input(self.options["propulsion_id"])
         for var_names, var_unit, var_shape, var_shape_by_conn, var_copy_shape in input_zip:
             if var_names[:5] == "data:" and var_names != "data:geometry:wing:area":
+                self._equilibrium_input_names.append(var_names)
                 if var_shape_by_conn:
                     self.add_input(
                         name=var_names,
@@ -97,10 +104,16 @@ class UpdateWingAreaLiftEquilibrium(om.ExplicitComponent):
 
         wing_area_landing_init_guess = 2 * mlw * g / (stall_speed ** 2) / (1.225 * max_cl)
 
-        wing_area_approach = compute_wing_area(inputs, self.options["propulsion_id"])
+        if self._equilibrium_problem is None:
+            self._equilibrium_problem = setup_equilibrium_problem(
+                inputs, self._equilibrium_input_names, self.options["propulsion_id"]
+            )
+
+        wing_area_approach = compute_wing_area(
+            inputs, self._equilibrium_input_names, self._equilibrium_problem
+        )
 
         if wing_area_approach > 1.2 * wing_area_landing_init_guess:
-            print("Vrai valeur", wing_area_approach)
             wing_area_approach = wing_area_landing_init_guess
             _LOGGER.info(
                 "Wing area too far from potential data, taking backup value for this iteration"
@@ -130,9 +143,15 @@ class ConstraintWingAreaLiftEquilibrium(om.ExplicitComponent):
         self.add_input("data:weight:aircraft:CG:aft:x", val=np.nan, units="m")
         self.add_input("data:weight:aircraft:CG:fwd:x", val=np.nan, units="m")
 
+        # The sub-problem that computes the equilibrium is built on the first call to compute
+        # and reused afterwards
+        self._equilibrium_problem = None
+        self._equilibrium_input_names = []
+
         input_zip = zip_equilibrium_input(self.options["propulsion_id"])
         for var_names, var_unit, var_shape, var_shape_by_conn, var_copy_shape in input_zip:
             if var_names[:5] == "data:" and var_names != "data:geometry:wing:area":
+                self._equilibrium_input_names.append(var_names)
                 if var_shape_by_conn:
                     self.add_input(
                         name=var_names,
@@ -165,7 +184,14 @@ class ConstraintWingAreaLiftEquilibrium(om.ExplicitComponent):
         mlw = inputs["data:weight:aircraft:MLW"]
         wing_area_actual = inputs["data:geometry:wing:area"]
 
-        wing_area_constraint = compute_wing_area(inputs, self.options["propulsion_id"])
+        if self._equilibrium_problem is None:
+            self._equilibrium_problem = setup_equilibrium_problem(
+                inputs, self._equilibrium_input_names, self.options["propulsion_id"]
+            )
+
+        wing_area_constraint = compute_wing_area(
+            inputs, self._equilibrium_input_names, self._equilibrium_problem
+        )
 
         additional_cl = (
             (2.0 * mlw * g)
@@ -185,30 +211,23 @@ class _IDThrustRate(om.ExplicitComponent):
         outputs["thrust_rate"] = inputs["thrust_rate_t_econ"][0:2]
 
 
-def compute_wing_area(inputs, propulsion_id):
-
-    # First, setup an initial guess
-    stall_speed = inputs["data:TLAR:v_approach"] / 1.3
-    mlw = inputs["data:weight:aircraft:MLW"]
-    cg_max_aft = float(inputs["data:weight:aircraft:CG:aft:x"])
-    cg_max_fwd = float(inputs["data:weight:aircraft:CG:fwd:x"])
-    delta_cl_flaps = inputs["data:aerodynamics:flaps:landing:CL"]
-    cl_alpha = inputs["data:aerodynamics:wing:cruise:CL_alpha"]
-    cl_0_wing = inputs["data:aerodynamics:wing:cruise:CL0_clean"]
-    max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
-    min_elevator_angle = min(
-        inputs["data:mission:sizing:landing:elevator_angle"],
-        inputs["data:mission:sizing:takeoff:elevator_angle"],
-    )
-    wing_area_landing_init_guess = 2 * mlw * g / (stall_speed ** 2) / (1.225 * max_cl)
-
-    alpha_max = (max_cl - delta_cl_flaps - cl_0_wing) / cl_alpha * 180.0 / np.pi
-
-    input_zip = zip_equilibrium_input(propulsion_id)
+def setup_equilibrium_problem(inputs, equilibrium_input_names, propulsion_id):
+    """
+    Creates and setups the problem that computes the equilibrium of the aircraft at stall speed
+    in landing configuration for the most forward and the most aft center of gravity. The problem
+    is meant to be reused for all the computations of the wing area, only the values of its
+    inputs are updated in compute_wing_area.
+
+    :param inputs: inputs of the component, used to get the shape of the variables
+    :param equilibrium_input_names: names of the inputs of the equilibrium that are inputs of
+    the component
+    :param propulsion_id: ID of propulsion wrapped to be used for computation of equilibrium.
+    :return problem: the equilibrium problem, already setup.
+    """
 
     ivc = om.IndepVarComp()
-    for var_names, var_unit, _, _, _ in input_zip:
-        if var_names[:5] == "data:" and var_names != "data:geometry:wing:area":
+    for var_names, var_unit, _, _, _ in zip_equilibrium_input(propulsion_id):
+        if var_names in equilibrium_input_names:
             ivc.add_output(
                 name=var_names,
                 val=inputs[var_names],
@@ -216,15 +235,16 @@ def compute_wing_area(inputs, propulsion_id):
                 shape=np.shape(inputs[var_names]),
             )
 
+    ivc.add_output(name="data:geometry:wing:area", val=np.nan, units="m**2")
     ivc.add_output(name="d_vx_dt", val=np.array([0.0, 0.0]), units="m/s**2")
-    ivc.add_output(name="mass", val=np.array([mlw, mlw]), units="kg")
+    ivc.add_output(name="mass", val=np.full(2, np.nan), units="kg")
     # x_cg should be evaluated at the worst case scenario so either max aft or max fwd
-    ivc.add_output(name="x_cg", val=np.array([cg_max_fwd, cg_max_aft]), units="m")
-    ivc.add_output(name="gamma", val=np.array([0.0, 0.0]), units=None)
+    ivc.add_output(name="x_cg", val=np.full(2, np.nan), units="m")
+    ivc.add_output(name="gamma", val=np.array([0.0, 0.0]), units="deg")
     ivc.add_output(name="altitude", val=np.array([0.0, 0.0]), units="m")
     # Time step is not important since we don't care about the fuel consumption
     ivc.add_output(name="time_step", val=np.array([0.0, 0.0]), units="s")
-    ivc.add_output(name="true_airspeed", val=np.array([stall_speed, stall_speed]), units="m/s")
+    ivc.add_output(name="true_airspeed", val=np.full(2, np.nan), units="m/s")
     ivc.add_output(name="engine_setting", val=np.full(2, EngineSetting.TAKEOFF))
 
     problem = om.Problem()
@@ -244,49 +264,112 @@ def compute_wing_area(inputs, propulsion_id):
     model.add_subsystem("thrust_rate_id", _IDThrustRate(), promotes=["*"])
 
     model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
-    model.nonlinear_solver.options["iprint"] = 2
+    model.nonlinear_solver.options["iprint"] = 0
     model.nonlinear_solver.options["maxiter"] = 100
     model.nonlinear_solver.options["rtol"] = 1e-4
     model.linear_solver = om.DirectSolver()
 
-    problem.driver = om.ScipyOptimizeDriver()
-    problem.driver.options["optimizer"] = "SLSQP"
-    problem.driver.options["maxiter"] = 100
-    problem.driver.options["tol"] = 1e-4
+    problem.setup()
 
-    problem.model.add_design_var(
-        name="data:geometry:wing:area",
-        units="m**2",
-        lower=1.0,
-        upper=2.0 * wing_area_landing_init_guess,
-    )
+    return problem
 
-    problem.model.add_objective(name="data:geometry:wing:area", units="m**2")
 
-    problem.model.add_constraint(
-        name="alpha", units="deg", lower=[0.0, 0.0], upper=[alpha_max, alpha_max]
-    )
-    problem.model.add_constraint(name="thrust_rate", lower=[0.0, 0.0], upper=[1.0, 1.0])
-    problem.model.add_constraint(
-        name="delta_m",
-        lower=[min_elevator_angle, min_elevator_angle],
-        upper=[abs(min_elevator_angle), abs(min_elevator_angle)],
+def compute_wing_area(inputs, equilibrium_input_names, problem):
+    """
+    Computes the smallest wing area for which the aircraft can be trimmed at stall speed in
+    landing configuration for both the most forward and the most aft center of gravity, with the
+    angle of attack between 0 and the angle at max lift, the elevator deflection within its
+    limits and the thrust rate between 0 and full throttle.
+
+    The smallest of the margins to those bounds is negative for the wing areas that are too
+    small, so the smallest area is found with a bracketed root search on it, each evaluation
+    being an equilibrium computation with the problem given as input.
+
+    :param inputs: inputs of the component
+    :param equilibrium_input_names: names of the inputs of the equilibrium that are inputs of
+    the component
+    :param problem: equilibrium problem, as created by setup_equilibrium_problem
+    :return wing_area_approach: the wing area, in m**2
+    """
+
+    # First, setup an initial guess
+    stall_speed = float(inputs["data:TLAR:v_approach"]) / 1.3
+    mlw = float(inputs["data:weight:aircraft:MLW"])
+    cg_max_aft = float(inputs["data:weight:aircraft:CG:aft:x"])
+    cg_max_fwd = float(inputs["data:weight:aircraft:CG:fwd:x"])
+    delta_cl_flaps = float(inputs["data:aerodynamics:flaps:landing:CL"])
+    cl_alpha = float(inputs["data:aerodynamics:wing:cruise:CL_alpha"])
+    cl_0_wing = float(inputs["data:aerodynamics:wing:cruise:CL0_clean"])
+    max_cl = float(inputs["data:aerodynamics:aircraft:landing:CL_max"])
+    min_elevator_angle = float(
+        min(
+            inputs["data:mission:sizing:landing:elevator_angle"],
+            inputs["data:mission:sizing:takeoff:elevator_angle"],
+        )
     )
+    wing_area_landing_init_guess = 2 * mlw * g / (stall_speed ** 2) / (1.225 * max_cl)
 
-    problem.model.approx_totals()
+    alpha_max = (max_cl - delta_cl_flaps - cl_0_wing) / cl_alpha * 180.0 / np.pi
 
-    problem.setup()
+    for var_names in equilibrium_input_names:
+        problem[var_names] = inputs[var_names]
+
+    problem["mass"] = np.array([mlw, mlw])
+    problem.set_val("x_cg", np.array([cg_max_fwd, cg_max_aft]), units="m")
+    problem.set_val("true_airspeed", np.array([stall_speed, stall_speed]), units="m/s")
 
-    problem["data:geometry:wing:area"] = wing_area_landing_init_guess
-    problem["delta_m"] = np.array([0.9 * min_elevator_angle, 0.9 * min_elevator_angle])
-    problem["alpha"] = np.array([0.9 * alpha_max, 0.9 * alpha_max])
+    # Same initial guess for every call so that the result does not depend on the previous ones
+    problem.set_val("delta_m", np.array([0.9 * min_elevator_angle, 0.9 * min_elevator_angle]))
+    problem.set_val("alpha", np.array([0.9 * alpha_max, 0.9 * alpha_max]), units="deg")
 
-    problem.run_driver()
+    def trim_margin(wing_area):
 
-    print(problem["delta_m"])
-    print(problem["alpha"])
+        problem.set_val("data:geometry:wing:area", wing_area, units="m**2")
+        problem.run_model()
 
-    wing_area_approach = problem.get_val("data:geometry:wing:area", units="m**2")
+        alpha = problem.get_val("alpha", units="deg")
+        delta_m = problem.get_val("delta_m", units="deg")
+        thrust_rate = problem.get_val("thrust_rate")
+
+        # Margins to the lower and upper bounds of each variable, normalized by the width of
+        # its range
+        return min(
+            np.min(alpha_max - alpha) / alpha_max,
+            np.min(alpha) / alpha_max,
+            np.min(delta_m - min_elevator_angle) / (2.0 * abs(min_elevator_angle)),
+            np.min(abs(min_elevator_angle) - delta_m) / (2.0 * abs(min_elevator_angle)),
+            np.min(1.0 - thrust_rate),
+            np.min(thrust_rate),
+        )
+
+    wing_area_min = 1.0
+    wing_area_max = 2.0 * wing_area_landing_init_guess
+
+    # Increase the upper bound of the search interval until the equilibrium can be reached,
+    # starting from the initial guess
+    wing_area_lower = None
+    wing_area_upper = wing_area_landing_init_guess
+    while trim_margin(wing_area_upper) < 0.0:
+        if wing_area_upper >= wing_area_max:
+            _LOGGER.warning(
+                "Could not find a wing area that allows an equilibrium at stall speed in landing "
+                "configuration, taking the upper bound of the search interval",
+            )
+            return wing_area_max
+        wing_area_lower = wing_area_upper
+        wing_area_upper = min(wing_area_upper * 1.5, wing_area_max)
+
+    # If the initial guess already allows the equilibrium, reduce the lower bound of the search
+    # interval until the equilibrium can't be reached anymore
+    if wing_area_lower is None:
+        wing_area_lower = max(wing_area_upper / 1.5, wing_area_min)
+        while trim_margin(wing_area_lower) >= 0.0:
+            if wing_area_lower <= wing_area_min:
+                return wing_area_min
+            wing_area_upper = wing_area_lower
+            wing_area_lower = max(wing_area_lower / 1.5, wing_area_min)
+
+    wing_area_approach = brentq(trim_margin, wing_area_lower, wing_area_upper, xtol=1e-4)
 
     return wing_area_approach
 
@@ -16,34 +16,49 @@ advanced computation of the maximum fuel weight.
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-import copy
 
 import numpy as np
 import openmdao.api as om
-from openmdao.utils.units import convert_units
 
 from scipy.optimize import fsolve
 
 import fastoad.api as oad
 
-from fastga.command.api import generate_block_analysis
-
-from fastga.models.geometry.geom_components.wing.components.compute_wing_span import ComputeWingSpan
-from fastga.models.geometry.geom_components.wing.components.compute_wing_y_root import (
-    ComputeWingYRoot,
+from fastga.models.geometry.geom_components.wing.wing_planform import (
+    wing_span,
+    wing_root_y,
+    wing_tip_y,
+    wing_root_chord,
+    wing_tip_chord,
 )
-from fastga.models.geometry.geom_components.wing.components.compute_wing_y_tip import (
-    ComputeWingYTip,
+from fastga.models.geometry.geom_components.wing_tank.compute_mfw_advanced import (
+    maximum_fuel_weight,
 )
-from fastga.models.geometry.geom_components.wing.components.compute_wing_l2 import ComputeWingL2
-from fastga.models.geometry.geom_components.wing.components.compute_wing_l4 import ComputeWingL4
-from fastga.models.geometry.geom_components.wing.components.compute_wing_l1 import ComputeWingL1
-from fastga.models.geometry.geom_components.wing_tank.compute_mfw_advanced import ComputeMFWAdvanced
 
 from ..constants import SUBMODEL_WING_AREA_GEOM_LOOP, SUBMODEL_WING_AREA_GEOM_CONS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Inputs of ComputeMFWAdvanced that do not depend on the wing area and can be read directly from
+# the inputs of the loop components
+MFW_INPUTS_INDEPENDENT_OF_AREA = [
+    "data:propulsion:fuel_type",
+    "data:geometry:wing:root:thickness_ratio",
+    "data:geometry:wing:tip:thickness_ratio",
+    "data:geometry:flap:chord_ratio",
+    "data:geometry:wing:aileron:chord_ratio",
+    "data:geometry:propulsion:tank:y_ratio_tank_beginning",
+    "data:geometry:propulsion:tank:y_ratio_tank_end",
+    "data:geometry:propulsion:engine:layout",
+    "data:geometry:propulsion:engine:y_ratio",
+    "data:geometry:propulsion:tank:LE_chord_percentage",
+    "data:geometry:propulsion:tank:TE_chord_percentage",
+    "data:geometry:propulsion:nacelle:width",
+    "data:geometry:landing_gear:type",
+    "data:geometry:landing_gear:y",
+    "settings:geometry:fuel_tanks:depth",
+]
+
 
 @oad.RegisterSubmodel(
     SUBMODEL_WING_AREA_GEOM_LOOP, "fastga.submodel.loop.wing_area.update.geom.advanced"
@@ -177,223 +192,34 @@ def compute_wing_area_new(wing_area, inputs, fuel_mission):
     :param inputs: inputs of the component
     :param fuel_mission: fuel needed to achieve the mission, in kg
     """
-    wing_ar = float(inputs["data:geometry:wing:aspect_ratio"])
-    wing_taper_ratio = float(inputs["data:geometry:wing:taper_ratio"])
-    fus_width = float(inputs["data:geometry:fuselage:maximum_width"])
-    kink_span_ratio = float(inputs["data:geometry:wing:kink:span_ratio"])
-
-    fuel_type = float(inputs["data:propulsion:fuel_type"])
-    root_tc = float(inputs["data:geometry:wing:root:thickness_ratio"])
-    tip_tc = float(inputs["data:geometry:wing:tip:thickness_ratio"])
-    flap_chord_ratio = float(inputs["data:geometry:flap:chord_ratio"])
-    aileron_chord_ratio = float(inputs["data:geometry:wing:aileron:chord_ratio"])
-    y_ratio_tank_beginning = float(inputs["data:geometry:propulsion:tank:y_ratio_tank_beginning"])
-    y_ratio_tank_end = float(inputs["data:geometry:propulsion:tank:y_ratio_tank_end"])
-    engine_config = float(inputs["data:geometry:propulsion:engine:layout"])
-    y_ratio_tank = inputs["data:geometry:propulsion:engine:y_ratio"]
-    le_chord_percentage = float(inputs["data:geometry:propulsion:tank:LE_chord_percentage"])
-    te_chord_percentage = float(inputs["data:geometry:propulsion:tank:TE_chord_percentage"])
-    nacelle_width = float(inputs["data:geometry:propulsion:nacelle:width"])
-    lg_type = float(inputs["data:geometry:landing_gear:type"])
-    y_lg = float(inputs["data:geometry:landing_gear:y"])
-    k = float(inputs["settings:geometry:fuel_tanks:depth"])
-
-    # We first have to recompute all the data needed for the tank capacity computation that
-    # depends on the wing area To ensure coherency with the method used, we will use the
-    # generate block analysis method on the component that compute said value and then use a
-    # block_analysis on the compute_mfw_advanced component.
-
-    # First we need to compute the span
-
-    var_inputs_compute_span = [
-        "data:geometry:wing:aspect_ratio",
-        "data:geometry:wing:area",
-    ]
-
-    compute_wing_span = generate_block_analysis(
-        ComputeWingSpan(), var_inputs_compute_span, "", False
-    )
-
-    var_dict_compute_span = {
-        "data:geometry:wing:aspect_ratio": (wing_ar, None),
-        "data:geometry:wing:area": (wing_area, "m**2"),
-    }
-
-    var_outputs_compute_span = compute_wing_span(var_dict_compute_span)
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    wing_span_original_val = var_outputs_compute_span.get("data:geometry:wing:span")[0]
-    wing_span_original_unit = var_outputs_compute_span.get("data:geometry:wing:span")[1]
-    wing_span = convert_units(wing_span_original_val, wing_span_original_unit, "m")
-
-    # Now we compute the Y position of the wing root
-
-    var_inputs_compute_root_y = ["data:geometry:fuselage:maximum_width"]
-
-    compute_root_y = generate_block_analysis(
-        ComputeWingYRoot(), var_inputs_compute_root_y, "", False
-    )
-
-    var_dict_compute_root_y = {
-        "data:geometry:fuselage:maximum_width": (fus_width, "m"),
-    }
-
-    var_outputs_compute_root_y = compute_root_y(var_dict_compute_root_y)
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    root_y_original_val = var_outputs_compute_root_y.get("data:geometry:wing:root:y")[0]
-    root_y_original_unit = var_outputs_compute_root_y.get("data:geometry:wing:root:y")[1]
-    root_y = convert_units(root_y_original_val, root_y_original_unit, "m")
-
-    # Compute the Y position of the wing tip
-
-    var_inputs_compute_tip_y = ["data:geometry:wing:span"]
-
-    compute_tip_y = generate_block_analysis(ComputeWingYTip(), var_inputs_compute_tip_y, "", False)
-
-    var_dict_compute_tip_y = {"data:geometry:wing:span": (wing_span, "m")}
 
-    var_outputs_compute_tip_y = compute_tip_y(var_dict_compute_tip_y)
+    wing_ar = inputs["data:geometry:wing:aspect_ratio"]
+    wing_taper_ratio = inputs["data:geometry:wing:taper_ratio"]
+    fus_width = inputs["data:geometry:fuselage:maximum_width"]
 
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    tip_y_original_val = var_outputs_compute_tip_y.get("data:geometry:wing:tip:y")[0]
-    tip_y_original_unit = var_outputs_compute_tip_y.get("data:geometry:wing:tip:y")[1]
-    tip_y = convert_units(tip_y_original_val, tip_y_original_unit, "m")
-
-    # We now compute the root chord
-
-    var_inputs_compute_root_chord = [
-        "data:geometry:wing:taper_ratio",
-        "data:geometry:wing:area",
-        "data:geometry:wing:root:y",
-        "data:geometry:wing:tip:y",
-    ]
-
-    compute_wing_root_chord = generate_block_analysis(
-        ComputeWingL2(), var_inputs_compute_root_chord, "", False
-    )
-
-    var_dict_compute_root_chord = {
-        "data:geometry:wing:taper_ratio": (wing_taper_ratio, None),
-        "data:geometry:wing:area": (wing_area, "m**2"),
-        "data:geometry:wing:root:y": (root_y, "m"),
-        "data:geometry:wing:tip:y": (tip_y, "m"),
-    }
-
-    var_outputs_compute_root_chord = compute_wing_root_chord(var_dict_compute_root_chord)
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    root_chord_original_value = var_outputs_compute_root_chord.get("data:geometry:wing:root:chord")[
-        0
-    ]
-    root_chord_original_unit = var_outputs_compute_root_chord.get("data:geometry:wing:root:chord")[
-        1
-    ]
-    root_chord = convert_units(root_chord_original_value, root_chord_original_unit, "m")
-
-    # Compute virtual root chord first
-
-    var_inputs_compute_virtual_root_chord = copy.copy(var_inputs_compute_root_chord)
-
-    compute_wing_virtual_root__chord = generate_block_analysis(
-        ComputeWingL1(), var_inputs_compute_virtual_root_chord, "", False
-    )
-
-    var_dict_compute_virtual_root_chord = copy.copy(var_dict_compute_root_chord)
-
-    var_outputs_compute_virtual_root_chord = compute_wing_virtual_root__chord(
-        var_dict_compute_virtual_root_chord
-    )
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    virtual_root_chord_original_value = var_outputs_compute_virtual_root_chord.get(
-        "data:geometry:wing:root:virtual_chord"
-    )[0]
-    virtual_root_chord_original_unit = var_outputs_compute_virtual_root_chord.get(
-        "data:geometry:wing:root:virtual_chord"
-    )[1]
-    virtual_root_chord = convert_units(
-        virtual_root_chord_original_value, virtual_root_chord_original_unit, "m"
-    )
-
-    # We now compute the tip chord
-
-    var_inputs_compute_tip_chord = [
-        "data:geometry:wing:taper_ratio",
-        "data:geometry:wing:root:virtual_chord",
-    ]
-
-    compute_wing_tip_chord = generate_block_analysis(
-        ComputeWingL4(), var_inputs_compute_tip_chord, "", False
-    )
-
-    var_dict_compute_tip_chord = {
-        "data:geometry:wing:taper_ratio": (wing_taper_ratio, None),
-        "data:geometry:wing:root:virtual_chord": (virtual_root_chord, "m"),
-    }
-
-    var_outputs_compute_tip_chord = compute_wing_tip_chord(var_dict_compute_tip_chord)
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    tip_chord_original_value = var_outputs_compute_tip_chord.get("data:geometry:wing:tip:chord")[0]
-    tip_chord_original_unit = var_outputs_compute_tip_chord.get("data:geometry:wing:tip:chord")[1]
-    tip_chord = convert_units(tip_chord_original_value, tip_chord_original_unit, "m")
+    # We first have to recompute all the data needed for the tank capacity computation that
+    # depends on the wing area. The functions used by ComputeWingSpan, ComputeWingYRoot,
+    # ComputeWingYTip, ComputeWingL1, ComputeWingL2 and ComputeWingL4 are evaluated directly
+    # rather than through a problem built for each component, since this function is called for
+    # each iteration of the solver.
+    span = wing_span(wing_ar, wing_area)
+    root_y = wing_root_y(fus_width)
+    tip_y = wing_tip_y(span)
+    root_chord = wing_root_chord(wing_area, root_y, tip_y, wing_taper_ratio)
+    # The virtual root chord is computed with the same function as the root chord
+    virtual_root_chord = root_chord
+    tip_chord = wing_tip_chord(virtual_root_chord, wing_taper_ratio)
 
     # We can now move on to the computation of the mfw for that wing area and then return the
-    # difference to solve for the right wing_area
-
-    var_inputs_compute_mfw = [
-        "data:propulsion:fuel_type",
-        "data:geometry:wing:root:chord",
-        "data:geometry:wing:tip:chord",
-        "data:geometry:wing:root:y",
-        "data:geometry:wing:tip:y",
-        "data:geometry:wing:root:thickness_ratio",
-        "data:geometry:wing:tip:thickness_ratio",
-        "data:geometry:flap:chord_ratio",
-        "data:geometry:wing:aileron:chord_ratio",
-        "data:geometry:propulsion:tank:y_ratio_tank_beginning",
-        "data:geometry:propulsion:tank:y_ratio_tank_end",
-        "data:geometry:propulsion:engine:layout",
-        "data:geometry:propulsion:engine:y_ratio",
-        "data:geometry:propulsion:tank:LE_chord_percentage",
-        "data:geometry:propulsion:tank:TE_chord_percentage",
-        "data:geometry:propulsion:nacelle:width",
-        "data:geometry:wing:span",
-        "data:geometry:landing_gear:type",
-        "data:geometry:landing_gear:y",
-        "settings:geometry:fuel_tanks:depth",
-    ]
-
-    compute_mfw = generate_block_analysis(ComputeMFWAdvanced(), var_inputs_compute_mfw, "", False)
-
-    var_dict_compute_root_chord = {
-        "data:propulsion:fuel_type": (fuel_type, None),
-        "data:geometry:wing:root:chord": (root_chord, "m"),
-        "data:geometry:wing:tip:chord": (tip_chord, "m"),
-        "data:geometry:wing:root:y": (root_y, "m"),
-        "data:geometry:wing:tip:y": (tip_y, "m"),
-        "data:geometry:wing:root:thickness_ratio": (root_tc, None),
-        "data:geometry:wing:tip:thickness_ratio": (tip_tc, None),
-        "data:geometry:flap:chord_ratio": (flap_chord_ratio, None),
-        "data:geometry:wing:aileron:chord_ratio": (aileron_chord_ratio, None),
-        "data:geometry:propulsion:tank:y_ratio_tank_beginning": (y_ratio_tank_beginning, None),
-        "data:geometry:propulsion:tank:y_ratio_tank_end": (y_ratio_tank_end, None),
-        "data:geometry:propulsion:engine:layout": (engine_config, None),
-        "data:geometry:propulsion:engine:y_ratio": (y_ratio_tank, None),
-        "data:geometry:propulsion:tank:LE_chord_percentage": (le_chord_percentage, None),
-        "data:geometry:propulsion:tank:TE_chord_percentage": (te_chord_percentage, None),
-        "data:geometry:propulsion:nacelle:width": (nacelle_width, "m"),
-        "data:geometry:wing:span": (wing_span, "m"),
-        "data:geometry:landing_gear:type": (lg_type, None),
-        "data:geometry:landing_gear:y": (y_lg, "m"),
-        "settings:geometry:fuel_tanks:depth": (k, None),
-    }
-
-    var_outputs_compute_mfw = compute_mfw(var_dict_compute_root_chord)
-
-    mfw_original_val = var_outputs_compute_mfw.get("data:weight:aircraft:MFW")[0]
-    mfw_original_unit = var_outputs_compute_mfw.get("data:weight:aircraft:MFW")[1]
-    mfw = convert_units(mfw_original_val, mfw_original_unit, "kg")
+    # difference to solve for the right wing_area, using the same function as
+    # ComputeMFWAdvanced
+    inputs_mfw = {name: inputs[name] for name in MFW_INPUTS_INDEPENDENT_OF_AREA}
+    inputs_mfw["data:geometry:wing:span"] = span
+    inputs_mfw["data:geometry:wing:root:y"] = root_y
+    inputs_mfw["data:geometry:wing:tip:y"] = tip_y
+    inputs_mfw["data:geometry:wing:root:chord"] = root_chord
+    inputs_mfw["data:geometry:wing:tip:chord"] = tip_chord
+
+    mfw = maximum_fuel_weight(inputs_mfw)
 
     return mfw - fuel_mission
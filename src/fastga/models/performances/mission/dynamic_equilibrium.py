@@ -21,7 +21,6 @@ import logging
 import numpy as np
 import openmdao.api as om
 from scipy.constants import g
-from scipy.optimize import fsolve
 import pandas as pd
 import fastoad.api as oad
 
@@ -54,6 +53,29 @@ for key in FAST_FIELDS_TO_REMOVE:
 
 _LOGGER = logging.getLogger(__name__)
 
+EQUILIBRIUM_MAX_ITERATIONS = 50
+EQUILIBRIUM_TOLERANCE = 1e-6  # Tolerance on alpha in deg and on thrust in kN
+EQUILIBRIUM_FD_STEP = 1e-6  # Step of the finite differences of the Jacobian in deg and kN
+
+
+def true_airspeed_from_cas(atm: Atmosphere, v_cas):
+    """
+    Computes the true airspeed from a subsonic calibrated airspeed, with the closed form of the
+    Saint-Venant relations. This gives the same results as setting the calibrated airspeed of
+    the Atmosphere instance, without the iterative solver it uses on arrays.
+
+    :param atm: the Atmosphere instance of the flight points
+    :param v_cas: the calibrated airspeed in m/s, float or array of the shape of the altitudes
+    :return: the true airspeed in m/s
+    """
+    sea_level = Atmosphere(0.0)
+    impact_pressure = sea_level.pressure * (
+        (1.0 + 0.2 * (np.asarray(v_cas) / sea_level.speed_of_sound) ** 2) ** 3.5 - 1.0
+    )
+    mach = np.sqrt(5.0 * ((impact_pressure / atm.pressure + 1.0) ** (1.0 / 3.5) - 1.0))
+
+    return mach * atm.speed_of_sound
+
 
 class DynamicEquilibrium(om.ExplicitComponent):
     """
@@ -63,15 +85,27 @@ class DynamicEquilibrium(om.ExplicitComponent):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.cl_wing_sol = 0.0
-        self.cl_tail_sol = 0.0
-        self.error_on_pitch_equilibrium = False
-        self.delta_e_sol = 0.0
-        self.cd_aircraft_sol = 0.0
         self.flight_points = []
+        self._saved_points = {}
 
     def initialize(self):
         self.options.declare("out_file", default="", types=str)
+        self.options.declare(
+            "keep_previous_runs",
+            default=False,
+            types=bool,
+            desc="If True, the flight points of every run are appended to out_file, otherwise it "
+            "only contains the flight points of the last run",
+        )
+        self.options.declare(
+            "saved_points",
+            default=None,
+            types=dict,
+            allow_none=True,
+            recordable=False,
+            desc="Number of points saved in out_file, shared by the phases of a mission that "
+            "append to the same file. If not given, the component keeps its own",
+        )
 
     def setup(self):
         self.add_input("data:geometry:wing:MAC:leading_edge:x:local", val=np.nan, units="m")
@@ -143,7 +177,7 @@ class DynamicEquilibrium(om.ExplicitComponent):
     ):
         """
         Method that finds the regulated thrust and aircraft to air angle to obtain dynamic
-        equilibrium
+        equilibrium of a single flight point, solved with dynamic_equilibrium_vector
 
         :param inputs: inputs derived from aero and mass models
         :param gamma: path angle (in rad.) equal to climb rate c=dh/dt over air speed V,
@@ -162,45 +196,121 @@ class DynamicEquilibrium(om.ExplicitComponent):
         based on fuel in tank
         """
 
-        cl_max_clean_htp = inputs["data:aerodynamics:horizontal_tail:low_speed:CL_max_clean"]
-        cl_min_clean_htp = inputs["data:aerodynamics:horizontal_tail:low_speed:CL_min_clean"]
+        equilibrium_result = self.dynamic_equilibrium_vector(
+            inputs,
+            gamma,
+            q,
+            dvx_dt,
+            dvz_dt,
+            mass,
+            flap_condition,
+            previous_step if len(previous_step) == 2 else None,
+            low_speed=low_speed,
+            x_cg=x_cg,
+        )
 
-        if len(previous_step) == 2:
-            result = fsolve(
-                self.equation_outer,
-                np.array([previous_step[0] * 180.0 / np.pi, previous_step[1] / 1000.0]),
-                args=(inputs, gamma, q, dvx_dt, dvz_dt, mass, flap_condition, low_speed, x_cg),
-                xtol=1.0e-3,
-            )
-        else:
-            result = fsolve(
-                self.equation_outer,
-                np.array([0.0, 1.0]),
-                args=(inputs, gamma, q, dvx_dt, dvz_dt, mass, flap_condition, low_speed, x_cg),
-                xtol=1.0e-3,
-            )
-        alpha_equilibrium = result[0] * np.pi / 180.0
-        # noinspection PyTypeChecker
-        thrust_equilibrium = result[1] * 1000.0
+        return tuple(float(value[0]) for value in equilibrium_result[:-1]) + (
+            bool(equilibrium_result[-1][0]),
+        )
 
-        cl_wing_local = self.cl_wing_sol
-        cl_htp_local = self.cl_tail_sol
-        delta_elevator = self.delta_e_sol
-        cd_aircraft_local = self.cd_aircraft_sol
+    def dynamic_equilibrium_vector(
+        self,
+        inputs,
+        gamma,
+        q,
+        dvx_dt,
+        dvz_dt,
+        mass,
+        flap_condition: str,
+        previous_step: tuple = None,
+        low_speed: bool = False,
+        x_cg=None,
+    ):
+        """
+        Vectorized version of dynamic_equilibrium, the equilibrium of all the flight points is
+        found at once with a Newton method whose Jacobian is computed by finite differences on
+        the arrays.
 
-        error_on_htp = bool((cl_htp_local > cl_max_clean_htp) or (cl_htp_local < cl_min_clean_htp))
+        :param inputs: inputs derived from aero and mass models
+        :param gamma: array of the path angles (in rad.)
+        :param q: array of the dynamic pressures
+        :param dvx_dt: array of the accelerations linear to air speed
+        :param dvz_dt: array of the accelerations perpendicular to air speed
+        :param mass: array of the masses of the flying aircraft
+        :param flap_condition: can refer either to "takeoff" or "landing" if high-lift contribution
+        should be considered
+        :param previous_step: arrays of alpha (in rad.) and thrust (in N) used as a first guess,
+        if known, to accelerate the calculation
+        :param low_speed: define which aerodynamic models should be used (either low speed or high
+        speed)
+        :param x_cg: array of the x positions of the center of gravity of the aircraft, if not
+        given, computed based on fuel in tank
+        :return: tuple of arrays of alpha (in rad.), thrust (in N), wing and horizontal tail lift
+        coefficients, elevator deflection, aircraft drag coefficient and error flags
+        """
 
-        error_on_wing = self.error_on_pitch_equilibrium
+        cl_max_clean_htp = inputs["data:aerodynamics:horizontal_tail:low_speed:CL_max_clean"]
+        cl_min_clean_htp = inputs["data:aerodynamics:horizontal_tail:low_speed:CL_min_clean"]
 
-        error = error_on_htp or error_on_wing
+        gamma, q, dvx_dt, dvz_dt, mass = np.broadcast_arrays(
+            *[
+                np.atleast_1d(np.asarray(value, dtype=float))
+                for value in (gamma, q, dvx_dt, dvz_dt, mass)
+            ]
+        )
+        if x_cg is not None:
+            x_cg = np.broadcast_to(np.asarray(x_cg, dtype=float), np.shape(mass))
+        args = (inputs, gamma, q, dvx_dt, dvz_dt, mass, flap_condition, low_speed, x_cg)
+
+        # The unknowns are expressed in deg and kN to be homogenous on the tolerance
+        x = np.zeros((2, np.size(mass)))
+        if previous_step is None:
+            x[1, :] = 1.0
+        else:
+            x[0, :] = np.asarray(previous_step[0]) * 180.0 / np.pi
+            x[1, :] = np.asarray(previous_step[1]) / 1000.0
+
+        converged = np.zeros(np.size(mass), dtype=bool)
+        for _ in range(EQUILIBRIUM_MAX_ITERATIONS):
+            residuals = self.equation_outer_vector(x, *args)[0]
+            jacobian = np.zeros((2, 2, np.size(mass)))
+            for idx in range(2):
+                x_step = np.copy(x)
+                x_step[idx, :] += EQUILIBRIUM_FD_STEP
+                jacobian[:, idx, :] = (
+                    self.equation_outer_vector(x_step, *args)[0] - residuals
+                ) / EQUILIBRIUM_FD_STEP
+
+            # Newton step on each point, the 2x2 systems being solved explicitly
+            determinant = jacobian[0, 0] * jacobian[1, 1] - jacobian[0, 1] * jacobian[1, 0]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                delta_x = (
+                    np.array(
+                        [
+                            jacobian[1, 1] * residuals[0] - jacobian[0, 1] * residuals[1],
+                            jacobian[0, 0] * residuals[1] - jacobian[1, 0] * residuals[0],
+                        ]
+                    )
+                    / np.where(determinant == 0.0, np.nan, determinant)
+                )
+            delta_x = np.where(np.isfinite(delta_x), delta_x, 0.0)
+            x -= delta_x
+            converged = np.max(np.abs(delta_x), axis=0) < EQUILIBRIUM_TOLERANCE
+            if np.all(converged):
+                break
+
+        _, cl_wing, cl_htp, delta_e, cd, error_on_wing = self.equation_outer_vector(x, *args)
+
+        error_on_htp = (cl_htp > cl_max_clean_htp) | (cl_htp < cl_min_clean_htp)
+        error = error_on_htp | error_on_wing | np.logical_not(converged)
 
         return (
-            alpha_equilibrium,
-            thrust_equilibrium,
-            cl_wing_local,
-            cl_htp_local,
-            delta_elevator,
-            cd_aircraft_local,
+            x[0] * np.pi / 180.0,
+            x[1] * 1000.0,
+            cl_wing,
+            cl_htp,
+            delta_e,
+            cd,
             error,
         )
 
@@ -215,7 +325,8 @@ class DynamicEquilibrium(om.ExplicitComponent):
         x_cg: float = None,
     ):
         """
-        Method that founds the lift equilibrium with regard to the global moment
+        Method that founds the lift equilibrium with regard to the global moment for a single
+        flight point, solved with found_cl_repartition_vector
 
         :param inputs: inputs derived from aero and mass models
         :param load_factor: load factor applied to the
@@ -230,6 +341,33 @@ class DynamicEquilibrium(om.ExplicitComponent):
         in the aircraft
         """
 
+        cl_wing, cl_htp, error = DynamicEquilibrium.found_cl_repartition_vector(
+            inputs, load_factor, mass, q, delta_cm, low_speed=low_speed, x_cg=x_cg
+        )
+
+        return float(cl_wing), float(cl_htp), bool(error)
+
+    @staticmethod
+    def found_cl_repartition_vector(
+        inputs, load_factor, mass, q, delta_cm, low_speed: bool = False, x_cg=None
+    ):
+        """
+        Vectorized version of found_cl_repartition, the 2x2 linear systems of all the points are
+        solved explicitly.
+
+        :param inputs: inputs derived from aero and mass models
+        :param load_factor: array of the load factors applied to the aircraft expressed as a
+        ratio of g
+        :param mass: array of the aircraft masses
+        :param q: array of the dynamic pressures
+        :param delta_cm: array of the DP induced cm to be added to the moment equilibrium
+        :param low_speed: define which aerodynamic models should be used (either low speed or high
+        speed)
+        :param x_cg: array of the x_cg positions of the aircraft, can be specified. If not
+        specified, computed based on current fuel in the aircraft
+        :return: arrays of the wing and horizontal tail lift coefficients and of the error flags
+        """
+
         l0_wing = inputs["data:geometry:wing:MAC:length"]
         x_wing = inputs["data:geometry:wing:MAC:at25percent:x"]
         wing_area = inputs["data:geometry:wing:area"]
@@ -254,29 +392,20 @@ class DynamicEquilibrium(om.ExplicitComponent):
             fuel_mass = mass - c3
             x_cg = (c1 + cg_tank * fuel_mass) / (c3 + fuel_mass)
 
-        # Define matrix equilibrium (applying load and moment equilibrium)
-        a11 = 1
-        a12 = 1
+        # Define matrix equilibrium (applying load and moment equilibrium), the first line being
+        # cl_wing + cl_htp = b1
         b1 = mass * g * load_factor / (q * wing_area)
         a21 = (x_wing - x_cg) - (cm_alpha_fus / cl_alpha_wing) * l0_wing
         a22 = x_htp - x_cg
         b2 = (cm0_wing + delta_cm + (cm_alpha_fus / cl_alpha_wing) * cl0_wing) * l0_wing
 
-        a = np.array([[a11, a12], [float(a21), float(a22)]])
-        b = np.array([b1, b2])
-        inv_a = np.linalg.inv(a)
-        cl_array = np.dot(inv_a, b)
-
-        # Return equilibrated lift coefficients if low speed maximum clean Cl not exceeded
-        # otherwise only cl_wing, 3rd term is an error flag returned by the function
-        if cl_array[0] < cl_max_clean:
-            cl_wing_return = float(cl_array[0])
-            cl_htp_return = float(cl_array[1])
-            error = False
-        else:
-            cl_wing_return = float(mass * g * load_factor / (q * wing_area))
-            cl_htp_return = 0.0
-            error = True
+        cl_wing = (a22 * b1 - b2) / (a22 - a21)
+        cl_htp = (b2 - a21 * b1) / (a22 - a21)
+
+        # Only cl_wing is returned if low speed maximum clean Cl is exceeded
+        error = cl_wing >= cl_max_clean
+        cl_wing_return = np.where(error, b1, cl_wing)
+        cl_htp_return = np.where(error, 0.0, cl_htp)
 
         return cl_wing_return, cl_htp_return, error
 
@@ -284,7 +413,10 @@ class DynamicEquilibrium(om.ExplicitComponent):
         self,
     ):
         """
-        Method to save mission point to .csv file for further post-processing
+        Method to save mission point to .csv file for further post-processing. The flight points
+        of the phase are appended to the file, whose header is only written on creation, so that
+        saving a phase does not require to read and rewrite the points already saved. The number
+        of saved points, used to continue the index, is kept in memory.
         """
         # From flight point list to dataframe
         dataframe_to_add = pd.DataFrame(self.flight_points)
@@ -295,26 +427,46 @@ class DynamicEquilibrium(om.ExplicitComponent):
                 return value.item()
             return value
 
-        dataframe_to_add = dataframe_to_add.applymap(as_scalar)
+        # Only the columns that are not already numerical may contain arrays
+        for column in dataframe_to_add.columns[dataframe_to_add.dtypes == object]:
+            dataframe_to_add[column] = dataframe_to_add[column].map(as_scalar)
         rename_dict = {
             field_name: f"{field_name} [{unit}]"
             for field_name, unit in oad.FlightPoint.get_units().items()
         }
         dataframe_to_add.rename(columns=rename_dict, inplace=True)
 
-        # Save and recycle data if a file is already present.
-        if not os.path.exists(self.options["out_file"]):
-            dataframe_to_add.index = range(len(dataframe_to_add))
-            dataframe_to_add.to_csv(self.options["out_file"])
+        # Index is continued from the number of points already saved. It is kept in memory
+        # along with the size and modification time of the file after the last save, and only
+        # counted in the file if it has been written or modified elsewhere since
+        saved_points = self.options["saved_points"]
+        if saved_points is None:
+            saved_points = self._saved_points
+        out_file = os.path.abspath(self.options["out_file"])
+        file_exists = os.path.exists(out_file)
+        if not file_exists:
+            saved_point_count = 0
+        elif saved_points.get("file_state") == self._file_state(out_file):
+            saved_point_count = saved_points["count"]
         else:
-            dataframe_existing = pd.read_csv(self.options["out_file"])
-            if "Unnamed: 0" in dataframe_existing.columns:
-                dataframe_existing = dataframe_existing.drop("Unnamed: 0", axis=1)
-            dataframe_to_add.index = range(
-                max(dataframe_existing.index), max(dataframe_existing.index) + len(dataframe_to_add)
-            )
-            dataframe_existing = pd.concat([dataframe_existing, dataframe_to_add])
-            dataframe_existing.to_csv(self.options["out_file"])
+            with open(out_file, "rb") as file:
+                saved_point_count = sum(1 for _ in file) - 1
+        dataframe_to_add.index = range(saved_point_count, saved_point_count + len(dataframe_to_add))
+        dataframe_to_add.to_csv(out_file, mode="a", header=not file_exists)
+        saved_points["count"] = saved_point_count + len(dataframe_to_add)
+        saved_points["file_state"] = self._file_state(out_file)
+
+    @staticmethod
+    def _file_state(file_path):
+        """
+        Gives the state of a file used to know whether it has changed since the last save.
+
+        :param file_path: absolute path of the file
+        :return: tuple of the path, size and modification time of the file
+        """
+        file_stat = os.stat(file_path)
+
+        return file_path, file_stat.st_size, file_stat.st_mtime_ns
 
     def equation_outer(
         self,
@@ -329,10 +481,54 @@ class DynamicEquilibrium(om.ExplicitComponent):
         low_speed: bool = False,
         x_cg=None,
     ):
+        """
+        Residuals of the equilibrium of a single flight point, computed with
+        equation_outer_vector.
 
-        # Define the system of equations to be solved: load equilibrium along the air x/z axis
-        # and moment equilibrium performed with found_cl_repartition sub-function. The moment
-        # generated by (x_cg_aircraft - x_cg_engine) * T * sin(alpha - alpha_eng) is neglected!
+        :param x: alpha (in deg) and thrust (in kN) of the flight point
+        :return: array of the two residuals
+        """
+
+        residuals = self.equation_outer_vector(
+            np.reshape(np.asarray(x, dtype=float), (2, 1)),
+            inputs,
+            np.atleast_1d(gamma),
+            np.atleast_1d(q),
+            np.atleast_1d(dvx_dt),
+            np.atleast_1d(dvz_dt),
+            np.atleast_1d(mass),
+            flap_condition,
+            low_speed,
+            x_cg,
+        )[0]
+
+        return residuals[:, 0]
+
+    def equation_outer_vector(
+        self,
+        x,
+        inputs,
+        gamma,
+        q,
+        dvx_dt,
+        dvz_dt,
+        mass,
+        flap_condition: str,
+        low_speed: bool = False,
+        x_cg=None,
+    ):
+        """
+        Defines the system of equations to be solved for each flight point: load equilibrium
+        along the air x/z axis and moment equilibrium performed with found_cl_repartition_vector
+        sub-function. The moment generated by (x_cg_aircraft - x_cg_engine) * T *
+        sin(alpha - alpha_eng) is neglected! No state is stored in the instance so that points can
+        be solved together or from several threads.
+
+        :param x: array of shape (2, n) of alpha (in deg) and thrust (in kN) of the n points
+        :return: array of shape (2, n) of the residuals and arrays of the wing and horizontal tail
+        lift coefficients, elevator deflection, aircraft drag coefficient and pitch equilibrium
+        error flags of the points
+        """
 
         if low_speed:
             coeff_k_wing = inputs["data:aerodynamics:wing:low_speed:induced_drag_coefficient"]
@@ -365,19 +561,19 @@ class DynamicEquilibrium(om.ExplicitComponent):
         z_eng = z_cg_aircraft - z_cg_engine
         alpha_eng = 0.0  # fixme: angle between propulsion and wing not defined
 
-        alpha = x[0] * np.pi / 180.0  # defined in degree to be homogenous on x-tolerance
-        thrust = x[1] * 1000.0  # defined in kN to be homogenous on x-tolerance
+        alpha = x[0] * np.pi / 180.0
+        thrust = x[1] * 1000.0
 
         load_factor = (-dvz_dt + g * np.cos(gamma) - thrust / mass * np.sin(alpha - alpha_eng)) / g
         # Additional aerodynamics
         delta_cl = 0.0
         delta_cm = z_eng * thrust * np.cos(alpha - alpha_eng) / (wing_mac * q * wing_area)
-        cl_wing_blown, cl_htp, error_tag = self.found_cl_repartition(
+        cl_wing_blown, cl_htp, error_tag = self.found_cl_repartition_vector(
             inputs, load_factor, mass, q, delta_cm, low_speed, x_cg
         )
 
-        self.error_on_pitch_equilibrium = error_tag
-
+        cl_wing = 0.0
+        cd0_flaps = 0.0
         if low_speed:
             if flap_condition == "takeoff":
                 cl_wing = inputs["data:aerodynamics:flaps:takeoff:CL"]
@@ -385,14 +581,7 @@ class DynamicEquilibrium(om.ExplicitComponent):
             elif flap_condition == "landing":
                 cl_wing = inputs["data:aerodynamics:flaps:landing:CL"]
                 cd0_flaps = inputs["data:aerodynamics:flaps:landing:CD"]
-            else:
-                cl_wing = 0.0
-                cd0_flaps = 0.0
-        else:
-            cl_wing = 0.0
-            cd0_flaps = 0.0
-        cl_wing += cl0_wing + cl_alpha_wing * alpha
-        # TODO : Change formula for trimmable htp
+        cl_wing = cl_wing + cl0_wing + cl_alpha_wing * alpha
         # Calculate the elevator command if htp not trimmed
         delta_e = (cl_htp - (alpha * cl_alpha_htp + cl0_htp)) / cl_elevator_delta
         cd = (
@@ -404,17 +593,12 @@ class DynamicEquilibrium(om.ExplicitComponent):
         )
         drag = q * cd * wing_area
         # Divide the results by characteristic number to have homogeneous responses
-        f1 = float(
+        f1 = (
             thrust * np.cos(alpha - alpha_eng) - mass * g * np.sin(gamma) - drag - mass * dvx_dt
-        ) / (float(mass) / 10.0)
-        f2 = float(cl_wing_blown - (cl_wing + delta_cl)) / float(cl_max_clean)
-
-        self.cl_wing_sol = cl_wing_blown
-        self.cl_tail_sol = cl_htp
-        self.delta_e_sol = delta_e
-        self.cd_aircraft_sol = cd
+        ) / (mass / 10.0)
+        f2 = (cl_wing_blown - (cl_wing + delta_cl)) / cl_max_clean
 
-        return np.array([f1, f2])
+        return np.array([f1, f2]), cl_wing_blown, cl_htp, delta_e, cd, error_tag
 
     def compute_flight_point_drag(
         self,
@@ -459,6 +643,44 @@ class DynamicEquilibrium(om.ExplicitComponent):
 
             self.flight_points.append(deepcopy(flight_point))
 
+    def add_flight_points_vector(
+        self,
+        flight_points: oad.FlightPoint = None,
+        equilibrium_result: tuple = None,
+        wing_area: float = None,
+    ):
+        """
+        Vectorized version of compute_flight_point_drag and add_flight_point: completes the
+        flight points, whose fields are arrays, with the equilibrium results and adds them to the
+        list of flight_point one by one.
+
+        :param flight_points: the flight points whose fields are arrays
+        :param equilibrium_result: result arrays of dynamic_equilibrium_vector
+        :param wing_area: reference surface of the aircraft
+        """
+
+        density = Atmosphere(flight_points.altitude, altitude_in_feet=False).density
+        flight_points.CD = equilibrium_result[5]
+        flight_points.drag = (
+            0.5 * density * flight_points.true_airspeed ** 2.0 * wing_area * equilibrium_result[5]
+        )
+        flight_points.alpha = equilibrium_result[0] * 180.0 / np.pi
+        flight_points.CL_wing = equilibrium_result[2]
+        flight_points.CL_htp = equilibrium_result[3]
+        flight_points.CL = equilibrium_result[2] + equilibrium_result[3]
+
+        field_names = oad.FlightPoint.get_field_names()
+        fields = {name: value for name, value in vars(flight_points).items() if name in field_names}
+        for idx in range(np.size(flight_points.mass)):
+            self.flight_points.append(
+                oad.FlightPoint(
+                    **{
+                        name: value[idx] if np.ndim(value) > 0 else value
+                        for name, value in fields.items()
+                    }
+                )
+            )
+
     def complete_flight_point(
         self, flight_point: oad.FlightPoint, mach=None, v_cas=None, v_tas=None, climb_rate=0.0
     ):
@@ -54,6 +54,13 @@ class Mission(om.Group):
     def initialize(self):
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
         self.options.declare("out_file", default="", types=str)
+        self.options.declare(
+            "keep_previous_runs",
+            default=False,
+            types=bool,
+            desc="If True, the flight points of every run are appended to out_file, otherwise it "
+            "only contains the flight points of the last run",
+        )
 
     def setup(self):
         self.add_subsystem("in_flight_cg_variation", InFlightCGVariation(), promotes=["*"])
@@ -69,6 +76,9 @@ class Mission(om.Group):
         options_mission = {
             "propulsion_id": self.options["propulsion_id"],
             "out_file": self.options["out_file"],
+            "keep_previous_runs": self.options["keep_previous_runs"],
+            # The phases append to the same out_file and share the count of its saved points
+            "saved_points": {},
         }
         self.add_subsystem(
             "climb_speed",
@@ -30,13 +30,15 @@ from stdatm import Atmosphere
 
 from fastga.models.performances.mission.takeoff import SAFETY_HEIGHT
 
-from ..dynamic_equilibrium import DynamicEquilibrium
+from ..dynamic_equilibrium import DynamicEquilibrium, true_airspeed_from_cas
 from ..constants import SUBMODEL_CLIMB, SUBMODEL_CLIMB_SPEED
 
 _LOGGER = logging.getLogger(__name__)
 
 POINTS_NB_CLIMB = 100
 MAX_CALCULATION_TIME = 15  # time in seconds
+MAX_BLOCK_ITERATIONS = 20
+BLOCK_MASS_TOLERANCE = 1e-4  # tolerance on the mass of the flight points, in kg
 
 oad.RegisterSubmodel.active_models[
     SUBMODEL_CLIMB
@@ -91,7 +93,7 @@ class ComputeClimb(DynamicEquilibrium):
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
         # Delete previous .csv results
-        if self.options["out_file"] != "":
+        if self.options["out_file"] != "" and not self.options["keep_previous_runs"]:
             # noinspection PyBroadException
             flight_point_df = None
             try:
@@ -211,6 +213,115 @@ class ComputeClimb(DynamicEquilibrium):
         outputs["data:mission:sizing:main_route:climb:duration"] = time_t
 
 
+@oad.RegisterSubmodel(SUBMODEL_CLIMB, "fastga.submodel.performances.mission.climb.block")
+class ComputeClimbBlock(ComputeClimb):
+    """
+    Same as ComputeClimb, but the flight points are computed all at once instead of one time
+    step after the other. Since the vertical speed is the climb rate, the altitudes of the time
+    steps do not depend on the equilibrium. Only the mass of the points does, so it is found
+    with a fixed point on the whole climb, each iteration solving the equilibrium and the
+    consumption of all the points with arrays. Once converged, the points are the ones of the
+    legacy time-marching.
+    """
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+
+        # Delete previous .csv results
+        if self.options["out_file"] != "" and not self.options["keep_previous_runs"]:
+            # noinspection PyBroadException
+            try:
+                os.remove(self.options["out_file"])
+            except:
+                _LOGGER.info("Failed to remove %s file!", self.options["out_file"])
+
+        propulsion_model = self._engine_wrapper.get_model(inputs)
+        wing_area = inputs["data:geometry:wing:area"]
+        cruise_altitude = float(inputs["data:mission:sizing:main_route:cruise:altitude"])
+        mtow = inputs["data:weight:aircraft:MTOW"]
+        m_to = inputs["data:mission:sizing:taxi_out:fuel"]
+        m_tk = inputs["data:mission:sizing:takeoff:fuel"]
+        m_ic = inputs["data:mission:sizing:initial_climb:fuel"]
+        v_cas = float(inputs["data:mission:sizing:main_route:climb:v_cas"])
+        climb_rate_sl = float(inputs["data:mission:sizing:main_route:climb:climb_rate:sea_level"])
+        climb_rate_cl = float(
+            inputs["data:mission:sizing:main_route:climb:climb_rate:cruise_level"]
+        )
+        mass_start = float(mtow - (m_to + m_tk + m_ic))
+
+        # Define specific time step ~POINTS_NB_CLIMB points for calculation (with ground conditions)
+        time_step = ((cruise_altitude - SAFETY_HEIGHT) / climb_rate_sl) / float(POINTS_NB_CLIMB)
+
+        # The vertical speed being the climb rate, the altitudes are found without the equilibrium
+        altitude = [SAFETY_HEIGHT]
+        time_steps = []
+        while altitude[-1] < cruise_altitude:
+            climb_rate = np.interp(
+                altitude[-1], [0.0, cruise_altitude], [climb_rate_sl, climb_rate_cl]
+            )
+            time_steps.append(min(time_step, (cruise_altitude - altitude[-1]) / climb_rate))
+            altitude.append(altitude[-1] + climb_rate * time_steps[-1])
+        altitude = np.array(altitude[:-1])
+        time_steps = np.array(time_steps)
+
+        climb_rate = np.interp(altitude, [0.0, cruise_altitude], [climb_rate_sl, climb_rate_cl])
+        atm = Atmosphere(altitude, altitude_in_feet=False)
+        v_tas = true_airspeed_from_cas(atm, v_cas)
+        atm.true_airspeed = v_tas
+        gamma = np.arcsin(climb_rate / v_tas)
+        atm_1 = Atmosphere(altitude + 1.0, altitude_in_feet=False)
+        dvx_dt = (true_airspeed_from_cas(atm_1, v_cas) - v_tas) * v_tas * np.sin(gamma)
+        dynamic_pressure = 0.5 * atm.density * v_tas ** 2
+
+        time_t = np.concatenate((np.zeros(1), np.cumsum(time_steps)))
+        distance_t = np.concatenate((np.zeros(1), np.cumsum(v_tas * np.cos(gamma) * time_steps)))
+
+        # Fixed point on the mass of the flight points
+        mass_t = np.full_like(altitude, mass_start)
+        previous_step = None
+        for _ in range(MAX_BLOCK_ITERATIONS):
+            previous_step = self.dynamic_equilibrium_vector(
+                inputs, gamma, dynamic_pressure, dvx_dt, 0.0, mass_t, "none", previous_step
+            )
+            flight_points = oad.FlightPoint(
+                altitude=altitude,
+                time=time_t[:-1],
+                ground_distance=distance_t[:-1],
+                engine_setting=EngineSetting.CLIMB,
+                thrust_is_regulated=np.full_like(altitude, True),
+                mass=mass_t,
+                name="sizing:main_route:climb",
+                mach=atm.mach,
+                true_airspeed=v_tas,
+                equivalent_airspeed=atm.equivalent_airspeed,
+                gamma=gamma,
+                thrust=previous_step[1],
+            )
+            propulsion_model.compute_flight_points(flight_points)
+            consumed_mass = propulsion_model.get_consumed_mass(flight_points, 1.0) * time_steps
+            mass_fuel_t = np.concatenate((np.zeros(1), np.cumsum(consumed_mass)))
+            mass_error = np.max(np.abs(mass_start - mass_fuel_t[:-1] - mass_t))
+            mass_t = mass_start - mass_fuel_t[:-1]
+            if mass_error <= BLOCK_MASS_TOLERANCE:
+                break
+        else:
+            _LOGGER.warning("Mass of the climb flight points did not converge")
+
+        if np.any(flight_points.thrust_rate > 1.0):
+            _LOGGER.warning("Thrust rate is above 1.0, value clipped at 1.0")
+
+        # Save mission
+        if self.options["out_file"] != "":
+            self.flight_points = []
+            self.add_flight_points_vector(
+                flight_points=flight_points, equilibrium_result=previous_step, wing_area=wing_area
+            )
+            self.save_csv()
+
+        outputs["data:mission:sizing:main_route:climb:fuel"] = mass_fuel_t[-1]
+        outputs["data:mission:sizing:main_route:climb:distance"] = distance_t[-1]
+        outputs["data:mission:sizing:main_route:climb:duration"] = time_t[-1]
+
+
 @oad.RegisterSubmodel(
     SUBMODEL_CLIMB_SPEED, "fastga.submodel.performances.mission.climb_speed.legacy"
 )
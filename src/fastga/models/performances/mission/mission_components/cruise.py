@@ -30,6 +30,8 @@ _LOGGER = logging.getLogger(__name__)
 
 POINTS_NB_CRUISE = 100
 MAX_CALCULATION_TIME = 15  # time in seconds
+MAX_BLOCK_ITERATIONS = 20
+BLOCK_MASS_TOLERANCE = 1e-4  # tolerance on the mass of the flight points, in kg
 
 oad.RegisterSubmodel.active_models[
     SUBMODEL_CRUISE
@@ -178,3 +180,110 @@ class ComputeCruise(DynamicEquilibrium):
         outputs["data:mission:sizing:main_route:cruise:fuel"] = mass_fuel_t
         outputs["data:mission:sizing:main_route:cruise:distance"] = distance_t
         outputs["data:mission:sizing:main_route:cruise:duration"] = time_t
+
+
+@oad.RegisterSubmodel(SUBMODEL_CRUISE, "fastga.submodel.performances.mission.cruise.block")
+class ComputeCruiseBlock(ComputeCruise):
+    """
+    Same as ComputeCruise, but the flight points are computed all at once instead of one time
+    step after the other. Altitude and speed being constant, the distances and time steps do not
+    depend on the equilibrium. Only the mass of the points does, so it is found with a fixed
+    point on the whole cruise, each iteration solving the equilibrium and the consumption of all
+    the points with arrays.
+    """
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+
+        propulsion_model = self._engine_wrapper.get_model(inputs)
+        v_tas = float(inputs["data:TLAR:v_cruise"])
+        cruise_distance = max(
+            0.0,
+            float(
+                inputs["data:TLAR:range"]
+                - inputs["data:mission:sizing:main_route:climb:distance"]
+                - inputs["data:mission:sizing:main_route:descent:distance"]
+            ),
+        )
+        if cruise_distance == 0.0:
+            _LOGGER.warning(
+                "Cruise distance is negative, check the input value mainly the range "
+                "and/or the climb and descent inputs"
+            )
+        wing_area = inputs["data:geometry:wing:area"]
+        cruise_altitude = float(inputs["data:mission:sizing:main_route:cruise:altitude"])
+        mtow = inputs["data:weight:aircraft:MTOW"]
+        m_to = inputs["data:mission:sizing:taxi_out:fuel"]
+        m_tk = inputs["data:mission:sizing:takeoff:fuel"]
+        m_ic = inputs["data:mission:sizing:initial_climb:fuel"]
+        m_cl = inputs["data:mission:sizing:main_route:climb:fuel"]
+        mass_start = float(mtow - (m_to + m_tk + m_ic + m_cl))
+
+        # Define specific time step ~POINTS_NB_CRUISE points for calculation
+        time_step = (cruise_distance / v_tas) / float(POINTS_NB_CRUISE)
+
+        # Distances and time steps are the ones of the time-marching of ComputeCruise
+        distance = [0.0]
+        time_steps = []
+        while distance[-1] < cruise_distance:
+            distance.append(
+                distance[-1] + v_tas * min(time_step, (cruise_distance - distance[-1]) / v_tas)
+            )
+            time_steps.append(min(time_step, (cruise_distance - distance[-1]) / v_tas))
+        distance_t = np.array(distance)
+        time_steps = np.array(time_steps)
+        time_t = np.concatenate((np.zeros(1), np.cumsum(time_steps)))
+        mass_fuel_t = np.zeros(1)
+
+        if np.size(time_steps) > 0:
+            altitude = np.full_like(time_steps, cruise_altitude)
+            atm = Atmosphere(altitude, altitude_in_feet=False)
+            atm.true_airspeed = np.full_like(altitude, v_tas)
+            dynamic_pressure = 0.5 * atm.density * v_tas ** 2
+
+            # Fixed point on the mass of the flight points
+            mass_t = np.full_like(altitude, mass_start)
+            previous_step = None
+            for _ in range(MAX_BLOCK_ITERATIONS):
+                previous_step = self.dynamic_equilibrium_vector(
+                    inputs, 0.0, dynamic_pressure, 0.0, 0.0, mass_t, "none", previous_step
+                )
+                flight_points = oad.FlightPoint(
+                    altitude=altitude,
+                    time=time_t[:-1],
+                    ground_distance=distance_t[:-1],
+                    engine_setting=EngineSetting.CRUISE,
+                    thrust_is_regulated=np.full_like(altitude, True),
+                    mass=mass_t,
+                    name="sizing:main_route:cruise",
+                    mach=atm.mach,
+                    true_airspeed=atm.true_airspeed,
+                    equivalent_airspeed=atm.equivalent_airspeed,
+                    gamma=np.zeros_like(altitude),
+                    thrust=previous_step[1],
+                )
+                propulsion_model.compute_flight_points(flight_points)
+                consumed_mass = propulsion_model.get_consumed_mass(flight_points, 1.0) * time_steps
+                mass_fuel_t = np.concatenate((np.zeros(1), np.cumsum(consumed_mass)))
+                mass_error = np.max(np.abs(mass_start - mass_fuel_t[:-1] - mass_t))
+                mass_t = mass_start - mass_fuel_t[:-1]
+                if mass_error <= BLOCK_MASS_TOLERANCE:
+                    break
+            else:
+                _LOGGER.warning("Mass of the cruise flight points did not converge")
+
+            if np.any(flight_points.thrust_rate > 1.0):
+                _LOGGER.warning("Thrust rate is above 1.0, value clipped at 1.0")
+
+            # Save results
+            if self.options["out_file"] != "":
+                self.flight_points = []
+                self.add_flight_points_vector(
+                    flight_points=flight_points,
+                    equilibrium_result=previous_step,
+                    wing_area=wing_area,
+                )
+                self.save_csv()
+
+        outputs["data:mission:sizing:main_route:cruise:fuel"] = mass_fuel_t[-1]
+        outputs["data:mission:sizing:main_route:cruise:distance"] = distance_t[-1]
+        outputs["data:mission:sizing:main_route:cruise:duration"] = time_t[-1]
@@ -28,13 +28,15 @@ from fastoad.constants import EngineSetting
 from stdatm import Atmosphere
 
 
-from ..dynamic_equilibrium import DynamicEquilibrium
+from ..dynamic_equilibrium import DynamicEquilibrium, true_airspeed_from_cas
 from ..constants import SUBMODEL_DESCENT, SUBMODEL_DESCENT_SPEED
 
 _LOGGER = logging.getLogger(__name__)
 
 POINTS_NB_DESCENT = 50
 MAX_CALCULATION_TIME = 15  # time in seconds
+MAX_BLOCK_ITERATIONS = 20
+BLOCK_MASS_TOLERANCE = 1e-4  # tolerance on the mass of the flight points, in kg
 
 oad.RegisterSubmodel.active_models[
     SUBMODEL_DESCENT
@@ -264,3 +266,153 @@ class ComputeDescentSpeed(om.ExplicitComponent):
         v_cas = max(np.sqrt((mass_t * g) / (0.5 * atm.density * wing_area * c_l)), 1.3 * vs1)
 
         outputs["data:mission:sizing:main_route:descent:v_cas"] = v_cas
+
+
+@oad.RegisterSubmodel(SUBMODEL_DESCENT, "fastga.submodel.performances.mission.descent.block")
+class ComputeDescentBlock(ComputeDescent):
+    """
+    Same as ComputeDescent, but the flight points are computed all at once instead of one time
+    step after the other. The altitudes of the time steps only depend on the number of times the
+    descent angle is reduced to avoid a negative thrust, and the consumption on the mass of the
+    points, so both are found with a fixed point on the whole descent, each iteration solving the
+    equilibrium and the consumption of all the points with arrays.
+    """
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+
+        wing_area = inputs["data:geometry:wing:area"]
+        propulsion_model = self._engine_wrapper.get_model(inputs)
+        cruise_altitude = float(inputs["data:mission:sizing:main_route:cruise:altitude"])
+        descent_rate = float(inputs["data:mission:sizing:main_route:descent:descent_rate"])
+        mtow = inputs["data:weight:aircraft:MTOW"]
+        m_to = inputs["data:mission:sizing:taxi_out:fuel"]
+        m_tk = inputs["data:mission:sizing:takeoff:fuel"]
+        m_ic = inputs["data:mission:sizing:initial_climb:fuel"]
+        m_cl = inputs["data:mission:sizing:main_route:climb:fuel"]
+        m_cr = inputs["data:mission:sizing:main_route:cruise:fuel"]
+        v_cas = float(inputs["data:mission:sizing:main_route:descent:v_cas"])
+        mass_start = float(mtow - (m_to + m_tk + m_ic + m_cl + m_cr))
+
+        # Define specific time step ~POINTS_NB_DESCENT points for calculation (with ground
+        # conditions)
+        time_step = abs((cruise_altitude / descent_rate)) / float(POINTS_NB_DESCENT)
+
+        # Number of times the descent angle of each point is reduced by 10% for the thrust to be
+        # positive
+        reduction_nb = np.zeros(0, dtype=int)
+        mass_t = np.zeros(0)
+        previous_step = None
+        for _ in range(MAX_BLOCK_ITERATIONS):
+
+            # March the altitudes with the descent angles of the previous iteration
+            altitude = [cruise_altitude]
+            v_tas = []
+            time_steps = []
+            step = time_step
+            while altitude[-1] > 0.0:
+                idx = len(time_steps)
+                v_tas.append(
+                    float(
+                        true_airspeed_from_cas(
+                            Atmosphere(altitude[-1], altitude_in_feet=False), v_cas
+                        )
+                    )
+                )
+                gamma = np.arcsin(descent_rate / v_tas[-1])
+                if np.size(reduction_nb) > 0:
+                    gamma = gamma * 0.9 ** reduction_nb[min(idx, np.size(reduction_nb) - 1)]
+                v_z = v_tas[-1] * np.sin(gamma)
+                step = min(step, -altitude[-1] / v_z)
+                time_steps.append(step)
+                altitude.append(altitude[-1] + v_z * step)
+            altitude = np.array(altitude[:-1])
+            v_tas = np.array(v_tas)
+            time_steps = np.array(time_steps)
+
+            atm = Atmosphere(altitude, altitude_in_feet=False)
+            atm.true_airspeed = v_tas
+            gamma_descent = np.arcsin(descent_rate / v_tas)
+            atm_1 = Atmosphere(altitude + 1.0, altitude_in_feet=False)
+            dvx_dt = (true_airspeed_from_cas(atm_1, v_cas) - v_tas) * v_tas * np.sin(gamma_descent)
+            dynamic_pressure = 0.5 * atm.density * v_tas ** 2
+
+            time_t = np.concatenate((np.zeros(1), np.cumsum(time_steps)))
+            if np.size(mass_t) != np.size(altitude):
+                # Points were added or removed, previous results are interpolated on the new ones
+                if np.size(mass_t) == 0:
+                    mass_t = np.full_like(altitude, mass_start)
+                else:
+                    mass_t = np.interp(time_t[:-1], flight_points.time, mass_t)
+                previous_step = None
+            previous_reduction_nb = np.full_like(
+                altitude, reduction_nb[-1] if np.size(reduction_nb) > 0 else 0, dtype=int
+            )
+            previous_reduction_nb[: np.size(reduction_nb)] = reduction_nb[: np.size(altitude)]
+
+            # Find equilibrium, decrease gamma where obtained thrust is negative
+            reduction_nb = np.zeros_like(altitude, dtype=int)
+            gamma = np.copy(gamma_descent)
+            previous_step = list(
+                self.dynamic_equilibrium_vector(
+                    inputs, gamma, dynamic_pressure, dvx_dt, 0.0, mass_t, "none", previous_step
+                )
+            )
+            negative = previous_step[1] < 0.0
+            while np.any(negative):
+                reduction_nb[negative] += 1
+                gamma = gamma_descent * 0.9 ** reduction_nb
+                partial_step = self.dynamic_equilibrium_vector(
+                    inputs,
+                    gamma[negative],
+                    dynamic_pressure[negative],
+                    dvx_dt[negative],
+                    0.0,
+                    mass_t[negative],
+                    "none",
+                    (previous_step[0][negative], previous_step[1][negative]),
+                )
+                for result, partial_result in zip(previous_step, partial_step):
+                    result[negative] = partial_result
+                negative = previous_step[1] < 0.0
+
+            distance_t = np.concatenate(
+                (np.zeros(1), np.cumsum(v_tas * np.cos(gamma) * time_steps))
+            )
+            flight_points = oad.FlightPoint(
+                altitude=altitude,
+                time=time_t[:-1],
+                ground_distance=distance_t[:-1],
+                engine_setting=EngineSetting.CLIMB,
+                thrust_is_regulated=np.full_like(altitude, True),
+                mass=mass_t,
+                name="sizing:main_route:descent",
+                mach=atm.mach,
+                true_airspeed=v_tas,
+                equivalent_airspeed=atm.equivalent_airspeed,
+                gamma=gamma,
+                thrust=previous_step[1],
+            )
+            propulsion_model.compute_flight_points(flight_points)
+            consumed_mass = propulsion_model.get_consumed_mass(flight_points, 1.0) * time_steps
+            mass_fuel_t = np.concatenate((np.zeros(1), np.cumsum(consumed_mass)))
+            mass_error = np.max(np.abs(mass_start - mass_fuel_t[:-1] - mass_t))
+            mass_t = mass_start - mass_fuel_t[:-1]
+            if (
+                np.array_equal(reduction_nb, previous_reduction_nb)
+                and mass_error <= BLOCK_MASS_TOLERANCE
+            ):
+                break
+        else:
+            _LOGGER.warning("Mass of the descent flight points did not converge")
+
+        # Save results
+        if self.options["out_file"] != "":
+            self.flight_points = []
+            self.add_flight_points_vector(
+                flight_points=flight_points, equilibrium_result=previous_step, wing_area=wing_area
+            )
+            self.save_csv()
+
+        outputs["data:mission:sizing:main_route:descent:fuel"] = mass_fuel_t[-1]
+        outputs["data:mission:sizing:main_route:descent:distance"] = distance_t[-1]
+        outputs["data:mission:sizing:main_route:descent:duration"] = time_t[-1]
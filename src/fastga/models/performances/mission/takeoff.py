@@ -33,6 +33,7 @@ ALPHA_RATE = 3.0 * np.pi / 180.0  # Angular rotation speed in rad/s
 SAFETY_HEIGHT = 50 * 0.3048  # Height in meters to reach V2 speed
 TIME_STEP = 0.1  # For time dependent simulation
 CLIMB_GRAD_AEO = 0.083  # Climb gradient when all engine are operating, based on CS23.65
+LIFT_OFF_ANGLES_NB = 10  # Number of lift-off angles tested to reach V2 at safety height
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +41,13 @@ _LOGGER = logging.getLogger(__name__)
 class TakeOffPhase(om.Group):
     def initialize(self):
         self.options.declare("propulsion_id", default="", types=str)
+        self.options.declare(
+            "number_of_lift_off_angles",
+            default=LIFT_OFF_ANGLES_NB,
+            types=int,
+            desc="number of lift-off angles of attack for which the transition to the safety "
+            "height is simulated",
+        )
 
     def setup(self):
 
@@ -53,7 +61,10 @@ class TakeOffPhase(om.Group):
         )
         self.add_subsystem(
             "compute_v_lift_off",
-            _v_lift_off_from_v2(propulsion_id=self.options["propulsion_id"]),
+            _v_lift_off_from_v2(
+                propulsion_id=self.options["propulsion_id"],
+                number_of_lift_off_angles=self.options["number_of_lift_off_angles"],
+            ),
             promotes=self.get_io_names(
                 _v_lift_off_from_v2(propulsion_id=self.options["propulsion_id"]),
                 excludes=[
@@ -222,6 +233,13 @@ class _v_lift_off_from_v2(om.ExplicitComponent):
 
     def initialize(self):
         self.options.declare("propulsion_id", default="", types=str)
+        self.options.declare(
+            "number_of_lift_off_angles",
+            default=LIFT_OFF_ANGLES_NB,
+            types=int,
+            desc="number of lift-off angles of attack for which the transition to the safety "
+            "height is simulated",
+        )
 
     def setup(self):
         self._engine_wrapper = BundleLoader().instantiate_component(self.options["propulsion_id"])
@@ -275,94 +293,89 @@ class _v_lift_off_from_v2(om.ExplicitComponent):
                 / (1.0 + 33.0 * ((lg_height + altitude) / wing_span) ** 1.5)
             )
 
-        # Calculate v2 speed @ safety height for different alpha lift-off
-        alpha = np.linspace(0.0, min(ALPHA_LIMIT, alpha_v2), num=10)
-        v_lift_off = np.zeros(np.size(alpha))
-        v2 = np.zeros(np.size(alpha))
+        # Calculate v2 speed @ safety height for different alpha lift-off, all the candidates
+        # are treated at the same time, as arrays
+        alpha = np.linspace(
+            0.0, min(ALPHA_LIMIT, alpha_v2), num=self.options["number_of_lift_off_angles"]
+        )
         atm_0 = Atmosphere(0.0)
 
         # Step 1.0 computes the lift-off speed for different value of angle of attack ranging
         # from 0° to the angle of attack corresponding to the V2 computation from previously
 
-        for i in range(len(alpha)):
-
-            # Calculate lift coefficient
-            cl = cl0 + cl_alpha * alpha[i]
-            # Loop on estimated lift-off speed error induced by thrust estimation
-            rel_error = 0.1
-            v_lift_off[i] = np.sqrt((mtow * g) / (0.5 * atm_0.density * wing_area * cl))
-            while rel_error > 0.05:
-                # Update thrust with v_lift_off
-                flight_point = oad.FlightPoint(
-                    mach=v_lift_off[i] / atm_0.speed_of_sound,
-                    altitude=0.0,
-                    engine_setting=EngineSetting.TAKEOFF,
-                    thrust_rate=thrust_rate,
-                )
-                propulsion_model.compute_flight_points(flight_point)
-                thrust = float(flight_point.thrust)
-                # Calculate v_lift_off necessary to overcome weight
-                if thrust * np.sin(alpha[i]) > mtow * g:
-                    break
-                else:
-                    v = np.sqrt(
-                        (mtow * g - thrust * np.sin(alpha[i]))
-                        / (0.5 * atm_0.density * wing_area * cl)
-                    )
-                rel_error = abs(v - v_lift_off[i]) / v
-                v_lift_off[i] = v
-
-            # Step 2.0 consists in performing the transition from v_lift_off to V2 with a
-            # constant rotation speed for the same range of AOA
-
-            # Perform climb with imposed rotational speed till reaching safety height
-            alpha_t = alpha[i]
-            gamma_t = 0.0
-            v_t = float(v_lift_off[i])
-            altitude_t = 0.0
-            distance_t = 0.0
-            while altitude_t < SAFETY_HEIGHT:
-                # Estimation of thrust
-                atm = Atmosphere(altitude_t, altitude_in_feet=False)
-                flight_point = oad.FlightPoint(
-                    mach=v_t / atm.speed_of_sound,
-                    altitude=altitude_t,
-                    engine_setting=EngineSetting.TAKEOFF,
-                    thrust_rate=thrust_rate,
-                )
-                propulsion_model.compute_flight_points(flight_point)
-                thrust = float(flight_point.thrust)
-                # Calculate lift and drag
-                cl = cl0 + cl_alpha * alpha_t
-                lift = 0.5 * atm.density * wing_area * cl * v_t ** 2
-                cd = cd0 + k_ground(altitude_t) * coeff_k * cl ** 2
-                drag = 0.5 * atm.density * wing_area * cd * v_t ** 2
-                # Calculate acceleration on x/z air axis
-                weight = mtow * g
-                acc_x = (thrust * np.cos(alpha_t) - weight * np.sin(gamma_t) - drag) / mtow
-                acc_z = (lift + thrust * np.sin(alpha_t) - weight * np.cos(gamma_t)) / mtow
-                # Calculate gamma change and new speed
-                delta_gamma = np.arctan2((acc_z * TIME_STEP), (v_t + acc_x * TIME_STEP))
-                v_t_new = np.sqrt((acc_z * TIME_STEP) ** 2 + (v_t + acc_x * TIME_STEP) ** 2)
-                # Trapezoidal integration on distance/altitude
-                delta_altitude = (
-                    (v_t_new * np.sin(gamma_t + delta_gamma) + v_t * np.sin(gamma_t))
-                    / 2
-                    * TIME_STEP
-                )
-                delta_distance = (
-                    (v_t_new * np.cos(gamma_t + delta_gamma) + v_t * np.cos(gamma_t))
-                    / 2
-                    * TIME_STEP
-                )
-                # Update temporal values
-                alpha_t = min(alpha_v2, alpha_t + ALPHA_RATE * TIME_STEP)
-                gamma_t = gamma_t + delta_gamma
-                altitude_t = altitude_t + delta_altitude
-                distance_t = distance_t + delta_distance
-                v_t = v_t_new
-            # Save obtained v2
-            v2[i] = v_t
+        # Calculate lift coefficient
+        cl = cl0 + cl_alpha * alpha
+        # Loop on estimated lift-off speed error induced by thrust estimation, the candidates
+        # for which the error is small enough or for which the thrust overcomes the weight are
+        # no longer updated
+        v_lift_off = np.sqrt((mtow * g) / (0.5 * atm_0.density * wing_area * cl))
+        iterating = np.full(np.size(alpha), True)
+        while np.any(iterating):
+            # Update thrust with v_lift_off
+            thrust = compute_takeoff_thrust(
+                propulsion_model,
+                v_lift_off[iterating],
+                np.zeros(np.sum(iterating)),
+                thrust_rate,
+            )
+            # Calculate v_lift_off necessary to overcome weight
+            alpha_iterating = alpha[iterating]
+            thrust_overcomes_weight = thrust * np.sin(alpha_iterating) > mtow * g
+            v = np.sqrt(
+                np.maximum(mtow * g - thrust * np.sin(alpha_iterating), 0.0)
+                / (0.5 * atm_0.density * wing_area * cl[iterating])
+            )
+            rel_error = np.abs(v - v_lift_off[iterating]) / v
+            v_lift_off[iterating] = np.where(thrust_overcomes_weight, v_lift_off[iterating], v)
+            iterating[iterating] = np.logical_not(thrust_overcomes_weight) & (rel_error > 0.05)
+
+        # Step 2.0 consists in performing the transition from v_lift_off to V2 with a
+        # constant rotation speed for the same range of AOA
+
+        # Perform climb with imposed rotational speed till reaching safety height, the
+        # trajectories are integrated in lockstep and frozen once they reach it
+        alpha_t = np.copy(alpha)
+        gamma_t = np.zeros(np.size(alpha))
+        v_t = np.copy(v_lift_off)
+        altitude_t = np.zeros(np.size(alpha))
+        distance_t = np.zeros(np.size(alpha))
+        climbing = altitude_t < SAFETY_HEIGHT
+        while np.any(climbing):
+            alpha_c = alpha_t[climbing]
+            gamma_c = gamma_t[climbing]
+            v_c = v_t[climbing]
+            altitude_c = altitude_t[climbing]
+            # Estimation of thrust
+            atm = Atmosphere(altitude_c, altitude_in_feet=False)
+            thrust = compute_takeoff_thrust(propulsion_model, v_c, altitude_c, thrust_rate)
+            # Calculate lift and drag
+            cl = cl0 + cl_alpha * alpha_c
+            lift = 0.5 * atm.density * wing_area * cl * v_c ** 2
+            cd = cd0 + k_ground(altitude_c) * coeff_k * cl ** 2
+            drag = 0.5 * atm.density * wing_area * cd * v_c ** 2
+            # Calculate acceleration on x/z air axis
+            weight = mtow * g
+            acc_x = (thrust * np.cos(alpha_c) - weight * np.sin(gamma_c) - drag) / mtow
+            acc_z = (lift + thrust * np.sin(alpha_c) - weight * np.cos(gamma_c)) / mtow
+            # Calculate gamma change and new speed
+            delta_gamma = np.arctan2((acc_z * TIME_STEP), (v_c + acc_x * TIME_STEP))
+            v_t_new = np.sqrt((acc_z * TIME_STEP) ** 2 + (v_c + acc_x * TIME_STEP) ** 2)
+            # Trapezoidal integration on distance/altitude
+            delta_altitude = (
+                (v_t_new * np.sin(gamma_c + delta_gamma) + v_c * np.sin(gamma_c)) / 2 * TIME_STEP
+            )
+            delta_distance = (
+                (v_t_new * np.cos(gamma_c + delta_gamma) + v_c * np.cos(gamma_c)) / 2 * TIME_STEP
+            )
+            # Update temporal values
+            alpha_t[climbing] = np.minimum(alpha_v2, alpha_c + ALPHA_RATE * TIME_STEP)
+            gamma_t[climbing] = gamma_c + delta_gamma
+            altitude_t[climbing] = altitude_c + delta_altitude
+            distance_t[climbing] = distance_t[climbing] + delta_distance
+            v_t[climbing] = v_t_new
+            climbing = altitude_t < SAFETY_HEIGHT
+        # Save obtained v2
+        v2 = v_t
 
         # If v2 target speed not reachable maximum lift-off speed chosen (alpha=0°)
         if sum(v2 > v2_target) == 0:
@@ -637,3 +650,28 @@ class _simulate_takeoff(om.ExplicitComponent):
         outputs["data:mission:sizing:takeoff:duration"] = time_t
         outputs["data:mission:sizing:takeoff:fuel"] = mass_fuel1_t
         outputs["data:mission:sizing:initial_climb:fuel"] = mass_fuel2_t
+
+
+def compute_takeoff_thrust(propulsion_model, true_airspeed, altitude, thrust_rate):
+    """
+    Computes the thrust at imposed thrust rate in takeoff setting for several flight points with
+    a single call to the propulsion model.
+
+    :param propulsion_model: the propulsion model
+    :param true_airspeed: array of true airspeed of the flight points, in m/s
+    :param altitude: array of altitude of the flight points, in m
+    :param thrust_rate: thrust rate imposed on all flight points
+    :return: array of thrust, in N
+    """
+
+    atm = Atmosphere(altitude, altitude_in_feet=False)
+    flight_points = oad.FlightPoint(
+        mach=true_airspeed / atm.speed_of_sound,
+        altitude=altitude,
+        engine_setting=EngineSetting.TAKEOFF,
+        thrust_is_regulated=np.full(np.size(altitude), False),
+        thrust_rate=np.full(np.size(altitude), float(thrust_rate)),
+    )
+    propulsion_model.compute_flight_points(flight_points)
+
+    return np.asarray(flight_points.thrust, dtype=float).flatten()
@@ -16,6 +16,11 @@ import openmdao.api as om
 import fastoad.api as oad
 from fastoad.module_management.constants import ModelDomain
 
+from fastga.models.performances.mission.mission_components import (
+    POINTS_NB_CLIMB,
+    POINTS_NB_CRUISE,
+    POINTS_NB_DESCENT,
+)
 from fastga.models.performances.mission.takeoff import TakeOffPhase
 from .mission_vector import MissionVector
 
@@ -28,6 +33,31 @@ class FullMission(om.Group):
 
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
         self.options.declare("out_file", default="", types=str)
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            types=int,
+            desc="number of equilibrium to be treated during the climb",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            types=int,
+            desc="number of equilibrium to be treated during the cruise",
+        )
+        self.options.declare(
+            "number_of_points_descent",
+            default=POINTS_NB_DESCENT,
+            types=int,
+            desc="number of equilibrium to be treated during the descent",
+        )
+        self.options.declare(
+            "adaptive_discretization",
+            default=False,
+            types=bool,
+            desc="Set to True to refine the mission points where the flight conditions vary the "
+            "most, see MissionVector",
+        )
 
     def setup(self):
 
@@ -37,7 +67,12 @@ class FullMission(om.Group):
         self.add_subsystem(
             "solve_equilibrium",
             MissionVector(
-                out_file=self.options["out_file"], propulsion_id=self.options["propulsion_id"]
+                out_file=self.options["out_file"],
+                propulsion_id=self.options["propulsion_id"],
+                number_of_points_climb=self.options["number_of_points_climb"],
+                number_of_points_cruise=self.options["number_of_points_cruise"],
+                number_of_points_descent=self.options["number_of_points_descent"],
+                adaptive_discretization=self.options["adaptive_discretization"],
             ),
             promotes=["*"],
         )
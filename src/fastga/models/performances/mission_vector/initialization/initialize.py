@@ -17,7 +17,6 @@ import openmdao.api as om
 from fastga.models.performances.mission.mission_components import (
     POINTS_NB_CLIMB,
     POINTS_NB_CRUISE,
-    POINTS_NB_DESCENT,
 )
 from ..initialization.initialize_cg import InitializeCoG
 from ..initialization.initialize_airspeed import InitializeAirspeed
@@ -36,15 +35,40 @@ class Initialize(om.Group):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
+        self.options.declare(
+            "adaptive_discretization",
+            default=False,
+            types=bool,
+            desc="Set to True to sample the phases based on the variation of the flight "
+            "conditions rather than uniformly",
+        )
 
     def setup(self):
 
         number_of_points = self.options["number_of_points"]
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        options_phases = {
+            "number_of_points": number_of_points,
+            "number_of_points_climb": number_of_points_climb,
+            "number_of_points_cruise": number_of_points_cruise,
+        }
         engine_setting = np.concatenate(
             (
-                np.full(POINTS_NB_CLIMB, 2),
-                np.full(POINTS_NB_CRUISE, 3),
-                np.full(POINTS_NB_DESCENT, 2),
+                np.full(number_of_points_climb, 2),
+                np.full(number_of_points_cruise, 3),
+                np.full(number_of_points - number_of_points_climb - number_of_points_cruise, 2),
             )
         )
         ivc_engine_setting = om.IndepVarComp()
@@ -55,19 +79,21 @@ class Initialize(om.Group):
         self.add_subsystem("initialize_engine_setting", subsys=ivc_engine_setting, promotes=[])
         self.add_subsystem(
             "initialize_altitude",
-            InitializeAltitude(number_of_points=number_of_points),
+            InitializeAltitude(
+                adaptive_discretization=self.options["adaptive_discretization"], **options_phases
+            ),
             promotes_inputs=["data:*"],
             promotes_outputs=[],
         )
         self.add_subsystem(
             "initialize_airspeed",
-            InitializeAirspeed(number_of_points=number_of_points),
+            InitializeAirspeed(**options_phases),
             promotes_inputs=["data:*"],
             promotes_outputs=[],
         )
         self.add_subsystem(
             "initialize_gamma",
-            InitializeGamma(number_of_points=number_of_points),
+            InitializeGamma(**options_phases),
             promotes_inputs=["data:*"],
             promotes_outputs=[],
         )
@@ -79,13 +105,15 @@ class Initialize(om.Group):
         )
         self.add_subsystem(
             "initialize_time_and_distance",
-            InitializeTimeAndDistance(number_of_points=number_of_points),
+            InitializeTimeAndDistance(
+                adaptive_discretization=self.options["adaptive_discretization"], **options_phases
+            ),
             promotes_inputs=["data:*"],
             promotes_outputs=[],
         )
         self.add_subsystem(
             "initialize_airspeed_time_derivatives",
-            InitializeAirspeedDerivatives(number_of_points=number_of_points),
+            InitializeAirspeedDerivatives(**options_phases),
             promotes_inputs=[],
             promotes_outputs=[],
         )
@@ -30,6 +30,17 @@ class InitializeAirspeed(om.ExplicitComponent):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
 
     def setup(self):
 
@@ -56,6 +67,10 @@ class InitializeAirspeed(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        start_of_descent = number_of_points_climb + number_of_points_cruise
+
         v_tas_cruise = inputs["data:TLAR:v_cruise"]
 
         cd0 = inputs["data:aerodynamics:aircraft:cruise:CD0"]
@@ -67,9 +82,9 @@ class InitializeAirspeed(om.ExplicitComponent):
         mass = inputs["mass"]
         altitude = inputs["altitude"]
 
-        altitude_climb = altitude[0:POINTS_NB_CLIMB]
-        altitude_cruise = altitude[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE]
-        altitude_descent = altitude[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
+        altitude_climb = altitude[0:number_of_points_climb]
+        altitude_cruise = altitude[number_of_points_climb:start_of_descent]
+        altitude_descent = altitude[start_of_descent:]
 
         # Computes the airspeed that gives the best climb rate
         # FIXME: VCAS constant-speed strategy is specific to ICE-propeller configuration,
@@ -92,7 +107,7 @@ class InitializeAirspeed(om.ExplicitComponent):
 
         cl_opt = inputs["data:aerodynamics:aircraft:cruise:optimal_CL"]
 
-        mass_descent = mass[POINTS_NB_CLIMB + POINTS_NB_CRUISE + 1]
+        mass_descent = mass[start_of_descent + 1]
         atm_descent = Atmosphere(altitude_descent, altitude_in_feet=False)
         vs1 = np.sqrt(
             (mass_descent * g) / (0.5 * atm_descent.density[0] * wing_area * cl_max_clean)
@@ -29,6 +29,17 @@ class InitializeAirspeedDerivatives(om.ExplicitComponent):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
 
     def setup(self):
 
@@ -59,20 +70,24 @@ class InitializeAirspeedDerivatives(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        start_of_descent = number_of_points_climb + number_of_points_cruise
+
         true_airspeed = inputs["true_airspeed"]
         equivalent_airspeed = inputs["equivalent_airspeed"]
         altitude = inputs["altitude"]
         gamma = inputs["gamma"] * np.pi / 180.0
 
-        altitude_climb = altitude[0:POINTS_NB_CLIMB]
-        gamma_climb = gamma[0:POINTS_NB_CLIMB]
-        equivalent_airspeed_climb = equivalent_airspeed[0:POINTS_NB_CLIMB]
-        true_airspeed_climb = true_airspeed[0:POINTS_NB_CLIMB]
+        altitude_climb = altitude[0:number_of_points_climb]
+        gamma_climb = gamma[0:number_of_points_climb]
+        equivalent_airspeed_climb = equivalent_airspeed[0:number_of_points_climb]
+        true_airspeed_climb = true_airspeed[0:number_of_points_climb]
 
-        altitude_descent = altitude[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
-        gamma_descent = gamma[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
-        equivalent_airspeed_descent = equivalent_airspeed[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
-        true_airspeed_descent = true_airspeed[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
+        altitude_descent = altitude[start_of_descent:]
+        gamma_descent = gamma[start_of_descent:]
+        equivalent_airspeed_descent = equivalent_airspeed[start_of_descent:]
+        true_airspeed_descent = true_airspeed[start_of_descent:]
 
         atm_climb_plus_1 = Atmosphere(altitude_climb + 1.0, altitude_in_feet=False)
         atm_climb_plus_1.equivalent_airspeed = equivalent_airspeed_climb
@@ -84,6 +99,8 @@ class InitializeAirspeedDerivatives(om.ExplicitComponent):
         d_v_tas_dh_descent = atm_descent_plus_1.true_airspeed - true_airspeed_descent
         d_vx_dt_descent = d_v_tas_dh_descent * true_airspeed_descent * np.sin(gamma_descent)
 
-        d_vx_dt = np.concatenate((d_vx_dt_climb, np.zeros(POINTS_NB_CRUISE), d_vx_dt_descent))
+        d_vx_dt = np.concatenate(
+            (d_vx_dt_climb, np.zeros(number_of_points_cruise), d_vx_dt_descent)
+        )
 
         outputs["d_vx_dt"] = d_vx_dt
@@ -13,38 +13,144 @@
 
 import numpy as np
 import openmdao.api as om
+from stdatm import Atmosphere
 
 from fastga.models.performances.mission.mission_components import (
     POINTS_NB_CLIMB,
     POINTS_NB_CRUISE,
-    POINTS_NB_DESCENT,
 )
 
 
+# Number of altitude samples per point used to evaluate the variation of the flight conditions
+# along a phase in adaptive mode
+ADAPTIVE_SAMPLES_PER_POINT = 10
+
+
+def adaptive_altitude_sampling(
+    start_altitude, end_altitude, vertical_speed_start, vertical_speed_end, number_of_points
+):
+    """
+    Samples the altitude between the start and end of a climb or descent so that each interval
+    sees the same variation of the flight conditions. The variations of altitude, time,
+    true airspeed at constant equivalent airspeed and density (which drives the power lapse of
+    the engine and hence the thrust rate) are each scaled by their range over the phase and
+    combined as an arc length which is then evenly split.
+
+    :param start_altitude: altitude at the start of the phase, in m
+    :param end_altitude: altitude at the end of the phase, in m
+    :param vertical_speed_start: absolute vertical speed at the start of the phase, in m/s
+    :param vertical_speed_end: absolute vertical speed at the end of the phase, in m/s
+    :param number_of_points: number of points in the phase
+    :return: the altitude of each point of the phase, in m
+    """
+
+    if start_altitude == end_altitude or number_of_points < 3:
+        return np.linspace(start_altitude, end_altitude, number_of_points)
+
+    altitude = np.linspace(
+        start_altitude, end_altitude, ADAPTIVE_SAMPLES_PER_POINT * number_of_points
+    )
+    vertical_speed = np.linspace(vertical_speed_start, vertical_speed_end, len(altitude))
+    time = np.concatenate(
+        (
+            np.zeros(1),
+            np.cumsum(np.abs(np.diff(altitude)) * 2.0 / (vertical_speed[:-1] + vertical_speed[1:])),
+        )
+    )
+    density = Atmosphere(altitude, altitude_in_feet=False).density
+    true_airspeed_ratio = np.sqrt(density[0] / density)
+
+    arc_length = np.zeros(len(altitude) - 1)
+    for flight_condition in [altitude, time, true_airspeed_ratio, density]:
+        variation = np.diff(flight_condition)
+        total_variation = np.sum(np.abs(variation))
+        if total_variation > 0.0:
+            arc_length += (variation / total_variation) ** 2.0
+    arc_length = np.concatenate((np.zeros(1), np.cumsum(np.sqrt(arc_length))))
+
+    return np.interp(np.linspace(0.0, arc_length[-1], number_of_points), arc_length, altitude)
+
+
 class InitializeAltitude(om.ExplicitComponent):
-    """Intializes the altitude at each time step."""
+    """
+    Intializes the altitude at each time step. Climb and descent are either sampled uniformly
+    in altitude or, in adaptive mode, refined where the flight conditions vary the most.
+    """
 
     def initialize(self):
 
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
+        self.options.declare(
+            "adaptive_discretization",
+            default=False,
+            types=bool,
+            desc="Set to True to sample the climb and descent based on the variation of the "
+            "flight conditions rather than uniformly in altitude",
+        )
 
     def setup(self):
 
         number_of_points = self.options["number_of_points"]
 
         self.add_input("data:mission:sizing:main_route:cruise:altitude", val=np.nan, units="m")
+        if self.options["adaptive_discretization"]:
+            self.add_input(
+                "data:mission:sizing:main_route:climb:climb_rate:sea_level",
+                val=np.nan,
+                units="m/s",
+            )
+            self.add_input(
+                "data:mission:sizing:main_route:climb:climb_rate:cruise_level",
+                val=np.nan,
+                units="m/s",
+            )
+            self.add_input(
+                "data:mission:sizing:main_route:descent:descent_rate", np.nan, units="m/s"
+            )
 
         self.add_output("altitude", shape=number_of_points, units="m")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        cruise_altitude = inputs["data:mission:sizing:main_route:cruise:altitude"]
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        number_of_points_descent = (
+            self.options["number_of_points"] - number_of_points_climb - number_of_points_cruise
+        )
+
+        cruise_altitude = float(inputs["data:mission:sizing:main_route:cruise:altitude"])
 
-        altitude_climb = np.linspace(0, cruise_altitude, POINTS_NB_CLIMB)[:, 0]
-        altitude_cruise = np.full(POINTS_NB_CRUISE, cruise_altitude)
-        altitude_descent = np.linspace(cruise_altitude, 0.0, POINTS_NB_DESCENT)[:, 0]
+        if self.options["adaptive_discretization"]:
+            climb_rate_sl = float(
+                inputs["data:mission:sizing:main_route:climb:climb_rate:sea_level"]
+            )
+            climb_rate_cl = float(
+                inputs["data:mission:sizing:main_route:climb:climb_rate:cruise_level"]
+            )
+            descent_rate = abs(float(inputs["data:mission:sizing:main_route:descent:descent_rate"]))
+            altitude_climb = adaptive_altitude_sampling(
+                0.0, cruise_altitude, climb_rate_sl, climb_rate_cl, number_of_points_climb
+            )
+            altitude_descent = adaptive_altitude_sampling(
+                cruise_altitude, 0.0, descent_rate, descent_rate, number_of_points_descent
+            )
+        else:
+            altitude_climb = np.linspace(0, cruise_altitude, number_of_points_climb)
+            altitude_descent = np.linspace(cruise_altitude, 0.0, number_of_points_descent)
+        altitude_cruise = np.full(number_of_points_cruise, cruise_altitude)
 
         altitude = np.concatenate((altitude_climb, altitude_cruise, altitude_descent))
 
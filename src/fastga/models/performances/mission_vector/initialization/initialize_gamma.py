@@ -28,6 +28,17 @@ class InitializeGamma(om.ExplicitComponent):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
 
     def setup(self):
 
@@ -56,6 +67,10 @@ class InitializeGamma(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        start_of_descent = number_of_points_climb + number_of_points_cruise
+
         cruise_altitude = inputs["data:mission:sizing:main_route:cruise:altitude"]
         climb_rate_sl = float(inputs["data:mission:sizing:main_route:climb:climb_rate:sea_level"])
         climb_rate_cl = float(
@@ -65,9 +80,9 @@ class InitializeGamma(om.ExplicitComponent):
         altitude = inputs["altitude"]
         true_airspeed = inputs["true_airspeed"]
 
-        altitude_climb = altitude[0:POINTS_NB_CLIMB]
-        altitude_cruise = altitude[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE]
-        altitude_descent = altitude[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
+        altitude_climb = altitude[0:number_of_points_climb]
+        altitude_cruise = altitude[number_of_points_climb:start_of_descent]
+        altitude_descent = altitude[start_of_descent:]
 
         vertical_speed_climb = np.interp(
             altitude_climb, [0.0, cruise_altitude], [climb_rate_sl, climb_rate_cl]
@@ -28,6 +28,24 @@ class InitializeTimeAndDistance(om.ExplicitComponent):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
+        self.options.declare(
+            "adaptive_discretization",
+            default=False,
+            types=bool,
+            desc="Set to True to concentrate the cruise points near the climb and descent "
+            "rather than spreading them uniformly",
+        )
 
     def setup(self):
 
@@ -66,6 +84,10 @@ class InitializeTimeAndDistance(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        start_of_descent = number_of_points_climb + number_of_points_cruise
+
         altitude = inputs["altitude"]
         horizontal_speed = inputs["horizontal_speed"]
 
@@ -78,10 +100,10 @@ class InitializeTimeAndDistance(om.ExplicitComponent):
         )
         descent_rate = -abs(inputs["data:mission:sizing:main_route:descent:descent_rate"])
 
-        altitude_climb = altitude[0:POINTS_NB_CLIMB]
-        horizontal_speed_climb = horizontal_speed[0:POINTS_NB_CLIMB]
-        altitude_descent = altitude[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
-        horizontal_speed_descent = horizontal_speed[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
+        altitude_climb = altitude[0:number_of_points_climb]
+        horizontal_speed_climb = horizontal_speed[0:number_of_points_climb]
+        altitude_descent = altitude[start_of_descent:]
+        horizontal_speed_descent = horizontal_speed[start_of_descent:]
 
         # Computing the time evolution during the climb phase, based on the altitude sampling and
         # the desired climb rate
@@ -114,12 +136,26 @@ class InitializeTimeAndDistance(om.ExplicitComponent):
 
         # Cruise position computation
         cruise_range = mission_range - position_climb[-1] - position_descent[-1]
-        cruise_distance_step = cruise_range / (POINTS_NB_CRUISE + 1)
-        position_cruise = np.linspace(
-            position_climb[-1] + cruise_distance_step,
-            position_climb[-1] + cruise_range - cruise_distance_step,
-            POINTS_NB_CRUISE,
-        )[:, 0]
+        if self.options["adaptive_discretization"]:
+            # The flight conditions are steady during the cruise, so only the transitions with
+            # the climb and descent need a fine sampling. The points are thus distributed with a
+            # cosine spacing, which is coarse in the middle of the cruise
+            cruise_fraction = (
+                1.0
+                - np.cos(
+                    np.pi
+                    * np.arange(1, number_of_points_cruise + 1)
+                    / (number_of_points_cruise + 1)
+                )
+            ) / 2.0
+            position_cruise = position_climb[-1] + cruise_range * cruise_fraction
+        else:
+            cruise_distance_step = cruise_range / (number_of_points_cruise + 1)
+            position_cruise = np.linspace(
+                position_climb[-1] + cruise_distance_step,
+                position_climb[-1] + cruise_range - cruise_distance_step,
+                number_of_points_cruise,
+            )[:, 0]
 
         cruise_time_array = (position_cruise - position_climb[-1]) / v_tas_cruise + time_climb[-1]
         cruise_time = cruise_range / v_tas_cruise
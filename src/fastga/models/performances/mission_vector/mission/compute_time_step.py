@@ -36,7 +36,18 @@ class ComputeTimeStep(om.ExplicitComponent):
 
     def setup_partials(self):
 
-        self.declare_partials(of="time_step", wrt="time", method="exact")
+        number_of_points = self.options["number_of_points"]
+
+        # The time step of point i is time(i+1) - time(i) except for the last one which reuses
+        # the previous step, the jacobian is thus constant and bi-diagonal
+        rows = np.concatenate((np.arange(number_of_points - 1), np.arange(number_of_points - 1)))
+        cols = np.concatenate((np.arange(number_of_points - 1), np.arange(1, number_of_points)))
+        val = np.concatenate((np.full(number_of_points - 1, -1.0), np.ones(number_of_points - 1)))
+        rows = np.append(rows, [number_of_points - 1, number_of_points - 1])
+        cols = np.append(cols, [number_of_points - 2, number_of_points - 1])
+        val = np.append(val, [-1.0, 1.0])
+
+        self.declare_partials(of="time_step", wrt="time", rows=rows, cols=cols, val=val)
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
@@ -46,14 +57,3 @@ class ComputeTimeStep(om.ExplicitComponent):
         time_step = np.append(time_step, time_step[-1])
 
         outputs["time_step"] = time_step
-
-    def compute_partials(self, inputs, partials, discrete_inputs=None):
-
-        number_of_points = self.options["number_of_points"]
-
-        middle_diagonal = -np.eye(number_of_points)
-        upper_diagonal = np.diagflat(np.full(number_of_points - 1, 1), 1)
-        d_ts_dt = middle_diagonal + upper_diagonal
-        d_ts_dt[-1, -1] = 1.0
-        d_ts_dt[-1, -2] = -1.0
-        partials["time_step", "time"] = d_ts_dt
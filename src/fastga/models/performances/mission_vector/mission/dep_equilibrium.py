@@ -35,6 +35,13 @@ class DEPEquilibrium(om.Group):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=None,
+            allow_none=True,
+            desc="number of climb points when the equilibrium is computed on a full mission, "
+            "used to correct the last time step of the climb for the energy consumption",
+        )
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
         self.options.declare(
             "promotes_all_variables",
@@ -55,7 +62,10 @@ class DEPEquilibrium(om.Group):
         if self.options["promotes_all_variables"]:
             self.add_subsystem(
                 "preparation_for_energy_consumption",
-                PrepareForEnergyConsumption(number_of_points=number_of_points),
+                PrepareForEnergyConsumption(
+                    number_of_points=number_of_points,
+                    number_of_points_climb=self.options["number_of_points_climb"],
+                ),
                 promotes_inputs=["*"],
                 promotes_outputs=["*"],
             )
@@ -92,7 +102,10 @@ class DEPEquilibrium(om.Group):
         else:
             self.add_subsystem(
                 "preparation_for_energy_consumption",
-                PrepareForEnergyConsumption(number_of_points=number_of_points),
+                PrepareForEnergyConsumption(
+                    number_of_points=number_of_points,
+                    number_of_points_climb=self.options["number_of_points_climb"],
+                ),
                 promotes_inputs=["data:*"],
                 promotes_outputs=[],
             )
@@ -32,6 +32,14 @@ class PrepareForEnergyConsumption(om.ExplicitComponent):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=None,
+            allow_none=True,
+            desc="number of climb points when the vectors describe a full mission, if None, "
+            "the default climb discretization is assumed when the number of points matches the "
+            "default mission discretization",
+        )
 
     def setup(self):
 
@@ -75,46 +83,68 @@ class PrepareForEnergyConsumption(om.ExplicitComponent):
 
     def setup_partials(self):
 
+        number_of_points = self.options["number_of_points"]
+
+        # All the outputs are copies of the inputs with the taxi points appended at the end so
+        # the partials are constant and only have one non-zero term per row
+        flight_points = np.arange(number_of_points)
+
         self.declare_partials(
-            of="thrust_econ",
-            wrt=[
-                "thrust",
-                "data:mission:sizing:taxi_out:thrust",
-                "data:mission:sizing:taxi_in:thrust",
-            ],
-            method="exact",
+            of="thrust_econ", wrt="thrust", rows=flight_points, cols=flight_points, val=1.0
         )
-
         self.declare_partials(
-            of="altitude_econ",
-            wrt=[
-                "altitude",
-            ],
-            method="exact",
+            of="altitude_econ", wrt="altitude", rows=flight_points, cols=flight_points, val=1.0
         )
-
         self.declare_partials(
-            of="time_step_econ",
-            wrt=[
-                "time_step",
-                "data:mission:sizing:taxi_out:duration",
-                "data:mission:sizing:taxi_in:duration",
-            ],
-            method="exact",
+            of="true_airspeed_econ",
+            wrt="true_airspeed",
+            rows=flight_points,
+            cols=flight_points,
+            val=1.0,
         )
 
+        # Since the last time step of the climb is replaced by the one before, see compute
+        time_step_cols = np.copy(flight_points)
+        end_of_climb = self._end_of_climb()
+        if end_of_climb is not None:
+            time_step_cols[end_of_climb] = end_of_climb - 1
         self.declare_partials(
-            of="true_airspeed_econ",
-            wrt=[
-                "true_airspeed",
+            of="time_step_econ", wrt="time_step", rows=flight_points, cols=time_step_cols, val=1.0
+        )
+
+        for output_name, taxi_out_name, taxi_in_name in [
+            (
+                "thrust_econ",
+                "data:mission:sizing:taxi_out:thrust",
+                "data:mission:sizing:taxi_in:thrust",
+            ),
+            (
+                "time_step_econ",
+                "data:mission:sizing:taxi_out:duration",
+                "data:mission:sizing:taxi_in:duration",
+            ),
+            (
+                "true_airspeed_econ",
                 "data:mission:sizing:taxi_out:speed",
                 "data:mission:sizing:taxi_in:speed",
-            ],
-            method="exact",
-        )
+            ),
+        ]:
+            self.declare_partials(
+                of=output_name,
+                wrt=taxi_out_name,
+                rows=np.array([number_of_points]),
+                cols=np.array([0]),
+                val=1.0,
+            )
+            self.declare_partials(
+                of=output_name,
+                wrt=taxi_in_name,
+                rows=np.array([number_of_points + 1]),
+                cols=np.array([0]),
+                val=1.0,
+            )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        number_of_points = self.options["number_of_points"]
 
         thrust_taxi_out = float(inputs["data:mission:sizing:taxi_out:thrust"])
         thrust_taxi_in = float(inputs["data:mission:sizing:taxi_in:thrust"])
@@ -133,12 +163,11 @@ class PrepareForEnergyConsumption(om.ExplicitComponent):
         # last time step of climb with the precedent to get a good estimate. This will only serve
         # for the energy consumption calculation.
         # Since this module might be used for something else than performances computation,
-        # the array might not be long enough for the index POINTS_NB_CLIMB - 1 to be reachable.
-        # Though it is a clumsy way to do it, we will check that n = POINTS_NB_CLIMB +
-        # POINTS_NB_CRUISE + POINTS_NB_DESCENT and only perform the change above if it is the case.
+        # the array might not describe a mission, in which case no change is done.
         time_step = inputs["time_step"]
-        if number_of_points == POINTS_NB_CLIMB + POINTS_NB_CRUISE + POINTS_NB_DESCENT:
-            time_step[POINTS_NB_CLIMB - 1] = time_step[POINTS_NB_CLIMB - 2]
+        end_of_climb = self._end_of_climb()
+        if end_of_climb is not None:
+            time_step[end_of_climb] = time_step[end_of_climb - 1]
         outputs["time_step_econ"] = np.concatenate(
             (time_step, np.array([time_step_taxi_out, time_step_taxi_in]))
         )
@@ -153,49 +182,23 @@ class PrepareForEnergyConsumption(om.ExplicitComponent):
             (inputs["engine_setting"], np.array([1, 1]))
         )
 
-    def compute_partials(self, inputs, partials, discrete_inputs=None):
+    def _end_of_climb(self):
+        """
+        Returns the index of the last point of the climb if the vectors describe a full mission
+        and None otherwise.
+        """
 
         number_of_points = self.options["number_of_points"]
+        number_of_points_climb = self.options["number_of_points_climb"]
 
-        d_thrust_econ_d_thrust = np.zeros((number_of_points + 2, number_of_points))
-        d_thrust_econ_d_thrust[:number_of_points, :] = np.eye(number_of_points)
-        partials["thrust_econ", "thrust"] = d_thrust_econ_d_thrust
-
-        d_thrust_econ_d_thrust_to = np.zeros(number_of_points + 2)
-        d_thrust_econ_d_thrust_to[-2] = 1.0
-        partials["thrust_econ", "data:mission:sizing:taxi_out:thrust"] = d_thrust_econ_d_thrust_to
-
-        d_thrust_econ_d_thrust_ti = np.zeros(number_of_points + 2)
-        d_thrust_econ_d_thrust_ti[-1] = 1.0
-        partials["thrust_econ", "data:mission:sizing:taxi_in:thrust"] = d_thrust_econ_d_thrust_ti
-
-        d_altitude_econ_d_altitude = np.zeros((number_of_points + 2, number_of_points))
-        d_altitude_econ_d_altitude[:number_of_points, :] = np.eye(number_of_points)
-        partials["altitude_econ", "altitude"] = d_altitude_econ_d_altitude
-
-        d_ts_econ_d_ts = np.zeros((number_of_points + 2, number_of_points))
-        d_ts_econ_d_ts[:number_of_points, :] = np.eye(number_of_points)
-        if number_of_points == POINTS_NB_CLIMB + POINTS_NB_CRUISE + POINTS_NB_DESCENT:
-            d_ts_econ_d_ts[POINTS_NB_CLIMB - 1, POINTS_NB_CLIMB - 1] = 0.0
-            d_ts_econ_d_ts[POINTS_NB_CLIMB - 1, POINTS_NB_CLIMB - 2] = 0.0
-        partials["time_step_econ", "time_step"] = d_ts_econ_d_ts
-
-        d_ts_econ_d_ts_to = np.zeros(number_of_points + 2)
-        d_ts_econ_d_ts_to[-2] = 1.0
-        partials["time_step_econ", "data:mission:sizing:taxi_out:duration"] = d_ts_econ_d_ts_to
-
-        d_ts_econ_d_ts_ti = np.zeros(number_of_points + 2)
-        d_ts_econ_d_ts_ti[-1] = 1.0
-        partials["time_step_econ", "data:mission:sizing:taxi_in:duration"] = d_ts_econ_d_ts_ti
-
-        d_tas_econ_d_tas = np.zeros((number_of_points + 2, number_of_points))
-        d_tas_econ_d_tas[:number_of_points, :] = np.eye(number_of_points)
-        partials["true_airspeed_econ", "true_airspeed"] = d_tas_econ_d_tas
+        if number_of_points_climb is None:
+            # Legacy behavior, where the default discretization of the mission is recognized
+            # based on the number of points
+            if number_of_points != POINTS_NB_CLIMB + POINTS_NB_CRUISE + POINTS_NB_DESCENT:
+                return None
+            number_of_points_climb = POINTS_NB_CLIMB
 
-        d_tas_econ_d_tas_to = np.zeros(number_of_points + 2)
-        d_tas_econ_d_tas_to[-2] = 1.0
-        partials["true_airspeed_econ", "data:mission:sizing:taxi_out:speed"] = d_tas_econ_d_tas_to
+        if 2 <= number_of_points_climb < number_of_points:
+            return number_of_points_climb - 1
 
-        d_tas_econ_d_tas_ti = np.zeros(number_of_points + 2)
-        d_tas_econ_d_tas_ti[-1] = 1.0
-        partials["true_airspeed_econ", "data:mission:sizing:taxi_in:speed"] = d_tas_econ_d_tas_ti
+        return None
@@ -16,6 +16,38 @@ import openmdao.api as om
 from scipy.constants import g
 from stdatm import Atmosphere
 
+# Constants of the pressure model used in stdatm, needed to differentiate the density
+TROPOPAUSE = 11000.0
+TROPOSPHERE_PRESSURE_EXPONENT = 5.25587611
+TROPOSPHERE_PRESSURE_ALTITUDE = 44330.78
+TROPOSPHERE_LAPSE_RATE = 0.0065
+STRATOSPHERE_PRESSURE_DECAY = 0.0001576883 * np.log(2.718281)
+
+
+def d_density_d_altitude(altitude):
+    """
+    Computes the derivative of the air density with respect to the altitude, consistent with the
+    ISA model implemented in stdatm.
+
+    :param altitude: altitude array, in m
+    :return: derivative of the density wrt the altitude, in kg/m**3/m
+    """
+
+    altitude = np.asarray(altitude, dtype=float)
+    atm = Atmosphere(altitude, altitude_in_feet=False)
+    rho = atm.density
+    temperature = atm.temperature
+
+    # rho = p / (R * T) hence d(rho)/rho = dp/p - dT/T, in the troposphere both pressure and
+    # temperature vary while only pressure does in the stratosphere
+    d_log_rho_troposphere = (
+        -TROPOSPHERE_PRESSURE_EXPONENT / (TROPOSPHERE_PRESSURE_ALTITUDE - altitude)
+        + TROPOSPHERE_LAPSE_RATE / temperature
+    )
+    d_log_rho = np.where(altitude < TROPOPAUSE, d_log_rho_troposphere, -STRATOSPHERE_PRESSURE_DECAY)
+
+    return rho * d_log_rho
+
 
 class Equilibrium(om.ImplicitComponent):
     """Find the conditions necessary for the aircraft equilibrium."""
@@ -79,50 +111,59 @@ class Equilibrium(om.ImplicitComponent):
         self.add_output("thrust", val=np.full(number_of_points, 1000.0), units="N")
         self.add_output("delta_m", val=np.full(number_of_points, -5.0), units="deg")
 
+        # Each point of the mission only depends on its own flight conditions, so the partials
+        # wrt vector inputs and outputs are purely diagonal and are declared as such to keep the
+        # jacobian sparse
+        diagonal = np.arange(number_of_points)
+
         self.declare_partials(
             of="alpha",
             wrt=[
+                "mass",
+                "gamma",
                 "altitude",
+                "true_airspeed",
+                "delta_Cl",
+                "thrust",
+                "alpha",
+                "delta_m",
             ],
-            method="fd",
-            form="central",
-            step=1.0e2,
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
         )
         self.declare_partials(
             of="alpha",
             wrt=[
-                "mass",
-                "gamma",
-                "true_airspeed",
                 "data:geometry:wing:area",
                 "data:aerodynamics:wing:cruise:CL0_clean",
                 "data:aerodynamics:wing:cruise:CL_alpha",
                 "data:aerodynamics:horizontal_tail:cruise:CL0",
                 "data:aerodynamics:horizontal_tail:cruise:CL_alpha",
-                "delta_Cl",
                 "data:aerodynamics:elevator:low_speed:CL_delta",
-                "thrust",
-                "alpha",
-                "delta_m",
             ],
             method="exact",
         )
         self.declare_partials(
             of="thrust",
             wrt=[
+                "gamma",
+                "d_vx_dt",
+                "mass",
                 "altitude",
+                "true_airspeed",
+                "delta_Cd",
+                "alpha",
+                "thrust",
+                "delta_m",
             ],
-            method="fd",
-            form="central",
-            step=1.0e2,
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
         )
         self.declare_partials(
             of="thrust",
             wrt=[
-                "gamma",
-                "d_vx_dt",
-                "mass",
-                "true_airspeed",
                 "data:geometry:wing:area",
                 "data:aerodynamics:aircraft:cruise:CD0",
                 "data:aerodynamics:wing:cruise:CL0_clean",
@@ -133,17 +174,25 @@ class Equilibrium(om.ImplicitComponent):
                 "data:aerodynamics:horizontal_tail:cruise:induced_drag_coefficient",
                 "data:aerodynamics:elevator:low_speed:CD_delta",
                 "data:aerodynamics:elevator:low_speed:CL_delta",
-                "delta_Cd",
+            ],
+            method="exact",
+        )
+        self.declare_partials(
+            of="delta_m",
+            wrt=[
+                "x_cg",
+                "delta_Cl",
+                "delta_Cm",
                 "alpha",
-                "thrust",
                 "delta_m",
             ],
             method="exact",
+            rows=diagonal,
+            cols=diagonal,
         )
         self.declare_partials(
             of="delta_m",
             wrt=[
-                "x_cg",
                 "data:geometry:wing:MAC:length",
                 "data:geometry:wing:MAC:at25percent:x",
                 "data:geometry:horizontal_tail:MAC:at25percent:x:from_wingMAC25",
@@ -154,10 +203,6 @@ class Equilibrium(om.ImplicitComponent):
                 "data:aerodynamics:horizontal_tail:cruise:CL0",
                 "data:aerodynamics:horizontal_tail:cruise:CL_alpha",
                 "data:aerodynamics:elevator:low_speed:CL_delta",
-                "delta_Cl",
-                "delta_Cm",
-                "alpha",
-                "delta_m",
             ],
             method="exact",
         )
@@ -166,7 +211,9 @@ class Equilibrium(om.ImplicitComponent):
                 of="alpha", wrt="data:aerodynamics:flaps:takeoff:CL", method="exact"
             )
             self.declare_partials(
-                of="thrust", wrt="data:aerodynamics:flaps:takeoff:CD", method="exact"
+                of="thrust",
+                wrt=["data:aerodynamics:flaps:takeoff:CD", "data:aerodynamics:flaps:takeoff:CL"],
+                method="exact",
             )
             self.declare_partials(
                 of="delta_m", wrt="data:aerodynamics:flaps:takeoff:CM", method="exact"
@@ -176,7 +223,9 @@ class Equilibrium(om.ImplicitComponent):
                 of="alpha", wrt="data:aerodynamics:flaps:landing:CL", method="exact"
             )
             self.declare_partials(
-                of="thrust", wrt="data:aerodynamics:flaps:landing:CD", method="exact"
+                of="thrust",
+                wrt=["data:aerodynamics:flaps:landing:CD", "data:aerodynamics:flaps:landing:CL"],
+                method="exact",
             )
             self.declare_partials(
                 of="delta_m", wrt="data:aerodynamics:flaps:landing:CM", method="exact"
@@ -235,19 +284,22 @@ class Equilibrium(om.ImplicitComponent):
 
         dynamic_pressure = 1.0 / 2.0 * rho * np.square(true_airspeed)
 
-        cl_wing = cl0_wing + cl_alpha_wing * alpha + delta_cl + delta_cl_flaps
+        cl_wing_clean = cl0_wing + cl_alpha_wing * alpha
+        cl_wing_flaps = cl_wing_clean + delta_cl_flaps
+        cl_wing_slip = cl_wing_clean + delta_cl
         cl_htp = cl0_htp + cl_alpha_htp * alpha + cl_delta_m * delta_m
 
         cd_tot = (
             cd0
             + delta_cd
             + delta_cd_flaps
-            + coeff_k_wing * cl_wing ** 2
+            + coeff_k_wing * cl_wing_flaps ** 2
             + coeff_k_htp * cl_htp ** 2
             + (cd_delta_m * delta_m ** 2.0)
         )
 
         d_q_d_airspeed = rho * true_airspeed
+        d_q_d_altitude = 1.0 / 2.0 * np.square(true_airspeed) * d_density_d_altitude(altitude)
 
         # ------------------ Derivatives wrt alpha residuals ------------------ #
 
@@ -257,18 +309,21 @@ class Equilibrium(om.ImplicitComponent):
             number_of_points
         )
         partials["alpha", "data:aerodynamics:horizontal_tail:cruise:CL_alpha"] = alpha
-        partials["alpha", "delta_Cl"] = np.identity(number_of_points)
+        partials["alpha", "delta_Cl"] = np.ones(number_of_points)
         partials["alpha", "data:aerodynamics:elevator:low_speed:CL_delta"] = delta_m
         d_alpha_d_mass_vector = -g * np.cos(gamma) / (dynamic_pressure * wing_area)
-        partials["alpha", "mass"] = np.diag(d_alpha_d_mass_vector)
+        partials["alpha", "mass"] = d_alpha_d_mass_vector
         d_alpha_d_thrust_vector = np.sin(alpha) / (dynamic_pressure * wing_area)
-        partials["alpha", "thrust"] = np.diag(d_alpha_d_thrust_vector)
-        d_alpha_d_gamma_vector = mass * g * np.sin(gamma) / (dynamic_pressure * wing_area)
-        partials["alpha", "gamma"] = np.diag(d_alpha_d_gamma_vector)
+        partials["alpha", "thrust"] = d_alpha_d_thrust_vector
+        d_alpha_d_gamma_vector = (
+            mass * g * np.sin(gamma) / (dynamic_pressure * wing_area) * np.pi / 180.0
+        )
+        partials["alpha", "gamma"] = d_alpha_d_gamma_vector
         d_alpha_d_q_vector = -(thrust * np.sin(alpha) - mass * g * np.cos(gamma)) / (
             wing_area * dynamic_pressure ** 2.0
         )
-        partials["alpha", "true_airspeed"] = np.diag(d_alpha_d_q_vector * d_q_d_airspeed)
+        partials["alpha", "true_airspeed"] = d_alpha_d_q_vector * d_q_d_airspeed
+        partials["alpha", "altitude"] = d_alpha_d_q_vector * d_q_d_altitude
         d_alpha_d_s_vector = -(thrust * np.sin(alpha) - mass * g * np.cos(gamma)) / (
             dynamic_pressure * wing_area ** 2.0
         )
@@ -276,8 +331,8 @@ class Equilibrium(om.ImplicitComponent):
         d_alpha_d_alpha_vector = (
             cl_alpha_wing + cl_alpha_htp + thrust * np.cos(alpha) / (dynamic_pressure * wing_area)
         )
-        partials["alpha", "alpha"] = np.diag(d_alpha_d_alpha_vector) * np.pi / 180.0
-        partials["alpha", "delta_m"] = np.identity(number_of_points) * cl_delta_m * np.pi / 180.0
+        partials["alpha", "alpha"] = d_alpha_d_alpha_vector * np.pi / 180.0
+        partials["alpha", "delta_m"] = np.ones(number_of_points) * cl_delta_m * np.pi / 180.0
         if self.options["flaps_position"] == "takeoff":
             partials["alpha", "data:aerodynamics:flaps:takeoff:CL"] = np.ones(number_of_points)
         if self.options["flaps_position"] == "landing":
@@ -285,26 +340,27 @@ class Equilibrium(om.ImplicitComponent):
 
         # ------------------ Derivatives wrt thrust residuals ------------------ #
 
-        d_thrust_d_cl_w = -2.0 * dynamic_pressure * wing_area * coeff_k_wing * cl_wing
+        d_thrust_d_cl_w = -2.0 * dynamic_pressure * wing_area * coeff_k_wing * cl_wing_flaps
         d_thrust_d_cl_h = -2.0 * dynamic_pressure * wing_area * coeff_k_htp * cl_htp
 
         d_cl_w_d_cl_alpha_w = alpha
         d_cl_h_d_cl_alpha_h = alpha
         d_cl_h_d_cl_delta = delta_m
 
-        partials["thrust", "d_vx_dt"] = np.diag(-mass)
-        partials["thrust", "gamma"] = np.diag(-mass * g * np.cos(gamma) * np.pi / 180.0)
-        partials["thrust", "mass"] = np.diag(-d_vx_dt - g * np.sin(gamma))
-        partials["thrust", "true_airspeed"] = -np.diag(wing_area * cd_tot * d_q_d_airspeed)
+        partials["thrust", "d_vx_dt"] = -mass
+        partials["thrust", "gamma"] = -mass * g * np.cos(gamma) * np.pi / 180.0
+        partials["thrust", "mass"] = -d_vx_dt - g * np.sin(gamma)
+        partials["thrust", "true_airspeed"] = -wing_area * cd_tot * d_q_d_airspeed
+        partials["thrust", "altitude"] = -wing_area * cd_tot * d_q_d_altitude
         partials["thrust", "data:geometry:wing:area"] = -dynamic_pressure * cd_tot
         partials["thrust", "data:aerodynamics:aircraft:cruise:CD0"] = -dynamic_pressure * wing_area
         partials["thrust", "data:aerodynamics:horizontal_tail:cruise:induced_drag_coefficient"] = (
             -dynamic_pressure * wing_area * cl_htp ** 2.0
         )
         partials["thrust", "data:aerodynamics:wing:cruise:induced_drag_coefficient"] = (
-            -dynamic_pressure * wing_area * cl_wing ** 2.0
+            -dynamic_pressure * wing_area * cl_wing_flaps ** 2.0
         )
-        partials["thrust", "delta_Cd"] = -np.diag(dynamic_pressure * wing_area)
+        partials["thrust", "delta_Cd"] = -dynamic_pressure * wing_area
         partials["thrust", "data:aerodynamics:elevator:low_speed:CD_delta"] = (
             -dynamic_pressure * wing_area * delta_m ** 2.0
         )
@@ -319,7 +375,7 @@ class Equilibrium(om.ImplicitComponent):
         partials["thrust", "data:aerodynamics:horizontal_tail:cruise:CL_alpha"] = (
             d_thrust_d_cl_h * d_cl_h_d_cl_alpha_h
         )
-        partials["thrust", "thrust"] = np.diag(np.cos(alpha))
+        partials["thrust", "thrust"] = np.cos(alpha)
         d_thrust_d_alpha_vector = (
             (
                 -thrust * np.sin(alpha)
@@ -329,7 +385,7 @@ class Equilibrium(om.ImplicitComponent):
             * np.pi
             / 180.0
         )
-        partials["thrust", "alpha"] = np.diag(d_thrust_d_alpha_vector)
+        partials["thrust", "alpha"] = d_thrust_d_alpha_vector
         d_thrust_d_delta_m_vector = (
             (
                 d_thrust_d_cl_h * cl_delta_m
@@ -338,11 +394,13 @@ class Equilibrium(om.ImplicitComponent):
             * np.pi
             / 180.0
         )
-        partials["thrust", "delta_m"] = np.diag(d_thrust_d_delta_m_vector)
+        partials["thrust", "delta_m"] = d_thrust_d_delta_m_vector
         if self.options["flaps_position"] == "takeoff":
             partials["thrust", "data:aerodynamics:flaps:takeoff:CD"] = -dynamic_pressure * wing_area
+            partials["thrust", "data:aerodynamics:flaps:takeoff:CL"] = d_thrust_d_cl_w
         if self.options["flaps_position"] == "landing":
             partials["thrust", "data:aerodynamics:flaps:landing:CD"] = -dynamic_pressure * wing_area
+            partials["thrust", "data:aerodynamics:flaps:landing:CL"] = d_thrust_d_cl_w
 
         # ------------------ Derivatives wrt delta_m residuals ------------------ #
 
@@ -357,25 +415,23 @@ class Equilibrium(om.ImplicitComponent):
         partials["delta_m", "data:aerodynamics:horizontal_tail:cruise:CL0"] = (
             x_cg - x_htp
         ) * np.ones(number_of_points)
-        partials["delta_m", "delta_Cl"] = np.diag(x_cg - x_wing)
-        partials["delta_m", "delta_Cm"] = np.diag(l0_wing)
+        partials["delta_m", "delta_Cl"] = x_cg - x_wing
+        partials["delta_m", "delta_Cm"] = np.ones(number_of_points) * l0_wing
         d_delta_m_d_alpha = (
-            (x_cg - x_wing) * cl_alpha_wing + (x_cg - x_htp) * cl_alpha_htp + cm_alpha_fus
+            (x_cg - x_wing) * cl_alpha_wing + (x_cg - x_htp) * cl_alpha_htp + cm_alpha_fus * l0_wing
         )
-        partials["delta_m", "alpha"] = np.diag(d_delta_m_d_alpha) * np.pi / 180.0
+        partials["delta_m", "alpha"] = d_delta_m_d_alpha * np.pi / 180.0
         partials["delta_m", "data:aerodynamics:horizontal_tail:cruise:CL_alpha"] = alpha * (
             x_cg - x_htp
         )
         partials["delta_m", "data:aerodynamics:elevator:low_speed:CL_delta"] = (
             x_cg - x_htp
         ) * delta_m
-        partials["delta_m", "delta_m"] = (
-            np.identity(number_of_points) * (x_cg - x_htp) * cl_delta_m * np.pi / 180.0
-        )
-        partials["delta_m", "x_cg"] = (cl_wing + cl_htp) * np.identity(number_of_points)
-        partials["delta_m", "data:geometry:wing:MAC:at25percent:x"] = -(cl_wing + cl_htp) * np.ones(
-            number_of_points
-        )
+        partials["delta_m", "delta_m"] = (x_cg - x_htp) * cl_delta_m * np.pi / 180.0
+        partials["delta_m", "x_cg"] = cl_wing_slip + cl_htp
+        partials["delta_m", "data:geometry:wing:MAC:at25percent:x"] = -(
+            cl_wing_slip + cl_htp
+        ) * np.ones(number_of_points)
         partials[
             "delta_m", "data:geometry:horizontal_tail:MAC:at25percent:x:from_wingMAC25"
         ] = -cl_htp
@@ -14,6 +14,10 @@
 import openmdao.api as om
 import fastoad.api as oad
 
+from fastga.models.performances.mission.mission_components import (
+    POINTS_NB_CLIMB,
+    POINTS_NB_CRUISE,
+)
 from ..constants import SUBMODEL_EQUILIBRIUM
 from ..mission.compute_time_step import ComputeTimeStep
 from ..mission.performance_per_phase import PerformancePerPhase
@@ -31,6 +35,17 @@ class MissionCore(om.Group):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
 
     def setup(self):
@@ -50,6 +65,7 @@ class MissionCore(om.Group):
         )
         options_equilibrium = {
             "number_of_points": number_of_points,
+            "number_of_points_climb": self.options["number_of_points_climb"],
             "propulsion_id": self.options["propulsion_id"],
         }
         self.add_subsystem(
@@ -60,7 +76,11 @@ class MissionCore(om.Group):
         )
         self.add_subsystem(
             "performance_per_phase",
-            PerformancePerPhase(number_of_points=number_of_points),
+            PerformancePerPhase(
+                number_of_points=number_of_points,
+                number_of_points_climb=self.options["number_of_points_climb"],
+                number_of_points_cruise=self.options["number_of_points_cruise"],
+            ),
             promotes_inputs=[],
             promotes_outputs=["data:*"],
         )
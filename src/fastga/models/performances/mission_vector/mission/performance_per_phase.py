@@ -17,7 +17,6 @@ import openmdao.api as om
 from fastga.models.performances.mission.mission_components import (
     POINTS_NB_CRUISE,
     POINTS_NB_CLIMB,
-    POINTS_NB_DESCENT,
 )
 
 
@@ -32,6 +31,17 @@ class PerformancePerPhase(om.ExplicitComponent):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
 
     def setup(self):
 
@@ -87,82 +97,105 @@ class PerformancePerPhase(om.ExplicitComponent):
 
     def setup_partials(self):
 
-        self.declare_partials(
-            of="data:mission:sizing:main_route:climb:fuel",
-            wrt="fuel_consumed_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:fuel",
-            wrt="fuel_consumed_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:descent:fuel",
-            wrt="fuel_consumed_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_out:fuel", wrt="fuel_consumed_t_econ", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_in:fuel", wrt="fuel_consumed_t_econ", method="exact"
-        )
-        self.declare_partials(of="fuel_consumed_t", wrt="fuel_consumed_t_econ", method="exact")
-
-        self.declare_partials(
-            of="data:mission:sizing:main_route:climb:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:descent:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_out:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_in:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="non_consumable_energy_t", wrt="non_consumable_energy_t_econ", method="exact"
-        )
+        number_of_points = self.options["number_of_points"]
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+
+        # Outputs are either sums over the points of a phase, differences between the end points
+        # of two phases or copies of the inputs, so the partials are constant and sparse
+        end_of_climb = number_of_points_climb - 1
+        end_of_cruise = number_of_points_climb + number_of_points_cruise - 1
+        phase_points = {
+            "climb": np.arange(0, number_of_points_climb),
+            "cruise": np.arange(number_of_points_climb, end_of_cruise + 1),
+            "descent": np.arange(end_of_cruise + 1, number_of_points),
+        }
+        phase_end_points = {
+            "climb": (np.array([end_of_climb]), np.array([1.0])),
+            "cruise": (np.array([end_of_cruise, end_of_climb]), np.array([1.0, -1.0])),
+            "descent": (np.array([number_of_points - 1, end_of_cruise]), np.array([1.0, -1.0])),
+        }
+
+        for phase_name in ["climb", "cruise", "descent"]:
+            cols = phase_points[phase_name]
+            self.declare_partials(
+                of="data:mission:sizing:main_route:" + phase_name + ":fuel",
+                wrt="fuel_consumed_t_econ",
+                rows=np.zeros_like(cols),
+                cols=cols,
+                val=1.0,
+            )
+            self.declare_partials(
+                of="data:mission:sizing:main_route:" + phase_name + ":energy",
+                wrt="non_consumable_energy_t_econ",
+                rows=np.zeros_like(cols),
+                cols=cols,
+                val=1.0,
+            )
 
-        self.declare_partials(of="thrust_rate_t", wrt="thrust_rate_t_econ", method="exact")
+            cols, val = phase_end_points[phase_name]
+            self.declare_partials(
+                of="data:mission:sizing:main_route:" + phase_name + ":distance",
+                wrt="position",
+                rows=np.zeros_like(cols),
+                cols=cols,
+                val=val,
+            )
+            self.declare_partials(
+                of="data:mission:sizing:main_route:" + phase_name + ":duration",
+                wrt="time",
+                rows=np.zeros_like(cols),
+                cols=cols,
+                val=val,
+            )
 
-        self.declare_partials(
-            of="data:mission:sizing:main_route:climb:distance", wrt="position", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:distance", wrt="position", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:descent:distance", wrt="position", method="exact"
-        )
+        for taxi_name, taxi_index in [
+            ("taxi_out", number_of_points),
+            ("taxi_in", number_of_points + 1),
+        ]:
+            self.declare_partials(
+                of="data:mission:sizing:" + taxi_name + ":fuel",
+                wrt="fuel_consumed_t_econ",
+                rows=np.array([0]),
+                cols=np.array([taxi_index]),
+                val=1.0,
+            )
+            self.declare_partials(
+                of="data:mission:sizing:" + taxi_name + ":energy",
+                wrt="non_consumable_energy_t_econ",
+                rows=np.array([0]),
+                cols=np.array([taxi_index]),
+                val=1.0,
+            )
 
+        flight_points = np.arange(number_of_points)
         self.declare_partials(
-            of="data:mission:sizing:main_route:climb:duration", wrt="time", method="exact"
+            of="fuel_consumed_t",
+            wrt="fuel_consumed_t_econ",
+            rows=flight_points,
+            cols=flight_points,
+            val=1.0,
         )
         self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:duration", wrt="time", method="exact"
+            of="non_consumable_energy_t",
+            wrt="non_consumable_energy_t_econ",
+            rows=flight_points,
+            cols=flight_points,
+            val=1.0,
         )
         self.declare_partials(
-            of="data:mission:sizing:main_route:descent:duration", wrt="time", method="exact"
+            of="thrust_rate_t",
+            wrt="thrust_rate_t_econ",
+            rows=flight_points,
+            cols=flight_points,
+            val=1.0,
         )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
+        number_of_points_climb = self.options["number_of_points_climb"]
+        start_of_descent = number_of_points_climb + self.options["number_of_points_cruise"]
+
         time = inputs["time"]
         position = inputs["position"]
         # This one is two element longer than the other array since it includes the fuel consumed
@@ -172,39 +205,43 @@ class PerformancePerPhase(om.ExplicitComponent):
         thrust_rate_t_econ = inputs["thrust_rate_t_econ"]
 
         outputs["data:mission:sizing:main_route:climb:fuel"] = np.sum(
-            fuel_consumed_t_econ[0:POINTS_NB_CLIMB]
+            fuel_consumed_t_econ[0:number_of_points_climb]
         )
         outputs["data:mission:sizing:main_route:climb:energy"] = np.sum(
-            non_consumable_energy[0:POINTS_NB_CLIMB]
+            non_consumable_energy[0:number_of_points_climb]
+        )
+        outputs["data:mission:sizing:main_route:climb:distance"] = max(
+            position[0:number_of_points_climb]
+        )
+        outputs["data:mission:sizing:main_route:climb:duration"] = max(
+            time[0:number_of_points_climb]
         )
-        outputs["data:mission:sizing:main_route:climb:distance"] = max(position[0:POINTS_NB_CLIMB])
-        outputs["data:mission:sizing:main_route:climb:duration"] = max(time[0:POINTS_NB_CLIMB])
 
         outputs["data:mission:sizing:main_route:cruise:fuel"] = np.sum(
-            fuel_consumed_t_econ[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE]
+            fuel_consumed_t_econ[number_of_points_climb:start_of_descent]
         )
         outputs["data:mission:sizing:main_route:cruise:energy"] = np.sum(
-            non_consumable_energy[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE]
+            non_consumable_energy[number_of_points_climb:start_of_descent]
         )
         outputs["data:mission:sizing:main_route:cruise:distance"] = max(
-            position[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE]
-        ) - max(position[0:POINTS_NB_CLIMB])
+            position[number_of_points_climb:start_of_descent]
+        ) - max(position[0:number_of_points_climb])
         outputs["data:mission:sizing:main_route:cruise:duration"] = max(
-            time[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE]
-        ) - max(time[0:POINTS_NB_CLIMB])
+            time[number_of_points_climb:start_of_descent]
+        ) - max(time[0:number_of_points_climb])
 
         outputs["data:mission:sizing:main_route:descent:fuel"] = np.sum(
-            fuel_consumed_t_econ[POINTS_NB_CLIMB + POINTS_NB_CRUISE : -2]
+            fuel_consumed_t_econ[start_of_descent:-2]
         )
         outputs["data:mission:sizing:main_route:descent:energy"] = np.sum(
-            non_consumable_energy[POINTS_NB_CLIMB + POINTS_NB_CRUISE : -2]
+            non_consumable_energy[start_of_descent:-2]
         )
         outputs["data:mission:sizing:main_route:descent:distance"] = max(
-            position[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
-        ) - max(position[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE])
+            position[start_of_descent:]
+        ) - max(position[number_of_points_climb:start_of_descent])
         outputs["data:mission:sizing:main_route:descent:duration"] = max(
-            time[POINTS_NB_CLIMB + POINTS_NB_CRUISE :]
-        ) - max(time[POINTS_NB_CLIMB : POINTS_NB_CLIMB + POINTS_NB_CRUISE])
+            time[start_of_descent:]
+        ) - max(time[number_of_points_climb:start_of_descent])
 
         outputs["data:mission:sizing:taxi_out:fuel"] = fuel_consumed_t_econ[-2]
         outputs["data:mission:sizing:taxi_out:energy"] = non_consumable_energy[-2]
@@ -214,99 +251,3 @@ class PerformancePerPhase(om.ExplicitComponent):
         outputs["fuel_consumed_t"] = fuel_consumed_t_econ[:-2]
         outputs["non_consumable_energy_t"] = non_consumable_energy[:-2]
         outputs["thrust_rate_t"] = thrust_rate_t_econ[:-2]
-
-    def compute_partials(self, inputs, partials, discrete_inputs=None):
-
-        number_of_points = self.options["number_of_points"]
-
-        partials[
-            "data:mission:sizing:main_route:climb:fuel", "fuel_consumed_t_econ"
-        ] = np.concatenate(
-            (np.full(POINTS_NB_CLIMB, 1), np.zeros(POINTS_NB_CRUISE + POINTS_NB_DESCENT + 2))
-        )
-        partials[
-            "data:mission:sizing:main_route:climb:energy", "non_consumable_energy_t_econ"
-        ] = np.concatenate(
-            (np.full(POINTS_NB_CLIMB, 1), np.zeros(POINTS_NB_CRUISE + POINTS_NB_DESCENT + 2))
-        )
-
-        partials[
-            "data:mission:sizing:main_route:cruise:fuel", "fuel_consumed_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB),
-                np.full(POINTS_NB_CRUISE, 1.0),
-                np.zeros(POINTS_NB_DESCENT + 2),
-            )
-        )
-        partials[
-            "data:mission:sizing:main_route:cruise:energy", "non_consumable_energy_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB),
-                np.full(POINTS_NB_CRUISE, 1.0),
-                np.zeros(POINTS_NB_DESCENT + 2),
-            )
-        )
-
-        partials[
-            "data:mission:sizing:main_route:cruise:fuel", "fuel_consumed_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB + POINTS_NB_CRUISE),
-                np.full(POINTS_NB_DESCENT, 1.0),
-                np.zeros(2),
-            )
-        )
-        partials[
-            "data:mission:sizing:main_route:cruise:energy", "non_consumable_energy_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB + POINTS_NB_CRUISE),
-                np.full(POINTS_NB_DESCENT, 1.0),
-                np.zeros(2),
-            )
-        )
-
-        d_taxi_out_d_fuel = np.zeros(number_of_points + 2)
-        d_taxi_out_d_fuel[-2] = 1
-        partials["data:mission:sizing:taxi_out:fuel", "fuel_consumed_t_econ"] = d_taxi_out_d_fuel
-        partials[
-            "data:mission:sizing:taxi_out:energy", "non_consumable_energy_t_econ"
-        ] = d_taxi_out_d_fuel
-
-        d_taxi_in_d_fuel = np.zeros(number_of_points + 2)
-        d_taxi_in_d_fuel[-1] = 1
-        partials["data:mission:sizing:taxi_in:fuel", "fuel_consumed_t_econ"] = d_taxi_in_d_fuel
-        partials[
-            "data:mission:sizing:taxi_in:energy", "non_consumable_energy_t_econ"
-        ] = d_taxi_in_d_fuel
-
-        d_fc_d_fc_t = np.zeros((number_of_points, number_of_points + 2))
-        d_fc_d_fc_t[:, :number_of_points] = np.eye(number_of_points)
-        partials["fuel_consumed_t", "fuel_consumed_t_econ"] = d_fc_d_fc_t
-        partials["non_consumable_energy_t", "non_consumable_energy_t_econ"] = d_fc_d_fc_t
-
-        d_tr_d_tr_t = np.zeros((number_of_points, number_of_points + 2))
-        d_tr_d_tr_t[:, :number_of_points] = np.eye(number_of_points)
-        partials["thrust_rate_t", "thrust_rate_t_econ"] = d_tr_d_tr_t
-
-        d_climb_d_d_pos = np.zeros(number_of_points)
-        d_climb_d_d_pos[POINTS_NB_CLIMB - 1] = 1.0
-        partials["data:mission:sizing:main_route:climb:distance", "position"] = d_climb_d_d_pos
-
-        d_cruise_d_d_pos = np.zeros(number_of_points)
-        d_cruise_d_d_pos[POINTS_NB_CLIMB + POINTS_NB_CRUISE - 1] = 1.0
-        d_cruise_d_d_pos[POINTS_NB_CLIMB - 1] = -1.0
-        partials["data:mission:sizing:main_route:cruise:distance", "position"] = d_cruise_d_d_pos
-
-        d_descent_d_d_pos = np.zeros(number_of_points)
-        d_descent_d_d_pos[-1] = 1.0
-        d_cruise_d_d_pos[POINTS_NB_CLIMB + POINTS_NB_CRUISE - 1] = -1.0
-        partials["data:mission:sizing:main_route:descent:distance", "position"] = d_descent_d_d_pos
-
-        partials["data:mission:sizing:main_route:climb:duration", "time"] = d_climb_d_d_pos
-
-        partials["data:mission:sizing:main_route:cruise:duration", "time"] = d_cruise_d_d_pos
-
-        partials["data:mission:sizing:main_route:descent:duration", "time"] = d_descent_d_d_pos
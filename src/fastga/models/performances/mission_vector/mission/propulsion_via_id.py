@@ -25,16 +25,39 @@ oad.RegisterSubmodel.active_models[
     SUBMODEL_ENERGY_CONSUMPTION
 ] = "fastga.submodel.performances.energy_consumption.ICE"
 
+# Relative step used for the finite differences of the engine model, the absolute step is not
+# allowed to go below the relative step itself so that null inputs can be perturbed
+ENGINE_FD_STEP = 1.0e-6
+
+# Inputs of the component which describe the flight points, every other input is an engine
+# parameter added by the propulsion wrapper
+FLIGHT_POINT_INPUTS = [
+    "thrust_econ",
+    "altitude_econ",
+    "time_step_econ",
+    "true_airspeed_econ",
+    "engine_setting_econ",
+]
+
 
 @oad.RegisterSubmodel(
     SUBMODEL_ENERGY_CONSUMPTION, "fastga.submodel.performances.energy_consumption.ICE"
 )
 class FuelConsumed(om.ExplicitComponent):
-    """Computes the fuel consumed at each time step."""
+    """
+    Computes the fuel consumed at each time step.
+
+    The propulsion model is only rebuilt when the engine parameters change. Since each flight
+    point only depends on its own thrust, altitude and airspeed, the partials are diagonal and
+    obtained by perturbing all the points at once, which takes one engine evaluation per variable
+    whatever the number of points.
+    """
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._engine_wrapper = None
+        self._propulsion_model = None
+        self._engine_parameters_key = None
 
     def initialize(self):
 
@@ -95,29 +118,121 @@ class FuelConsumed(om.ExplicitComponent):
             desc="thrust ratio at each time step",
         )
 
+    def setup_partials(self):
+
+        number_of_points = self.options["number_of_points"]
+        diagonal = np.arange(number_of_points + 2)
+
+        self.declare_partials(
+            of=["fuel_consumed_t_econ", "thrust_rate_t_econ"],
+            wrt=["thrust_econ", "altitude_econ", "true_airspeed_econ"],
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of="fuel_consumed_t_econ",
+            wrt="time_step_econ",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        propulsion_model = self._engine_wrapper.get_model(inputs)
+        propulsion_model = self._get_propulsion_model(inputs)
 
-        time_step = inputs["time_step_econ"]
-        atm = Atmosphere(inputs["altitude_econ"], altitude_in_feet=False)
-        atm.true_airspeed = inputs["true_airspeed_econ"]
+        consumed_mass_1s, thrust_rate = self._compute_flight_points(
+            propulsion_model,
+            inputs["thrust_econ"],
+            inputs["altitude_econ"],
+            inputs["true_airspeed_econ"],
+            inputs["engine_setting_econ"],
+        )
+        fuel_consumed_t = consumed_mass_1s * inputs["time_step_econ"]
+
+        outputs["fuel_consumed_t_econ"] = fuel_consumed_t
+        outputs["thrust_rate_t_econ"] = thrust_rate
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+
+        propulsion_model = self._get_propulsion_model(inputs)
 
+        flight_conditions = {
+            "thrust_econ": inputs["thrust_econ"],
+            "altitude_econ": inputs["altitude_econ"],
+            "true_airspeed_econ": inputs["true_airspeed_econ"],
+        }
         engine_setting = inputs["engine_setting_econ"]
+        time_step = inputs["time_step_econ"]
+
+        consumed_mass_1s, thrust_rate = self._compute_flight_points(
+            propulsion_model, *flight_conditions.values(), engine_setting
+        )
+        partials["fuel_consumed_t_econ", "time_step_econ"] = consumed_mass_1s
+
+        for input_name, input_value in flight_conditions.items():
+            step = ENGINE_FD_STEP * np.maximum(np.abs(input_value), 1.0)
+            perturbed_conditions = dict(flight_conditions)
+            perturbed_conditions[input_name] = input_value + step
+            perturbed_consumed_mass_1s, perturbed_thrust_rate = self._compute_flight_points(
+                propulsion_model, *perturbed_conditions.values(), engine_setting
+            )
+            partials["fuel_consumed_t_econ", input_name] = (
+                (perturbed_consumed_mass_1s - consumed_mass_1s) / step * time_step
+            )
+            partials["thrust_rate_t_econ", input_name] = (
+                perturbed_thrust_rate - thrust_rate
+            ) / step
+
+    def _get_propulsion_model(self, inputs):
+        """
+        Gives the propulsion model for the current engine parameters, the model of the previous
+        evaluation is reused if they did not change.
+        """
+
+        engine_parameters_key = np.concatenate(
+            [
+                np.asarray(inputs[input_name], dtype=float).ravel()
+                for input_name in sorted(inputs.keys())
+                if input_name not in FLIGHT_POINT_INPUTS
+            ]
+            + [np.zeros(0)]
+        ).tobytes()
+
+        if self._propulsion_model is None or engine_parameters_key != self._engine_parameters_key:
+            self._propulsion_model = self._engine_wrapper.get_model(inputs)
+            self._engine_parameters_key = engine_parameters_key
+
+        return self._propulsion_model
+
+    @staticmethod
+    def _compute_flight_points(propulsion_model, thrust, altitude, true_airspeed, engine_setting):
+        """
+        Computes the fuel consumed in one second and the thrust rate at each flight point.
+
+        :param propulsion_model: the propulsion model
+        :param thrust: the thrust to provide at each point, in N
+        :param altitude: the altitude of each point, in m
+        :param true_airspeed: the true airspeed of each point, in m/s
+        :param engine_setting: the engine setting of each point
+        :return: the fuel consumed in one second, in kg, and the thrust rate
+        """
+
+        atm = Atmosphere(altitude, altitude_in_feet=False)
+        atm.true_airspeed = true_airspeed
 
         # TODO : Change the EngineSetting based on the phase we are in
         flight_point = oad.FlightPoint(
             mach=atm.mach,
-            altitude=inputs["altitude_econ"],
+            altitude=altitude,
             engine_setting=engine_setting,
-            thrust_is_regulated=np.full_like(inputs["altitude_econ"], True),
-            thrust=inputs["thrust_econ"],
-            thrust_rate=np.full_like(inputs["altitude_econ"], 0.0),
+            thrust_is_regulated=np.full_like(altitude, True),
+            thrust=thrust,
+            thrust_rate=np.full_like(altitude, 0.0),
         )
         propulsion_model.compute_flight_points(flight_point)
 
         consumed_mass_1s = propulsion_model.get_consumed_mass(flight_point, 1.0)
-        fuel_consumed_t = consumed_mass_1s * time_step
 
-        outputs["fuel_consumed_t_econ"] = fuel_consumed_t
-        outputs["thrust_rate_t_econ"] = flight_point.thrust_rate
+        return consumed_mass_1s, flight_point.thrust_rate
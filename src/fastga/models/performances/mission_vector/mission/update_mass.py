@@ -15,8 +15,14 @@ import numpy as np
 import openmdao.api as om
 
 
-class UpdateMass(om.ExplicitComponent):
-    """Update mass for next iteration."""
+class UpdateMass(om.ImplicitComponent):
+    """
+    Update mass for next iteration.
+
+    The mass at each point is written as the mass at the previous point minus the fuel burned in
+    between, which is the implicit form of the cumulative sum and keeps the jacobian bi-diagonal
+    instead of lower triangular.
+    """
 
     def initialize(self):
 
@@ -44,9 +50,56 @@ class UpdateMass(om.ExplicitComponent):
         )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="exact")
 
-    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        number_of_points = self.options["number_of_points"]
+
+        # Only the first point depends on the fuel burned before the climb
+        for input_name in [
+            "data:weight:aircraft:MTOW",
+            "data:mission:sizing:taxi_out:fuel",
+            "data:mission:sizing:initial_climb:fuel",
+            "data:mission:sizing:takeoff:fuel",
+        ]:
+            self.declare_partials(
+                of="mass",
+                wrt=input_name,
+                rows=np.array([0]),
+                cols=np.array([0]),
+                val=-1.0 if input_name == "data:weight:aircraft:MTOW" else 1.0,
+            )
+
+        current_points = np.arange(1, number_of_points)
+        previous_points = np.arange(number_of_points - 1)
+
+        self.declare_partials(
+            of="mass",
+            wrt="fuel_consumed_t",
+            rows=current_points,
+            cols=previous_points,
+            val=1.0,
+        )
+        self.declare_partials(
+            of="mass",
+            wrt="mass",
+            rows=np.concatenate((np.arange(number_of_points), current_points)),
+            cols=np.concatenate((np.arange(number_of_points), previous_points)),
+            val=np.concatenate((np.ones(number_of_points), np.full(number_of_points - 1, -1.0))),
+        )
+
+    def apply_nonlinear(
+        self, inputs, outputs, residuals, discrete_inputs=None, discrete_outputs=None
+    ):
+
+        mtow = inputs["data:weight:aircraft:MTOW"]
+        fuel_taxi_out = inputs["data:mission:sizing:taxi_out:fuel"]
+        fuel_takeoff = inputs["data:mission:sizing:takeoff:fuel"]
+        fuel_initial_climb = inputs["data:mission:sizing:initial_climb:fuel"]
+        mass = outputs["mass"]
+
+        residuals["mass"][0] = mass[0] - (mtow - fuel_taxi_out - fuel_takeoff - fuel_initial_climb)
+        residuals["mass"][1:] = mass[1:] - mass[:-1] + inputs["fuel_consumed_t"][:-1]
+
+    def solve_nonlinear(self, inputs, outputs):
 
         mtow = inputs["data:weight:aircraft:MTOW"]
         fuel_taxi_out = inputs["data:mission:sizing:taxi_out:fuel"]
@@ -66,14 +119,3 @@ class UpdateMass(om.ExplicitComponent):
             - fuel_initial_climb
             - np.cumsum(np.concatenate((np.zeros(1), inputs["fuel_consumed_t"][:-1])))
         )
-
-    def compute_partials(self, inputs, partials, discrete_inputs=None):
-        number_of_points = self.options["number_of_points"]
-
-        partials["mass", "data:weight:aircraft:MTOW"] = np.full(number_of_points, 1.0)
-        partials["mass", "data:mission:sizing:taxi_out:fuel"] = np.full(number_of_points, -1.0)
-        partials["mass", "data:mission:sizing:initial_climb:fuel"] = np.full(number_of_points, -1.0)
-        partials["mass", "data:mission:sizing:takeoff:fuel"] = np.full(number_of_points, -1.0)
-        partials["mass", "fuel_consumed_t"] = -(
-            np.tri(number_of_points, number_of_points) - np.eye(number_of_points)
-        )
@@ -35,35 +35,75 @@ class MissionVector(om.Group):
         self.nonlinear_solver.options["iprint"] = 0
         self.nonlinear_solver.options["maxiter"] = 50
         self.nonlinear_solver.options["rtol"] = 1e-5
-        self.linear_solver = om.DirectSolver()
+        # The partials of the mission components are declared sparse, assembling them in a CSC
+        # matrix lets the direct solver use a sparse LU factorization instead of a dense one
+        self.linear_solver = om.DirectSolver(assemble_jac=True)
+        self.options["assembled_jac_type"] = "csc"
 
     def initialize(self):
 
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
         self.options.declare("out_file", default="", types=str)
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            types=int,
+            desc="number of equilibrium to be treated during the climb",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            types=int,
+            desc="number of equilibrium to be treated during the cruise",
+        )
+        self.options.declare(
+            "number_of_points_descent",
+            default=POINTS_NB_DESCENT,
+            types=int,
+            desc="number of equilibrium to be treated during the descent",
+        )
+        self.options.declare(
+            "adaptive_discretization",
+            default=False,
+            types=bool,
+            desc="Set to True to place the climb and descent points where the flight conditions "
+            "vary the most and to concentrate the cruise points near the phase transitions "
+            "instead of sampling each phase uniformly",
+        )
 
     def setup(self):
 
-        number_of_points = POINTS_NB_CLIMB + POINTS_NB_CRUISE + POINTS_NB_DESCENT
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        number_of_points = (
+            number_of_points_climb
+            + number_of_points_cruise
+            + self.options["number_of_points_descent"]
+        )
+        options_phases = {
+            "number_of_points": number_of_points,
+            "number_of_points_climb": number_of_points_climb,
+            "number_of_points_cruise": number_of_points_cruise,
+        }
 
         self.add_subsystem("in_flight_cg_variation", InFlightCGVariation(), promotes=["*"])
         self.add_subsystem(
             "initialization",
-            Initialize(number_of_points=number_of_points),
+            Initialize(
+                adaptive_discretization=self.options["adaptive_discretization"], **options_phases
+            ),
             promotes_inputs=["data:*"],
             promotes_outputs=[],
         )
         self.add_subsystem(
             "solve_equilibrium",
-            MissionCore(
-                number_of_points=number_of_points, propulsion_id=self.options["propulsion_id"]
-            ),
+            MissionCore(propulsion_id=self.options["propulsion_id"], **options_phases),
             promotes_inputs=["data:*", "settings:*"],
             promotes_outputs=["data:*"],
         )
         self.add_subsystem(
             "to_csv",
-            ToCSV(number_of_points=number_of_points, out_file=self.options["out_file"]),
+            ToCSV(out_file=self.options["out_file"], **options_phases),
             promotes_inputs=["data:*"],
             promotes_outputs=[],
         )
@@ -21,7 +21,6 @@ from stdatm import Atmosphere
 from fastga.models.performances.mission.mission_components import (
     POINTS_NB_CRUISE,
     POINTS_NB_CLIMB,
-    POINTS_NB_DESCENT,
 )
 
 CSV_DATA_LABELS = [
@@ -61,6 +60,17 @@ class ToCSV(om.ExplicitComponent):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be " "treated"
         )
+        self.options.declare(
+            "number_of_points_climb",
+            default=POINTS_NB_CLIMB,
+            desc="number of equilibrium to be treated during the climb, the first points",
+        )
+        self.options.declare(
+            "number_of_points_cruise",
+            default=POINTS_NB_CRUISE,
+            desc="number of equilibrium to be treated during the cruise, the descent being the "
+            "remaining points",
+        )
         self.options.declare("out_file", default="", types=str)
 
     def setup(self):
@@ -196,11 +206,16 @@ class ToCSV(om.ExplicitComponent):
         tsfc = fuel_consumed_t / time_step / thrust
         fuel_flow = fuel_consumed_t / time_step
 
+        number_of_points_climb = self.options["number_of_points_climb"]
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        number_of_points_descent = (
+            self.options["number_of_points"] - number_of_points_climb - number_of_points_cruise
+        )
         name = np.concatenate(
             (
-                np.full(POINTS_NB_CLIMB, "sizing:main_route:climb"),
-                np.full(POINTS_NB_CRUISE, "sizing:main_route:cruise"),
-                np.full(POINTS_NB_DESCENT, "sizing:main_route:descent"),
+                np.full(number_of_points_climb, "sizing:main_route:climb"),
+                np.full(number_of_points_cruise, "sizing:main_route:cruise"),
+                np.full(number_of_points_descent, "sizing:main_route:descent"),
             )
         )
 
@@ -22,13 +22,15 @@ from scipy.optimize import fsolve
 
 import fastoad.api as oad
 from fastoad.module_management.constants import ModelDomain
-from fastoad.openmdao.problem import AutoUnitsDefaultGroup
 
 from fastga.command import api as api_cs23
 from fastga.models.performances.mission.mission import Mission
 
 _LOGGER = logging.getLogger(__name__)
 
+SECANT_MAX_ITERATIONS = 20
+SECANT_TOLERANCE = 1e-4  # Relative tolerance on the fuel of the points solved by secant method
+
 
 @oad.RegisterOpenMDAOSystem("fastga.performances.payload_range", domain=ModelDomain.PERFORMANCE)
 class ComputePayloadRange(om.ExplicitComponent):
@@ -36,16 +38,40 @@ class ComputePayloadRange(om.ExplicitComponent):
     Payload Range. The minimal payload which defines point E is taken as two pilots. This class
     uses a blank xml file for the execution of the mission class. All the input quantities of the
     mission are created in a dict. generate_block_analysis still needs a xml file to be processed.
+    The mission problem is set up once and kept between the computations, only the range and the
+    mass of the aircraft are changed between two evaluations of the mission.
     """
 
     def initialize(self):
         self.options.declare("propulsion_id", default="", types=str)
+        self.options.declare(
+            "intermediate_points_nb",
+            default=0,
+            types=int,
+            desc="number of points computed between the corner points on each segment of the "
+            "payload range diagram",
+        )
+        self.options.declare(
+            "secant_solve",
+            default=False,
+            types=bool,
+            desc="if True, the ranges are solved with a secant method started from the specific "
+            "range of the design point instead of fsolve. The mission is still run once per point "
+            "and per iteration, so the points are not evaluated together",
+        )
 
     def setup(self):
         variables = api_cs23.list_variables(Mission(propulsion_id=self.options["propulsion_id"]))
 
         inputs_mission = [var for var in variables if var.is_input]
 
+        # The mission problem is only set up at the first computation and then kept, as the
+        # inputs are only known then
+        self._mission_problem = None
+        self._mission_inputs = [
+            (var.name, var.metadata["units"], var.metadata["shape"]) for var in inputs_mission
+        ]
+
         for comp_input in inputs_mission:
             self.add_input(
                 comp_input.name,
@@ -63,154 +89,244 @@ class ComputePayloadRange(om.ExplicitComponent):
         self.add_output("data:payload_range:range_array", units="NM", shape=5)
         self.add_output("data:payload_range:specific_range_array", units="NM/kg", shape=5)
 
+        points_nb = self.options["intermediate_points_nb"]
+        if points_nb:
+            envelope_shape = 4 + 3 * points_nb
+            self.add_output(
+                "data:payload_range:envelope:payload_array", units="kg", shape=envelope_shape
+            )
+            self.add_output(
+                "data:payload_range:envelope:range_array", units="NM", shape=envelope_shape
+            )
+            self.add_output(
+                "data:payload_range:envelope:specific_range_array",
+                units="NM/kg",
+                shape=envelope_shape,
+            )
+
         self.declare_partials("*", "*", method="fd")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        payload_mission = inputs["data:weight:aircraft:payload"]
-        max_payload = inputs["data:weight:aircraft:max_payload"]
-        range_mission = inputs["data:TLAR:range"]
-        fuel_mission = inputs["data:mission:sizing:fuel"]
-        mfw = inputs["data:weight:aircraft:MFW"]
-        mzfw = inputs["data:weight:aircraft:MZFW"]
-        mtow = inputs["data:weight:aircraft:MTOW"]
-        owe = inputs["data:weight:aircraft:OWE"]
-        mass_pilot = inputs["settings:weight:aircraft:payload:design_mass_per_passenger"]
-
-        payload_array = []
-        range_array = []
-        sr_array = []
+        payload_mission = float(inputs["data:weight:aircraft:payload"])
+        max_payload = float(inputs["data:weight:aircraft:max_payload"])
+        range_mission = float(inputs["data:TLAR:range"])
+        fuel_mission = float(inputs["data:mission:sizing:fuel"])
+        mfw = float(inputs["data:weight:aircraft:MFW"])
+        mzfw = float(inputs["data:weight:aircraft:MZFW"])
+        mtow = float(inputs["data:weight:aircraft:MTOW"])
+        owe = float(inputs["data:weight:aircraft:OWE"])
+        mass_pilot = float(inputs["settings:weight:aircraft:payload:design_mass_per_passenger"])
+
+        self._setup_mission_problem(inputs)
 
         # Point A : 0 fuel, max payload and mass < MTOW
-        payload_array.append(max_payload)
-        range_array.append(0)
-        sr_array.append(0)
-
         # Point B : max payload, enough fuel to have mass = MTOW
-        fuel_target_b = mtow - mzfw
-        range_b, _, ier, message = fsolve(
-            self.fuel_function,
-            range_mission / 2,
-            args=(fuel_target_b, mtow, inputs, self.options["propulsion_id"]),
-            xtol=0.01,
-            full_output=True,
-        )
-        if ier != 1:
-            _LOGGER.warning("Computation of point B failed. Error message : %s", message)
-
-        payload_array.append(max_payload)
-        range_array.append(range_b[0])
-        sr_array.append(range_b[0] / fuel_target_b)
-
-        fuel_target_c = fuel_mission
-        range_c, _, ier, message = fsolve(
-            self.fuel_function,
-            range_mission / 2,
-            args=(fuel_target_c, mtow, inputs, self.options["propulsion_id"]),
-            xtol=0.01,
-            full_output=True,
-        )
-        if ier != 1:
-            _LOGGER.warning("Computation of point C failed. Error message : %s", message)
-
-        payload_array.append(payload_mission)
-        range_array.append(range_c)
-        sr_array.append(range_c / fuel_target_c)
-
+        # Point C : design point
         # Point D : max fuel (MFW), enough payload to have mass = MTOW
-        fuel_target_d = mfw
-        payload_d = max_payload - (mfw - fuel_target_b)
-
-        range_d, _, ier, message = fsolve(
-            self.fuel_function,
-            range_mission,
-            args=(fuel_target_d, mtow, inputs, self.options["propulsion_id"]),
-            xtol=0.01,
-            full_output=True,
-        )
-        if ier != 1:
-            _LOGGER.warning("Computation of point D failed. Error message : %s", message)
-
+        # Point E : max fuel (MFW), min payload and the aircraft resulting mass
+        fuel_b = mtow - mzfw
+        payload_d = max_payload - (mfw - fuel_b)
+        payload_e = 0.0
         if payload_d < 2 * mass_pilot:
             _LOGGER.warning(
                 "Point D computed but the payload for this point is lower than minimal payload (2 "
                 "pilots) "
             )
-        payload_array.append(payload_d)
-        range_array.append(range_d[0])
-        sr_array.append(range_d[0] / fuel_target_d)
 
-        # Point E : max fuel (MFW), min payload and the aircraft resulting mass
-        fuel_target_e = mfw
-        payload_e = 0.0
-        mass_aircraft = owe + mfw + payload_e
-        range_e, _, ier, message = fsolve(
-            self.fuel_function,
-            range_mission,
-            args=(fuel_target_e, mass_aircraft, inputs, self.options["propulsion_id"]),
-            xtol=0.01,
-            full_output=True,
+        # Each point is defined by its payload, its fuel, the take-off mass and a first guess of
+        # the range, point A is not solved since its range is 0
+        point_names = ["point B", "point C", "point D", "point E"]
+        payloads = [max_payload, payload_mission, payload_d, payload_e]
+        fuels = [fuel_b, fuel_mission, mfw, mfw]
+        masses = [mtow, mtow, mtow, owe + mfw + payload_e]
+        range_guesses = [range_mission / 2.0, range_mission / 2.0, range_mission, range_mission]
+
+        # Intermediate points are taken evenly along the segments AB, BD and DE of the diagram,
+        # their first guess is based on the specific range of the design point
+        points_nb = self.options["intermediate_points_nb"]
+        ratios = np.linspace(0.0, 1.0, points_nb + 2)[1:-1]
+        point_a = np.array([max_payload, 0.0, mzfw])
+        point_b, point_d, point_e = (
+            np.array([payloads[index], fuels[index], masses[index]]) for index in (0, 2, 3)
         )
-        if ier != 1:
-            _LOGGER.warning("Computation of point E failed. Error message : %s", message)
-
-        payload_array.append(payload_e)
-        range_array.append(range_e[0])
-        sr_array.append(range_e[0] / fuel_target_e)
+        for segment_name, start_point, end_point in (
+            ("AB", point_a, point_b),
+            ("BD", point_b, point_d),
+            ("DE", point_d, point_e),
+        ):
+            for index, ratio in enumerate(ratios):
+                payload, fuel, mass = start_point + ratio * (end_point - start_point)
+                point_names.append(
+                    "intermediate point %i of segment %s" % (index + 1, segment_name)
+                )
+                payloads.append(payload)
+                fuels.append(fuel)
+                masses.append(mass)
+                range_guesses.append(fuel * range_mission / fuel_mission)
+
+        if self.options["secant_solve"]:
+            fuels_array = np.array(fuels)
+            ranges, converged = self._solve_ranges_secant(
+                fuels_array, np.array(masses), fuels_array * range_mission / fuel_mission
+            )
+            for index in np.where(~converged)[0]:
+                _LOGGER.warning("Computation of %s failed.", point_names[index])
+        else:
+            ranges = np.zeros(len(fuels))
+            for index, (fuel, mass, range_guess) in enumerate(zip(fuels, masses, range_guesses)):
+                range_solution, _, ier, message = fsolve(
+                    self.fuel_function,
+                    range_guess,
+                    args=(fuel, mass),
+                    xtol=0.01,
+                    full_output=True,
+                )
+                if ier != 1:
+                    _LOGGER.warning(
+                        "Computation of %s failed. Error message : %s", point_names[index], message
+                    )
+                ranges[index] = range_solution[0]
+
+        payloads = np.array([max_payload] + payloads)
+        fuels = np.array([0.0] + fuels)
+        ranges = np.concatenate((np.zeros(1), ranges))
+        specific_ranges = np.zeros_like(ranges)
+        specific_ranges[1:] = ranges[1:] / fuels[1:]
 
         # Conversion in nautical miles
-        range_array = [i / 1852 for i in range_array]
-        sr_array = [i / 1852 for i in sr_array]
+        ranges /= 1852.0
+        specific_ranges /= 1852.0
+
+        outputs["data:payload_range:payload_array"] = payloads[:5]
+        outputs["data:payload_range:range_array"] = ranges[:5]
+        outputs["data:payload_range:specific_range_array"] = specific_ranges[:5]
+
+        if points_nb:
+            # Points of the envelope in the order A, AB, B, BD, D, DE, E
+            index_ab = 5 + np.arange(points_nb)
+            envelope_indexes = np.concatenate(
+                (
+                    [0],
+                    index_ab,
+                    [1],
+                    index_ab + points_nb,
+                    [3],
+                    index_ab + 2 * points_nb,
+                    [4],
+                )
+            )
+            outputs["data:payload_range:envelope:payload_array"] = payloads[envelope_indexes]
+            outputs["data:payload_range:envelope:range_array"] = ranges[envelope_indexes]
+            outputs["data:payload_range:envelope:specific_range_array"] = specific_ranges[
+                envelope_indexes
+            ]
+
+    def fuel_function(self, range_parameter, fuel_target, mass):
+        """
+        Computes the difference between the fuel consumed on a mission of the given range and
+        the target fuel. Only the range and the mass are changed in the mission problem kept
+        between evaluations, so that no new problem has to be set up.
+
+        :param range_parameter: range of the mission, in m.
+        :param fuel_target: fuel that should be consumed on the mission, in kg.
+        :param mass: take-off mass of the aircraft, in kg.
+        :return: the difference between the consumed fuel and the target, in kg.
+        """
 
-        outputs["data:payload_range:payload_array"] = payload_array
-        outputs["data:payload_range:range_array"] = range_array
-        outputs["data:payload_range:specific_range_array"] = sr_array
+        problem = self._mission_problem
 
-    @staticmethod
-    def fuel_function(range_parameter, fuel_target, mass, inputs, prop_id):
+        problem.set_val("data:TLAR:range", range_parameter, units="m")
+        problem.set_val("data:weight:aircraft:MTOW", mass, units="kg")
 
-        mission_component = AutoUnitsDefaultGroup()
-        mission_component.add_subsystem(
-            "system",
-            Mission(propulsion_id=prop_id),
-            promotes=["*"],
+        problem.run_model()
+
+        fuel = problem.get_val("data:mission:sizing:fuel", units="kg")
+
+        return fuel - fuel_target
+
+    def _solve_ranges_secant(self, fuel_targets, masses, range_guesses):
+        """
+        Solves the ranges of the points with a secant method. The points are iterated in lockstep
+        but not batched: each iteration runs the mission once for each of the points not yet
+        converged, so this gives no speedup over solving the points one after the other with the
+        same method. The only gain over fsolve comes from the first step, which assumes that the
+        fuel is proportional to the range and saves a few mission runs per point.
+
+        :param fuel_targets: array of the fuel of each point, in kg.
+        :param masses: array of the take-off mass of each point, in kg.
+        :param range_guesses: array of the first guess of the range of each point, in m.
+        :return: the array of the ranges of the points, in m, and the array of the convergence
+        flags.
+        """
+
+        ranges = np.array(range_guesses, dtype=float)
+        residuals = np.array(
+            [
+                float(self.fuel_function(range_guess, fuel_target, mass))
+                for range_guess, fuel_target, mass in zip(ranges, fuel_targets, masses)
+            ]
         )
-        variables = api_cs23.list_variables(mission_component)
-        var_inputs = [var.name for var in variables if var.is_input]
-        var_units = [var.units for var in variables if var.is_input]
-        var_shapes = [np.shape(var.val) for var in variables if var.is_input]
-
-        input_zip = zip(var_inputs, var_units, var_shapes)
-
-        ivc = om.IndepVarComp()
-        for var_names, var_unit, var_shape in input_zip:
-            if var_names != "data:TLAR:range" and var_names != "data:weight:aircraft:MTOW":
-                ivc.add_output(
-                    name=var_names, val=inputs[var_names], units=var_unit, shape=var_shape
+        new_ranges = ranges * fuel_targets / (residuals + fuel_targets)
+        new_residuals = np.copy(residuals)
+        converged = np.zeros(len(ranges), dtype=bool)
+
+        for _ in range(SECANT_MAX_ITERATIONS):
+            for index in np.where(~converged)[0]:
+                new_residuals[index] = self.fuel_function(
+                    new_ranges[index], fuel_targets[index], masses[index]
                 )
+            converged = (
+                converged
+                | (np.abs(new_residuals) <= SECANT_TOLERANCE * fuel_targets)
+                | (np.abs(new_ranges - ranges) <= SECANT_TOLERANCE * np.abs(new_ranges))
+            )
+            if np.all(converged):
+                break
 
-        ivc.add_output(name="data:TLAR:range", val=range_parameter, units="m")
-        ivc.add_output(name="data:weight:aircraft:MTOW", val=mass, units="kg")
+            update = ~converged
+            slopes = (new_residuals[update] - residuals[update]) / (
+                new_ranges[update] - ranges[update]
+            )
+            ranges[update] = new_ranges[update]
+            residuals[update] = new_residuals[update]
+            new_ranges[update] = ranges[update] - residuals[update] / slopes
 
-        problem = oad.FASTOADProblem()
-        model = problem.model
+        return new_ranges, converged
 
-        model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
-        model.add_subsystem("mission", Mission(propulsion_id=prop_id), promotes=["*"])
+    def _setup_mission_problem(self, inputs):
+        """
+        Sets up, at the first call, the problem in which the mission is run for each point of the
+        diagram, then updates the inputs it shares with the component.
 
-        model.nonlinear_solver = om.NonlinearBlockGS()
-        model.nonlinear_solver.options["iprint"] = 0
-        model.nonlinear_solver.options["maxiter"] = 10
-        model.nonlinear_solver.options["rtol"] = 1e-3
+        :param inputs: inputs of the component.
+        """
 
-        model.linear_solver = om.LinearBlockGS()
-        model.linear_solver.options["iprint"] = 0
-        model.linear_solver.options["maxiter"] = 10
-        model.linear_solver.options["rtol"] = 1e-3
+        if self._mission_problem is None:
+            ivc = om.IndepVarComp()
+            for var_name, var_unit, var_shape in self._mission_inputs:
+                ivc.add_output(name=var_name, units=var_unit, shape=var_shape)
 
-        problem.setup()
+            problem = oad.FASTOADProblem()
+            model = problem.model
 
-        problem.run_model()
+            model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
+            model.add_subsystem(
+                "mission", Mission(propulsion_id=self.options["propulsion_id"]), promotes=["*"]
+            )
 
-        fuel = problem.get_val("data:mission:sizing:fuel", units="kg")
+            model.nonlinear_solver = om.NonlinearBlockGS()
+            model.nonlinear_solver.options["iprint"] = 0
+            model.nonlinear_solver.options["maxiter"] = 10
+            model.nonlinear_solver.options["rtol"] = 1e-3
 
-        return fuel - fuel_target
+            model.linear_solver = om.LinearBlockGS()
+            model.linear_solver.options["iprint"] = 0
+            model.linear_solver.options["maxiter"] = 10
+            model.linear_solver.options["rtol"] = 1e-3
+
+            problem.setup()
+
+            self._mission_problem = problem
+
+        for var_name, var_unit, _ in self._mission_inputs:
+            self._mission_problem.set_val(var_name, inputs[var_name], units=var_unit)
@@ -71,7 +71,7 @@ class DummyEngineBE76(AbstractFuelPropulsion):
             / np.maximum(mach * Atmosphere(flight_points.altitude).speed_of_sound, 1e-20),
         )
         if flight_points.thrust_rate is None:
-            flight_points.thrust = min(max_thrust, thrust)
+            flight_points.thrust = np.minimum(max_thrust, thrust)
             flight_points.thrust_rate = thrust / max_thrust
         elif flight_points.thrust is None:
             flight_points.thrust = max_thrust * np.array(flight_points.thrust_rate)
@@ -165,7 +165,7 @@ class DummyEngineSR22(AbstractFuelPropulsion):
             / np.maximum(mach * Atmosphere(flight_points.altitude).speed_of_sound, 1e-20),
         )
         if flight_points.thrust_rate is None:
-            flight_points.thrust = min(max_thrust, thrust)
+            flight_points.thrust = np.minimum(max_thrust, thrust)
             flight_points.thrust_rate = thrust / max_thrust
         elif flight_points.thrust is None:
             flight_points.thrust = max_thrust * np.array(flight_points.thrust_rate)
@@ -242,7 +242,7 @@ class DummyEngineTBM900(AbstractFuelPropulsion):
             / np.maximum(mach * Atmosphere(flight_points.altitude).speed_of_sound, 1e-20),
         )
         if flight_points.thrust_rate is None:
-            flight_points.thrust = min(max_thrust, thrust)
+            flight_points.thrust = np.minimum(max_thrust, thrust)
             flight_points.thrust_rate = thrust / max_thrust
         elif flight_points.thrust is None:
             flight_points.thrust = max_thrust * np.array(flight_points.thrust_rate)
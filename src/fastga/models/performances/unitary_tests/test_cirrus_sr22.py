@@ -14,9 +14,13 @@ Test takeoff module.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os.path as pth
+import tempfile
+
 from openmdao.core.group import Group
 import pytest
 import numpy as np
+import pandas as pd
 
 from fastga.models.performances.mission.takeoff import (
     TakeOffPhase,
@@ -28,15 +32,21 @@ from fastga.models.performances.mission.takeoff import (
 from fastga.models.performances.mission.mission_components import (
     ComputeTaxi,
     ComputeClimb,
+    ComputeClimbBlock,
     ComputeClimbSpeed,
     ComputeCruise,
+    ComputeCruiseBlock,
     ComputeDescent,
+    ComputeDescentBlock,
     ComputeDescentSpeed,
     ComputeReserve,
 )
 from fastga.models.performances.mission.mission import Mission
 from fastga.models.performances.mission.mission_builder_prep import PrepareMissionBuilder
 from fastga.models.performances.mission_vector.mission_vector import MissionVector
+from fastga.models.performances.mission_vector.mission.equilibrium import Equilibrium
+from fastga.models.performances.mission_vector.mission.propulsion_via_id import FuelConsumed
+from fastga.models.performances.mission_vector.mission.update_mass import UpdateMass
 from ..payload_range.payload_range import ComputePayloadRange
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
@@ -81,6 +91,15 @@ def test_vloff():
     alpha = problem.get_val("v_lift_off:angle", units="deg")
     assert alpha == pytest.approx(10.25, abs=1e-2)
 
+    # Same with a finer grid of lift-off angles
+    problem = run_system(
+        _v_lift_off_from_v2(propulsion_id=ENGINE_WRAPPER, number_of_lift_off_angles=40), ivc
+    )
+    vloff = problem.get_val("v_lift_off:speed", units="m/s")
+    assert vloff == pytest.approx(38.39, abs=1e-2)
+    alpha = problem.get_val("v_lift_off:angle", units="deg")
+    assert alpha == pytest.approx(10.25, abs=1e-2)
+
 
 def test_vr():
     """Tests rotation speed"""
@@ -294,6 +313,81 @@ def test_compute_descent():
     assert duration == pytest.approx(27, abs=1)
 
 
+def test_compute_main_route_block():
+    """Tests climb, cruise and descent phases computed with arrays"""
+
+    expected_values = {
+        "climb": (ComputeClimbBlock, (4.2, 1e-1), (24.17, 1e-2), (8.29, 1e-2), "min"),
+        "cruise": (ComputeCruiseBlock, (139, 1), (1753, 1), (5.85, 1e-2), "h"),
+        "descent": (ComputeDescentBlock, (0.83, 1e-2), (87, 1), (27, 1), "min"),
+    }
+    for phase, (phase_class, fuel, distance, duration, time_unit) in expected_values.items():
+        # Research independent input value in .xml file
+        group = Group()
+        group.add_subsystem("in_flight_cg_variation", InFlightCGVariation(), promotes=["*"])
+        group.add_subsystem(phase, phase_class(propulsion_id=ENGINE_WRAPPER), promotes=["*"])
+        ivc = get_indep_var_comp(list_inputs(group), __file__, XML_FILE)
+
+        # Run problem and check obtained value(s) is/(are) the same as with time-marching
+        problem = run_system(group, ivc)
+        fuel_mass = problem.get_val("data:mission:sizing:main_route:" + phase + ":fuel", units="kg")
+        assert fuel_mass == pytest.approx(fuel[0], abs=fuel[1])
+        phase_distance = problem.get_val(
+            "data:mission:sizing:main_route:" + phase + ":distance", units="km"
+        )
+        assert phase_distance == pytest.approx(distance[0], abs=distance[1])
+        phase_duration = problem.get_val(
+            "data:mission:sizing:main_route:" + phase + ":duration", units=time_unit
+        )
+        assert phase_duration == pytest.approx(duration[0], abs=duration[1])
+
+
+def test_mission_out_file():
+    """Tests the saving of the flight points of the phases in the .csv file"""
+
+    results_folder = tempfile.TemporaryDirectory()
+    out_file = pth.join(results_folder.name, "flight_points.csv")
+    for keep_previous_runs in (False, True):
+        options = {
+            "propulsion_id": ENGINE_WRAPPER,
+            "out_file": out_file,
+            "keep_previous_runs": keep_previous_runs,
+            "saved_points": {},
+        }
+        group = Group()
+        group.add_subsystem("in_flight_cg_variation", InFlightCGVariation(), promotes=["*"])
+        group.add_subsystem("climb", ComputeClimbBlock(**options), promotes=["*"])
+        group.add_subsystem("cruise", ComputeCruiseBlock(**options), promotes=["*"])
+        ivc = get_indep_var_comp(list_inputs(group), __file__, XML_FILE)
+
+        # Run problem twice, points of the first run are kept in the file only if asked to
+        problem = run_system(group, ivc)
+        point_count = len(problem.model.component.climb.flight_points) + len(
+            problem.model.component.cruise.flight_points
+        )
+        problem.run_model()
+        flight_points = pd.read_csv(out_file, index_col=0)
+        if keep_previous_runs:
+            # The run of the previous loop iteration is also kept
+            assert len(flight_points) == 3 * point_count
+        else:
+            assert len(flight_points) == point_count
+        assert np.array_equal(flight_points.index, np.arange(len(flight_points)))
+        assert list(flight_points["name"].unique()) == [
+            "sizing:main_route:climb",
+            "sizing:main_route:cruise",
+        ]
+
+    # The points of a file modified outside of the mission are counted to continue the index
+    flight_points.iloc[:point_count].to_csv(out_file)
+    problem.run_model()
+    flight_points = pd.read_csv(out_file, index_col=0)
+    assert len(flight_points) == 2 * point_count
+    assert np.array_equal(flight_points.index, np.arange(len(flight_points)))
+
+    results_folder.cleanup()
+
+
 def test_compute_reserve():
     """Tests reserve phase"""
 
@@ -348,6 +442,122 @@ def test_mission_vector():
     assert sizing_energy == pytest.approx(0.0, abs=1e-2)
 
 
+def test_mission_vector_adaptive_discretization():
+
+    options = {
+        "propulsion_id": ENGINE_WRAPPER,
+        "number_of_points_climb": 30,
+        "number_of_points_cruise": 10,
+        "number_of_points_descent": 20,
+        "adaptive_discretization": True,
+    }
+
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(list_inputs(MissionVector(**options)), __file__, XML_FILE)
+
+    problem = run_system(MissionVector(**options), ivc)
+    sizing_fuel = problem.get_val("data:mission:sizing:fuel", units="kg")
+    assert sizing_fuel == pytest.approx(237.74, abs=1e-2)
+    climb_distance = problem.get_val("data:mission:sizing:main_route:climb:distance", units="NM")
+    cruise_distance = problem.get_val("data:mission:sizing:main_route:cruise:distance", units="NM")
+    descent_distance = problem.get_val(
+        "data:mission:sizing:main_route:descent:distance", units="NM"
+    )
+    total_distance = problem.get_val("data:TLAR:range", units="NM")
+    error_distance = total_distance - (climb_distance + cruise_distance + descent_distance)
+    assert error_distance == pytest.approx(0.0, abs=1e-1)
+
+    # The altitude of the climb points should be refined near the cruise level
+    altitude = problem.get_val("component.initialization.initialize_altitude.altitude", units="m")[
+        0:30
+    ]
+    altitude_step = altitude[1:] - altitude[:-1]
+    assert altitude_step[-1] < altitude_step[0]
+
+
+def test_fuel_consumed_partials():
+
+    number_of_points = 5
+
+    # Research independent input value in .xml file and add the flight points
+    ivc = get_indep_var_comp(
+        list_inputs(FuelConsumed(number_of_points=number_of_points, propulsion_id=ENGINE_WRAPPER)),
+        __file__,
+        XML_FILE,
+    )
+    ivc.add_output("thrust_econ", np.linspace(500.0, 2500.0, number_of_points + 2), units="N")
+    ivc.add_output("altitude_econ", np.linspace(0.0, 2500.0, number_of_points + 2), units="m")
+    ivc.add_output("time_step_econ", np.linspace(5.0, 60.0, number_of_points + 2), units="s")
+    ivc.add_output("true_airspeed_econ", np.linspace(40.0, 80.0, number_of_points + 2), units="m/s")
+
+    problem = run_system(
+        FuelConsumed(number_of_points=number_of_points, propulsion_id=ENGINE_WRAPPER), ivc
+    )
+    data = problem.check_partials(out_stream=None, method="fd", form="central", step=1e-3)
+    for component_data in data.values():
+        for (_, input_name), partial_data in component_data.items():
+            # Engine parameters are not differentiated
+            if not input_name.startswith("data:"):
+                assert partial_data["abs error"].forward <= 1e-6 * max(
+                    1.0, partial_data["magnitude"].fd
+                )
+
+
+def _assert_check_partials(problem):
+    """Checks the declared partials against central finite differences."""
+
+    data = problem.check_partials(compact_print=True, method="fd", form="central", step=1e-4)
+    for component_data in data.values():
+        for partial_data in component_data.values():
+            assert partial_data["abs error"].forward <= 1e-5 * max(
+                1.0, partial_data["magnitude"].fd
+            )
+
+
+def test_equilibrium_partials():
+
+    number_of_points = 5
+
+    for flaps_position in ("cruise", "takeoff"):
+        component = Equilibrium(number_of_points=number_of_points, flaps_position=flaps_position)
+
+        # Research independent input value in .xml file and add the flight points
+        ivc = get_indep_var_comp(list_inputs(component), __file__, XML_FILE)
+        ivc.add_output("d_vx_dt", np.linspace(-0.2, 0.4, number_of_points), units="m/s**2")
+        ivc.add_output("mass", np.linspace(1600.0, 1450.0, number_of_points), units="kg")
+        ivc.add_output("x_cg", np.linspace(2.9, 2.7, number_of_points), units="m")
+        ivc.add_output("gamma", np.linspace(5.0, -3.0, number_of_points), units="deg")
+        ivc.add_output("altitude", np.linspace(0.0, 2500.0, number_of_points), units="m")
+        ivc.add_output("true_airspeed", np.linspace(40.0, 80.0, number_of_points), units="m/s")
+        ivc.add_output("delta_Cl", np.linspace(0.0, 0.05, number_of_points))
+        ivc.add_output("delta_Cd", np.linspace(0.0, 0.005, number_of_points))
+        ivc.add_output("delta_Cm", np.linspace(0.0, -0.01, number_of_points))
+
+        problem = run_system(component, ivc)
+
+        # The partials of the residuals are checked away from the equilibrium
+        problem.set_val("alpha", np.linspace(2.0, 8.0, number_of_points), units="deg")
+        problem.set_val("thrust", np.linspace(800.0, 2500.0, number_of_points), units="N")
+        problem.set_val("delta_m", np.linspace(-8.0, -2.0, number_of_points), units="deg")
+
+        _assert_check_partials(problem)
+
+
+def test_update_mass_partials():
+
+    number_of_points = 5
+
+    # Research independent input value in .xml file and add the fuel consumed at each point
+    ivc = get_indep_var_comp(
+        list_inputs(UpdateMass(number_of_points=number_of_points)), __file__, XML_FILE
+    )
+    ivc.add_output("fuel_consumed_t", np.linspace(0.5, 2.0, number_of_points), units="kg")
+
+    problem = run_system(UpdateMass(number_of_points=number_of_points), ivc)
+
+    _assert_check_partials(problem)
+
+
 def test_payload_range():
     """Tests the payload range computation. Here the results and especially the range array do not make a lot of sense
     because of the dummy engine model. Note that the third point of the arrays is the design point."""
@@ -368,3 +578,30 @@ def test_payload_range():
     specific_range_array = problem.get_val("data:payload_range:specific_range_array", units="NM/kg")
     specific_range_result = np.array([0.0, 6.24, 6.47, 6.58, 7.45])
     assert np.max(np.abs(specific_range_array - specific_range_result)) <= 1e-1
+
+
+def test_payload_range_secant():
+    """Tests the payload range computation with the ranges solved by secant method and one
+    intermediate point on each segment of the diagram."""
+
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(
+        list_inputs(ComputePayloadRange(propulsion_id=ENGINE_WRAPPER)), __file__, XML_FILE
+    )
+    # Run problem and check obtained value(s) is/(are) correct
+    # noinspection PyTypeChecker
+    problem = run_system(
+        ComputePayloadRange(
+            propulsion_id=ENGINE_WRAPPER, intermediate_points_nb=1, secant_solve=True
+        ),
+        ivc,
+    )
+    range_array = problem.get_val("data:payload_range:range_array", units="NM")
+    range_result = np.array([0.0, 1172.88, 1635.65, 1958.44, 2214.56])
+    assert np.max(np.abs(range_array - range_result)) <= 1
+    payload_array = problem.get_val("data:payload_range:envelope:payload_array", units="kg")
+    payload_result = np.array([420.0, 420.0, 420.0, 365.349, 310.697, 155.349, 0.0])
+    assert np.max(np.abs(payload_array - payload_result)) <= 1e-1
+    range_array = problem.get_val("data:payload_range:envelope:range_array", units="NM")
+    range_result = np.array([0.0, 551.90, 1172.75, 1561.48, 1958.32, 2087.89, 2214.55])
+    assert np.max(np.abs(range_array - range_result)) <= 1
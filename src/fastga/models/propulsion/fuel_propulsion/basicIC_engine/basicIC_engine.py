@@ -16,7 +16,7 @@
 import logging
 import pandas as pd
 from typing import Union, Sequence, Tuple, Optional
-from scipy.interpolate import interp2d
+from scipy.interpolate import RectBivariateSpline
 import os.path as pth
 import numpy as np
 
@@ -26,6 +26,7 @@ from fastoad.exceptions import FastUnknownEngineSettingError
 from stdatm import Atmosphere
 
 from fastga.models.propulsion.fuel_propulsion.base import AbstractFuelPropulsion
+from fastga.models.propulsion.fuel_propulsion.utils import interp_lines
 from fastga.models.propulsion.dict import DynamicAttributeDict, AddKeyAttributes
 
 from .exceptions import FastBasicICEngineInconsistentInputParametersError
@@ -135,6 +136,24 @@ class BasicICEngine(AbstractFuelPropulsion):
         )  # conversion rpm to rad/s included
         self.volume = volume
 
+        # The interpolation tables do not depend on the flight point, so the interpolants are
+        # built once. The bicubic splines are the ones interp2d(..., kind="cubic") builds on a
+        # regular grid, but can be evaluated on arrays of points.
+        torque_vect = pme_vect * 1e5 * volume / (8.0 * np.pi)
+        self.ICE_sfc = RectBivariateSpline(torque_vect, rpm_vect, sfc_matrix.T)
+        self.propeller_efficiency_SL = RectBivariateSpline(
+            self.thrust_SL,
+            self.speed_SL,
+            # Include the efficiency loss in here
+            np.transpose(self.efficiency_SL * self.effective_efficiency_ls),
+        )
+        self.propeller_efficiency_CL = RectBivariateSpline(
+            self.thrust_CL,
+            self.speed_CL,
+            # Include the efficiency loss in here
+            np.transpose(self.efficiency_CL * self.effective_efficiency_cruise),
+        )
+
         # Declare sub-components attribute
         self.engine = Engine(power_SL=max_power)
         self.engine.mass = None
@@ -403,67 +422,54 @@ class BasicICEngine(AbstractFuelPropulsion):
         :param atmosphere: Atmosphere instance at intended altitude
         :return: efficiency
         """
+        propeller_efficiency = self._propeller_efficiency(
+            thrust, atmosphere.true_airspeed, atmosphere.get_altitude(altitude_in_feet=False)
+        )
+        if np.size(propeller_efficiency) == 1:  # calculate for float
+            return float(propeller_efficiency)
+
+        return propeller_efficiency
+
+    def _propeller_efficiency(
+        self,
+        thrust: Union[float, np.ndarray],
+        true_airspeed: Union[float, np.ndarray],
+        altitude: Union[float, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Same as :meth:`propeller_efficiency` for arrays of thrust, speed and altitude that can be
+        broadcast together.
+
+        :param thrust: Thrust (in N)
+        :param true_airspeed: true airspeed (in m/s)
+        :param altitude: altitude (in m)
+        :return: efficiency
+        """
         # Include advance ratio loss in here, we will assume that since we work at constant RPM
         # the change in advance ration is equal to a change in velocity
-        installed_airspeed = atmosphere.true_airspeed * self.effective_J
+        installed_airspeed = np.asarray(true_airspeed) * self.effective_J
 
-        propeller_efficiency_SL = interp2d(
-            self.thrust_SL,
-            self.speed_SL,
-            self.efficiency_SL * self.effective_efficiency_ls,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_SL = np.minimum(
+            np.maximum(np.min(self.thrust_SL), thrust),
+            np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
         )
-        propeller_efficiency_CL = interp2d(
-            self.thrust_CL,
-            self.speed_CL,
-            self.efficiency_CL * self.effective_efficiency_cruise,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_CL = np.minimum(
+            np.maximum(np.min(self.thrust_CL), thrust),
+            np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
         )
-        if isinstance(atmosphere.true_airspeed, float):
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
-            )
-        else:
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(list(installed_airspeed), self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(list(installed_airspeed), self.speed_CL, self.thrust_limit_CL),
-            )
-        if np.size(thrust) == 1:  # calculate for float
-            lower_bound = float(propeller_efficiency_SL(thrust_interp_SL, installed_airspeed))
-            upper_bound = float(propeller_efficiency_CL(thrust_interp_CL, installed_airspeed))
-            altitude = atmosphere.get_altitude(altitude_in_feet=False)
-            propeller_efficiency = np.interp(
-                altitude, [0, self.cruise_altitude_propeller], [lower_bound, upper_bound]
-            )
-        else:  # calculate for array
-            propeller_efficiency = np.zeros(np.size(thrust))
-            for idx in range(np.size(thrust)):
-                lower_bound = propeller_efficiency_SL(
-                    thrust_interp_SL[idx], installed_airspeed[idx]
-                )
-                upper_bound = propeller_efficiency_CL(
-                    thrust_interp_CL[idx], installed_airspeed[idx]
-                )
-                altitude = atmosphere.get_altitude(altitude_in_feet=False)[idx]
-                propeller_efficiency[idx] = (
-                    lower_bound
-                    + (upper_bound - lower_bound)
-                    * np.minimum(altitude, self.cruise_altitude_propeller)
-                    / self.cruise_altitude_propeller
-                )
+        thrust_interp_SL, thrust_interp_CL, installed_airspeed = np.broadcast_arrays(
+            thrust_interp_SL, thrust_interp_CL, installed_airspeed
+        )
+        lower_bound = self.propeller_efficiency_SL.ev(thrust_interp_SL, installed_airspeed)
+        upper_bound = self.propeller_efficiency_CL.ev(thrust_interp_CL, installed_airspeed)
 
-        return propeller_efficiency
+        # Linear interpolation between sea level and cruise altitude tables, limited to those
+        # tables outside of that range
+        altitude_ratio = (
+            np.clip(altitude, 0.0, self.cruise_altitude_propeller) / self.cruise_altitude_propeller
+        )
+
+        return lower_bound + (upper_bound - lower_bound) * altitude_ratio
 
     def compute_max_power(self, flight_points: oad.FlightPoint) -> Union[float, Sequence]:
         """
@@ -492,13 +498,6 @@ class BasicICEngine(AbstractFuelPropulsion):
         :param atmosphere: Atmosphere instance at intended altitude
         :return: SFC (in g/kw) and Power (in W)
         """
-        # Load engine map and save interpolation formula
-        rpm_vect = self.rpm_vect_ref
-        pme_vect = self.pme_vect_ref
-        sfc_matrix = self.sfc_matrix_ref
-        torque_vect = pme_vect * 1e5 * self.volume / (8.0 * np.pi)
-        ICE_sfc = interp2d(torque_vect, rpm_vect, sfc_matrix, kind="cubic")
-
         # Define RPM & mixture using engine settings
         if np.size(engine_setting) == 1:
             rpm_values = self.rpm_values[int(engine_setting)]
@@ -512,30 +511,13 @@ class BasicICEngine(AbstractFuelPropulsion):
             )
 
         # Compute sfc @ 2500RPM
-        real_power = np.zeros(np.size(thrust))
-        torque = np.zeros(np.size(thrust))
-        sfc = np.zeros(np.size(thrust))
-        if np.size(thrust) == 1:
-            real_power = (
-                thrust * atmosphere.true_airspeed / self.propeller_efficiency(thrust, atmosphere)
-            )
-            torque = real_power / (rpm_values * np.pi / 30.0)
-            sfc = ICE_sfc(torque, rpm_values) * mixture_values * self.k_factor_sfc
-        else:
-            for idx in range(np.size(thrust)):
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude()[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                real_power[idx] = (
-                    thrust[idx]
-                    * atmosphere.true_airspeed[idx]
-                    / self.propeller_efficiency(thrust[idx], local_atmosphere)
-                )
-                torque[idx] = real_power[idx] / (rpm_values[idx] * np.pi / 30.0)
-                sfc[idx] = (
-                    ICE_sfc(torque[idx], rpm_values[idx]) * mixture_values[idx] * self.k_factor_sfc
-                )
+        real_power = (
+            thrust * atmosphere.true_airspeed / self.propeller_efficiency(thrust, atmosphere)
+        )
+        torque = real_power / (rpm_values * np.pi / 30.0)
+        sfc = np.atleast_1d(self.ICE_sfc.ev(torque, rpm_values))
+        sfc = sfc * mixture_values * self.k_factor_sfc
+
         return sfc, real_power
 
     def max_thrust(
@@ -551,16 +533,9 @@ class BasicICEngine(AbstractFuelPropulsion):
         :return: maximum thrust (in N)
         """
         # Calculate maximum propeller thrust @ given altitude and speed
-        if isinstance(atmosphere.true_airspeed, float):
-            lower_bound = np.interp(atmosphere.true_airspeed, self.speed_SL, self.thrust_limit_SL)
-            upper_bound = np.interp(atmosphere.true_airspeed, self.speed_CL, self.thrust_limit_CL)
-        else:
-            lower_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_SL, self.thrust_limit_SL
-            )
-            upper_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_CL, self.thrust_limit_CL
-            )
+        true_airspeed = atmosphere.true_airspeed
+        lower_bound = np.interp(true_airspeed, self.speed_SL, self.thrust_limit_SL)
+        upper_bound = np.interp(true_airspeed, self.speed_CL, self.thrust_limit_CL)
         altitude = atmosphere.get_altitude(altitude_in_feet=False)
         thrust_max_propeller = (
             lower_bound
@@ -576,83 +551,59 @@ class BasicICEngine(AbstractFuelPropulsion):
         power_max_vect = torque_vect * rpm_vect * (np.pi / 30.0)
         if np.size(engine_setting) == 1:
             rpm_values = np.array(self.rpm_values[int(engine_setting)])
-            max_power_SL = np.interp(rpm_values, rpm_vect, power_max_vect)
         else:
             rpm_values = np.array(
                 [self.rpm_values[engine_setting[idx]] for idx in range(np.size(engine_setting))]
             )
-            max_power_SL = np.interp(list(rpm_values), rpm_vect, power_max_vect)
+        max_power_SL = np.interp(rpm_values, rpm_vect, power_max_vect)
         sigma = atmosphere.density / Atmosphere(0.0).density
         max_power = max_power_SL * (sigma - (1 - sigma) / 7.55)
 
+        # The computation is done on all flight points at once, one line per flight point
+        true_airspeed = np.ravel(true_airspeed)
+        altitude = np.ravel(altitude)
+        max_power = np.ravel(max_power) * np.ones_like(altitude)
+
         # Found thrust relative to ICE maximum power @ given altitude and speed: calculates first
         # thrust interpolation vector (between min and max of propeller table) and associated
         # efficiency, then calculates power and found thrust (interpolation limits to max
         # propeller thrust)
         thrust_interp = np.linspace(
             np.min(self.thrust_SL) * np.ones(np.size(thrust_max_propeller)),
-            thrust_max_propeller,
+            np.ravel(thrust_max_propeller),
             10,
         ).transpose()
-        if np.size(altitude) == 1:  # Calculate for float
-            thrust_max_global = 0.0
-            local_atmosphere = Atmosphere(
-                altitude * np.ones(np.size(thrust_interp)), altitude_in_feet=False
+        propeller_efficiency = self._propeller_efficiency(
+            thrust_interp, true_airspeed[:, np.newaxis], altitude[:, np.newaxis]
+        )
+        mechanical_power = thrust_interp * true_airspeed[:, np.newaxis] / propeller_efficiency
+        thrust_max_global = interp_lines(max_power, mechanical_power, thrust_interp)
+
+        # When even the lowest thrust of the table requires more than max power, take the lower
+        # bound efficiency for calculation and iterate on the efficiency for those points
+        power_limited = np.min(mechanical_power, axis=1) > max_power
+        efficiency_relative_error = np.ones_like(max_power)
+        propeller_efficiency = propeller_efficiency[:, 0]
+        while np.any(power_limited):
+            thrust_max_global[power_limited] = (
+                max_power[power_limited]
+                * propeller_efficiency[power_limited]
+                / true_airspeed[power_limited]
             )
-            local_atmosphere.mach = atmosphere.mach * np.ones(np.size(thrust_interp))
-            propeller_efficiency = self.propeller_efficiency(thrust_interp[0], local_atmosphere)
-            mechanical_power = thrust_interp[0] * atmosphere.true_airspeed / propeller_efficiency
-            if np.min(mechanical_power) > max_power:
-                efficiency_relative_error = 1
-                propeller_efficiency = propeller_efficiency[0]
-                while efficiency_relative_error > 1e-2:
-                    thrust_max_global = max_power * propeller_efficiency / atmosphere.true_airspeed
-                    propeller_efficiency_new = self.propeller_efficiency(
-                        thrust_max_global, atmosphere
-                    )
-                    efficiency_relative_error = np.abs(
-                        (propeller_efficiency_new - propeller_efficiency)
-                        / efficiency_relative_error
-                    )
-                    propeller_efficiency = propeller_efficiency_new
-            else:
-                thrust_max_global = np.interp(max_power, mechanical_power, thrust_interp[0])
-        else:  # Calculate for array
-            thrust_max_global = np.zeros(np.size(altitude))
-            for idx in range(np.size(altitude)):
-                local_atmosphere = Atmosphere(
-                    altitude[idx] * np.ones(np.size(thrust_interp[idx])), altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx] * np.ones(np.size(thrust_interp[idx]))
-                propeller_efficiency = self.propeller_efficiency(
-                    thrust_interp[idx], local_atmosphere
-                )
-                mechanical_power = (
-                    thrust_interp[idx] * atmosphere.true_airspeed[idx] / propeller_efficiency
-                )
-                if (
-                    np.min(mechanical_power) > max_power[idx]
-                ):  # take the lower bound efficiency for calculation
-                    efficiency_relative_error = 1
-                    local_atmosphere = Atmosphere(altitude[idx], altitude_in_feet=False)
-                    local_atmosphere.mach = atmosphere.mach[idx]
-                    propeller_efficiency = propeller_efficiency[0]
-                    while efficiency_relative_error > 1e-2:
-                        thrust_max_global[idx] = (
-                            max_power[idx] * propeller_efficiency / atmosphere.true_airspeed[idx]
-                        )
-                        propeller_efficiency_new = self.propeller_efficiency(
-                            thrust_max_global[idx], local_atmosphere
-                        )
-                        efficiency_relative_error = np.abs(
-                            (propeller_efficiency_new - propeller_efficiency)
-                            / efficiency_relative_error
-                        )
-                        propeller_efficiency = propeller_efficiency_new
-                else:
-                    thrust_max_global[idx] = np.interp(
-                        max_power[idx], mechanical_power, thrust_interp[idx]
-                    )
+            propeller_efficiency_new = self._propeller_efficiency(
+                thrust_max_global[power_limited],
+                true_airspeed[power_limited],
+                altitude[power_limited],
+            )
+            efficiency_relative_error[power_limited] = np.abs(
+                (propeller_efficiency_new - propeller_efficiency[power_limited])
+                / efficiency_relative_error[power_limited]
+            )
+            propeller_efficiency[power_limited] = propeller_efficiency_new
+            power_limited = np.logical_and(power_limited, efficiency_relative_error > 1e-2)
+
+        if np.ndim(atmosphere.get_altitude()) == 0:  # return a float for float inputs
+            return thrust_max_global[0]
 
         return thrust_max_global
 
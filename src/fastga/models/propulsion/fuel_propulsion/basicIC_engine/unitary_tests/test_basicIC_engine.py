@@ -836,7 +836,7 @@ def test_compute_flight_points():
         EngineSetting.IDLE,
         EngineSetting.CRUISE,
     ]  # mix EngineSetting with integers
-    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 2.040742e-05, 1.553841e-05]
+    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 2.145666e-05, 1.553841e-05]
 
     flight_points = oad.FlightPoint(
         mach=machs + machs,
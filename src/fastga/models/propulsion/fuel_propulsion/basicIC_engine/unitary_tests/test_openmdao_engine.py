@@ -799,7 +799,7 @@ def test_OMBasicICEngineComponent():
         EngineSetting.IDLE,
         EngineSetting.CRUISE,
     ]  # mix EngineSetting with integers
-    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 3.069944e-05, 2.250824e-05]
+    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 3.108261e-05, 2.250824e-05]
 
     ivc = om.IndepVarComp()
     ivc.add_output("data:propulsion:IC_engine:max_power", 130000, units="W")
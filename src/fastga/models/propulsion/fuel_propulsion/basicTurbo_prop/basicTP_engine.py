@@ -16,7 +16,7 @@
 import os.path as pth
 import logging
 from typing import Union, Sequence, Tuple, Optional
-from scipy.interpolate import interp2d, interp1d
+from scipy.interpolate import interp1d, RectBivariateSpline, RegularGridInterpolator
 from scipy.optimize import fsolve
 from pandas import read_csv
 import numpy as np
@@ -33,11 +33,18 @@ from fastga.models.propulsion.fuel_propulsion.basicTurbo_prop.exceptions import
     FastBasicTPEngineUnknownLimit,
 )
 from fastga.models.propulsion.fuel_propulsion.base import AbstractFuelPropulsion
+from fastga.models.propulsion.fuel_propulsion.utils import interp_lines
 from fastga.models.propulsion.dict import DynamicAttributeDict, AddKeyAttributes
 
 # Logger for this module
 _LOGGER = logging.getLogger(__name__)
 
+# Discretization of the off-design performances table used in tabulated mode, the power is given
+# as a ratio of the maximum power the turboshaft can give within its temperature and opr limits
+TABLE_ALTITUDE_PTS_NB = 10
+TABLE_MACH_PTS_NB = 6
+TABLE_POWER_RATIOS = np.array([0.02, 0.1, 0.2, 0.35, 0.5, 0.65, 0.8, 1.0])
+
 # Set of dictionary keys that are mapped to instance attributes.
 ENGINE_LABELS = {
     "power_SL": dict(doc="power at sea level in watts."),
@@ -94,6 +101,7 @@ class BasicTPEngine(AbstractFuelPropulsion):
         inter_compressor_bleed=0.04,
         exhaust_mach_design=0.4,
         pr_1_ratio_design=0.25,
+        tabulated=False,
     ):
         """
         Parametric turboprop engine.
@@ -145,6 +153,10 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :param exhaust_mach_design: mach number at the exhaust in the design point
         :param pr_1_ratio_design: ratio of the first stage pressure ration to the OPR at the design
         point.
+        :param tabulated: if True, the off-design performances of the turboshaft are computed once
+        on an (altitude, mach, power) table at the creation of the engine and then interpolated,
+        instead of being solved at each flight point. The maximum error of the table against the
+        solver is stored in turboshaft_table_error.
         """
 
         # Load the value of the air properties graph
@@ -222,6 +234,22 @@ class BasicTPEngine(AbstractFuelPropulsion):
         self.effective_efficiency_cruise = float(effective_efficiency_cruise)
         self.specific_shape = None
 
+        # The propeller tables do not depend on the flight point, so the interpolants are built
+        # once. The bicubic splines are the ones interp2d(..., kind="cubic") builds on a regular
+        # grid, but can be evaluated on arrays of points.
+        self.propeller_efficiency_SL = RectBivariateSpline(
+            self.thrust_SL,
+            self.speed_SL,
+            # Include the efficiency loss in here
+            np.transpose(self.efficiency_SL * self.effective_efficiency_ls),
+        )
+        self.propeller_efficiency_CL = RectBivariateSpline(
+            self.thrust_CL,
+            self.speed_CL,
+            # Include the efficiency loss in here
+            np.transpose(self.efficiency_CL * self.effective_efficiency_cruise),
+        )
+
         # Declare sub-components attribute
         self.engine = Engine(power_SL=power_design)
         self.engine.mass = None
@@ -295,6 +323,12 @@ class BasicTPEngine(AbstractFuelPropulsion):
         self.power_sol = [0.0]
         self.thrust_sol = [0.0]
 
+        self.tabulated = bool(np.round(tabulated))
+        self.turboshaft_table = None
+        self.turboshaft_table_error = None
+        if self.tabulated:
+            self.construct_turboshaft_table()
+
     @staticmethod
     def air_coefficients_reader():
 
@@ -1065,6 +1099,186 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         return fuel, power_sol[0], thrust_sol[0]
 
+    def turboshaft_compute_at_limits(self, altitude, mach_vol):
+
+        """
+        Computes the performances of the turboprop at the highest power it can give within its
+        temperature and opr limits, regardless of the power limit of the gearbox.
+
+        :param altitude: the flight altitude, in m.
+        :param mach_vol: the flight mach number.
+
+        :return fuel: the fuel flow at the highest achievable power, in kg/s.
+        :return power_sol: the highest achievable power, in kW.
+        :return thrust_sol: the exhaust thrust, in N.
+        """
+
+        fuel = self.turboshaft_performance_envelope_limits_real_gas(
+            "t_45t", self.itt_limit, altitude, mach_vol
+        )
+        power_sol = self.power_sol
+        thrust_sol = self.thrust_sol
+
+        if self.opr_sol > self.opr_limit:
+            fuel = self.turboshaft_performance_envelope_limits_real_gas(
+                "opr", self.opr_limit, altitude, mach_vol
+            )
+            power_sol = self.power_sol
+            thrust_sol = self.thrust_sol
+
+        return fuel, power_sol[0], thrust_sol[0]
+
+    def construct_turboshaft_table(self):
+
+        """
+        Computes the off-design performances of the turboshaft on an (altitude, mach, power) table
+        so that they can be interpolated instead of solved at each flight point. The power is
+        discretized as a ratio of the highest power achievable within the temperature and opr
+        limits, which is tabulated separately, so that the table does not contain the change of
+        behaviour when a limit is reached. The table is then checked against the solver at the
+        center of some of its cells, the maximum errors are stored in turboshaft_table_error.
+        """
+
+        altitudes = np.linspace(
+            0.0,
+            1.2 * max(self.cruise_altitude_propeller, self.design_point_altitude, 1000.0),
+            TABLE_ALTITUDE_PTS_NB,
+        )
+        machs = np.linspace(0.0, max(1.3 * self.design_point_mach, 0.3), TABLE_MACH_PTS_NB)
+        power_ratios = TABLE_POWER_RATIOS
+
+        power_limit = np.zeros((len(altitudes), len(machs)))
+        fuel = np.zeros((len(altitudes), len(machs), len(power_ratios)))
+        thrust_exhaust = np.zeros((len(altitudes), len(machs), len(power_ratios)))
+        for idx_altitude, altitude in enumerate(altitudes):
+            for idx_mach, mach in enumerate(machs):
+                (
+                    fuel[idx_altitude, idx_mach, -1],
+                    power_limit[idx_altitude, idx_mach],
+                    thrust_exhaust[idx_altitude, idx_mach, -1],
+                ) = self.turboshaft_compute_at_limits(altitude, mach)
+                for idx_ratio, power_ratio in enumerate(power_ratios[:-1]):
+                    (
+                        fuel[idx_altitude, idx_mach, idx_ratio],
+                        _,
+                        thrust_exhaust[idx_altitude, idx_mach, idx_ratio],
+                    ) = self.turboshaft_compute_within_limits(
+                        power_ratio * power_limit[idx_altitude, idx_mach], altitude, mach
+                    )
+
+        # Points outside of the table are given as nan and are then solved
+        self.turboshaft_table = {
+            "power_limit": RegularGridInterpolator(
+                (altitudes, machs), power_limit, bounds_error=False, fill_value=np.nan
+            ),
+            "fuel": RegularGridInterpolator(
+                (altitudes, machs, power_ratios), fuel, bounds_error=False, fill_value=np.nan
+            ),
+            "thrust_exhaust": RegularGridInterpolator(
+                (altitudes, machs, power_ratios),
+                thrust_exhaust,
+                bounds_error=False,
+                fill_value=np.nan,
+            ),
+        }
+
+        # Check the table at the center of one cell per altitude interval, both for a power
+        # within the limits and for the maximum power of the engine
+        check_altitudes = (altitudes[1:] + altitudes[:-1]) / 2.0
+        check_machs = ((machs[1:] + machs[:-1]) / 2.0)[
+            np.arange(len(check_altitudes)) % (len(machs) - 1)
+        ]
+        check_ratios = ((power_ratios[1:] + power_ratios[:-1]) / 2.0)[
+            np.arange(len(check_altitudes)) % (len(power_ratios) - 1)
+        ]
+        check_powers = np.concatenate(
+            (
+                check_ratios
+                * self.turboshaft_table["power_limit"](
+                    np.column_stack((check_altitudes, check_machs))
+                ),
+                np.full_like(check_altitudes, self.max_power_avail),
+            )
+        )
+        check_altitudes = np.tile(check_altitudes, 2)
+        check_machs = np.tile(check_machs, 2)
+        table_results = self.read_turboshaft_table(check_powers, check_altitudes, check_machs)
+        solver_results = np.array(
+            [
+                self.turboshaft_compute_within_limits(power, altitude, mach)
+                for power, altitude, mach in zip(check_powers, check_altitudes, check_machs)
+            ]
+        ).transpose()
+        self.turboshaft_table_error = {
+            "fuel": np.max(np.abs(table_results[0] / solver_results[0] - 1.0)),
+            "power": np.max(np.abs(table_results[1] / solver_results[1] - 1.0)),
+            "thrust_exhaust": np.max(np.abs(table_results[2] - solver_results[2])),
+        }
+        _LOGGER.info(
+            "Turboshaft table computed, maximum relative error on fuel flow: %.2e, on power: %.2e, "
+            "maximum error on exhaust thrust: %.2f N",
+            self.turboshaft_table_error["fuel"],
+            self.turboshaft_table_error["power"],
+            self.turboshaft_table_error["thrust_exhaust"],
+        )
+
+    def read_turboshaft_table(self, target_power, altitude, mach_vol):
+
+        """
+        Same as :meth:`turboshaft_compute_within_limits` with the table computed at the creation
+        of the engine, for arrays of flight points. Results are nan for points outside of the
+        table.
+
+        :param target_power: required power, in kW.
+        :param altitude: the flight altitude, in m.
+        :param mach_vol: the flight mach number.
+
+        :return fuel: the fuel flow giving the required power or highest achievable power, in kg/s.
+        :return power_sol: the required power or highest achievable power, in kW.
+        :return thrust_sol: the exhaust thrust, in N.
+        """
+
+        flight_points = np.column_stack((altitude, mach_vol))
+        power_limit = self.turboshaft_table["power_limit"](flight_points)
+        power_sol = np.minimum(target_power, power_limit)
+        flight_points = np.column_stack((flight_points, power_sol / power_limit))
+        fuel = self.turboshaft_table["fuel"](flight_points)
+        thrust_sol = self.turboshaft_table["thrust_exhaust"](flight_points)
+
+        return fuel, power_sol, thrust_sol
+
+    def _turboshaft_compute_within_limits(self, target_power, altitude, mach_vol):
+
+        """
+        Same as :meth:`turboshaft_compute_within_limits` for arrays of flight points, reading the
+        table in tabulated mode and solving the points outside of it.
+
+        :param target_power: required power, in kW.
+        :param altitude: the flight altitude, in m.
+        :param mach_vol: the flight mach number.
+
+        :return fuel: the fuel flow giving the required power or highest achievable power, in kg/s.
+        :return power_sol: the required power or highest achievable power, in kW.
+        :return thrust_sol: the exhaust thrust, in N.
+        """
+
+        target_power, altitude, mach_vol = np.broadcast_arrays(target_power, altitude, mach_vol)
+        if self.tabulated:
+            fuel, power_sol, thrust_sol = self.read_turboshaft_table(
+                target_power, altitude, mach_vol
+            )
+        else:
+            fuel = np.full(np.shape(target_power), np.nan)
+            power_sol = np.full(np.shape(target_power), np.nan)
+            thrust_sol = np.full(np.shape(target_power), np.nan)
+
+        for idx in np.where(np.isnan(fuel))[0]:
+            fuel[idx], power_sol[idx], thrust_sol[idx] = self.turboshaft_compute_within_limits(
+                target_power[idx], altitude[idx], mach_vol[idx]
+            )
+
+        return fuel, power_sol, thrust_sol
+
     def compute_flight_points(self, flight_points: oad.FlightPoint):
         # pylint: disable=too-many-arguments
         # they define the trajectory
@@ -1271,67 +1485,54 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :param atmosphere: Atmosphere instance at intended altitude
         :return: efficiency
         """
+        propeller_efficiency = self._propeller_efficiency(
+            thrust, atmosphere.true_airspeed, atmosphere.get_altitude(altitude_in_feet=False)
+        )
+        if np.size(propeller_efficiency) == 1:  # calculate for float
+            return float(propeller_efficiency)
+
+        return propeller_efficiency
+
+    def _propeller_efficiency(
+        self,
+        thrust: Union[float, np.ndarray],
+        true_airspeed: Union[float, np.ndarray],
+        altitude: Union[float, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Same as :meth:`propeller_efficiency` for arrays of thrust, speed and altitude that can be
+        broadcast together.
+
+        :param thrust: Thrust (in N)
+        :param true_airspeed: true airspeed (in m/s)
+        :param altitude: altitude (in m)
+        :return: efficiency
+        """
         # Include advance ratio loss in here, we will assume that since we work at constant RPM
         # the change in advance ration is equal to a change in velocity
-        installed_airspeed = atmosphere.true_airspeed * self.effective_J
+        installed_airspeed = np.asarray(true_airspeed) * self.effective_J
 
-        propeller_efficiency_SL = interp2d(
-            self.thrust_SL,
-            self.speed_SL,
-            self.efficiency_SL * self.effective_efficiency_ls,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_SL = np.minimum(
+            np.maximum(np.min(self.thrust_SL), thrust),
+            np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
         )
-        propeller_efficiency_CL = interp2d(
-            self.thrust_CL,
-            self.speed_CL,
-            self.efficiency_CL * self.effective_efficiency_cruise,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_CL = np.minimum(
+            np.maximum(np.min(self.thrust_CL), thrust),
+            np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
         )
-        if isinstance(atmosphere.true_airspeed, float):
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
-            )
-        else:
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(list(installed_airspeed), self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(list(installed_airspeed), self.speed_CL, self.thrust_limit_CL),
-            )
-        if isinstance(thrust, float):  # calculate for float
-            lower_bound = float(propeller_efficiency_SL(thrust_interp_SL, installed_airspeed))
-            upper_bound = float(propeller_efficiency_CL(thrust_interp_CL, installed_airspeed))
-            altitude = atmosphere.get_altitude(altitude_in_feet=False)
-            propeller_efficiency = np.interp(
-                altitude, [0, self.cruise_altitude_propeller], [lower_bound, upper_bound]
-            )
-        else:  # calculate for array
-            propeller_efficiency = np.zeros(np.size(thrust))
-            for idx in range(np.size(thrust)):
-                lower_bound = propeller_efficiency_SL(
-                    thrust_interp_SL[idx], installed_airspeed[idx]
-                )
-                upper_bound = propeller_efficiency_CL(
-                    thrust_interp_CL[idx], installed_airspeed[idx]
-                )
-                altitude = atmosphere.get_altitude(altitude_in_feet=False)[idx]
-                propeller_efficiency[idx] = (
-                    lower_bound
-                    + (upper_bound - lower_bound)
-                    * np.minimum(altitude, self.cruise_altitude_propeller)
-                    / self.cruise_altitude_propeller
-                )
+        thrust_interp_SL, thrust_interp_CL, installed_airspeed = np.broadcast_arrays(
+            thrust_interp_SL, thrust_interp_CL, installed_airspeed
+        )
+        lower_bound = self.propeller_efficiency_SL.ev(thrust_interp_SL, installed_airspeed)
+        upper_bound = self.propeller_efficiency_CL.ev(thrust_interp_CL, installed_airspeed)
 
-        return propeller_efficiency
+        # Linear interpolation between sea level and cruise altitude tables, limited to those
+        # tables outside of that range
+        altitude_ratio = (
+            np.clip(altitude, 0.0, self.cruise_altitude_propeller) / self.cruise_altitude_propeller
+        )
+
+        return lower_bound + (upper_bound - lower_bound) * altitude_ratio
 
     def compute_max_power(self, flight_points: oad.FlightPoint) -> Union[float, Sequence]:
         """
@@ -1362,60 +1563,48 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :return: SFC (in kg/s/W) and power (in W)
         """
 
-        # Compute sfc
+        # Compute sfc, the exhaust thrust being given by the turboshaft computation, the propeller
+        # thrust is iterated on until the sum of both matches the required thrust. All flight
+        # points are computed at once, each one until its own convergence.
+        true_airspeed = np.ravel(atmosphere.true_airspeed) * np.ones(np.size(thrust))
+        altitude = np.ravel(atmosphere.get_altitude(altitude_in_feet=False)) * np.ones(
+            np.size(thrust)
+        )
+        mach = np.ravel(atmosphere.mach) * np.ones(np.size(thrust))
+        thrust = np.ravel(thrust) * np.ones(np.size(thrust))
+
+        thrust_propeller = np.copy(thrust)
         power_shaft = np.zeros(np.size(thrust))
-        # torque = np.zeros(np.size(thrust))
         sfc = np.zeros(np.size(thrust))
-        if np.size(thrust) == 1:
-            thrust_propeller = thrust
-            while True:
-                power_shaft = (
-                    thrust_propeller
-                    * atmosphere.true_airspeed
-                    / self.propeller_efficiency(thrust_propeller, atmosphere)
+        to_compute = np.ones(np.size(thrust), dtype=bool)
+        while np.any(to_compute):
+            power_in_kw = (
+                thrust_propeller[to_compute]
+                * true_airspeed[to_compute]
+                / self._propeller_efficiency(
+                    thrust_propeller[to_compute], true_airspeed[to_compute], altitude[to_compute]
                 )
-                h_vol_point = atmosphere.get_altitude(altitude_in_feet=False)
-                mach_vol_point = atmosphere.mach
+                / 1000.0
+            )
+            fuel, power_out, thrust_exhaust = self._turboshaft_compute_within_limits(
+                power_in_kw, altitude[to_compute], mach[to_compute]
+            )
+            power_out_watts = power_out * 1000.0
 
-                power_in_kw = power_shaft / 1000.0
+            sfc[to_compute] = fuel / power_out_watts
+            power_shaft[to_compute] = power_out_watts
+            converged = (
+                np.abs(thrust[to_compute] - thrust_propeller[to_compute] - thrust_exhaust)
+                / thrust[to_compute]
+                < 1e-3
+            )
+            thrust_propeller[to_compute] = np.where(
+                converged, thrust_propeller[to_compute], thrust[to_compute] - thrust_exhaust
+            )
+            to_compute[to_compute] = np.logical_not(converged)
 
-                fuel_point, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                    power_in_kw, h_vol_point, mach_vol_point
-                )
-                power_out_watts = power_out * 1000.0
-
-                sfc = fuel_point / power_out_watts
-                power_shaft = power_out_watts
-                if abs(thrust - thrust_propeller - thrust_exhaust) / thrust < 1e-3:
-                    break
-                else:
-                    thrust_propeller = thrust - thrust_exhaust
-        else:
-            for idx in range(np.size(thrust)):
-                thrust_propeller = thrust[idx]
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude(altitude_in_feet=False)[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                while True:
-                    power_shaft[idx] = (
-                        thrust_propeller
-                        * local_atmosphere.true_airspeed
-                        / self.propeller_efficiency(thrust_propeller, local_atmosphere)
-                    )
-                    h_vol = local_atmosphere.get_altitude(altitude_in_feet=False)
-                    mach_vol = local_atmosphere.mach
-                    power_in_kw = power_shaft[idx] / 1000.0
-                    fuel, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                        power_in_kw, h_vol, mach_vol
-                    )
-                    power_out_watts = power_out * 1000.0
-                    sfc[idx] = fuel / power_out_watts
-                    power_shaft[idx] = power_out_watts
-                    if abs(thrust[idx] - thrust_propeller - thrust_exhaust) / thrust[idx] < 1e-3:
-                        break
-                    else:
-                        thrust_propeller = thrust[idx] - thrust_exhaust
+        if np.size(thrust) == 1:  # return floats for float inputs
+            return sfc[0], power_shaft[0]
 
         return sfc, power_shaft
 
@@ -1431,16 +1620,9 @@ class BasicTPEngine(AbstractFuelPropulsion):
         """
 
         # Calculate maximum propeller thrust @ given altitude and speed
-        if isinstance(atmosphere.true_airspeed, float):
-            lower_bound = np.interp(atmosphere.true_airspeed, self.speed_SL, self.thrust_limit_SL)
-            upper_bound = np.interp(atmosphere.true_airspeed, self.speed_CL, self.thrust_limit_CL)
-        else:
-            lower_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_SL, self.thrust_limit_SL
-            )
-            upper_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_CL, self.thrust_limit_CL
-            )
+        true_airspeed = atmosphere.true_airspeed
+        lower_bound = np.interp(true_airspeed, self.speed_SL, self.thrust_limit_SL)
+        upper_bound = np.interp(true_airspeed, self.speed_CL, self.thrust_limit_CL)
         altitude = atmosphere.get_altitude(altitude_in_feet=False)
         thrust_max_propeller = (
             lower_bound
@@ -1449,32 +1631,16 @@ class BasicTPEngine(AbstractFuelPropulsion):
             / self.cruise_altitude_propeller
         )
 
-        altitudes_to_evaluate = atmosphere.get_altitude(altitude_in_feet=False)
-        if np.size(altitudes_to_evaluate) == 1:
-            h_vol = altitudes_to_evaluate
-            mach_vol = atmosphere.mach
-            _, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                self.max_power_avail, h_vol, mach_vol
-            )
-            power_out_watts = power_out * 1000.0
-            max_power = power_out_watts
-            exhaust_thrust_at_max_power = thrust_exhaust
-        else:
-            max_power = np.zeros(len(altitudes_to_evaluate))
-            exhaust_thrust_at_max_power = np.zeros(len(altitudes_to_evaluate))
-            for idx, h_vol in enumerate(altitudes_to_evaluate):
-                mach_vol = atmosphere.mach[idx]
-                _, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                    self.max_power_avail, h_vol, mach_vol
-                )
-                power_out_watts = power_out * 1000.0
-                # max_power = power_out_watts
-                max_power[idx] = power_out_watts
-                exhaust_thrust_at_max_power[idx] = thrust_exhaust
+        # The computation is done on all flight points at once, one line per flight point
+        true_airspeed = np.ravel(true_airspeed)
+        altitude = np.ravel(altitude)
+        mach = np.ravel(atmosphere.mach) * np.ones_like(altitude)
 
+        _, power_out, exhaust_thrust_at_max_power = self._turboshaft_compute_within_limits(
+            self.max_power_avail, altitude, mach
+        )
         # Max power --> Array containing the maximum available power at the given flight points
-        # thrust_max_propeller --> Array containing the maximum available thrust at the given
-        # flight points for the propeller
+        max_power = power_out * 1000.0
 
         # Found thrust relative to turboprop maximum power @ given altitude and speed: calculates
         # first thrust interpolation vector (between min and max of propeller table) and
@@ -1482,90 +1648,47 @@ class BasicTPEngine(AbstractFuelPropulsion):
         # max propeller thrust)
         thrust_interp = np.linspace(
             np.min(self.thrust_SL) * np.ones(np.size(thrust_max_propeller)),
-            thrust_max_propeller,
+            np.ravel(thrust_max_propeller),
             10,
         ).transpose()
-        if np.size(altitude) == 1:  # Calculate for float
-            thrust_max_global = 0.0
-            local_atmosphere = Atmosphere(
-                altitude * np.ones(np.size(thrust_interp)), altitude_in_feet=False
+        propeller_efficiency = self._propeller_efficiency(
+            thrust_interp, true_airspeed[:, np.newaxis], altitude[:, np.newaxis]
+        )
+        # mechanical power contain the shaft power required to obtain the thrust from
+        # thrust_interp. Mechanical power is already limited by the maximum thrust that the
+        # propeller can produce so we are sure that we will never go above our propeller's
+        # capacity
+        mechanical_power = thrust_interp * true_airspeed[:, np.newaxis] / propeller_efficiency
+        thrust_max_global = interp_lines(max_power, mechanical_power, thrust_interp)
+
+        # If the limiting factor is the turboprop, thrust_max_global is computed based on
+        # max_power, taking the lower bound efficiency for calculation
+        # TODO : is there a need to take into account the fact when the turboprop is
+        #  over-sized and the limiting  factor becomes the propeller ? Is it physically
+        #  relevant ? Here it looks like in any case, the  engine is always the  limiting
+        #  factor
+        power_limited = np.min(mechanical_power, axis=1) > max_power
+        efficiency_relative_error = np.ones_like(max_power)
+        propeller_efficiency = propeller_efficiency[:, 0]
+        while np.any(power_limited):
+            thrust_max_global[power_limited] = (
+                max_power[power_limited]
+                * propeller_efficiency[power_limited]
+                / true_airspeed[power_limited]
             )
-            local_atmosphere.mach = atmosphere.mach * np.ones(np.size(thrust_interp))
-            propeller_efficiency = self.propeller_efficiency(thrust_interp[0], local_atmosphere)
-            mechanical_power = thrust_interp[0] * atmosphere.true_airspeed / propeller_efficiency
-            if np.min(mechanical_power) > max_power:
-                efficiency_relative_error = 1
-                propeller_efficiency = propeller_efficiency[0]
-                while efficiency_relative_error > 1e-2:
-                    thrust_max_global = max_power * propeller_efficiency / atmosphere.true_airspeed
-                    propeller_efficiency_new = self.propeller_efficiency(
-                        thrust_max_global, atmosphere
-                    )
-                    efficiency_relative_error = np.abs(
-                        (propeller_efficiency_new - propeller_efficiency)
-                        / efficiency_relative_error
-                    )
-                    propeller_efficiency = propeller_efficiency_new
-                thrust_max_global += exhaust_thrust_at_max_power
-            # TODO : is there a need to take into account the fact when the turboprop is
-            #  over-sized and the limiting  factor becomes the propeller ? Is it physically
-            #  relevant ? Here it looks like in any case, the  engine is always the  limiting
-            #  factor
-            else:
-                thrust_max_global = (
-                    np.interp(max_power, mechanical_power, thrust_interp[0])
-                    + exhaust_thrust_at_max_power
-                )
-            if isinstance(thrust_max_global, float):
-                thrust_max_global = np.array([thrust_max_global])
-        else:  # Calculate for array
-            thrust_max_global = np.zeros(np.size(altitude))
-            for idx in range(np.size(altitude)):
-                local_atmosphere = Atmosphere(
-                    altitude[idx] * np.ones(np.size(thrust_interp[idx])), altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx] * np.ones(np.size(thrust_interp[idx]))
-                propeller_efficiency = self.propeller_efficiency(
-                    thrust_interp[idx], local_atmosphere
-                )
-                mechanical_power = (
-                    thrust_interp[idx] * atmosphere.true_airspeed[idx] / propeller_efficiency
-                )
-                # mechanical power contain the shaft power required to obtain the thrust from
-                # thrust_interp, where thrust_interp[idx] is the thrust interpolation array
-                # corresponding to the flight conditions [idx] Mechanical power is already
-                # limited by the maximum thrust that the propeller can produce so we are sure
-                # that we will never go above our propeller's capacity
-
-                # If the limiting factor is the turboprop, thrust_max_global is computed based on
-                # max_power[idx]
-                if (
-                    np.min(mechanical_power) > max_power[idx]
-                ):  # take the lower bound efficiency for calculation
-                    efficiency_relative_error = 1
-                    local_atmosphere = Atmosphere(altitude[idx], altitude_in_feet=False)
-                    local_atmosphere.mach = atmosphere.mach[idx]
-                    propeller_efficiency = propeller_efficiency[0]
-                    while efficiency_relative_error > 1e-2:
-                        thrust_max_global[idx] = (
-                            max_power[idx] * propeller_efficiency / atmosphere.true_airspeed[idx]
-                        )
-                        propeller_efficiency_new = self.propeller_efficiency(
-                            thrust_max_global[idx], local_atmosphere
-                        )
-                        efficiency_relative_error = np.abs(
-                            (propeller_efficiency_new - propeller_efficiency)
-                            / efficiency_relative_error
-                        )
-                        propeller_efficiency = propeller_efficiency_new
-                    thrust_max_global[idx] += exhaust_thrust_at_max_power[idx]
-                else:
-                    thrust_max_global[idx] = (
-                        np.interp(max_power[idx], mechanical_power, thrust_interp[idx])
-                        + exhaust_thrust_at_max_power[idx]
-                    )
+            propeller_efficiency_new = self._propeller_efficiency(
+                thrust_max_global[power_limited],
+                true_airspeed[power_limited],
+                altitude[power_limited],
+            )
+            efficiency_relative_error[power_limited] = np.abs(
+                (propeller_efficiency_new - propeller_efficiency[power_limited])
+                / efficiency_relative_error[power_limited]
+            )
+            propeller_efficiency[power_limited] = propeller_efficiency_new
+            power_limited = np.logical_and(power_limited, efficiency_relative_error > 1e-2)
 
-        return thrust_max_global
+        return thrust_max_global + exhaust_thrust_at_max_power
 
     def compute_weight(self) -> float:
         """
@@ -12,6 +12,8 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+
 import numpy as np
 from openmdao.core.component import Component
 
@@ -25,6 +27,12 @@ from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero i
     SPEED_PTS_NB,
 )
 
+# Maximum number of engines kept in memory by the wrapper, the least recently used one is removed
+# when the limit is reached
+ENGINE_CACHE_SIZE = 32
+
+_ENGINE_CACHE = OrderedDict()
+
 
 @oad.RegisterPropulsion("fastga.wrapper.propulsion.basicTurboprop")
 class OMBasicTurbopropWrapper(oad.IOMPropulsionWrapper):
@@ -155,6 +163,7 @@ class OMBasicTurbopropWrapper(oad.IOMPropulsionWrapper):
         component.add_input(
             "settings:propulsion:turboprop:design_point:first_stage_pressure_ratio", val=0.25
         )
+        component.add_input("settings:propulsion:turboprop:off_design:tabulated", val=0.0)
 
     @staticmethod
     def get_model(inputs) -> IPropulsion:
@@ -215,13 +224,41 @@ class OMBasicTurbopropWrapper(oad.IOMPropulsionWrapper):
             "pr_1_ratio_design": inputs[
                 "settings:propulsion:turboprop:design_point:first_stage_pressure_ratio"
             ],
+            "tabulated": inputs["settings:propulsion:turboprop:off_design:tabulated"],
         }
 
         return FuelEngineSet(
-            BasicTPEngine(**engine_params), inputs["data:geometry:propulsion:engine:count"]
+            get_engine(engine_params), inputs["data:geometry:propulsion:engine:count"]
         )
 
 
+def get_engine(engine_params: dict) -> BasicTPEngine:
+    """
+    Gives the turboprop corresponding to the parameters. As the construction of the engine
+    solves the design point, engines are kept in memory and reused when the same parameters are
+    given again, e.g. by the different components of a mission at each iteration.
+
+    :param engine_params: parameters of the BasicTPEngine constructor
+    :return: a :class:`BasicTPEngine` instance
+    """
+
+    # Parameters are copied so that the engine kept in memory does not change when the
+    # OpenMDAO inputs are modified in place
+    engine_params = {name: np.array(value, dtype=float) for name, value in engine_params.items()}
+    key = np.concatenate([value.ravel() for value in engine_params.values()]).tobytes()
+
+    if key in _ENGINE_CACHE:
+        _ENGINE_CACHE.move_to_end(key)
+        return _ENGINE_CACHE[key]
+
+    engine = BasicTPEngine(**engine_params)
+    _ENGINE_CACHE[key] = engine
+    if len(_ENGINE_CACHE) > ENGINE_CACHE_SIZE:
+        _ENGINE_CACHE.popitem(last=False)
+
+    return engine
+
+
 @oad.ValidityDomainChecker(
     {
         "data:propulsion:turboprop:max_power": (
@@ -924,6 +924,84 @@ def test_compute_flight_points():
     np.testing.assert_allclose(flight_points.sfc, expected_sfc + expected_sfc, rtol=1e-2)
 
 
+def test_compute_flight_points_tabulated():
+    """Tests the turboprop with its off-design performances read in a table."""
+    engine = BasicTPEngine(
+        power_design=745.7,
+        t_41t_design=1350,
+        opr_design=9.5,
+        cruise_altitude_propeller=9000.0,
+        design_altitude=0.0,
+        design_mach=0.5,
+        prop_layout=1.0,
+        bleed_control=1.0,
+        itt_limit=1100.0,
+        power_limit=521.99,
+        opr_limit=12.0,
+        speed_SL=SPEED,
+        thrust_SL=THRUST_SL,
+        thrust_limit_SL=THRUST_SL_LIMIT,
+        efficiency_SL=EFFICIENCY_SL,
+        speed_CL=SPEED,
+        thrust_CL=THRUST_CL,
+        thrust_limit_CL=THRUST_CL_LIMIT,
+        efficiency_CL=EFFICIENCY_CL,
+        effective_J=0.95,  # Effective advance ratio factor
+        effective_efficiency_ls=0.97,  # Effective efficiency in low speed conditions
+        effective_efficiency_cruise=0.98,  # Effective efficiency in cruise conditions
+        eta_225=0.85,
+        eta_253=0.86,
+        eta_445=0.86,
+        eta_455=0.86,
+        eta_q=43.260e6 * 0.95,
+        eta_axe=0.98,
+        pi_02=0.8,
+        pi_cc=0.95,
+        cooling_ratio=0.05,
+        hp_shaft_power_out=50 * 745.7,
+        gearbox_efficiency=0.98,
+        inter_compressor_bleed=0.04,
+        exhaust_mach_design=0.4,
+        pr_1_ratio_design=0.25,
+        tabulated=True,
+    )  # load a 1000 kW turboprop gasoline engine
+
+    # The error of the table is checked against the solver when it is computed
+    assert engine.turboshaft_table_error["fuel"] < 1e-2
+    assert engine.turboshaft_table_error["power"] < 1e-2
+    assert engine.turboshaft_table_error["thrust_exhaust"] < 5.0
+
+    # Same results as the solver for the flight points of test_compute_flight_points
+    # 2D arrays are used, where first line is for thrust rates, and second line
+    # is for thrust values.
+    # As thrust rates and thrust values match, thrust rate results are 2 equal
+    # lines and so are thrust value results.
+    machs = [0.3, 0.3, 0.3, 0.4, 0.4]
+    altitudes = [0, 0, 0, 1000, 2400]
+    thrust_rates = [0.8, 0.5, 0.5, 0.4, 0.7]
+    thrusts = [3552.993438, 2220.620899, 2220.620899, 1355.227044, 2436.320399]
+    engine_settings = [
+        EngineSetting.TAKEOFF,
+        EngineSetting.TAKEOFF,
+        EngineSetting.CLIMB,
+        EngineSetting.IDLE,
+        EngineSetting.CRUISE,
+    ]  # mix EngineSetting with integers
+    expected_sfc = [1.471528e-05, 1.831423e-05, 1.831423e-05, 2.576356e-05, 1.766113e-05]
+
+    flight_points = oad.FlightPoint(
+        mach=machs + machs,
+        altitude=altitudes + altitudes,
+        engine_setting=engine_settings + engine_settings,
+        thrust_is_regulated=[False] * 5 + [True] * 5,
+        thrust_rate=thrust_rates + [0.0] * 5,
+        thrust=[0.0] * 5 + thrusts,
+    )
+
+    engine.compute_flight_points(flight_points)
+    np.testing.assert_allclose(flight_points.sfc, expected_sfc + expected_sfc, rtol=1e-2)
+
+
 def test_engine_weight():
     _745_kW_engine = BasicTPEngine(
         power_design=745.7,
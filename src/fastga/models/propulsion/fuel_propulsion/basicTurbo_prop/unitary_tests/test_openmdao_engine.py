@@ -18,7 +18,7 @@ import numpy as np
 import openmdao.api as om
 from fastoad.constants import EngineSetting
 
-from ..openmdao import OMBasicTPEngineComponent
+from ..openmdao import OMBasicTPEngineComponent, get_engine, ENGINE_CACHE_SIZE
 
 from tests.testing_utilities import run_system
 
@@ -868,3 +868,49 @@ def test_OMBasicTPEngineComponent():
     np.testing.assert_allclose(
         problem["data:propulsion:SFC"], [expected_sfc, expected_sfc], rtol=1e-2
     )
+
+
+def test_engine_cache():
+    """Tests that the turboprop is only built once for a given set of parameters."""
+
+    engine_params = {
+        "power_design": 745.7,
+        "t_41t_design": 1350.0,
+        "opr_design": 9.5,
+        "cruise_altitude_propeller": 9000.0,
+        "design_altitude": 0.0,
+        "design_mach": 0.5,
+        "prop_layout": 1.0,
+        "bleed_control": 1.0,
+        "itt_limit": 1100.0,
+        "power_limit": 522.0,
+        "opr_limit": 12.0,
+        "speed_SL": SPEED.copy(),
+        "thrust_SL": THRUST_SL.copy(),
+        "thrust_limit_SL": THRUST_SL_LIMIT.copy(),
+        "efficiency_SL": EFFICIENCY_SL.copy(),
+        "speed_CL": SPEED.copy(),
+        "thrust_CL": THRUST_CL.copy(),
+        "thrust_limit_CL": THRUST_CL_LIMIT.copy(),
+        "efficiency_CL": EFFICIENCY_CL.copy(),
+        "effective_J": 0.95,
+        "effective_efficiency_ls": 0.97,
+        "effective_efficiency_cruise": 0.98,
+    }
+
+    engine = get_engine(engine_params)
+    assert get_engine(engine_params) is engine
+
+    # Modifying the parameters in place, as OpenMDAO does with its inputs, gives a new engine
+    # and leaves the one in memory untouched
+    engine_params["efficiency_SL"] *= 0.99
+    modified_engine = get_engine(engine_params)
+    assert modified_engine is not engine
+    np.testing.assert_allclose(engine.efficiency_SL, EFFICIENCY_SL)
+    engine_params["efficiency_SL"] = EFFICIENCY_SL.copy()
+    assert get_engine(engine_params) is engine
+
+    # Least recently used engines are removed from memory once the limit is reached
+    for opr_limit in np.linspace(12.1, 13.0, ENGINE_CACHE_SIZE):
+        get_engine(dict(engine_params, opr_limit=opr_limit))
+    assert get_engine(engine_params) is not engine
@@ -0,0 +1,38 @@
+"""Helper functions shared by the fuel-consuming propulsion models."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+def interp_lines(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    One dimensional linear interpolation on each line of a table, equivalent to calling
+    np.interp(x[i], xp[i], fp[i]) for each line i, values outside of xp being limited to its
+    bounds.
+
+    :param x: values at which to interpolate, one per line
+    :param xp: increasing abscissas of the data points, one line per value of x
+    :param fp: ordinates of the data points, same shape as xp
+    :return: interpolated values
+    """
+    lines = np.arange(len(x))
+    index = np.clip(np.sum(xp <= x[:, np.newaxis], axis=1) - 1, 0, np.shape(xp)[1] - 2)
+    with np.errstate(divide="ignore", invalid="ignore"):  # lines beyond bounds are set after
+        slope = (fp[lines, index + 1] - fp[lines, index]) / (
+            xp[lines, index + 1] - xp[lines, index]
+        )
+        y = slope * (x - xp[lines, index]) + fp[lines, index]
+    y = np.where(x < xp[:, 0], fp[:, 0], y)
+
+    return np.where(x >= xp[:, -1], fp[:, -1], y)